@@ -1,8 +1,13 @@
+import time
+
+# import 소요 시간 측정 시작
+_IMPORT_START = time.perf_counter()
+
 import os
 import sys
-import time
 import logging
 from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # 환경변수 로드
@@ -13,11 +18,15 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # 프로젝트 모듈 import
 from src.config import settings
-from src.utils import setup_logging
+from src.utils import setup_logging, StartupProfiler
 from src.core import HedgeBot
-from src.exchanges.upbit import UpbitExchange
-from src.exchanges.bithumb import BithumbExchange
-from src.exchanges.gateio import GateIOExchange
+# 거래소 어댑터는 선택된 거래소만 초기화 시점에 import
+from src.exchanges import FUTURES_EXCHANGE_IDS, KOREAN_EXCHANGE_IDS, get_exchange_class
+from src.exchanges.market_registry import MarketRegistry
+from src.managers.order_journal import OrderJournal
+from src.managers.state_store import StateStore
+
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_START
 
 # 로깅 설정
 setup_logging()
@@ -31,70 +40,108 @@ class RedflagHedgeBot:
     def __init__(self):
         self.bot = None
         self.korean_exchange = None
+        self.korean_venues = []
         self.futures_exchange = None
+        self.market_registry = MarketRegistry()
+        self.profiler = StartupProfiler()
+        self.profiler.record('imports', IMPORT_SECONDS)
     
     # 완료
-    def get_user_input(self) -> Tuple[List[str], str, str]:
+    def get_user_input(self) -> Tuple[List[str], List[str], List[str]]:
         
         symbols_input = input("거래할 코인 심볼 (쉼표로 구분, 예: XRP,ETH,BTC): ").strip().upper()
         symbols = [s.strip() for s in symbols_input.split(',') if s.strip()]
         
-        logger.info("한국 거래소 선택: 1. Upbit, 2. Bithumb")
+        logger.info("한국 거래소 선택: 1. Upbit, 2. Bithumb, 3. Upbit + Bithumb (호가가 좋은 거래소로 주문)")
         while True:
-            choice = input("선택 (1-2): ").strip()
+            choice = input("선택 (1-3): ").strip()
             if choice == '1':
-                korean_exchange = 'upbit'
+                korean_exchanges = ['upbit']
                 break
             elif choice == '2':
-                korean_exchange = 'bithumb'
+                korean_exchanges = ['bithumb']
                 break
-            logger.warning("1 또는 2를 입력해주세요.")
+            elif choice == '3':
+                korean_exchanges = ['upbit', 'bithumb']
+                break
+            logger.warning("1, 2 또는 3을 입력해주세요.")
         
-        # 선물 거래소는 GateIO만 지원
-        futures_exchange = 'gateio'
-        logger.info("선물 거래소: GateIO (현재는 1개만 지원)")
+        # 선물 거래소는 설정값 사용 (2개 이상이면 헤지 분할)
+        futures_exchanges = list(settings.FUTURES_VENUES)
+        logger.info(f"선물 거래소: {', '.join(futures_exchanges)}")
         
-        return symbols, korean_exchange, futures_exchange
+        return symbols, korean_exchanges, futures_exchanges
     
     # 완료
-    def initialize_exchanges(self, korean_name: str, futures_name: str) -> bool:
+    def initialize_exchanges(self, korean_names: List[str], futures_names: List[str]) -> bool:
         """거래소 초기화"""
         try:
-            # 한국 거래소 API 키 가져오기
-            korean_key = os.getenv(f'{korean_name.upper()}_API_KEY')
-            korean_secret = os.getenv(f'{korean_name.upper()}_API_SECRET')
+            unsupported = [name for name in korean_names if name not in KOREAN_EXCHANGE_IDS]
+            if not korean_names or unsupported:
+                logger.error(f"지원하지 않는 한국 거래소: {', '.join(unsupported) or '(없음)'}")
+                return False
+            
+            unsupported = [name for name in futures_names if name not in FUTURES_EXCHANGE_IDS]
+            if not futures_names or unsupported:
+                logger.error(f"지원하지 않는 선물 거래소: {', '.join(unsupported) or '(없음)'}")
+                return False
             
-            # 선물 거래소 API 키 가져오기
-            futures_key = os.getenv(f'{futures_name.upper()}_API_KEY')
-            futures_secret = os.getenv(f'{futures_name.upper()}_API_SECRET')
+            # 거래소별 API 키 가져오기
+            credentials = {
+                name: (os.getenv(f'{name.upper()}_API_KEY'), os.getenv(f'{name.upper()}_API_SECRET'))
+                for name in korean_names + futures_names
+            }
             
-            if not all([korean_key, korean_secret, futures_key, futures_secret]):
+            if not all(key and secret for key, secret in credentials.values()):
                 logger.error("API 인증 정보가 .env 파일에 없습니다.")
                 logger.error(f"필요한 환경변수:")
-                logger.error(f"{korean_name.upper()}_API_KEY")
-                logger.error(f"{korean_name.upper()}_API_SECRET")
-                logger.error(f"{futures_name.upper()}_API_KEY")
-                logger.error(f"{futures_name.upper()}_API_SECRET")
+                for name in credentials:
+                    logger.error(f"{name.upper()}_API_KEY")
+                    logger.error(f"{name.upper()}_API_SECRET")
                 return False
             
-            # 한국 거래소 초기화
-            if korean_name == 'upbit':
-                self.korean_exchange = UpbitExchange(korean_key, korean_secret)
-            else:  # korean_name == 'bithumb' (already validated in get_user_input)
-                self.korean_exchange = BithumbExchange(korean_key, korean_secret)
+            def create_korean_exchange(korean_name):
+                korean_key, korean_secret = credentials[korean_name]
+                korean_class = get_exchange_class(korean_name)
+                return korean_class(korean_key, korean_secret, self.market_registry)
             
-            # 선물 거래소 초기화
-            if futures_name == 'gateio':
-                self.futures_exchange = GateIOExchange({
+            def create_futures_exchange(futures_name):
+                futures_key, futures_secret = credentials[futures_name]
+                futures_class = get_exchange_class(futures_name)
+                exchange = futures_class({
                     'apiKey': futures_key,
                     'secret': futures_secret
-                })
-            # 나중에 다른 선물 거래소 추가 시 여기에 elif 추가
+                }, self.market_registry)
+                # 서버 시각 API로 시계 오프셋 표본 (한국 거래소는 응답 헤더/본문 시각으로 추정)
+                exchange.sync_clock()
+                return exchange
+            
+            # 한국/선물 거래소 동시 초기화
+            with self.profiler.stage('exchange_init'):
+                with ThreadPoolExecutor(max_workers=len(korean_names) + len(futures_names)) as executor:
+                    korean_futures = [executor.submit(create_korean_exchange, name) for name in korean_names]
+                    futures_venues = list(executor.map(create_futures_exchange, futures_names))
+                    self.korean_venues = [future.result() for future in korean_futures]
+            
+            # 한국 거래소가 여러 개면 최적 호가 라우팅 어댑터로 묶음 (첫 번째가 주 거래소)
+            if len(self.korean_venues) == 1:
+                self.korean_exchange = self.korean_venues[0]
             else:
-                logger.error(f"지원하지 않는 선물 거래소: {futures_name}")
-                return False
+                from src.exchanges.multi_venue import MultiVenueSpotExchange
+                self.korean_exchange = MultiVenueSpotExchange(self.korean_venues)
+            
+            # 선물 거래소가 여러 개면 분할 주문 어댑터로 묶음 (첫 번째가 주 거래소)
+            if len(futures_venues) == 1:
+                self.futures_exchange = futures_venues[0]
+            else:
+                from src.exchanges.multi_venue import MultiVenueFuturesExchange
+                self.futures_exchange = MultiVenueFuturesExchange(futures_venues)
+            
+            # 마켓 정보 로드 (디스크 캐시 우선, 만료 시 백그라운드 갱신)
+            with self.profiler.stage('market_load'):
+                self.market_registry.load(self.korean_venues + futures_venues)
             
-            logger.info(f"거래소 초기화 완료: {korean_name} + {futures_name}")
+            logger.info(f"거래소 초기화 완료: {' + '.join(korean_names)} + {' + '.join(futures_names)}")
             return True
             
         except Exception as e:
@@ -105,31 +152,43 @@ class RedflagHedgeBot:
     def run(self):
         """봇 실행"""
         # 사용자 입력
-        symbols, korean_exchange, futures_exchange = self.get_user_input()
+        symbols, korean_exchanges, futures_exchanges = self.get_user_input()
         
         logger.info("거래소 초기화 시작")
-        if not self.initialize_exchanges(korean_exchange, futures_exchange):
+        if not self.initialize_exchanges(korean_exchanges, futures_exchanges):
             logger.error("거래소 초기화 실패!")
             return
         
         # 헤징 봇 생성
-        self.bot = HedgeBot(self.korean_exchange, self.futures_exchange)
+        self.order_journal = OrderJournal()
+        self.state_store = StateStore()
+        self.bot = HedgeBot(
+            self.korean_exchange, self.futures_exchange, self.market_registry,
+            self.order_journal, self.state_store
+        )
         
-        # 심볼 추가 및 검증
+        # 심볼 추가 및 검증 (일괄 처리)
         logger.info("거래 페어 확인 시작")
-        verified_count = 0
+        added_symbols = self.bot.add_symbols(symbols, self.profiler)
         for symbol in symbols:
-            if self.bot.add_symbol(symbol):
-                verified_count += 1
+            if symbol in added_symbols:
                 logger.info(f"{symbol} 추가됨")
             else:
                 logger.error(f"{symbol} 추가 실패")
         
-        if verified_count == 0:
+        if not added_symbols:
             logger.error("거래 가능한 심볼이 없습니다.")
             return
         
-        logger.info(f"거래 준비 완료 - 심볼: {', '.join(self.bot.symbols)}, 한국 거래소: {korean_exchange}, 선물 거래소: {futures_exchange}")
+        # 심볼별 주문 제한 정보 (백그라운드)
+        for korean_venue in self.korean_venues:
+            self.market_registry.refresh_limits(
+                korean_venue, [f"{symbol}/KRW" for symbol in self.bot.symbols], background=True
+            )
+        
+        self.profiler.report()
+        
+        logger.info(f"거래 준비 완료 - 심볼: {', '.join(self.bot.symbols)}, 한국 거래소: {', '.join(korean_exchanges)}, 선물 거래소: {', '.join(futures_exchanges)}")
         logger.info(f"설정 - 최대 포지션: ${settings.MAX_POSITION_USD}, 포지션 증가 단위: ${settings.POSITION_INCREMENT_USD}, 타이머: {settings.STAGE_TIMER_MINUTES}분, 확인 간격: {settings.MAIN_LOOP_INTERVAL}초")
         
         logger.info("봇 실행 시작")
@@ -151,6 +210,9 @@ class RedflagHedgeBot:
             logger.info("사용자가 봇을 종료했습니다.")
         except Exception as e:
             logger.error(f"예상치 못한 오류: {e}")
+        finally:
+            self.order_journal.close()
+            self.state_store.close()
 
 
 if __name__ == "__main__":
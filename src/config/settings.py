@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, List
 
 @dataclass
 class Settings:
@@ -28,9 +28,17 @@ class Settings:
     MIN_ORDER_SIZES: Dict[str, float] = field(default_factory=lambda: {
         'upbit': 5.0,     # 5,000 KRW ≈ $5
         'bithumb': 5.0,   # 5,000 KRW ≈ $5
-        'gateio': 10.0    # $10 USD
+        'gateio': 10.0,   # $10 USD
+        'binance': 5.0    # $5 USDT (MIN_NOTIONAL)
     })
     
+    # 선물 거래소 설정 (첫 번째가 주 거래소, 2개 이상이면 헤지 분할)
+    FUTURES_VENUES: List[str] = field(default_factory=lambda: ['gateio'])
+    HEDGE_SPLIT_QUOTE_TIMEOUT: float = 1.0  # 분할용 호가 조회 제한 시간 (초), 초과 거래소는 제외
+    
+    # 한국 거래소 동시 사용 설정 (업비트 + 빗썸)
+    SPOT_ROUTE_QUOTE_TIMEOUT: float = 1.0  # 라우팅용 호가 조회 제한 시간 (초), 초과 거래소는 제외
+    
     # 재시도 설정
     MAX_FAILED_ATTEMPTS: int = 3  # 최대 실패 허용 횟수
     
@@ -39,6 +47,85 @@ class Settings:
     REBALANCE_THRESHOLD_USD: float = 15.0  # 리밸런싱 트리거 갭 (USD)
     MIN_RESIDUAL_USD: float = 5.0  # 청산 후 허용 잔여 포지션 (USD)
     
+    # 헤지 수량 솔버 설정
+    HEDGE_QUANTITY_TOLERANCE_PCT: float = 0.5  # 현물/선물 개수 허용 오차 (%)
+    HEDGE_SOLVER_SEARCH_WINDOW: int = 10  # 기준 계약수 전후 탐색 범위 (계약)
+    
+    # 분할 실행 설정 (큰 포지션 증가 단위를 현물+선물 쌍 조각으로 나눠 실행)
+    SLICED_EXECUTION_ENABLED: bool = False
+    SLICE_DEPTH_FRACTION: float = 0.5  # 조각 크기 = 한국 최우선 매도 호가 잔량 x 비율
+    SLICE_MIN_USD: float = 20.0  # 최소 조각 크기 (USD)
+    SLICE_MAX_USD: float = 200.0  # 최대 조각 크기 (USD)
+    SLICE_INTERVAL_SECONDS: float = 2.0  # 조각 사이 최소 간격 (초, 사이클마다 1조각)
+    SLICE_MAX_PREMIUM_DRIFT: float = 0.3  # 결정 시점 대비 허용 프리미엄 악화 (%p), 초과 시 중단
+    
+    # 슬리피지 상한 (포지션 구축 시 양쪽 지정가 IOC - 보호 가격 밖 잔량은 취소)
+    SLIPPAGE_PROTECTION_ENABLED: bool = False
+    MAX_SLIPPAGE_BPS: float = 30.0  # 주문 직전 호가 대비 허용 슬리피지 (bp)
+    
+    # 실행 방식 ('taker': 양쪽 시장가, 'maker': 선물 숏 post-only 지정가 후 체결분만큼 현물 매수)
+    EXECUTION_MODE: str = 'taker'
+    MAKER_MAX_WAIT_SECONDS: float = 30.0  # 메이커 주문 최대 대기 시간 (초), 지나면 남은 주문 취소
+    MAKER_POLL_INTERVAL_SECONDS: float = 0.5  # 주문 체결 확인 간격 (초)
+    MAKER_COUNTDOWN_SECONDS: int = 10  # 거래소 자동 취소 타이머 (초), 봇 응답이 끊기면 미체결 주문 취소
+    MAKER_MAX_REPRICE_PCT: float = 0.2  # 최초 주문 가격 대비 정정 허용 폭 (%)
+    
+    # 선물 일괄 주문 (Gate.io create_batch_futures_order)
+    FUTURES_BATCH_ENABLED: bool = False  # 켜면 같은 사이클에서 동시에 실행되는 선물 주문을 배치로 묶음
+    FUTURES_BATCH_WINDOW_SECONDS: float = 0.05  # 배치 수집 창 (초)
+    
+    # 주문 실행 우선순위 큐 (전체 청산 > 부분 청산 > 균형 조정 > 진입)
+    EXECUTION_MAX_CONCURRENCY: int = 4  # 사이클 안에서 동시에 실행할 주문 작업 수
+    EXECUTION_MAX_PER_VENUE: int = 3  # 거래소별 동시 주문 작업 수
+    EXECUTION_RESERVED_EXIT_SLOTS: int = 1  # 청산 전용으로 비워둘 슬롯 수 (진입/균형 조정은 사용 불가)
+    EXECUTION_MAX_PENDING_ENTRIES: int = 8  # 대기 중인 진입 작업 상한 (초과분은 다음 사이클로 연기)
+    
+    # 요청 제한 시간 - 사이클 데드라인이 모든 거래소 호출까지 전달되고,
+    # 호출마다 엔드포인트 예산과 남은 시간 중 작은 값을 HTTP 타임아웃으로 사용
+    CYCLE_DEADLINE_SECONDS: float = 120.0  # 한 사이클 전체 제한 시간
+    HEDGE_DEADLINE_SECONDS: float = 30.0  # 양쪽 주문 1쌍 제한 시간 (넘기면 결과 미확인 → reconcile)
+    QUOTE_TIMEOUT_SECONDS: float = 3.0  # 시세/호가 조회
+    ACCOUNT_TIMEOUT_SECONDS: float = 5.0  # 잔고/포지션/주문 조회
+    ORDER_TIMEOUT_SECONDS: float = 5.0  # 주문 제출/취소 (응답이 없으면 클라이언트 ID로 조회 후 재제출)
+    ORDER_SUBMIT_RETRIES: int = 2  # 미접수가 확인된 주문 재제출 횟수
+    ORDER_LOOKUP_DELAY_SECONDS: float = 0.2  # 응답 없는 주문 조회 전 대기 (체결 엔진 반영)
+    
+    # 공개 시세 GET 헤지 요청 (1차 요청이 엔드포인트 p90 안에 응답이 없으면 복제 요청 1건, 먼저 온 응답 사용)
+    # 멱등 시세 조회 전용 - 주문/계정 요청에는 적용되지 않음
+    HEDGED_REQUESTS_ENABLED: bool = False
+    HEDGED_REQUEST_MAX_RATIO: float = 0.1  # 복제 요청 예산 (전체 요청 대비 비율)
+    HEDGED_REQUEST_MAX_WORKERS: int = 16  # 거래소별 헤지 요청 스레드 수
+    
+    # 거래소 서킷 브레이커 (거래소 x 엔드포인트 그룹별) - open이면 시세/계정 요청 즉시 실패,
+    # 주문은 청산을 위해 항상 전송, 성능 저하 거래소에는 신규 진입 보류
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_WINDOW_SIZE: int = 20  # 오류율/지연 계산에 쓰는 최근 호출 수
+    CIRCUIT_MIN_CALLS: int = 5  # open 판단에 필요한 최소 호출 수
+    CIRCUIT_ERROR_RATE: float = 0.5  # open 오류율 (5xx, 429, 타임아웃/연결 오류)
+    CIRCUIT_SLOW_CALL_SECONDS: float = 2.0  # 느린 호출 기준 (초)
+    CIRCUIT_SLOW_CALL_RATE: float = 0.8  # open 느린 호출 비율
+    CIRCUIT_OPEN_SECONDS: float = 30.0  # open 유지 시간 (초), 지나면 half_open
+    CIRCUIT_HALF_OPEN_PROBES: int = 2  # half_open 시험 요청 수 (모두 성공하면 closed)
+    
+    # 호가 나이 제한 - 거래소 시계 오프셋으로 환산한 호가 시각 기준, 한 쪽이라도 넘으면 프리미엄 계산 안 함
+    # (거래소 시각 호가는 오프셋 불확실성만큼 제한을 늘려 비교)
+    MAX_QUOTE_AGE_SECONDS: float = 2.0  # 0이면 확인 안 함
+    CLOCK_SYNC_INTERVAL_SECONDS: float = 60.0  # 서버 시각 API 재동기화 주기 (초), 0이면 시작 시 한 번만
+    
+    # 시작 설정
+    STARTUP_MAX_WORKERS: int = 8  # 심볼 온보딩 동시 처리 스레드 수
+    
+    # 주문 선기록 저널 - 주문 전 의도를 fsync, 재시작 시 미완료 주문 심볼은 reconcile 후 거래 재개
+    ORDER_JOURNAL_FILE: str = 'order_journal.jsonl'  # 빈 문자열이면 기록 안 함
+    
+    # 상태 저장소 - 포지션 가치/이익 실현 타이머/실패 횟수를 재시작 후에도 유지
+    STATE_DB_FILE: str = 'hedge_state.db'  # SQLite (WAL), 빈 문자열이면 메모리에만
+    STATE_VERIFY_RESTORED_POSITIONS: bool = True  # 복원한 포지션은 첫 사이클에 실제 잔고/포지션으로 확인
+    
+    # 마켓 정보 캐시 설정
+    MARKET_CACHE_FILE: str = 'market_cache.json'  # 마켓 메타데이터 캐시 파일
+    MARKET_CACHE_TTL_MINUTES: int = 360  # 캐시 유효 시간 (분)
+    
     # 로깅 설정
     LOG_LEVEL: str = 'INFO'
     LOG_FILE: str = 'redflag_hedge.log'
@@ -1,6 +1,10 @@
 """핵심 모듈"""
 from .hedge_bot import HedgeBot
 from .premium_calculator import PremiumCalculator
-from .order_executor import OrderExecutor
+from .order_executor import HedgeFill, OrderExecutor
+from .sliced_executor import SliceReport, SlicedExecutor
+from .maker_executor import MakerHedgeExecutor
+from .execution_scheduler import ExecutionPriority, ExecutionScheduler
 
-__all__ = ['HedgeBot', 'PremiumCalculator', 'OrderExecutor']
\ No newline at end of file
+__all__ = ['HedgeBot', 'PremiumCalculator', 'OrderExecutor', 'HedgeFill', 'SlicedExecutor', 'SliceReport',
+           'MakerHedgeExecutor', 'ExecutionPriority', 'ExecutionScheduler']
\ No newline at end of file
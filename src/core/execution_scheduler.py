@@ -0,0 +1,148 @@
+"""
+주문 실행 스케줄러 - 우선순위 큐 (전체 청산 > 부분 청산 > 균형 조정 > 진입) + 동시 실행 제한
+"""
+import heapq
+import itertools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+from src.utils.deadline import bind
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionPriority(IntEnum):
+    """주문 작업 우선순위 (값이 작을수록 먼저 실행)"""
+    CLOSE_ALL = 0
+    CLOSE_PARTIAL = 1
+    REBALANCE = 2
+    BUILD = 3
+
+    @property
+    def is_exit(self) -> bool:
+        """청산 작업 여부 (전용 슬롯 사용 가능)"""
+        return self <= ExecutionPriority.CLOSE_PARTIAL
+
+
+@dataclass(order=True)
+class _Task:
+    """대기 중인 주문 작업 (우선순위, 제출 순서로 정렬)"""
+    priority: ExecutionPriority
+    sequence: int
+    symbol: str = field(compare=False)
+    action: Callable[[], None] = field(compare=False)
+    venues: Tuple[str, ...] = field(compare=False)
+
+
+class ExecutionScheduler:
+    """사이클 안의 주문 작업을 우선순위대로 실행
+
+    - cycle() 안에서 submit된 작업은 우선순위 큐에 들어가고 슬롯이 나는 대로 바로 실행
+      (cycle() 종료 시 대기/실행 중인 작업이 모두 끝날 때까지 대기)
+    - 전체 동시 실행은 max_concurrency, 거래소별 동시 실행은 max_per_venue로 제한
+    - 진입/균형 조정은 reserved_exit_slots만큼 슬롯을 비워둠 - 진입이 몰려도 청산은 바로 시작
+    - 대기 중인 진입이 max_pending_entries건이면 새 진입 거부 (호출 측에서 다음 사이클로 연기)
+    - cycle() 밖에서 submit하면 호출 스레드에서 바로 실행
+    """
+
+    def __init__(self, max_concurrency: int, max_per_venue: int,
+                 reserved_exit_slots: int = 1, max_pending_entries: int = 8):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_venue = max(1, max_per_venue)
+        self.reserved_exit_slots = max(0, min(reserved_exit_slots, self.max_concurrency - 1))
+        self.max_pending_entries = max_pending_entries
+
+        self._queue: List[_Task] = []
+        self._sequence = itertools.count()
+        self._running = 0
+        self._venue_running: Dict[str, int] = {}
+        self._active = False
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='execution')
+
+    @contextmanager
+    def cycle(self) -> Iterator['ExecutionScheduler']:
+        """작업 수집/실행 구간 - 빠져나갈 때 모든 작업 완료 대기"""
+        with self._cond:
+            self._active = True
+        try:
+            yield self
+        finally:
+            with self._cond:
+                while self._queue or self._running:
+                    self._cond.wait()
+                self._active = False
+
+    def submit(self, symbol: str, priority: ExecutionPriority, action: Callable[[], None],
+               venues: Sequence[str] = ()) -> bool:
+        """작업 제출 - 진입 대기열이 가득 차면 False (역압)"""
+        with self._cond:
+            if self._active:
+                if priority == ExecutionPriority.BUILD and self.pending_entries >= self.max_pending_entries:
+                    logger.warning(
+                        f"{symbol} 진입 대기열 포화 ({self.pending_entries}건) - 다음 사이클로 연기"
+                    )
+                    return False
+                # 제출한 스레드의 데드라인을 실행 스레드로 전달
+                task = _Task(priority, next(self._sequence), symbol, bind(action), tuple(venues))
+                heapq.heappush(self._queue, task)
+                self._launch_ready()
+                return True
+
+        self._execute(symbol, action)
+        return True
+
+    @property
+    def pending_entries(self) -> int:
+        """대기 중인 진입 작업 수"""
+        return sum(1 for task in self._queue if task.priority == ExecutionPriority.BUILD)
+
+    def _launch_ready(self) -> None:
+        """슬롯이 남는 작업을 우선순위 순서로 시작 (락 보유 상태에서 호출)"""
+        launched = []
+        for task in sorted(self._queue):
+            if self._has_slot(task):
+                self._running += 1
+                for venue in task.venues:
+                    self._venue_running[venue] = self._venue_running.get(venue, 0) + 1
+                launched.append(task)
+
+        if not launched:
+            return
+        for task in launched:
+            self._queue.remove(task)
+        heapq.heapify(self._queue)
+        for task in launched:
+            self._pool.submit(self._run, task)
+
+    def _has_slot(self, task: _Task) -> bool:
+        """전체/거래소별 슬롯 여유 확인 (청산이 아니면 전용 슬롯 제외)"""
+        reserved = 0 if task.priority.is_exit else self.reserved_exit_slots
+        if self._running >= self.max_concurrency - reserved:
+            return False
+        venue_limit = max(1, self.max_per_venue - reserved)
+        return all(self._venue_running.get(venue, 0) < venue_limit for venue in task.venues)
+
+    def _run(self, task: _Task) -> None:
+        """작업 실행 후 슬롯 반환, 대기 작업 시작"""
+        try:
+            self._execute(task.symbol, task.action)
+        finally:
+            with self._cond:
+                self._running -= 1
+                for venue in task.venues:
+                    self._venue_running[venue] -= 1
+                self._launch_ready()
+                self._cond.notify_all()
+
+    @staticmethod
+    def _execute(symbol: str, action: Callable[[], None]) -> None:
+        try:
+            action()
+        except Exception as e:
+            logger.error(f"{symbol} 주문 작업 실패: {e}")
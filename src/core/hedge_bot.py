@@ -2,15 +2,28 @@
 헤징 봇 핵심 로직
 """
 import logging
-from typing import List, Dict, Set, Tuple
+import threading
+from typing import List, Dict, Set, Tuple, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from src.config import settings
 from src.core.premium_calculator import PremiumCalculator
 from src.core.order_executor import OrderExecutor
+from src.core.maker_executor import MakerHedgeExecutor
+from src.core.sliced_executor import SlicedExecutor
+from src.core.execution_scheduler import ExecutionPriority, ExecutionScheduler
 from src.core.position_balancer import PositionBalancer
 from src.managers.position_manager import PositionManager
 from src.managers.timer_manager import TimerManager
+from src.managers.residual_ledger import ResidualLedger
+from src.managers.order_journal import OrderJournal
+from src.managers.state_store import StateStore
+from src.exchanges.clock_sync import clock_sync
+from src.exchanges.health import exchange_health
+from src.exchanges.multi_venue import MultiVenueFuturesExchange, MultiVenueSpotExchange
+from src.utils.startup_profiler import StartupProfiler
+from src.utils.deadline import deadline_scope
 
 logger = logging.getLogger(__name__)
 
@@ -18,82 +31,189 @@ logger = logging.getLogger(__name__)
 class HedgeBot:
     """레드플래그 헤징 봇"""
     
-    def __init__(self, korean_exchange, futures_exchange):
+    def __init__(self, korean_exchange, futures_exchange, market_registry=None,
+                 order_journal: Optional[OrderJournal] = None, state_store: Optional[StateStore] = None):
         # Validate exchanges are not None
         if korean_exchange is None or futures_exchange is None:
             raise ValueError("Both korean_exchange and futures_exchange must be provided")
         
         self.korean_exchange = korean_exchange
         self.futures_exchange = futures_exchange
+        # 마켓 레지스트리가 있으면 심볼 검증을 시세 조회 대신 집합 조회로 처리
+        self.market_registry = market_registry
         
         # 심볼 리스트
         self.symbols: List[str] = []
         
-        # 관리자 초기화
-        self.position_manager = PositionManager()
-        self.timer_manager = TimerManager()
+        # 관리자 초기화 (포지션 가치/타이머/실패 횟수는 상태 저장소에서 복원)
+        self.state_store = state_store or StateStore('')
+        self.position_manager = PositionManager(self.state_store)
+        self.timer_manager = TimerManager(self.state_store)
+        self.residual_ledger = ResidualLedger()
         self.premium_calculator = PremiumCalculator(korean_exchange, futures_exchange)
-        self.order_executor = OrderExecutor(korean_exchange, futures_exchange)
+        self.order_executor = OrderExecutor(
+            korean_exchange, futures_exchange, self.residual_ledger, order_journal
+        )
+        # 이전 실행에서 완료되지 않은 주문 - 실제 잔고/포지션 확인 전까지 새 주문 보류
+        self.order_executor.reconcile_symbols.update(self.order_executor.journal.incomplete_symbols())
+        # 포지션 구축 주문 실행기 (메이커 모드면 선물 post-only 후 체결분 현물 매수)
+        self.hedge_executor = (
+            MakerHedgeExecutor(self.order_executor) if settings.EXECUTION_MODE == 'maker'
+            else self.order_executor
+        )
+        self.sliced_executor = SlicedExecutor(self.hedge_executor, self.premium_calculator, korean_exchange)
         self.position_balancer = PositionBalancer(
             self.position_manager, 
             self.order_executor,
             korean_exchange,
-            futures_exchange
+            futures_exchange,
+            self.residual_ledger
         )
         
-        # 실패 추적
+        # 한국 거래소 여러 곳 사용 시 거래소별 현물 보유량은 PositionManager가 관리
+        self.multi_spot_venue = isinstance(korean_exchange, MultiVenueSpotExchange)
+        if self.multi_spot_venue:
+            korean_exchange.add_fill_listener(self.position_manager.set_spot_venue_amount)
+        
+        # 실패 추적 (이전 실행 값은 심볼 등록 시 복원)
         self.failed_attempts: Dict[str, int] = {}
+        self._restored_failures = self.state_store.load_failures()
+        
+        # 주문 작업 우선순위 실행 (청산이 진입 뒤에 줄 서지 않도록)
+        self.execution_scheduler = ExecutionScheduler(
+            settings.EXECUTION_MAX_CONCURRENCY,
+            settings.EXECUTION_MAX_PER_VENUE,
+            settings.EXECUTION_RESERVED_EXIT_SLOTS,
+            settings.EXECUTION_MAX_PENDING_ENTRIES
+        )
+        self.execution_venues = (korean_exchange.exchange_id, futures_exchange.exchange_id)
+        # 서킷 브레이커 상태를 확인할 거래소 (여러 거래소 묶음은 모두 저하돼야 진입 보류)
+        self.health_venue_groups = (self._venue_ids(korean_exchange), self._venue_ids(futures_exchange))
+        
+        # 시계 오프셋 마지막 동기화 시각 (시작 시 거래소 생성과 함께 동기화)
+        self._clock_synced_at = clock_sync.clock()
         
         # 진행중인 주문 추적 (중복 방지)
         self.orders_in_progress: Set[Tuple[str, str]] = set()
+        # 주문 작업은 실행 스케줄러 스레드에서 돌므로 실패 횟수/진행 중 주문/심볼 목록 변경은 락 안에서
+        self._state_lock = threading.RLock()
     
     def add_symbol(self, symbol: str) -> bool:
         """심볼 추가 및 검증"""
+        return symbol in self.add_symbols([symbol])
+    
+    def add_symbols(self, symbols: List[str], profiler: Optional[StartupProfiler] = None) -> List[str]:
+        """
+        여러 심볼 추가 및 검증
+        
+        심볼 검증은 공통 마켓 집합 조회로, 기존 포지션은 잔고/포지션 일괄 조회로 처리하고
+        네트워크 호출이 필요한 단계는 제한된 스레드 풀에서 동시에 실행.
+        상태 저장소에 포지션이 있는 심볼은 저장된 값으로 바로 등록
+        (STATE_VERIFY_RESTORED_POSITIONS면 첫 사이클에 실제 잔고/포지션으로 확인)
+        
+        Returns:
+            추가된 심볼 리스트 (입력 순서 유지)
+        """
+        profiler = profiler or StartupProfiler()
+        try:
+            with ThreadPoolExecutor(max_workers=settings.STARTUP_MAX_WORKERS) as executor:
+                with profiler.stage('validation'):
+                    tradable = list(executor.map(self._is_tradable, symbols))
+                valid_symbols = [symbol for symbol, ok in zip(symbols, tradable) if ok]
+                if not valid_symbols:
+                    return []
+                
+                # 기존 포지션 확인 (저장된 값이 없는 심볼만 일괄 조회)
+                with profiler.stage('position_discovery'):
+                    restored = self.position_manager.restored_values
+                    existing_values = {symbol: restored[symbol] for symbol in valid_symbols if symbol in restored}
+                    discover = [symbol for symbol in valid_symbols if symbol not in restored]
+                    if discover:
+                        existing_values.update(self.position_manager.get_existing_positions_bulk(
+                            discover, self.korean_exchange, self.futures_exchange
+                        ))
+                    if self.multi_spot_venue:
+                        self.position_manager.sync_spot_venues(
+                            valid_symbols, self.korean_exchange.get_venue_balances()
+                        )
+                
+                # 새로 조회한 기존 포지션만 초기 균형 확인 (복원한 포지션은 첫 사이클에 reconcile)
+                with profiler.stage('initial_rebalance'):
+                    held = [symbol for symbol in discover if existing_values.get(symbol, 0.0) > 0]
+                    list(executor.map(self._initial_rebalance, held))
+                if settings.STATE_VERIFY_RESTORED_POSITIONS:
+                    self.order_executor.reconcile_symbols.update(
+                        symbol for symbol in valid_symbols if restored.get(symbol, 0.0) > 0
+                    )
+            
+            return [
+                symbol for symbol in valid_symbols
+                if self._register_symbol(symbol, existing_values.get(symbol, 0.0))
+            ]
+            
+        except Exception as e:
+            logger.error(f"심볼 추가 실패: {e}")
+            return []
+    
+    def _is_tradable(self, symbol: str) -> bool:
+        """양쪽 거래소 모두 거래 가능한 심볼인지 확인"""
+        if self.market_registry is not None:
+            universe = self.market_registry.get_symbol_universe(
+                self.korean_exchange.exchange_id, self.futures_exchange.exchange_id
+            )
+            if universe:
+                if symbol not in universe:
+                    logger.error(
+                        f"{symbol}은 {self.korean_exchange.exchange_id} KRW 마켓과 "
+                        f"{self.futures_exchange.exchange_id} USDT 무기한 계약에 모두 상장되어 있지 않음"
+                    )
+                    return False
+                logger.info(f"거래 페어 확인됨: {symbol}/KRW와 {symbol}/USDT:USDT")
+                return True
+        
+        # 마켓 정보가 없으면 시세 조회로 확인
         try:
-            # 한국 거래소 확인
-            korean_ticker = self.korean_exchange.get_ticker(f"{symbol}/KRW")
+            korean_ticker = self.korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
             if not korean_ticker:
                 logger.error(f"{symbol}/KRW를 {self.korean_exchange.exchange_id}에서 찾을 수 없음")
                 return False
             
-            # 선물 거래소 확인
-            futures_ticker = self.futures_exchange.get_ticker(f"{symbol}/USDT:USDT")
+            futures_ticker = self.futures_exchange.get_best_bid_ask(f"{symbol}/USDT:USDT")
             if not futures_ticker:
                 logger.error(f"{symbol}/USDT:USDT를 {self.futures_exchange.exchange_id}에서 찾을 수 없음")
                 return False
             
             logger.info(f"거래 페어 확인됨: {symbol}/KRW와 {symbol}/USDT:USDT")
+            return True
             
-            # 기존 포지션 확인
-            existing_value = self.position_manager.get_existing_positions(
-                symbol, self.korean_exchange, self.futures_exchange
-            )
-            
+        except Exception as e:
+            logger.error(f"{symbol} 거래 페어 확인 실패: {e}")
+            return False
+    
+    def _initial_rebalance(self, symbol: str) -> None:
+        """기존 포지션 초기 균형 체크 및 자동 리밸런싱 (임계값 이하 갭은 장부에 이월)"""
+        try:
+            if self.position_balancer.rebalance_position(symbol):
+                logger.info(f"✅ {symbol} 초기 균형 확인 완료")
+            else:
+                logger.error(f"❌ {symbol} 초기 리밸런싱 실패 - 수동 확인 필요")
+        except Exception as e:
+            logger.error(f"{symbol} 초기 리밸런싱 실패: {e}")
+    
+    def _register_symbol(self, symbol: str, existing_value: float) -> bool:
+        """검증된 심볼 등록"""
+        try:
             # 포지션 설정
-            position = self.position_manager.get_position(symbol)
-            position.value_usd = existing_value
+            self.position_manager.set_value(symbol, existing_value)
             
             if existing_value > 0:
                 logger.info(f"📊 기존 {symbol} 포지션 발견: ${existing_value:.2f}")
-                
-                # 초기 균형 체크 및 자동 리밸런싱
-                balance = self.position_balancer.check_position_balance(symbol)
-                if balance and balance.needs_rebalancing:
-                    logger.warning(
-                        f"⚠️ {symbol} 초기 헤지 불균형 감지! "
-                        f"갭: ${balance.gap_usd:.2f}"
-                    )
-                    logger.info(f"🔄 자동 리밸런싱 시작...")
-                    if self.position_balancer.rebalance_position(symbol):
-                        logger.info(f"✅ {symbol} 초기 리밸런싱 완료")
-                    else:
-                        logger.error(f"❌ {symbol} 초기 리밸런싱 실패 - 수동 확인 필요")
             
-            # 타이머 초기화
+            # 타이머 초기화 (저장된 쿨다운 복원)
             self.timer_manager.initialize_symbol(symbol)
             
-            # 실패 카운터 초기화
-            self.failed_attempts[symbol] = 0
+            # 실패 카운터 초기화 (저장된 값 복원)
+            self.failed_attempts[symbol] = self._restored_failures.pop(symbol, 0)
             
             # 심볼 추가
             self.symbols.append(symbol)
@@ -111,6 +231,11 @@ class HedgeBot:
             if self._is_order_in_progress(symbol):
                 return
             
+            # 결과 미확인 주문이 있으면 실제 잔고/포지션 확인이 끝날 때까지 새 주문 보류
+            if symbol in self.order_executor.reconcile_symbols:
+                self._schedule(symbol, ExecutionPriority.REBALANCE, lambda: self._reconcile_symbol(symbol))
+                return
+            
             # 프리미엄 계산
             premium = self.premium_calculator.calculate(symbol)
             if premium is None:
@@ -120,11 +245,22 @@ class HedgeBot:
             position = self.position_manager.get_position(symbol)
             
             # 상태 출력
-            self._print_status(symbol, premium, position.value_usd)
+            self._print_status(symbol, premium, position.value_usd, position.spot_venues)
+            
+            # 분할 실행 중이면 다음 조각만 (조각 사이 대기는 작업 밖에서 - 사이클마다 1조각)
+            if self.sliced_executor.has_active(symbol):
+                if self.sliced_executor.is_due(symbol) and not self._degraded_venues():
+                    self._schedule(symbol, ExecutionPriority.BUILD, lambda: self._continue_slices(symbol, premium))
+                return
             
             # 포지션 구축 확인
             if self._should_build_position(premium, position.value_usd):
-                self._build_position(symbol)
+                # 상태 저하 거래소에는 신규 진입 보류 (청산은 계속 허용)
+                degraded = self._degraded_venues()
+                if degraded:
+                    logger.warning(f"⚠️ {symbol} 진입 보류 - 거래소 상태 저하: {', '.join(degraded)}")
+                    return
+                self._schedule(symbol, ExecutionPriority.BUILD, lambda: self._build_position(symbol, premium))
             
             # 이익 실현 확인
             elif position.value_usd > 0:
@@ -140,8 +276,8 @@ class HedgeBot:
             position_value < settings.MAX_POSITION_USD
         )
     
-    def _build_position(self, symbol: str) -> None:
-        """포지션 구축"""
+    def _build_position(self, symbol: str, premium: Optional[float] = None) -> None:
+        """포지션 구축 (premium: 진입 결정 프리미엄, 있으면 분할 실행 가능)"""
         increment = self.position_manager.get_position_increment(
             symbol, settings.MAX_POSITION_USD, settings.POSITION_INCREMENT_USD
         )
@@ -152,26 +288,51 @@ class HedgeBot:
             return
         
         order_key = (symbol, 'hedge')
-        self.orders_in_progress.add(order_key)
+        self._begin_order(order_key)
         
         try:
-            success = self.order_executor.execute_hedge_position(symbol, increment)
+            if premium is not None and self.sliced_executor.should_slice(increment):
+                # 첫 조각만 실행 - 남은 조각은 다음 사이클부터 하나씩 (체결된 만큼 포지션 반영)
+                report = self.sliced_executor.start(symbol, increment, premium)
+                increment = report.executed_usd
+                success = increment > 0
+            else:
+                fill = self.hedge_executor.execute_hedge(symbol, increment)
+                success = fill is not None
+                if success:
+                    # 지정가 IOC/메이커 주문이 일부만 체결되면 체결된 만큼만 포지션 반영
+                    increment *= fill.filled_ratio
             
             if success:
                 self.position_manager.update_position(symbol, increment)
                 logger.info(f"📈 {symbol} 포지션 구축: ${increment:.2f}")
-                self.failed_attempts[symbol] = 0
+                self._set_failed_attempts(symbol, 0)
                 
-                # 포지션 균형 체크 및 리밸런싱
-                balance = self.position_balancer.check_position_balance(symbol)
-                if balance and balance.needs_rebalancing:
-                    logger.info(f"🔄 {symbol} 포지션 리밸런싱 필요")
-                    self.position_balancer.rebalance_position(symbol)
+                # 포지션 균형 체크 - 누적 갭이 임계값을 넘을 때만 보정 주문
+                self._schedule(symbol, ExecutionPriority.REBALANCE,
+                               lambda: self.position_balancer.rebalance_position(symbol))
             else:
                 self._handle_failure(symbol)
                 
         finally:
-            self.orders_in_progress.discard(order_key)
+            self._end_order(order_key)
+    
+    def _continue_slices(self, symbol: str, premium: float) -> None:
+        """분할 실행 다음 조각 (첫 조각 이후 실패는 중단만 - 실패 횟수에 넣지 않음)"""
+        order_key = (symbol, 'hedge')
+        self._begin_order(order_key)
+        
+        try:
+            item = self.sliced_executor.execute_next(symbol, premium)
+            if item is None:
+                return
+            increment = item.requested_usd * item.fill.filled_ratio
+            self.position_manager.update_position(symbol, increment)
+            logger.info(f"📈 {symbol} 포지션 구축 (조각 {item.index}): ${increment:.2f}")
+            self._schedule(symbol, ExecutionPriority.REBALANCE,
+                           lambda: self.position_balancer.rebalance_position(symbol))
+        finally:
+            self._end_order(order_key)
     
     def _check_profit_taking(self, symbol: str, premium: float, position_value: float) -> None:
         """이익 실현 확인"""
@@ -189,20 +350,45 @@ class HedgeBot:
             target_premium, close_percentage = result
             
             if close_percentage == 100:
-                self._close_all_position(symbol, premium)
+                self._schedule(symbol, ExecutionPriority.CLOSE_ALL,
+                               lambda: self._close_all_position(symbol, premium))
             else:
-                self._close_partial_position(symbol, close_percentage, position_value, target_premium)
+                self._schedule(symbol, ExecutionPriority.CLOSE_PARTIAL, lambda: self._close_partial_position(
+                    symbol, close_percentage, position_value, target_premium
+                ))
+    
+    @staticmethod
+    def _venue_ids(exchange) -> List[str]:
+        """거래소 ID 목록 (여러 거래소 묶음이면 구성 거래소 전체)"""
+        if isinstance(exchange, (MultiVenueSpotExchange, MultiVenueFuturesExchange)):
+            return list(exchange.venues)
+        return [exchange.exchange_id]
+    
+    def _degraded_venues(self) -> List[str]:
+        """서킷이 closed가 아닌 거래소 (묶음은 모든 거래소가 저하된 경우만)"""
+        degraded = []
+        for venue_ids in self.health_venue_groups:
+            if all(exchange_health.is_degraded(venue_id) for venue_id in venue_ids):
+                degraded.extend(venue_ids)
+        return degraded
+    
+    def get_health(self) -> Dict[str, Dict[str, Dict]]:
+        """거래소 x 엔드포인트 그룹별 서킷 상태 (모니터링용)"""
+        return exchange_health.snapshot()
+    
+    def _schedule(self, symbol: str, priority: ExecutionPriority, action) -> bool:
+        """주문 작업 제출 (사이클 중이면 우선순위 큐, 아니면 바로 실행) - 대기열 포화 시 False"""
+        return self.execution_scheduler.submit(symbol, priority, action, self.execution_venues)
     
     def _close_all_position(self, symbol: str, premium: float) -> None:
         """전체 포지션 청산"""
         order_key = (symbol, 'close_100')
-        self.orders_in_progress.add(order_key)
+        self._begin_order(order_key)
         
         try:
+            # 빠른 경로: 계좌 스냅샷의 현물 수량 매도 + 선물 포지션 전체 청산 주문을 바로 전송
             position = self.position_manager.get_position(symbol)
-            success = self.order_executor.close_position_percentage(
-                symbol, 100, position.value_usd
-            )
+            success = self.order_executor.close_all_position(symbol, position.spot_amount)
             
             if success:
                 logger.info(f"🎯 {symbol} 전체 포지션 청산! 프리미엄: {premium:.2f}%")
@@ -211,11 +397,13 @@ class HedgeBot:
                 
                 self._cleanup_symbol(symbol)
             else:
+                # 스냅샷이 어긋났을 수 있으므로 다음 시도는 잔고 조회 후 매도
+                position.spot_amount = 0.0
                 logger.error(f"❌ {symbol} 전체 청산 실패. 다음 사이클에 재시도.")
                 self._handle_failure(symbol)
                 
         finally:
-            self.orders_in_progress.discard(order_key)
+            self._end_order(order_key)
     
     def _close_partial_position(
         self, symbol: str, close_percentage: float, 
@@ -223,7 +411,7 @@ class HedgeBot:
     ) -> None:
         """부분 포지션 청산"""
         order_key = (symbol, f'close_{close_percentage}')
-        self.orders_in_progress.add(order_key)
+        self._begin_order(order_key)
         
         try:
             # 타이머 먼저 설정 (중복 주문 방지)
@@ -242,55 +430,136 @@ class HedgeBot:
                 logger.info(f"💰 {symbol} {close_percentage}% 이익 실현!")
                 
                 # 부분 청산 후 균형 조정
-                self.position_balancer.balance_after_close(symbol, close_percentage)
+                self._schedule(symbol, ExecutionPriority.REBALANCE,
+                               lambda: self.position_balancer.balance_after_close(symbol, close_percentage))
                 
-                self.failed_attempts[symbol] = 0
+                self._set_failed_attempts(symbol, 0)
             else:
                 # 실패시 타이머 복원
                 if old_timer:
-                    self.timer_manager.stage_timers[symbol][target_premium] = old_timer
+                    self.timer_manager.restore_timer(symbol, target_premium, old_timer)
                 logger.error(f"❌ {symbol} {target_premium}% 이익 실패. 재시도.")
                 self._handle_failure(symbol)
                 
         finally:
-            self.orders_in_progress.discard(order_key)
+            self._end_order(order_key)
+    
+    def _reconcile_symbol(self, symbol: str) -> None:
+        """결과 미확인 주문 확인 - 저널의 클라이언트 주문 ID로 거래소에서 주문 결과를 조회해
+        체결 수량 차이를 보정 (조회할 수 없는 주문이 있으면 실제 잔고/포지션으로 헤지 균형 복구)"""
+        order_key = (symbol, 'reconcile')
+        self._begin_order(order_key)
+        
+        try:
+            gap = self.order_executor.recover_orders(symbol)
+            if gap is not None:
+                # 주문 결과 확인 완료 - 남은 갭은 장부로 보정 (보정 실패 시 다음 확인은 잔고 기준)
+                self.order_executor.journal.resolve_symbol(symbol)
+                recovered = self.position_balancer.correct_gap(symbol, gap)
+            else:
+                logger.warning(f"⚠️ {symbol} 주문 조회로 확인 불가 - 실제 잔고/포지션으로 확인")
+                recovered = self.position_balancer.rebalance_position(symbol)
+            
+            # 헤지된 포지션 가치 (갭 보정 후 현물/선물 중 작은 쪽)
+            values = self.position_manager.get_existing_positions_bulk(
+                [symbol], self.korean_exchange, self.futures_exchange
+            )
+            self.position_manager.set_value(symbol, values.get(symbol, 0.0))
+            
+            if recovered:
+                self.order_executor.reconcile_symbols.discard(symbol)
+                self.order_executor.journal.resolve_symbol(symbol)
+                logger.info(f"✅ {symbol} 미확인 주문 확인 완료 - 포지션 ${values.get(symbol, 0.0):.2f}")
+            else:
+                logger.error(f"❌ {symbol} 미확인 주문 확인 실패. 다음 사이클에 재시도.")
+                
+        finally:
+            self._end_order(order_key)
+    
+    def _sync_clocks(self) -> None:
+        """CLOCK_SYNC_INTERVAL_SECONDS마다 서버 시각 API로 시계 오프셋 재측정
+
+        시작 시 표본만 쓰면 시계 drift만큼 호가 시각 환산이 어긋남
+        (Date 헤더/응답 본문 시각으로 추정하는 거래소는 조회할 때마다 표본이 쌓임)
+        """
+        interval = settings.CLOCK_SYNC_INTERVAL_SECONDS
+        now = clock_sync.clock()
+        if not interval or now - self._clock_synced_at < interval:
+            return
+        self._clock_synced_at = now
+        for exchange in (self.futures_exchange, self.korean_exchange):
+            try:
+                exchange.sync_clock()
+            except Exception as e:
+                logger.warning(f"{exchange.exchange_id} 시계 동기화 실패: {e}")
     
     def _cleanup_symbol(self, symbol: str) -> None:
         """심볼 정리"""
-        self.symbols.remove(symbol)
+        self.sliced_executor.cancel(symbol, "심볼 청산")
+        with self._state_lock:
+            self.symbols.remove(symbol)
+            self.failed_attempts.pop(symbol, None)
         self.position_manager.remove_position(symbol)
         self.timer_manager.remove_symbol(symbol)
-        
-        if symbol in self.failed_attempts:
-            del self.failed_attempts[symbol]
+        self.residual_ledger.remove_symbol(symbol)
+        self.state_store.delete_failures(symbol)
+    
+    def _set_failed_attempts(self, symbol: str, count: int) -> None:
+        """실패 횟수 갱신 (상태 저장소에도 기록)"""
+        with self._state_lock:
+            self.failed_attempts[symbol] = count
+            self.state_store.save_failures(symbol, count)
     
     def _handle_failure(self, symbol: str) -> None:
         """실패 처리"""
-        self.failed_attempts[symbol] = self.failed_attempts.get(symbol, 0) + 1
+        with self._state_lock:
+            count = self.failed_attempts.get(symbol, 0) + 1
+            self._set_failed_attempts(symbol, count)
         
-        if self.failed_attempts[symbol] >= settings.MAX_FAILED_ATTEMPTS:
+        if count >= settings.MAX_FAILED_ATTEMPTS:
             logger.critical(f"{symbol} 다중 실패! 수동 확인 필요.")
     
+    def _begin_order(self, order_key: Tuple[str, str]) -> None:
+        with self._state_lock:
+            self.orders_in_progress.add(order_key)
+    
+    def _end_order(self, order_key: Tuple[str, str]) -> None:
+        with self._state_lock:
+            self.orders_in_progress.discard(order_key)
+    
     def _is_order_in_progress(self, symbol: str) -> bool:
         """주문 진행중 확인"""
-        for order_key in self.orders_in_progress:
-            if order_key[0] == symbol:
-                logger.warning(f"{symbol} 주문이 이미 진행중")
-                return True
-        return False
+        with self._state_lock:
+            in_progress = any(order_key[0] == symbol for order_key in self.orders_in_progress)
+        if in_progress:
+            logger.warning(f"{symbol} 주문이 이미 진행중")
+        return in_progress
     
     
-    def _print_status(self, symbol: str, premium: float, position_value: float) -> None:
+    def _print_status(
+        self, symbol: str, premium: float, position_value: float,
+        spot_venues: Optional[Dict[str, float]] = None
+    ) -> None:
         """상태 출력"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        logger.info(f"[{timestamp}] {symbol} 프리미엄: {premium:.2f}% | 포지션: ${position_value:.2f}")
+        status = f"[{timestamp}] {symbol} 프리미엄: {premium:.2f}% | 포지션: ${position_value:.2f}"
+        if spot_venues:
+            status += " | 현물: " + ', '.join(f"{venue} {amount:.8g}" for venue, amount in spot_venues.items())
+        logger.info(status)
     
     def run_cycle(self) -> bool:
         """한 사이클 실행"""
         try:
             # 모든 심볼 처리
-            for symbol in self.symbols.copy():  # copy()로 안전하게 순회
-                self.process_symbol(symbol)
+            with self._state_lock:
+                symbols = self.symbols.copy()  # copy()로 안전하게 순회
+            # 심볼별 판단은 순서대로, 판단에서 나온 주문 작업은 우선순위 큐로 동시 실행
+            # (사이클 끝에서 모두 완료 대기, 선물 일괄 주문 사용 시 같은 사이클의 선물 주문이 한 배치로 묶임)
+            # 사이클 데드라인은 모든 거래소 호출의 HTTP 타임아웃 상한
+            with deadline_scope(settings.CYCLE_DEADLINE_SECONDS), self.execution_scheduler.cycle():
+                self._sync_clocks()
+                for symbol in symbols:
+                    self.process_symbol(symbol)
             
             # 모든 심볼이 청산되었는지 확인
             return len(self.symbols) > 0
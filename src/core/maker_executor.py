@@ -0,0 +1,252 @@
+"""
+메이커 실행 모듈 - 선물 숏을 post-only 지정가로 걸어두고 체결된 만큼 현물 매수
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from src.config import settings
+from src.core.order_executor import HedgeFill, OrderExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class MakerHedgeExecutor:
+    """선물 메이커 + 현물 테이커 헤지 실행기
+
+    - 선물 숏을 최우선 매도 호가에 post-only로 주문 (스프레드/메이커 리베이트 확보)
+    - 주문 상태를 MAKER_POLL_INTERVAL_SECONDS마다 조회해 새로 체결된 계약만큼 즉시 현물 매수
+    - 최우선 매도 호가가 내려가면 주문 가격 정정 (최초 가격 대비 MAKER_MAX_REPRICE_PCT까지)
+    - 거래소 자동 취소 타이머(countdown)를 폴링마다 재설정 - 봇이 멈추면 미체결 주문이 자동 취소됨
+    - MAKER_MAX_WAIT_SECONDS가 지나면 남은 주문 취소 후 체결된 만큼만 헤지
+    - 이월된 잔여 갭은 현물 매수 수량에서 상쇄하고, 끝난 뒤 실제 갭을 잔여 갭 장부에 기록
+    - 주문 전 저널에 의도를 기록 - 진행 중 프로세스가 죽으면 재시작 시 reconcile 대상
+
+    OrderExecutor와 같은 execute_hedge / execute_hedge_position 인터페이스를 제공하며,
+    maker_orders 역량이 없는 선물 거래소에서는 OrderExecutor로 그대로 위임
+    """
+
+    def __init__(self, order_executor: OrderExecutor, sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.order_executor = order_executor
+        self.korean_exchange = order_executor.korean_exchange
+        self.futures_exchange = order_executor.futures_exchange
+        self.sleep = sleep
+        self.clock = clock
+
+        capabilities = self.futures_exchange.capabilities
+        self.enabled = capabilities.maker_orders and capabilities.contract_sizing
+        if not self.enabled:
+            logger.warning(
+                f"{self.futures_exchange.exchange_id}: post-only 주문 미지원 - 메이커 모드 대신 시장가 실행"
+            )
+
+    def execute_hedge_position(self, symbol: str, amount_usd: float) -> bool:
+        """헤지 포지션 실행 - 성공 여부"""
+        return self.execute_hedge(symbol, amount_usd) is not None
+
+    def execute_hedge(self, symbol: str, amount_usd: float) -> Optional[HedgeFill]:
+        """헤지 포지션 실행 - 체결된 만큼의 HedgeFill 반환 (체결 없으면 None)"""
+        if not self.enabled:
+            return self.order_executor.execute_hedge(symbol, amount_usd)
+
+        futures_symbol = f"{symbol}/USDT:USDT"
+        try:
+            prices = self.order_executor.get_prices(symbol)
+            quote = self.futures_exchange.get_best_bid_ask(futures_symbol)
+            if not prices or not quote or not quote.get('ask'):
+                logger.error(f"{symbol} 메이커 주문 가격 조회 실패")
+                return None
+            krw_ask_price, _, usdt_krw_rate = prices
+            maker_price = quote['ask']
+
+            contract_size = self.futures_exchange.get_contract_size(futures_symbol)
+            carry_quantity = self.order_executor.residual_ledger.get_gap(symbol)
+            hedge = self.order_executor.quantity_solver.solve(
+                amount_usd, maker_price, contract_size, krw_ask_price, usdt_krw_rate,
+                carry_quantity=carry_quantity
+            )
+            if hedge is None:
+                return None
+        except Exception as e:
+            logger.error(f"{symbol} 메이커 헤지 준비 실패: {e}")
+            return None
+
+        # 체결분 현물 매수가 끝날 때까지 잔고 예약
+        with self.order_executor.reserve_balances(hedge.spot_order_amount, hedge.notional_usd) as reserved:
+            if not reserved:
+                return None
+            journal = self.order_executor.journal
+            intent = journal.begin(
+                symbol, 'maker_open', futures_quantity=hedge.contracts, futures_price=maker_price,
+                carry_quantity=carry_quantity
+            )
+            try:
+                fill = self._work_order(
+                    symbol, hedge.contracts, contract_size, maker_price, usdt_krw_rate, carry_quantity, intent
+                )
+            except Exception:
+                # 체결/매수 진행 상황을 알 수 없음 - 실제 잔고/포지션 확인 전까지 새 주문 보류
+                self.order_executor.reconcile_symbols.add(symbol)
+                raise
+            journal.complete(intent)
+            return fill
+
+    def _work_order(self, symbol: str, contracts: int, contract_size: float, maker_price: float,
+                    usdt_krw_rate: float, carry_quantity: float, intent: int) -> Optional[HedgeFill]:
+        """post-only 주문을 체결/정정/취소하며 체결분 현물 헤지"""
+        futures_symbol = f"{symbol}/USDT:USDT"
+        state = _MakerState(contracts, contract_size, maker_price, maker_price, gap=carry_quantity)
+
+        self.futures_exchange.countdown_cancel(futures_symbol, settings.MAKER_COUNTDOWN_SECONDS)
+        order = self.futures_exchange.create_post_only_order(futures_symbol, 'sell', contracts, maker_price)
+        if not order:
+            # post-only 거부 (호가가 바로 체결될 위치) 등 - 걸린 주문 없음
+            self.futures_exchange.countdown_cancel(futures_symbol, 0)
+            return None
+        self.order_executor.journal.record(intent, futures={'id': order.get('id'), 'status': 'open'})
+
+        deadline = self.clock() + settings.MAKER_MAX_WAIT_SECONDS
+        try:
+            while True:
+                self._hedge_new_fills(symbol, state, order)
+                if state.failed or state.remaining <= 0 or order.get('status') == 'finished':
+                    break
+                if self.clock() >= deadline:
+                    logger.info(f"{symbol} 메이커 주문 대기 시간 초과 - 남은 {state.remaining}계약 취소")
+                    break
+
+                self.sleep(settings.MAKER_POLL_INTERVAL_SECONDS)
+                self.futures_exchange.countdown_cancel(futures_symbol, settings.MAKER_COUNTDOWN_SECONDS)
+                order = self._reprice(symbol, order, state) or order
+                order = self.futures_exchange.get_order(futures_symbol, order['id']) or order
+        finally:
+            if order.get('status') != 'finished':
+                cancelled = self.futures_exchange.cancel_order(futures_symbol, order['id'])
+                if cancelled:
+                    self._hedge_new_fills(symbol, state, cancelled)
+            self._flush_pending(symbol, state)
+            self.futures_exchange.countdown_cancel(futures_symbol, 0)
+
+        self.order_executor.journal.record(
+            intent, futures={'id': order.get('id'), 'filled': state.filled, 'hedged': state.hedged},
+            spot=state.spot_quantity
+        )
+        if state.gap != carry_quantity:
+            # 이월 갭 상쇄 / 최소 주문 미만 자투리 / 되돌리지 못한 체결분을 반영한 실제 갭
+            self.order_executor.residual_ledger.record(symbol, state.gap, state.order_price)
+
+        if state.hedged <= 0:
+            return None
+        notional_usd = state.hedged * contract_size * state.krw_price / usdt_krw_rate
+        logger.info(
+            f"메이커 헤지 완료: {state.spot_quantity:.8f} {symbol} = {state.hedged}/{contracts} contracts "
+            f"@ {state.order_price} (${notional_usd:.2f}, 잔여 갭 {state.gap:+.8f})"
+        )
+        return HedgeFill(
+            symbol, state.spot_quantity, state.hedged, notional_usd,
+            state.krw_price, state.order_price, usdt_krw_rate,
+            filled_ratio=state.hedged / contracts
+        )
+
+    def _reprice(self, symbol: str, order: Dict, state: '_MakerState') -> Optional[Dict]:
+        """최우선 매도 호가가 주문 가격보다 내려가면 따라서 정정"""
+        futures_symbol = f"{symbol}/USDT:USDT"
+        quote = self.futures_exchange.get_best_bid_ask(futures_symbol)
+        new_price = quote.get('ask') if quote else None
+        if not new_price or new_price >= state.order_price:
+            return None
+
+        floor_price = state.initial_price * (1 - settings.MAKER_MAX_REPRICE_PCT / 100)
+        if new_price < floor_price:
+            logger.info(f"{symbol} 선물 호가 하락 폭 초과 ({new_price} < {floor_price:.6f}) - 정정 중단")
+            return None
+
+        amended = self.futures_exchange.amend_order(futures_symbol, order['id'], new_price)
+        if amended:
+            state.order_price = new_price
+        return amended
+
+    def _hedge_new_fills(self, symbol: str, state: '_MakerState', order: Dict) -> None:
+        """새로 체결된 계약만큼 현물 매수 (최소 주문 금액 미만이면 모았다가 매수)"""
+        new_contracts = int(order.get('filled') or 0) - state.filled
+        if new_contracts <= 0:
+            return
+        state.filled += new_contracts
+        state.pending += new_contracts
+        if state.failed:
+            # 현물 매수가 이미 실패한 뒤 취소 전에 들어온 체결도 되돌림
+            self._unwind(symbol, state, "현물 헤지 중단 후 추가 체결")
+            return
+        self._buy_pending(symbol, state, force=False)
+
+    def _flush_pending(self, symbol: str, state: '_MakerState') -> None:
+        """종료 시 남은 미헤지 체결분 처리"""
+        if state.pending and not state.failed:
+            self._buy_pending(symbol, state, force=True)
+
+    def _buy_pending(self, symbol: str, state: '_MakerState', force: bool) -> None:
+        """모인 체결 계약만큼 현물 시장가 매수 (남은 갭 상쇄) - 실패 시 해당 선물 숏 되돌리기"""
+        coins = state.pending * state.contract_size
+        quantity = self.order_executor.round_spot_quantity(max(coins - state.gap, 0.0))
+        quote = self.korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
+        if not quote or not quote.get('ask'):
+            self._unwind(symbol, state, "한국 거래소 호가 조회 실패")
+            return
+        state.krw_price = quote['ask']
+
+        krw_amount = quantity * quote['ask']
+        min_order_krw = self.korean_exchange.get_min_order_krw(f"{symbol}/KRW")
+        if quantity > 0 and krw_amount < min_order_krw:
+            if not force:
+                return
+            # 최소 주문 미만 자투리는 사지 않고 선물 초과 갭으로 이월 (체결된 숏은 헤지 포지션에 포함)
+            logger.info(f"{symbol} 메이커 체결 자투리 {quantity:.8f}개 잔여 갭으로 이월")
+            quantity = 0.0
+
+        if quantity > 0:
+            amount = krw_amount if self.order_executor.spot_buys_by_amount else quantity
+            order = self.korean_exchange.create_market_order(f"{symbol}/KRW", 'buy', amount)
+            if not order:
+                self._unwind(symbol, state, "현물 매수 실패")
+                return
+
+        state.spot_quantity += quantity
+        state.gap += quantity - coins
+        state.hedged += state.pending
+        logger.info(f"{symbol} 메이커 체결 {state.pending}계약 → 현물 {quantity:.8f}개 매수")
+        state.pending = 0
+
+    def _unwind(self, symbol: str, state: '_MakerState', reason: str) -> None:
+        """현물을 못 산 선물 체결분을 시장가로 되사고 남은 주문 처리 중단"""
+        logger.error(f"{symbol} {reason} - 선물 {state.pending}계약 되돌리기")
+        state.failed = True
+        result = self.order_executor.place_futures_order(
+            f"{symbol}/USDT:USDT", 'buy', state.pending, True
+        )
+        if not result:
+            logger.critical(f"{symbol} 선물 {state.pending}계약 미헤지 상태! 수동 확인 필요")
+            state.gap -= state.pending * state.contract_size
+        state.pending = 0
+
+
+@dataclass
+class _MakerState:
+    """메이커 주문 진행 상태 (계약 단위)"""
+    contracts: int
+    contract_size: float
+    initial_price: float
+    order_price: float
+    filled: int = 0  # 선물 체결 계약
+    pending: int = 0  # 체결됐지만 아직 현물 매수 전인 계약
+    hedged: int = 0  # 현물 매수까지 끝난 계약
+    spot_quantity: float = 0.0  # 매수한 현물 개수
+    krw_price: float = 0.0  # 마지막 현물 매수 기준 ask
+    gap: float = 0.0  # 현물 - 선물 갭 (이월분 포함, 매수 때마다 상쇄)
+    failed: bool = False
+
+    @property
+    def remaining(self) -> int:
+        """미체결 계약"""
+        return self.contracts - self.filled
@@ -2,18 +2,83 @@
 주문 실행 모듈
 """
 import logging
-from typing import Dict, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+
+from src.config import settings
+from src.core.quantity_solver import HedgeQuantitySolver
+from src.exchanges.order_ids import new_client_order_id, with_client_order_id
+from src.managers.order_journal import OrderJournal
+from src.managers.residual_ledger import ResidualLedger
+from src.utils.deadline import Deadline, bind, deadline_scope
 
 logger = logging.getLogger(__name__)
 
+# 주문 조회 결과로 갭을 계산하는 작업 (현물-선물 체결 수량 차이의 부호) - 전체 청산/메이커 주문은 잔고로 확인
+RECOVERY_GAP_SIGNS = {'open': 1, 'close': -1}
+# 클라이언트 주문 ID 조회로 접수 여부를 확인하지 못한 주문
+LOOKUP_UNKNOWN = 'unknown'
+
+
+@dataclass
+class HedgeFill:
+    """체결된 헤지 주문 (현물 매수 + 선물 숏 1쌍)"""
+    symbol: str
+    spot_quantity: float  # 현물 예상 체결 개수
+    futures_size: float  # 선물 주문 수량 (계약 단위 거래소는 계약 수)
+    notional_usd: float  # 실제 USD 가치 (KRW 기준)
+    krw_ask_price: float  # 주문 기준 한국 ask
+    futures_bid_price: float  # 주문 기준 선물 bid
+    usdt_krw_rate: float  # 주문 기준 USDT/KRW
+    filled_ratio: float = 1.0  # 요청 수량 대비 체결 비율 (지정가 IOC 잔량/메이커 미체결 시 1 미만)
+    
+    @property
+    def premium(self) -> float:
+        """주문 기준 호가의 김치 프리미엄 (%) - PremiumCalculator와 같은 식"""
+        return ((self.krw_ask_price / self.usdt_krw_rate) / self.futures_bid_price - 1) * 100
+
 
 class OrderExecutor:
     """주문 실행을 담당하는 클래스"""
     
-    def __init__(self, korean_exchange, futures_exchange):
+    def __init__(self, korean_exchange, futures_exchange, residual_ledger: Optional[ResidualLedger] = None,
+                 journal: Optional[OrderJournal] = None):
         self.korean_exchange = korean_exchange
         self.futures_exchange = futures_exchange
+        self.residual_ledger = residual_ledger or ResidualLedger()
+        # 주문 의도 선기록 (없으면 메모리에만 - 재시작 복구 없음)
+        self.journal = journal or OrderJournal('')
+        # 주문 결과를 알 수 없게 된 심볼 (실제 잔고/포지션으로 확인 전까지 새 주문 보류)
+        self.reconcile_symbols: Set[str] = set()
+        # 진행 중인 진입 주문이 예약한 금액 (동시 주문이 같은 잔고를 중복 사용하지 않도록)
+        self._balance_lock = threading.Lock()
+        self._reserved_krw = 0.0
+        self._reserved_usd = 0.0
+        
+        # 거래소 역량에 따른 주문 전략을 생성 시 한 번만 결정
+        spot_capabilities = korean_exchange.capabilities
+        self.quantity_solver = HedgeQuantitySolver(spot_capabilities)
+        self.round_spot_quantity = spot_capabilities.round_quantity
+        self.floor_spot_quantity = spot_capabilities.floor_quantity
+        self.spot_buys_by_amount = spot_capabilities.quote_amount_buys
+        self.futures_in_contracts = futures_exchange.capabilities.contract_sizing
+        # 선물 주문 (symbol, side, size, reduce_only) - size는 계약 단위 거래소면 계약 수, 아니면 코인 개수
+        self.place_futures_order = (
+            self._place_contract_order if self.futures_in_contracts else self._place_quantity_order
+        )
+        # 슬리피지 상한: 양쪽 모두 지정가 IOC를 지원하고 선물이 계약 단위일 때만
+        self.slippage_protected = settings.SLIPPAGE_PROTECTION_ENABLED and (
+            spot_capabilities.limit_ioc_orders and futures_exchange.capabilities.limit_ioc_orders
+            and self.futures_in_contracts
+        )
+        if settings.SLIPPAGE_PROTECTION_ENABLED and not self.slippage_protected:
+            logger.warning("지정가 IOC 미지원 거래소 - 슬리피지 상한 없이 시장가 주문")
+        self.korean_min_usd = settings.MIN_ORDER_SIZES.get(korean_exchange.exchange_id.lower(), 0)
+        self.futures_min_usd = settings.MIN_ORDER_SIZES.get(futures_exchange.exchange_id.lower(), 0)
     
     def execute_hedge_position(self, symbol: str, amount_usd: float) -> bool:
         """
@@ -26,68 +91,239 @@ class OrderExecutor:
         Returns:
             성공 여부
         """
+        return self.execute_hedge(symbol, amount_usd) is not None
+    
+    def execute_hedge(self, symbol: str, amount_usd: float) -> Optional[HedgeFill]:
+        """헤지 포지션 실행 - 체결 정보 반환 (실패 시 None)"""
         try:
             # 가격 정보 조회
-            prices = self._get_prices(symbol)
+            prices = self.get_prices(symbol)
             if not prices:
-                return False
+                return None
             
             krw_ask_price, futures_bid_price, usdt_krw_rate = prices
             
-            # 1단계: 대략적인 수량 계산
-            approx_quantity = amount_usd / futures_bid_price
-            
-            # 2단계: Gate.io 정수 계약수 계산
-            futures_contracts = self._calculate_futures_quantity(symbol, approx_quantity)
-            if futures_contracts is None:
-                return False
-            
-            # 3단계: Gate.io 계약수에서 실제 코인 개수 역산
+            # 양쪽 주문 단위를 모두 만족하는 수량 계산
             markets = self.futures_exchange.get_markets()
             futures_symbol = f"{symbol}/USDT:USDT"
             contract_size = markets.get(futures_symbol, {}).get('contract_size', 1)
-            exact_quantity = futures_contracts * contract_size
             
-            # 빗썸은 4자리 반올림 (API 자동거래)
-            if self.korean_exchange.exchange_id.lower() == 'bithumb':
-                exact_quantity = round(exact_quantity, 4)
+            # 이월된 잔여 갭은 이번 증분에서 상쇄
+            carry_quantity = self.residual_ledger.get_gap(symbol)
             
-            # 4단계: 정확한 금액 재계산
-            krw_amount = exact_quantity * krw_ask_price
-            actual_usd_value = krw_amount / usdt_krw_rate
+            hedge = self.quantity_solver.solve(
+                amount_usd, futures_bid_price, contract_size, krw_ask_price, usdt_krw_rate,
+                carry_quantity=carry_quantity
+            )
+            if hedge is None:
+                return None
             
-            # 금액 차이 로깅
-            diff_percent = abs(actual_usd_value - amount_usd) / amount_usd * 100
+            futures_contracts = hedge.contracts
+            exact_quantity = hedge.spot_quantity
+            krw_amount = hedge.spot_order_amount
+            actual_usd_value = hedge.notional_usd
             
             logger.info(
                 f"헤지 수량 조정: 요청 ${amount_usd:.2f} → 실제 ${actual_usd_value:.2f} "
-                f"(차이 {diff_percent:.1f}%)"
+                f"(차이 {hedge.deviation_pct:.1f}%)"
             )
             logger.info(
                 f"완벽한 헤지: {exact_quantity:.8f} {symbol} = "
-                f"{futures_contracts} contracts (계약크기: {contract_size})"
-            )
-            
-            # 잔고 확인 (조정된 금액으로)
-            if not self._check_balances(krw_amount, actual_usd_value):
-                return False
-            
-            # 동시 주문 실행 (정확히 같은 수량)
-            success = self._execute_concurrent_orders(
-                symbol, exact_quantity, futures_contracts, 'open'
+                f"{futures_contracts} contracts (계약크기: {contract_size}, "
+                f"수량 차이: {hedge.mismatch_pct:.3f}%)"
             )
             
-            if success:
+            # 잔고 확인 후 주문이 끝날 때까지 예약 (조정된 금액으로)
+            with self.reserve_balances(krw_amount, actual_usd_value) as reserved:
+                if not reserved:
+                    return None
+                
+                if self.slippage_protected:
+                    return self._execute_protected_hedge(
+                        symbol, hedge, contract_size, carry_quantity,
+                        krw_ask_price, futures_bid_price, usdt_krw_rate
+                    )
+                
+                # 동시 주문 실행 (정확히 같은 수량)
+                placed = self._execute_concurrent_orders(
+                    symbol, exact_quantity, futures_contracts, 'open', spot_amount=krw_amount
+                )
+                
+                if placed is None:
+                    return None
+                
+                # 선물이 일부만 주문되면 (분할 주문 조각 실패 등) 현물 초과분을 잔여 갭에 기록
+                residual = hedge.residual_quantity + (futures_contracts - placed) * contract_size
+                self.residual_ledger.record(symbol, residual, futures_bid_price)
                 logger.info(
                     f"완벽한 헤지 포지션 실행: {exact_quantity:.8f} {symbol} = "
-                    f"{futures_contracts} contracts (${actual_usd_value:.2f})"
+                    f"{placed} contracts (${actual_usd_value:.2f})"
+                )
+                return HedgeFill(
+                    symbol, exact_quantity, placed, actual_usd_value,
+                    krw_ask_price, futures_bid_price, usdt_krw_rate
                 )
-            
-            return success
             
         except Exception as e:
             logger.error(f"헤지 포지션 실행 실패: {e}")
+            return None
+    
+    def _execute_protected_hedge(
+        self, symbol: str, hedge, contract_size: float, carry_quantity: float,
+        krw_ask_price: float, futures_bid_price: float, usdt_krw_rate: float
+    ) -> Optional[HedgeFill]:
+        """양쪽 지정가 IOC 헤지 - 보호 가격 밖 잔량은 취소되고 체결분만 반영
+        
+        체결 수량 차이는 잔여 갭 장부에 기록해 다음 주문/리밸런싱에서 보정
+        """
+        spot_symbol = f"{symbol}/KRW"
+        futures_symbol = f"{symbol}/USDT:USDT"
+        bps = settings.MAX_SLIPPAGE_BPS
+        spot_price = self.korean_exchange.protected_price(spot_symbol, 'buy', krw_ask_price, bps)
+        futures_price = self.futures_exchange.protected_price(futures_symbol, 'sell', futures_bid_price, bps)
+        
+        intent, client_ids = self._begin_legs(
+            symbol, 'open', spot_quantity=hedge.spot_quantity, spot_price=spot_price,
+            futures_quantity=hedge.contracts, futures_price=futures_price
+        )
+        spot_result, futures_result, unknown = self._run_legs(
+            symbol,
+            partial(self.korean_exchange.create_limit_ioc_order, spot_symbol, 'buy', hedge.spot_quantity, spot_price),
+            partial(self.futures_exchange.create_contract_order,
+                    futures_symbol, 'sell', hedge.contracts, False, futures_price),
+            intent, client_ids
+        )
+        if unknown:
+            return None
+        
+        spot_filled = float(spot_result.get('filled') or 0) if spot_result else 0.0
+        contracts_filled = int(futures_result.get('filled') or 0) if futures_result else 0
+        
+        if spot_filled <= 0 or contracts_filled <= 0:
+            logger.error(
+                f"{symbol} 보호 가격 내 체결 부족 (현물 {spot_filled:.8f} @ {spot_price:,.4f}, "
+                f"선물 {contracts_filled} contracts @ {futures_price})"
+            )
+            # 한쪽만 체결되면 체결된 만큼 시장가로 되돌림
+            self._handle_partial_execution(
+                symbol, spot_filled, contracts_filled,
+                spot_result if spot_filled > 0 else None,
+                futures_result if contracts_filled > 0 else None, 'open'
+            )
+            self.journal.complete(intent)
+            return None
+        
+        if spot_filled < hedge.spot_quantity or contracts_filled < hedge.contracts:
+            logger.warning(
+                f"{symbol} 슬리피지 상한으로 일부만 체결: 현물 {spot_filled:.8f}/{hedge.spot_quantity:.8f}, "
+                f"선물 {contracts_filled}/{hedge.contracts} contracts"
+            )
+        
+        residual = carry_quantity + spot_filled - contracts_filled * contract_size
+        self.residual_ledger.record(symbol, residual, futures_bid_price)
+        self.journal.complete(intent)
+        logger.info(
+            f"보호 가격 헤지 실행: {spot_filled:.8f} {symbol} = {contracts_filled} contracts "
+            f"(잔여 갭 {residual:+.8f})"
+        )
+        return HedgeFill(
+            symbol, spot_filled, contracts_filled, spot_filled * krw_ask_price / usdt_krw_rate,
+            krw_ask_price, futures_bid_price, usdt_krw_rate,
+            filled_ratio=min(spot_filled / hedge.spot_quantity, 1.0)
+        )
+    
+    def close_all_position(self, symbol: str, spot_quantity: Optional[float] = None) -> bool:
+        """
+        전체 포지션 청산 빠른 경로 - 조회 없이 선물 포지션 청산 주문과 현물 매도를 바로 동시 전송
+        
+        Args:
+            symbol: 심볼
+            spot_quantity: 계좌 스냅샷의 현물 매도 가능 수량 (하한값, 없으면 잔고 조회 후 매도)
+            
+        Returns:
+            양쪽 모두 성공 여부
+        """
+        # 선물은 계약 수 계산 없이 포지션 전체 청산 주문
+        intent, client_ids = self._begin_legs(symbol, 'close_all', spot_quantity=spot_quantity)
+        spot_sold, futures_result, unknown = self._run_legs(
+            symbol,
+            partial(self._sell_all_spot, symbol, spot_quantity),
+            partial(self.futures_exchange.close_position, f"{symbol}/USDT:USDT"),
+            intent, client_ids
+        )
+        if unknown:
+            return False
+        
+        # 청산 주문이 거부되면 (이전 시도에서 이미 청산된 경우 등) 포지션이 남았는지 확인
+        futures_closed = bool(futures_result) or not self._has_futures_position(symbol)
+        if not futures_closed:
+            logger.critical(f"{symbol} 선물 포지션 전체 청산 실패! 수동 확인 필요")
+        if not spot_sold:
+            logger.critical(f"{symbol} 현물 전량 매도 실패! 수동 확인 필요")
+        
+        success = futures_closed and spot_sold
+        self.journal.complete(intent)
+        if success:
+            self.residual_ledger.remove_symbol(symbol)
+            logger.info(f"{symbol} 전체 청산 주문 완료 (현물 스냅샷 {spot_quantity or 0:.8f}개)")
+        return success
+    
+    def _has_futures_position(self, symbol: str) -> bool:
+        """선물 포지션 보유 여부 (조회 실패 시 보유로 간주)"""
+        try:
+            positions = self.futures_exchange.get_positions()
+        except Exception as e:
+            logger.error(f"{symbol} 선물 포지션 조회 실패: {e}")
+            return True
+        if positions is None:
+            logger.error(f"{symbol} 선물 포지션 조회 실패 - 청산 여부 확인 불가")
+            return True
+        return any(position['symbol'] == f"{symbol}/USDT:USDT" for position in positions)
+    
+    def _sell_all_spot(self, symbol: str, spot_quantity: Optional[float]) -> bool:
+        """현물 전량 매도 - 스냅샷 수량 우선 (거절되면 잔고 재조회 후 1회 재시도)
+
+        스냅샷은 하한값으로만 사용: 스냅샷 이후 리밸런싱 등으로 늘어난 현물은
+        매도 후 남은 잔고를 다시 조회해 정리
+        """
+        spot_symbol = f"{symbol}/KRW"
+        if spot_quantity:
+            if self.korean_exchange.create_market_order(
+                spot_symbol, 'sell', self.floor_spot_quantity(spot_quantity)
+            ):
+                return self._sweep_remaining_spot(symbol)
+            logger.warning(f"{symbol} 스냅샷 수량 매도 실패 - 잔고 재조회 후 재시도")
+        
+        balance = self.korean_exchange.get_balance(symbol)
+        if balance is None:
+            logger.error(f"{symbol} 현물 잔고 조회 실패 - 매도 여부 확인 불가")
             return False
+        quantity = self.floor_spot_quantity(balance.get('free', 0))
+        if quantity <= 0:
+            logger.info(f"{symbol} 매도할 현물 없음")
+            return True
+        return bool(self.korean_exchange.create_market_order(spot_symbol, 'sell', quantity))
+    
+    def _sweep_remaining_spot(self, symbol: str) -> bool:
+        """스냅샷 매도 후 남은 현물 매도 (최소 주문 금액 미만 잔량은 무시)"""
+        spot_symbol = f"{symbol}/KRW"
+        balance = self.korean_exchange.get_balance(symbol)
+        if balance is None:
+            # 확인 불가 - 남은 현물이 헤지 없이 방치되지 않도록 실패 처리 (다음 시도는 잔고 조회 후 매도)
+            logger.error(f"{symbol} 스냅샷 매도 후 잔고 조회 실패")
+            return False
+        
+        quantity = self.floor_spot_quantity(balance.get('free', 0))
+        if quantity <= 0:
+            return True
+        
+        ticker = self.korean_exchange.get_best_bid_ask(spot_symbol)
+        if ticker and quantity * ticker['bid'] < self.korean_exchange.get_min_order_krw(spot_symbol):
+            logger.info(f"{symbol} 남은 현물 {quantity:.8f}개는 최소 주문 금액 미만 - 무시")
+            return True
+        
+        logger.warning(f"{symbol} 스냅샷 이후 늘어난 현물 {quantity:.8f}개 추가 매도")
+        return bool(self.korean_exchange.create_market_order(spot_symbol, 'sell', quantity))
     
     def close_position_percentage(self, symbol: str, percentage: float, position_value_usd: float) -> bool:
         """
@@ -119,7 +355,7 @@ class OrderExecutor:
             close_amount_usd = position_value_usd * (percentage / 100)
             
             # 현재 가격으로 이상적인 수량 계산
-            futures_ticker = self.futures_exchange.get_ticker(f"{symbol}/USDT:USDT")
+            futures_ticker = self.futures_exchange.get_best_bid_ask(f"{symbol}/USDT:USDT")
             if not futures_ticker or 'bid' not in futures_ticker or 'ask' not in futures_ticker:
                 return False
             
@@ -135,9 +371,8 @@ class OrderExecutor:
                 # 부분 청산 시 계산된 수량과 보유량 중 작은 값 사용
                 quantity = min(ideal_quantity, actual_spot_quantity)
                 
-            # 빗썸은 4자리 반올림 (API 자동거래)
-            if self.korean_exchange.exchange_id.lower() == 'bithumb':
-                quantity = round(quantity, 4)
+            # 거래소 수량 정밀도에 맞춤 (빗썸 4자리)
+            quantity = self.round_spot_quantity(quantity)
             
             # 수량이 너무 작으면 중단
             if quantity < 0.00000001:
@@ -146,6 +381,9 @@ class OrderExecutor:
             
             # 선물 포지션 확인 및 수량 조정
             futures_positions = self.futures_exchange.get_positions()
+            if futures_positions is None:
+                logger.error(f"{symbol} 선물 포지션 조회 실패")
+                return False
             futures_position = None
             for pos in futures_positions:
                 if pos['symbol'] == f"{symbol}/USDT:USDT":
@@ -174,6 +412,16 @@ class OrderExecutor:
                 if futures_quantity is None:
                     return False
             
+            # 부분 청산 시 이월된 잔여 갭을 현물 수량에 반영 (현물 초과분은 더 팔고 부족분은 덜 판다)
+            carry_quantity = 0.0
+            if percentage < 100:
+                carry_quantity = self.residual_ledger.get_gap(symbol)
+                if carry_quantity:
+                    quantity = self.round_spot_quantity(
+                        min(max(quantity + carry_quantity, 0.0), actual_spot_quantity)
+                    )
+                    logger.info(f"{symbol} 잔여 갭 상쇄: {carry_quantity:+.8f}개 → 현물 {quantity:.8f}개")
+            
             logger.info(
                 f"{percentage}% 포지션 청산: {quantity:.8f} {symbol} 현물, "
                 f"{futures_quantity:.8f} 선물 (${close_amount_usd:.2f})"
@@ -182,9 +430,16 @@ class OrderExecutor:
             # 동시 주문 실행
             success = self._execute_concurrent_orders(
                 symbol, quantity, futures_quantity, 'close'
-            )
+            ) is not None
             
             if success:
+                if percentage >= 100:
+                    self.residual_ledger.remove_symbol(symbol)
+                else:
+                    markets = self.futures_exchange.get_markets()
+                    contract_size = markets.get(f"{symbol}/USDT:USDT", {}).get('contract_size', 1)
+                    residual = carry_quantity - quantity + futures_quantity * contract_size
+                    self.residual_ledger.record(symbol, residual, mid_price)
                 logger.info(
                     f"{percentage}% 포지션 청산 성공: {quantity:.4f} {symbol}"
                 )
@@ -195,12 +450,12 @@ class OrderExecutor:
             logger.error(f"포지션 청산 실패: {e}")
             return False
     
-    def _get_prices(self, symbol: str) -> Optional[Tuple[float, float, float]]:
+    def get_prices(self, symbol: str) -> Optional[Tuple[float, float, float]]:
         """현재 가격 정보 조회"""
         try:
             # 한국 거래소 가격
-            korean_ticker = self.korean_exchange.get_ticker(f"{symbol}/KRW")
-            if not korean_ticker or 'last' not in korean_ticker:
+            korean_ticker = self.korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
+            if not korean_ticker:
                 logger.error("한국 거래소 가격 조회 실패")
                 return None
             
@@ -210,7 +465,7 @@ class OrderExecutor:
             krw_ask_price = korean_ticker['ask']
             
             # 선물 거래소 가격
-            futures_ticker = self.futures_exchange.get_ticker(f"{symbol}/USDT:USDT")
+            futures_ticker = self.futures_exchange.get_best_bid_ask(f"{symbol}/USDT:USDT")
             if not futures_ticker or 'bid' not in futures_ticker:
                 logger.error("선물 거래소 bid 가격 조회 실패")
                 return None
@@ -218,7 +473,7 @@ class OrderExecutor:
             futures_bid_price = futures_ticker['bid']  # 숏 진입 시 실제 체결가
             
             # USDT/KRW 환율 (KRW를 USD로 변환 시 ask 사용)
-            usdt_krw_ticker = self.korean_exchange.get_ticker('USDT/KRW')
+            usdt_krw_ticker = self.korean_exchange.get_best_bid_ask('USDT/KRW')
             if not usdt_krw_ticker or 'ask' not in usdt_krw_ticker:
                 logger.error("USDT/KRW 환율 조회 실패")
                 return None
@@ -231,9 +486,9 @@ class OrderExecutor:
             return None
     
     def _calculate_futures_quantity(self, symbol: str, quantity: float) -> Optional[float]:
-        """선물 수량 계산 (GateIO는 계약 단위)"""
+        """선물 수량 계산 (계약 단위 거래소는 계약 수, 아니면 코인 개수)"""
         try:
-            if self.futures_exchange.exchange_id.lower() == 'gateio':
+            if self.futures_in_contracts:
                 markets = self.futures_exchange.get_markets()
                 futures_symbol = f"{symbol}/USDT:USDT"
                 
@@ -267,7 +522,7 @@ class OrderExecutor:
                     diff_percent = abs(actual_quantity - quantity) / quantity * 100
                     
                     logger.info(
-                        f"GateIO 선물: {quantity:.8f} {symbol} 요청 → "
+                        f"선물: {quantity:.8f} {symbol} 요청 → "
                         f"{contracts} contracts 주문 (실제: {actual_quantity:.8f} {symbol}, "
                         f"차이: {diff_percent:.2f}%)"
                     )
@@ -281,10 +536,8 @@ class OrderExecutor:
     
     def _check_minimum_order_size(self, actual_usd: float, target_usd: float) -> bool:
         """최소 주문 크기 확인"""
-        from src.config import settings
-        
-        korean_min = settings.MIN_ORDER_SIZES.get(self.korean_exchange.exchange_id.lower(), 0)
-        futures_min = settings.MIN_ORDER_SIZES.get(self.futures_exchange.exchange_id.lower(), 0)
+        korean_min = self.korean_min_usd
+        futures_min = self.futures_min_usd
         
         if actual_usd < korean_min:
             logger.error(f"한국 거래소 최소 주문 크기 미달: ${actual_usd:.2f} < ${korean_min}")
@@ -296,12 +549,36 @@ class OrderExecutor:
         
         return True
     
+    @contextmanager
+    def reserve_balances(self, krw_amount: float, usd_amount: float) -> Iterator[bool]:
+        """잔고 확인 후 블록이 끝날 때까지 금액 예약 - 잔고 부족이면 False
+
+        다른 스레드가 예약한 금액은 사용 가능 잔고에서 제외 (조회와 예약은 한 번에 하나씩)
+        """
+        with self._balance_lock:
+            reserved = self._check_balances(
+                krw_amount + self._reserved_krw, usd_amount + self._reserved_usd
+            )
+            if reserved:
+                self._reserved_krw += krw_amount
+                self._reserved_usd += usd_amount
+        try:
+            yield reserved
+        finally:
+            if reserved:
+                with self._balance_lock:
+                    self._reserved_krw -= krw_amount
+                    self._reserved_usd -= usd_amount
+    
     def _check_balances(self, krw_amount: float, usd_amount: float) -> bool:
         """잔고 확인"""
         try:
             # KRW 잔고 확인
             krw_balance = self.korean_exchange.get_balance('KRW')
-            if krw_balance and krw_balance.get('free', 0) < krw_amount:
+            if krw_balance is None:
+                logger.error("KRW 잔고 조회 실패")
+                return False
+            if krw_balance.get('free', 0) < krw_amount:
                 logger.error(
                     f"KRW 잔고 부족: {krw_balance.get('free', 0):,.0f} < {krw_amount:,.0f}"
                 )
@@ -322,67 +599,212 @@ class OrderExecutor:
             return True
     
     def _execute_concurrent_orders(
-        self, symbol: str, spot_quantity: float, futures_quantity: float, operation: str
-    ) -> bool:
-        """동시 주문 실행"""
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            if operation == 'open':
-                # 포지션 열기: 현물 매수 + 선물 숏
-                # Bithumb와 Upbit 모두 매수 시 KRW 금액을 받음
-                if self.korean_exchange.exchange_id.lower() in ['bithumb', 'upbit']:
+        self, symbol: str, spot_quantity: float, futures_quantity: float, operation: str,
+        spot_amount: Optional[float] = None
+    ) -> Optional[float]:
+        """동시 주문 실행
+        
+        spot_amount: 포지션 열기 시 이미 계산된 KRW 매수 금액 (없으면 현재 ask로 계산)
+        
+        Returns:
+            양쪽 주문 성공 시 주문된 선물 수량 (포지션 열기에서 일부만 주문되면 그 수량), 실패 시 None
+        """
+        if operation == 'open':
+            # 포지션 열기: 현물 매수 + 선물 숏
+            # KRW 금액으로 매수하는 거래소 (빗썸, 업비트)
+            if self.spot_buys_by_amount:
+                if spot_amount is not None:
+                    krw_amount = spot_amount
+                else:
                     # 현재 가격으로 KRW 금액 계산
-                    ticker = self.korean_exchange.get_ticker(f"{symbol}/KRW")
+                    ticker = self.korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
                     krw_amount = spot_quantity * ticker['ask']
-                    spot_future = executor.submit(
-                        self.korean_exchange.create_market_order,
-                        f"{symbol}/KRW", 'buy', krw_amount
-                    )
-                else:
-                    # 다른 거래소는 수량을 받음
-                    spot_future = executor.submit(
-                        self.korean_exchange.create_market_order,
-                        f"{symbol}/KRW", 'buy', spot_quantity
-                    )
-                # GateIO에게 이미 계약 수로 변환되었음을 알림
-                futures_params = {'from_order_executor': True} if self.futures_exchange.exchange_id.lower() == 'gateio' else None
-                futures_future = executor.submit(
-                    self.futures_exchange.create_market_order,
-                    f"{symbol}/USDT:USDT", 'sell', futures_quantity, futures_params
-                )
+                spot_call = partial(self.korean_exchange.create_market_order, f"{symbol}/KRW", 'buy', krw_amount)
             else:
-                # 포지션 닫기: 현물 매도 + 선물 숏 커버 (reduce_only 필수)
-                spot_future = executor.submit(
-                    self.korean_exchange.create_market_order,
-                    f"{symbol}/KRW", 'sell', spot_quantity
-                )
-                # GateIO에게 이미 계약 수로 변환되었음을 알림
-                futures_params = {'reduce_only': True, 'from_order_executor': True} if self.futures_exchange.exchange_id.lower() == 'gateio' else {'reduce_only': True}
-                futures_future = executor.submit(
-                    self.futures_exchange.create_market_order,
-                    f"{symbol}/USDT:USDT", 'buy', futures_quantity,
-                    futures_params  # 절대 롱 포지션 생성 방지
+                # 다른 거래소는 수량을 받음
+                spot_call = partial(self.korean_exchange.create_market_order, f"{symbol}/KRW", 'buy', spot_quantity)
+            futures_call = partial(
+                self.place_futures_order, f"{symbol}/USDT:USDT", 'sell', futures_quantity, False
+            )
+        else:
+            # 포지션 닫기: 현물 매도 + 선물 숏 커버 (reduce_only 필수)
+            spot_call = partial(self.korean_exchange.create_market_order, f"{symbol}/KRW", 'sell', spot_quantity)
+            futures_call = partial(
+                self.place_futures_order, f"{symbol}/USDT:USDT", 'buy', futures_quantity,
+                True  # 절대 롱 포지션 생성 방지
+            )
+        
+        intent, client_ids = self._begin_legs(
+            symbol, operation, spot_quantity=spot_quantity, futures_quantity=futures_quantity,
+            spot_amount=spot_amount
+        )
+        spot_result, futures_result, unknown = self._run_legs(symbol, spot_call, futures_call, intent, client_ids)
+        if unknown:
+            # 결과를 모르는 주문이 있으면 반대쪽을 되돌리지 않음 (reconcile에서 실제 상태로 보정)
+            return None
+        
+        placed = futures_quantity
+        if operation == 'open' and futures_result:
+            placed = self._placed_futures_size(futures_result, futures_quantity)
+            if placed <= 0:
+                futures_result = None
+        
+        if not spot_result or not futures_result:
+            logger.error("하나 이상의 주문 실패")
+            # 부분 실행 복구 시도
+            self._handle_partial_execution(
+                symbol, spot_quantity, futures_quantity,
+                spot_result, futures_result, operation
+            )
+            self.journal.complete(intent)
+            return None
+        
+        if placed < futures_quantity:
+            logger.warning(f"{symbol} 선물 일부만 주문: {placed}/{futures_quantity} - 부족분은 잔여 갭으로 보정")
+        self.journal.complete(intent)
+        return placed
+    
+    @staticmethod
+    def _placed_futures_size(result, requested: float) -> float:
+        """선물 주문 결과의 체결 수량 (결과에 체결 수량이 없으면 요청 수량)
+
+        분할 주문 거래소는 일부 조각만 주문되어도 주문 결과를 반환하므로 filled로 확인
+        """
+        if isinstance(result, dict) and result.get('filled') is not None:
+            return min(float(result['filled']), requested)
+        return requested
+    
+    def _begin_legs(self, symbol: str, operation: str, **details) -> Tuple[int, Dict[str, str]]:
+        """주문 의도 기록 - 양쪽 첫 주문의 클라이언트 주문 ID를 미리 정해 함께 기록
+        (재시작 후 거래소에서 주문 조회)
+        
+        Returns:
+            (intent id, {'spot', 'futures'} 클라이언트 주문 ID)
+        """
+        client_ids = {'spot': new_client_order_id(), 'futures': new_client_order_id()}
+        return self.journal.begin(symbol, operation, client_ids=client_ids, **details), client_ids
+    
+    def _run_legs(self, symbol: str, spot_call: Callable, futures_call: Callable,
+                  intent: int, client_ids: Dict[str, str]) -> Tuple[object, object, bool]:
+        """현물/선물 주문 동시 실행 - HEDGE_DEADLINE_SECONDS 데드라인을 양쪽 HTTP 호출까지 전달
+        
+        intent: 주문 전에 저널에 기록한 의도 (양쪽 결과를 이어서 기록)
+        client_ids: 의도에 기록한 클라이언트 주문 ID (각 거래소 첫 주문에 사용)
+        
+        Returns:
+            (현물 결과, 선물 결과, 결과 미확인 여부) - 미확인이면 심볼을 reconcile 대상으로 등록
+            (저널 의도는 reconcile 완료 때까지 미완료로 남음)
+        """
+        with deadline_scope(settings.HEDGE_DEADLINE_SECONDS) as deadline:
+            executor = ThreadPoolExecutor(max_workers=2)
+            try:
+                spot_future = executor.submit(bind(with_client_order_id(client_ids['spot'], spot_call)))
+                futures_future = executor.submit(bind(with_client_order_id(client_ids['futures'], futures_call)))
+                spot_result = self._leg_result(spot_future, deadline, f"{symbol} 현물")
+                futures_result = self._leg_result(futures_future, deadline, f"{symbol} 선물")
+            finally:
+                # 응답 없는 주문 스레드를 기다리지 않음 (HTTP 타임아웃이 데드라인에 묶여 곧 종료)
+                executor.shutdown(wait=False)
+        
+        self.journal.record(
+            intent, spot=self._leg_summary(spot_result), futures=self._leg_summary(futures_result),
+            unknown=deadline.unknown_orders
+        )
+        if deadline.outcome_unknown:
+            self.reconcile_symbols.add(symbol)
+            logger.critical(
+                f"{symbol} 주문 결과 미확인 ({', '.join(deadline.unknown_orders)}) - "
+                f"실제 잔고/포지션 확인 전까지 새 주문 보류"
+            )
+        return spot_result, futures_result, deadline.outcome_unknown
+    
+    def recover_orders(self, symbol: str) -> Optional[float]:
+        """미완료 의도의 주문을 클라이언트 주문 ID로 조회해 결과 기록 (재시작 또는 결과 미확인 후)
+        
+        Returns:
+            모든 주문 결과를 확인하면 그 주문들이 만든 현물-선물 갭 (코인 개수, 양수면 현물 초과),
+            확인할 수 없는 주문이 있거나 남은 의도가 없으면 None (실제 잔고/포지션으로 확인)
+        """
+        intents = self.journal.intents_for(symbol)
+        if not intents:
+            return None
+        gap = 0.0
+        recovered = True
+        for intent_id, record in intents.items():
+            client_ids = record.get('client_ids')
+            if not client_ids:
+                logger.warning(f"{symbol} 미완료 주문 ({record['operation']}, seq {intent_id})에 클라이언트 주문 ID 없음")
+                recovered = False
+                continue
+            
+            placed_at = record.get('time', 0.0)
+            legs = {
+                'spot': self._lookup_order(self.korean_exchange, f"{symbol}/KRW", client_ids['spot'], placed_at),
+                'futures': self._lookup_order(
+                    self.futures_exchange, f"{symbol}/USDT:USDT", client_ids['futures'], placed_at
                 )
+            }
+            self.journal.record(intent_id, recovered=legs)
+            logger.warning(
+                f"{symbol} 미완료 주문 조회 ({record['operation']}, seq {intent_id}): "
+                + ', '.join(f"{leg} {self._describe_lookup(found)}" for leg, found in legs.items())
+            )
             
-            try:
-                spot_result = spot_future.result(timeout=30)
-                futures_result = futures_future.result(timeout=30)
-                
-                if not spot_result or not futures_result:
-                    logger.error("하나 이상의 주문 실패")
-                    # 부분 실행 복구 시도
-                    self._handle_partial_execution(
-                        symbol, spot_quantity, futures_quantity,
-                        spot_result, futures_result, operation
-                    )
-                    return False
-                
-                return True
-                
-            except FuturesTimeoutError:
-                logger.error("주문 실행 타임아웃")
-                spot_future.cancel()
-                futures_future.cancel()
-                return False
+            sign = RECOVERY_GAP_SIGNS.get(record['operation'])
+            if sign is None or LOOKUP_UNKNOWN in legs.values():
+                recovered = False
+                continue
+            spot_filled = legs['spot']['filled'] if legs['spot'] else 0.0
+            futures_filled = legs['futures']['filled'] if legs['futures'] else 0.0
+            if self.futures_in_contracts:
+                futures_filled *= self.futures_exchange.get_contract_size(f"{symbol}/USDT:USDT")
+            gap += sign * (spot_filled - futures_filled)
+        
+        return gap if recovered else None
+    
+    @staticmethod
+    def _lookup_order(exchange, symbol: str, client_order_id: str, placed_at: float) -> object:
+        """클라이언트 주문 ID로 주문 조회 - 주문이면 {'id', 'status', 'filled'}, 미접수면 None, 확인 불가면 'unknown'"""
+        if not exchange.capabilities.client_order_lookup:
+            return LOOKUP_UNKNOWN
+        try:
+            return exchange.find_order_by_client_id(symbol, client_order_id, placed_at)
+        except Exception as e:
+            logger.error(f"{symbol} 주문 {client_order_id} 조회 실패: {e}")
+            return LOOKUP_UNKNOWN
+    
+    @staticmethod
+    def _describe_lookup(found: object) -> str:
+        if found == LOOKUP_UNKNOWN:
+            return '확인 불가'
+        if found is None:
+            return '미접수'
+        return f"접수됨 (체결 {found['filled']}, {found['status']})"
+    
+    @staticmethod
+    def _leg_summary(result) -> object:
+        """저널에 남길 주문 결과 요약 (주문 dict면 id/체결 수량, 아니면 성공 여부)"""
+        if isinstance(result, dict):
+            return {key: result.get(key) for key in ('id', 'filled', 'status')}
+        return bool(result)
+    
+    @staticmethod
+    def _leg_result(future: Future, deadline: Deadline, leg: str):
+        """주문 결과 대기 - 데드라인이 지나도 응답이 없으면 결과 미확인"""
+        try:
+            return future.result(timeout=deadline.result_timeout())
+        except FuturesTimeoutError:
+            deadline.mark_unknown(f"{leg} 주문 응답 대기 시간 초과")
+            return None
+    
+    def _place_contract_order(self, symbol: str, side: str, size: float, reduce_only: bool) -> Optional[Dict]:
+        """계약 수 기준 선물 주문 (size = 계약 수)"""
+        return self.futures_exchange.create_contract_order(symbol, side, size, reduce_only=reduce_only)
+    
+    def _place_quantity_order(self, symbol: str, side: str, size: float, reduce_only: bool) -> Optional[Dict]:
+        """코인 개수 기준 선물 주문 (size = 코인 개수)"""
+        params = {'reduce_only': True} if reduce_only else None
+        return self.futures_exchange.create_market_order(symbol, side, size, params)
     
     def _handle_partial_execution(
         self, symbol: str, spot_quantity: float, futures_quantity: float,
@@ -399,9 +821,8 @@ class OrderExecutor:
                     )
                 elif futures_result and not spot_result:
                     logger.warning("현물 주문 실패, 선물 포지션 닫기")
-                    self.futures_exchange.create_market_order(
-                        f"{symbol}/USDT:USDT", 'buy', futures_quantity,
-                        {'reduce_only': True}
+                    self.place_futures_order(
+                        f"{symbol}/USDT:USDT", 'buy', futures_quantity, True
                     )
             else:
                 logger.critical(f"포지션 청산 부분 실행! {symbol} 수동 확인 필요")
@@ -4,6 +4,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 from src.config import settings
+from src.managers.residual_ledger import ResidualLedger
 import time
 
 logger = logging.getLogger(__name__)
@@ -27,19 +28,26 @@ class PositionBalance:
 class PositionBalancer:
     """포지션 균형 관리자"""
     
-    def __init__(self, position_manager, order_executor, korean_exchange, futures_exchange):
+    def __init__(self, position_manager, order_executor, korean_exchange, futures_exchange,
+                 residual_ledger: Optional[ResidualLedger] = None):
         self.position_manager = position_manager
         self.order_executor = order_executor
         self.korean_exchange = korean_exchange
         self.futures_exchange = futures_exchange
         self.max_gap_usd = settings.MAX_POSITION_GAP_USD  # 최대 허용 갭
         self.rebalance_threshold = settings.REBALANCE_THRESHOLD_USD  # 리밸런싱 트리거 갭
+        # 임계값 미만 갭은 장부에 이월하여 다음 주문에서 상쇄
+        self.residual_ledger = residual_ledger or ResidualLedger(self.rebalance_threshold)
+        # 현물 수량 정밀도는 생성 시 한 번만 결정
+        self.round_spot_quantity = korean_exchange.capabilities.round_quantity
         
     def check_position_balance(self, symbol: str) -> Optional[PositionBalance]:
         """특정 심볼의 포지션 균형 체크 - 코인 개수 기준"""
         try:
             # 현물 포지션 조회 (개수와 가치)
             spot_quantity, spot_value = self._get_spot_position_info(symbol)
+            # 매 주문 후 확인한 현물 수량을 계좌 스냅샷으로 보관 (전체 청산 빠른 경로에서 사용)
+            self.position_manager.get_position(symbol).spot_amount = spot_quantity
             
             # 선물 포지션 조회 (개수와 가치)
             futures_quantity, futures_value = self._get_futures_position_info(symbol)
@@ -94,7 +102,7 @@ class PositionBalancer:
                 return 0.0, 0.0
             
             # 현재 매도 가격(bid)으로 USD 환산
-            ticker = self.korean_exchange.get_ticker(symbol)
+            ticker = self.korean_exchange.get_best_bid_ask(symbol)
             if not ticker or 'bid' not in ticker:
                 return spot_amount, 0.0
             
@@ -102,7 +110,7 @@ class PositionBalancer:
             krw_value = spot_amount * ticker['bid']
             
             # USDT/KRW 환율 조회 (KRW를 USD로 변환)
-            usdt_krw_ticker = self.korean_exchange.get_ticker('USDT/KRW')
+            usdt_krw_ticker = self.korean_exchange.get_best_bid_ask('USDT/KRW')
             if not usdt_krw_ticker or 'ask' not in usdt_krw_ticker:
                 return spot_amount, 0.0
             
@@ -150,9 +158,8 @@ class PositionBalancer:
                 contracts = abs(position.get("contracts", 0))  # 계약 수
                 mark_price = float(position.get("mark_price") or position.get("markPrice", 0))
                 
-                # Gate.io의 contract_size 정보 활용
-                contract_info = self.futures_exchange.futures_markets.get(f"{symbol}/USDT:USDT", {})
-                contract_size = contract_info.get('contract_size', 1)
+                # 계약 크기 (계약 단위가 없는 거래소는 1)
+                contract_size = self.futures_exchange.get_contract_size(f"{symbol}/USDT:USDT")
                 
                 # 실제 코인 개수 = 계약수 × 계약크기
                 coin_quantity = contracts * contract_size
@@ -174,12 +181,45 @@ class PositionBalancer:
         _, value = self._get_futures_position_info(symbol)
         return value
     
+    def _record_residual(self, balance: PositionBalance) -> None:
+        """측정된 갭을 잔여 갭 장부에 기록"""
+        if balance.spot_quantity > 0:
+            price_usd = balance.spot_value_usd / balance.spot_quantity
+        elif balance.futures_quantity > 0:
+            price_usd = balance.futures_value_usd / balance.futures_quantity
+        else:
+            price_usd = 0.0
+        
+        self.residual_ledger.record(
+            balance.symbol, balance.spot_quantity - balance.futures_quantity, price_usd
+        )
+    
+    def _should_carry_residual(self, symbol: str) -> bool:
+        """누적 갭이 임계값 이하이면 보정 주문 없이 이월 (보정 주문 여부의 유일한 기준)"""
+        if self.residual_ledger.needs_correction(symbol):
+            return False
+        
+        if self.residual_ledger.get_gap(symbol):
+            logger.info(
+                f"{symbol} 잔여 갭 ${self.residual_ledger.gap_usd(symbol):.2f} 이월 "
+                f"(임계값 ${self.residual_ledger.threshold_usd:.2f} 이하)"
+            )
+        return True
+    
     def rebalance_position(self, symbol: str) -> bool:
-        """포지션 리밸런싱 실행 - 코인 개수 기준"""
+        """포지션 리밸런싱 실행 - 코인 개수 기준
+        
+        누적 갭이 REBALANCE_THRESHOLD_USD 이하이면 주문 없이 장부에 이월
+        """
         try:
             balance = self.check_position_balance(symbol)
             
-            if not balance or not balance.needs_rebalancing:
+            if not balance:
+                return True
+            
+            self._record_residual(balance)
+            
+            if self._should_carry_residual(symbol):
                 return True
             
             logger.info(
@@ -206,6 +246,7 @@ class PositionBalancer:
                 success = self._add_spot_position_by_quantity(symbol, quantity_gap)
             
             if success:
+                self.residual_ledger.clear(symbol)
                 logger.info(f"✅ {symbol} 포지션 리밸런싱 완료")
             else:
                 logger.error(f"❌ {symbol} 포지션 리밸런싱 실패")
@@ -216,6 +257,36 @@ class PositionBalancer:
             logger.error(f"{symbol} 포지션 리밸런싱 실패: {e}")
             return False
     
+    def correct_gap(self, symbol: str, quantity_gap: float) -> bool:
+        """주문 조회로 확인한 갭 보정 (잔고 재조회 없이 장부에 누적 후 임계값 기준으로 보정)
+        
+        quantity_gap: 현물 - 선물 코인 개수 (양수면 선물 숏 추가, 음수면 현물 추가)
+        """
+        try:
+            ticker = self.futures_exchange.get_best_bid_ask(f"{symbol}/USDT:USDT")
+            price_usd = (ticker['bid'] + ticker['ask']) / 2 if ticker else None
+            self.residual_ledger.add(symbol, quantity_gap, price_usd)
+            
+            if self._should_carry_residual(symbol):
+                return True
+            
+            gap = self.residual_ledger.get_gap(symbol)
+            logger.info(f"🔄 {symbol} 확인된 주문 갭 보정: {gap:+.6f}개")
+            if gap > 0:
+                success = self._add_futures_short_by_quantity(symbol, gap)
+            else:
+                success = self._add_spot_position_by_quantity(symbol, -gap)
+            
+            if success:
+                self.residual_ledger.clear(symbol)
+            else:
+                logger.error(f"❌ {symbol} 주문 갭 보정 실패")
+            return success
+            
+        except Exception as e:
+            logger.error(f"{symbol} 주문 갭 보정 실패: {e}")
+            return False
+    
     def _add_futures_short_by_quantity(self, symbol: str, quantity: float) -> bool:
         """선물 숏 포지션 추가 (코인 개수 기준)"""
         try:
@@ -224,12 +295,11 @@ class PositionBalancer:
                 logger.info(f"{symbol} 선물 추가 수량 너무 작음: {quantity:.6f}개")
                 return True
             
-            # Gate.io는 코인 개수를 받아서 내부적으로 계약수로 변환
-            # params 없이 보내면 직접 호출로 인식되어 코인->계약 변환됨
+            # create_market_order는 코인 개수를 받음 (계약 단위 거래소는 내부에서 계약수로 변환)
             order = self.futures_exchange.create_market_order(
                 symbol=f"{symbol}/USDT:USDT",
                 side='sell',
-                amount=quantity  # 코인 개수 (Gate.io가 계약수로 변환)
+                amount=quantity  # 코인 개수
             )
             
             if order:
@@ -251,15 +321,15 @@ class PositionBalancer:
                 return True
             
             # 현재 가격 조회
-            korean_ticker = self.korean_exchange.get_ticker(f"{symbol}/KRW")
+            korean_ticker = self.korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
             if not korean_ticker or 'ask' not in korean_ticker:
                 return False
             
             # 코인 개수를 KRW 금액으로 변환 (매수는 KRW 금액으로만 가능)
             krw_amount = quantity * korean_ticker['ask']
             
-            # 최소 주문 금액 확인 (업비트 5000원, 빗썸 1000원)
-            min_order_krw = 5000 if self.korean_exchange.exchange_id.lower() == 'upbit' else 1000
+            # 최소 주문 금액 확인 (마켓 정보 우선, 없으면 거래소 기본값)
+            min_order_krw = self.korean_exchange.get_min_order_krw(f"{symbol}/KRW")
             if krw_amount < min_order_krw:
                 logger.info(f"{symbol} 주문 금액 너무 작음: {krw_amount:.0f}원 < {min_order_krw}원")
                 return True
@@ -290,7 +360,7 @@ class PositionBalancer:
                 return True
             
             # 현재 가격으로 수량 계산
-            futures_ticker = self.futures_exchange.get_ticker(f"{symbol}/USDT:USDT")
+            futures_ticker = self.futures_exchange.get_best_bid_ask(f"{symbol}/USDT:USDT")
             if not futures_ticker or 'bid' not in futures_ticker:
                 return False
             
@@ -322,12 +392,12 @@ class PositionBalancer:
                 return True
             
             # USDT/KRW 환율 조회
-            usdt_krw_ticker = self.korean_exchange.get_ticker('USDT/KRW')
+            usdt_krw_ticker = self.korean_exchange.get_best_bid_ask('USDT/KRW')
             if not usdt_krw_ticker or 'ask' not in usdt_krw_ticker:
                 return False
             
             # 현재 가격 조회
-            korean_ticker = self.korean_exchange.get_ticker(f"{symbol}/KRW")
+            korean_ticker = self.korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
             if not korean_ticker or 'ask' not in korean_ticker:
                 return False
             
@@ -384,9 +454,10 @@ class PositionBalancer:
             if not balance:
                 return False
             
-            # 균형이 맞으면 종료
-            if balance.is_balanced:
-                logger.info(f"✅ {symbol} 청산 후 균형 유지됨: 개수 차이 {balance.quantity_gap:.6f}개 ({balance.gap_percentage:.2f}%)")
+            self._record_residual(balance)
+            
+            # 임계값 이하 갭은 다음 청산/증분에서 상쇄
+            if self._should_carry_residual(symbol):
                 return True
             
             logger.warning(
@@ -425,6 +496,8 @@ class PositionBalancer:
                 # 재확인
                 time.sleep(2)
                 final_balance = self.check_position_balance(symbol)
+                if final_balance:
+                    self._record_residual(final_balance)
                 if final_balance and final_balance.is_balanced:
                     logger.info(f"✅ {symbol} 균형 조정 완료: 개수 차이 {final_balance.quantity_gap:.6f}개")
                     return True
@@ -440,9 +513,8 @@ class PositionBalancer:
     def _close_excess_spot_by_quantity(self, symbol: str, quantity: float) -> bool:
         """초과 현물 청산 (코인 개수 기준)"""
         try:
-            # 빗썸은 4자리 반올림
-            if self.korean_exchange.exchange_id.lower() == 'bithumb':
-                quantity = round(quantity, 4)
+            # 거래소 수량 정밀도에 맞춤 (빗썸 4자리)
+            quantity = self.round_spot_quantity(quantity)
             
             # 현물 매도 주문 - 기존 create_market_order 사용
             order = self.korean_exchange.create_market_order(
@@ -464,12 +536,12 @@ class PositionBalancer:
     def _close_excess_futures_by_quantity(self, symbol: str, quantity: float) -> bool:
         """초과 선물 청산 (코인 개수 기준)"""
         try:
-            # Gate.io는 코인 개수를 받아서 내부적으로 계약수로 변환
+            # create_market_order는 코인 개수를 받음 (계약 단위 거래소는 내부에서 계약수로 변환)
             # reduce_only는 포지션 청산 전용 모드
             order = self.futures_exchange.create_market_order(
                 symbol=f"{symbol}/USDT:USDT",
                 side='buy',
-                amount=quantity,  # 코인 개수 (Gate.io가 계약수로 변환)
+                amount=quantity,  # 코인 개수
                 params={'reduce_only': True}  # 포지션 청산 모드
             )
             
@@ -487,12 +559,12 @@ class PositionBalancer:
         """초과 현물 청산"""
         try:
             # 현재 가격 조회
-            korean_ticker = self.korean_exchange.get_ticker(f"{symbol}/KRW")
+            korean_ticker = self.korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
             if not korean_ticker or 'bid' not in korean_ticker:
                 return False
             
             # USDT/KRW 환율
-            usdt_krw_ticker = self.korean_exchange.get_ticker('USDT/KRW')
+            usdt_krw_ticker = self.korean_exchange.get_best_bid_ask('USDT/KRW')
             if not usdt_krw_ticker or 'ask' not in usdt_krw_ticker:
                 return False
             
@@ -500,9 +572,8 @@ class PositionBalancer:
             ticker_usd = korean_ticker['bid'] / usdt_krw_ticker['ask']
             quantity = amount_usd / ticker_usd
             
-            # 빗썸은 4자리 반올림
-            if self.korean_exchange.exchange_id.lower() == 'bithumb':
-                quantity = round(quantity, 4)
+            # 거래소 수량 정밀도에 맞춤 (빗썸 4자리)
+            quantity = self.round_spot_quantity(quantity)
             
             # 현물 매도 주문 - 기존 create_market_order 사용
             order = self.korean_exchange.create_market_order(
@@ -525,7 +596,7 @@ class PositionBalancer:
         """초과 선물 청산 (숏 포지션 매수로 청산)"""
         try:
             # 현재 가격 조회 (숏 청산 = 매수이므로 ask 사용)
-            futures_ticker = self.futures_exchange.get_ticker(f"{symbol}/USDT:USDT")
+            futures_ticker = self.futures_exchange.get_best_bid_ask(f"{symbol}/USDT:USDT")
             if not futures_ticker or 'ask' not in futures_ticker:
                 return False
             
@@ -1,5 +1,8 @@
 import logging
-from typing import Optional
+from typing import Dict, Optional
+
+from src.config import settings
+from src.exchanges.clock_sync import clock_sync
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +26,7 @@ class PremiumCalculator:
         """
         try:
             # 한국 거래소 가격 조회
-            korean_ticker = self.korean_exchange.get_ticker(f"{symbol}/KRW")
+            korean_ticker = self.korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
             if not korean_ticker or 'ask' not in korean_ticker:
                 logger.error(f"한국 거래소 {symbol} ask 가격 조회 실패")
                 return None
@@ -31,18 +34,25 @@ class PremiumCalculator:
             krw_ask_price = korean_ticker['ask']
             
             # USDT/KRW 환율 조회
-            usdt_krw_price = self._get_usdt_krw_rate()
-            if not usdt_krw_price:
+            usdt_krw_ticker = self._get_usdt_krw_ticker()
+            if not usdt_krw_ticker:
                 return None
+            usdt_krw_price = usdt_krw_ticker['ask']
             
             # 선물 거래소 가격 조회
-            futures_ticker = self.futures_exchange.get_ticker(f"{symbol}/USDT:USDT")
+            futures_ticker = self.futures_exchange.get_best_bid_ask(f"{symbol}/USDT:USDT")
             if not futures_ticker or 'bid' not in futures_ticker:
                 logger.error(f"선물 거래소 {symbol} bid 가격 조회 실패")
                 return None
             
             usdt_bid_price = futures_ticker['bid']
             
+            # 오래된 호가로 계산한 프리미엄은 사용하지 않음
+            if self._has_stale_leg(symbol, {
+                f"{symbol}/KRW": korean_ticker, 'USDT/KRW': usdt_krw_ticker, f"{symbol}/USDT:USDT": futures_ticker
+            }):
+                return None
+            
             # 프리미엄 계산
             # 한국에서 사는 가격을 USD로 변환
             usd_equivalent = krw_ask_price / usdt_krw_price
@@ -61,17 +71,43 @@ class PremiumCalculator:
             logger.error(f"{symbol} 프리미엄 계산 실패: {e}")
             return None
     
-    def _get_usdt_krw_rate(self) -> Optional[float]:
-        """USDT/KRW 환율 조회 (ask 가격 사용)"""
+    @staticmethod
+    def _has_stale_leg(symbol: str, quotes: Dict[str, Dict]) -> bool:
+        """MAX_QUOTE_AGE_SECONDS보다 오래된 호가가 있는지 (시각 정보가 없는 호가는 확인 안 함)
+
+        거래소 시각으로 환산한 호가는 시계 오프셋 불확실성만큼 제한을 늘림
+        (Date 헤더로만 추정하는 거래소는 ±0.5초 이상 - 그만큼 멀쩡한 호가를 오래됐다고 보지 않도록)
+        """
+        if not settings.MAX_QUOTE_AGE_SECONDS:
+            return False
+        stale = {}
+        for market, quote in quotes.items():
+            age = clock_sync.quote_age(quote)
+            if age is not None and age > settings.MAX_QUOTE_AGE_SECONDS + quote.get('quote_time_error', 0.0):
+                stale[market] = age
+        if stale:
+            logger.warning(
+                f"{symbol} 오래된 호가로 프리미엄 계산 안 함: "
+                + ', '.join(f"{market} {age * 1000:.0f}ms" for market, age in stale.items())
+            )
+        return bool(stale)
+    
+    def _get_usdt_krw_ticker(self) -> Optional[Dict]:
+        """USDT/KRW 호가 조회 (환율은 ask 가격 사용)"""
         try:
-            usdt_krw_ticker = self.korean_exchange.get_ticker('USDT/KRW')
+            usdt_krw_ticker = self.korean_exchange.get_best_bid_ask('USDT/KRW')
             
             if not usdt_krw_ticker or 'ask' not in usdt_krw_ticker:
                 logger.error("USDT/KRW ask 가격 조회 실패")
                 return None
             
-            return usdt_krw_ticker['ask']
+            return usdt_krw_ticker
             
         except Exception as e:
             logger.error(f"USDT/KRW 환율 조회 실패: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _get_usdt_krw_rate(self) -> Optional[float]:
+        """USDT/KRW 환율 조회 (ask 가격 사용)"""
+        ticker = self._get_usdt_krw_ticker()
+        return ticker['ask'] if ticker else None
\ No newline at end of file
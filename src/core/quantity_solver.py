@@ -0,0 +1,167 @@
+"""
+헤지 수량 솔버 - 거래소별 주문 단위를 고려한 정확한 헤지 수량 계산
+"""
+import logging
+import math
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from src.config import settings
+from src.exchanges.base import ExchangeCapabilities
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgeQuantity:
+    """헤지 수량 계산 결과"""
+    contracts: int  # Gate.io 계약 수
+    futures_quantity: float  # 선물 코인 개수
+    spot_quantity: float  # 현물 예상 체결 개수
+    spot_order_amount: float  # 현물 매수 주문 금액 (KRW)
+    notional_usd: float  # 실제 USD 가치 (KRW 기준)
+    mismatch_pct: float  # 주문 후 현물/선물 개수 차이 비율
+    deviation_pct: float  # 목표 금액 대비 차이 비율
+    residual_quantity: float = 0.0  # 주문 후 남는 갭 (현물 - 선물, 이월분 포함)
+
+
+class HedgeQuantitySolver:
+    """현물/선물 양쪽 주문 단위를 동시에 만족하는 헤지 수량 계산기
+
+    - 선물: 정수 계약 (계약 크기 = quanto_multiplier)
+    - 수량 정밀도가 있는 현물 (빗썸): 코인 개수를 정밀도에 맞춰 반올림
+    - KRW 금액 매수 현물 (업비트): 정수 원 단위 KRW 금액 기준 시장가
+    """
+
+    def __init__(self, spot_capabilities: ExchangeCapabilities,
+                 tolerance_pct: Optional[float] = None,
+                 search_window: Optional[int] = None):
+        self.spot_capabilities = spot_capabilities
+        self.tolerance_pct = (
+            settings.HEDGE_QUANTITY_TOLERANCE_PCT if tolerance_pct is None else tolerance_pct
+        )
+        self.search_window = (
+            settings.HEDGE_SOLVER_SEARCH_WINDOW if search_window is None else search_window
+        )
+
+    def spot_fill(self, quantity: float, krw_ask_price: float) -> Tuple[float, float]:
+        """
+        현물 매수 시 실제 체결될 수량과 주문 금액 계산
+
+        Args:
+            quantity: 목표 코인 개수
+            krw_ask_price: 한국 거래소 ask 가격
+
+        Returns:
+            (예상 체결 개수, KRW 주문 금액)
+        """
+        capabilities = self.spot_capabilities
+        if capabilities.quantity_precision is not None:
+            # 코인 개수를 정밀도에 맞춰 반올림해서 주문 (빗썸)
+            units = capabilities.round_quantity(quantity)
+            return units, units * krw_ask_price
+
+        if capabilities.quote_amount_buys:
+            # 정수 원 단위 KRW 금액으로 매수 (업비트)
+            krw_amount = float(round(quantity * krw_ask_price))
+            return krw_amount / krw_ask_price, krw_amount
+
+        return quantity, quantity * krw_ask_price
+
+    def solve(
+        self, amount_usd: float, futures_price: float, contract_size: float,
+        krw_ask_price: float, usdt_krw_rate: float, carry_quantity: float = 0.0
+    ) -> Optional[HedgeQuantity]:
+        """
+        목표 USD 금액에 가장 가까우면서 양쪽 수량이 허용 오차 안에서 일치하는 계약 수 선택
+
+        Args:
+            amount_usd: 목표 USD 금액
+            futures_price: 선물 기준 가격 (숏 진입 시 bid)
+            contract_size: 계약 크기
+            krw_ask_price: 한국 거래소 ask 가격
+            usdt_krw_rate: USDT/KRW 환율
+            carry_quantity: 이월된 잔여 갭 (현물 - 선물), 이번 주문에서 상쇄
+
+        Returns:
+            HedgeQuantity 또는 None
+        """
+        if amount_usd <= 0 or futures_price <= 0 or contract_size <= 0:
+            logger.error(
+                f"헤지 수량 계산 불가: 금액 ${amount_usd}, 가격 {futures_price}, 계약크기 {contract_size}"
+            )
+            return None
+        if krw_ask_price <= 0 or usdt_krw_rate <= 0:
+            logger.error(f"헤지 수량 계산 불가: KRW {krw_ask_price}, USDT/KRW {usdt_krw_rate}")
+            return None
+
+        contracts_exact = amount_usd / futures_price / contract_size
+        center = round(contracts_exact)
+        if center < 1:
+            # 1계약으로 올리면 목표 금액을 크게 넘으므로 주문하지 않음
+            logger.warning(
+                f"계약수 1 미만: ${amount_usd:.2f} = {contracts_exact:.4f} contracts (계약크기 {contract_size})"
+            )
+            return None
+        low = max(1, math.floor(contracts_exact) - self.search_window)
+        high = max(center, math.ceil(contracts_exact)) + self.search_window
+
+        best_matched: Optional[HedgeQuantity] = None
+        best_any: Optional[HedgeQuantity] = None
+
+        for contracts in range(low, high + 1):
+            candidate = self._evaluate(
+                contracts, amount_usd, contract_size, krw_ask_price, usdt_krw_rate, carry_quantity
+            )
+            if candidate.spot_quantity <= 0:
+                continue
+
+            if best_any is None or self._rank(candidate, by_mismatch=True) < self._rank(best_any, by_mismatch=True):
+                best_any = candidate
+
+            if candidate.mismatch_pct <= self.tolerance_pct:
+                if best_matched is None or self._rank(candidate) < self._rank(best_matched):
+                    best_matched = candidate
+
+        if best_matched:
+            return best_matched
+
+        if best_any:
+            logger.warning(
+                f"허용 오차({self.tolerance_pct}%) 내 헤지 수량 없음 - "
+                f"최소 차이 {best_any.mismatch_pct:.3f}% 수량 사용"
+            )
+        return best_any
+
+    def _evaluate(
+        self, contracts: int, amount_usd: float, contract_size: float,
+        krw_ask_price: float, usdt_krw_rate: float, carry_quantity: float = 0.0
+    ) -> HedgeQuantity:
+        """계약 수 하나에 대한 양쪽 체결 수량 평가"""
+        futures_quantity = contracts * contract_size
+        # 이월 갭만큼 현물을 덜/더 사서 주문 후 잔여 갭을 0에 가깝게
+        spot_target = max(0.0, futures_quantity - carry_quantity)
+        spot_quantity, krw_amount = self.spot_fill(spot_target, krw_ask_price)
+
+        residual = carry_quantity + spot_quantity - futures_quantity
+        mismatch_pct = abs(residual) / futures_quantity * 100
+        notional_usd = krw_amount / usdt_krw_rate
+        deviation_pct = abs(notional_usd - amount_usd) / amount_usd * 100
+
+        return HedgeQuantity(
+            contracts=contracts,
+            futures_quantity=futures_quantity,
+            spot_quantity=spot_quantity,
+            spot_order_amount=krw_amount,
+            notional_usd=notional_usd,
+            mismatch_pct=mismatch_pct,
+            deviation_pct=deviation_pct,
+            residual_quantity=residual
+        )
+
+    @staticmethod
+    def _rank(candidate: HedgeQuantity, by_mismatch: bool = False) -> Tuple[float, float]:
+        """후보 정렬 키 (작을수록 우선)"""
+        if by_mismatch:
+            return candidate.mismatch_pct, candidate.deviation_pct
+        return candidate.deviation_pct, candidate.mismatch_pct
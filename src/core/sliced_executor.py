@@ -0,0 +1,218 @@
+"""
+분할 실행 모듈 - 큰 헤지 증분을 현물+선물 쌍 조각으로 나눠 실행 (TWAP/아이스버그)
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from src.config import settings
+from src.core.order_executor import HedgeFill, OrderExecutor
+from src.core.premium_calculator import PremiumCalculator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SliceFill:
+    """조각 1개 실행 결과"""
+    index: int
+    requested_usd: float  # 조각 요청 금액
+    fill: HedgeFill
+
+
+@dataclass
+class SliceReport:
+    """분할 실행 결과"""
+    symbol: str
+    decision_premium: float  # 진입 결정 시 프리미엄 (%)
+    requested_usd: float
+    slices: List[SliceFill] = field(default_factory=list)
+    abort_reason: Optional[str] = None
+    remaining_usd: float = 0.0  # 아직 실행하지 않은 금액
+    last_slice_at: float = 0.0  # 마지막 조각 실행 시각 (monotonic)
+
+    def __post_init__(self):
+        self.remaining_usd = self.requested_usd
+
+    @property
+    def executed_usd(self) -> float:
+        """체결된 조각 요청 금액 합계 (포지션 장부 기준, 일부 체결은 체결 비율만큼)"""
+        return sum(item.requested_usd * item.fill.filled_ratio for item in self.slices)
+
+    @property
+    def notional_usd(self) -> float:
+        """체결된 조각 실제 USD 가치 합계"""
+        return sum(item.fill.notional_usd for item in self.slices)
+
+    @property
+    def achieved_premium(self) -> Optional[float]:
+        """조각별 주문 기준 프리미엄의 금액 가중 평균 (%)"""
+        notional = self.notional_usd
+        if notional <= 0:
+            return None
+        return sum(item.fill.premium * item.fill.notional_usd for item in self.slices) / notional
+
+    def summary(self) -> str:
+        """결과 요약 문자열"""
+        achieved = self.achieved_premium
+        text = (
+            f"{self.symbol} 분할 실행: {len(self.slices)}조각, "
+            f"${self.executed_usd:.2f}/${self.requested_usd:.2f}"
+        )
+        if achieved is not None:
+            text += (
+                f", 달성 프리미엄 {achieved:.3f}% "
+                f"(결정 {self.decision_premium:.3f}%, 차이 {achieved - self.decision_premium:+.3f}%p)"
+            )
+        if self.abort_reason:
+            text += f", 중단: {self.abort_reason}"
+        return text
+
+
+class SlicedExecutor:
+    """헤지 증분 분할 실행기
+
+    - 조각 크기: 한국 거래소 최우선 매도 호가 잔량 x SLICE_DEPTH_FRACTION
+      (SLICE_MIN_USD ~ SLICE_MAX_USD 범위, 마지막 자투리는 앞 조각에 합침)
+    - 각 조각은 OrderExecutor로 현물 매수 + 선물 숏을 동시에 실행 (조각마다 즉시 헤지)
+    - 조각 사이 SLICE_INTERVAL_SECONDS 이상 간격, 프리미엄이 결정 시점보다
+      SLICE_MAX_PREMIUM_DRIFT 이상 나빠지면 남은 조각 중단
+
+    HedgeBot은 start / execute_next로 사이클마다 조각 1개씩 실행 (조각 사이 대기 중에
+    실행 스케줄러 슬롯과 사이클 데드라인을 잡고 있지 않도록). execute는 한 번에 끝까지 실행
+    """
+
+    def __init__(self, order_executor: OrderExecutor, premium_calculator: PremiumCalculator,
+                 korean_exchange, sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.order_executor = order_executor
+        self.premium_calculator = premium_calculator
+        self.korean_exchange = korean_exchange
+        self.sleep = sleep
+        self.clock = clock
+        # 진행 중인 분할 실행 (심볼 -> 리포트)
+        self._active: Dict[str, SliceReport] = {}
+        self._lock = threading.Lock()
+
+    def should_slice(self, amount_usd: float) -> bool:
+        """분할 실행 대상 여부 (조각 2개 이상 나올 때만)"""
+        return settings.SLICED_EXECUTION_ENABLED and amount_usd >= 2 * settings.SLICE_MIN_USD
+
+    def plan_slice_usd(self, symbol: str, remaining_usd: float) -> float:
+        """최우선 매도 호가 잔량 기준 다음 조각 금액"""
+        slice_usd = settings.SLICE_MAX_USD
+        try:
+            quotes = self.korean_exchange.get_best_bid_asks([f"{symbol}/KRW", 'USDT/KRW'])
+            quote = quotes.get(f"{symbol}/KRW") or {}
+            usdt_krw = (quotes.get('USDT/KRW') or {}).get('ask')
+            if quote.get('ask') and quote.get('ask_size') and usdt_krw:
+                depth_usd = quote['ask'] * quote['ask_size'] / usdt_krw
+                slice_usd = depth_usd * settings.SLICE_DEPTH_FRACTION
+        except Exception as e:
+            logger.warning(f"{symbol} 호가 잔량 조회 실패 - 최대 조각 크기 사용: {e}")
+
+        slice_usd = min(max(slice_usd, settings.SLICE_MIN_USD), settings.SLICE_MAX_USD)
+        # 남는 자투리가 최소 조각보다 작으면 이번 조각에 합침
+        if remaining_usd - slice_usd < settings.SLICE_MIN_USD:
+            return remaining_usd
+        return slice_usd
+
+    def execute(self, symbol: str, amount_usd: float, decision_premium: float) -> SliceReport:
+        """
+        헤지 증분 분할 실행 (조각 사이 SLICE_INTERVAL_SECONDS 대기하며 끝까지)
+
+        Args:
+            symbol: 심볼
+            amount_usd: 전체 증분 금액
+            decision_premium: 진입을 결정한 프리미엄 (%)
+
+        Returns:
+            조각별 체결과 달성 프리미엄이 담긴 SliceReport
+        """
+        report = self.start(symbol, amount_usd, decision_premium)
+        while self.has_active(symbol):
+            self.sleep(settings.SLICE_INTERVAL_SECONDS)
+            self.execute_next(symbol, self.premium_calculator.calculate(symbol))
+        return report
+
+    def start(self, symbol: str, amount_usd: float, decision_premium: float) -> SliceReport:
+        """분할 실행 시작 - 첫 조각 실행 (남은 조각은 execute_next로)"""
+        report = SliceReport(symbol, decision_premium, amount_usd)
+        with self._lock:
+            self._active[symbol] = report
+        self._execute_slice(report)
+        return report
+
+    def has_active(self, symbol: str) -> bool:
+        """진행 중인 분할 실행 여부"""
+        with self._lock:
+            return symbol in self._active
+
+    def is_due(self, symbol: str) -> bool:
+        """다음 조각 실행 시각이 되었는지 (마지막 조각 후 SLICE_INTERVAL_SECONDS)"""
+        with self._lock:
+            report = self._active.get(symbol)
+        return report is not None and self.clock() - report.last_slice_at >= settings.SLICE_INTERVAL_SECONDS
+
+    def execute_next(self, symbol: str, premium: Optional[float]) -> Optional[SliceFill]:
+        """다음 조각 1개 실행 (premium: 현재 프리미엄 - 결정 시점보다 악화됐으면 중단)
+
+        Returns:
+            실행된 조각 (중단/실패 시 None)
+        """
+        with self._lock:
+            report = self._active.get(symbol)
+        if report is None:
+            return None
+
+        max_premium = report.decision_premium + settings.SLICE_MAX_PREMIUM_DRIFT
+        if premium is None:
+            self._finish(report, "프리미엄 조회 실패")
+            return None
+        if premium > max_premium:
+            self._finish(report, f"프리미엄 악화 {premium:.3f}% > {max_premium:.3f}%")
+            return None
+        return self._execute_slice(report)
+
+    def cancel(self, symbol: str, reason: str) -> None:
+        """진행 중인 분할 실행 중단 (청산/심볼 제거 시)"""
+        with self._lock:
+            report = self._active.get(symbol)
+        if report is not None:
+            self._finish(report, reason)
+
+    def _execute_slice(self, report: SliceReport) -> Optional[SliceFill]:
+        """조각 1개 실행 후 남은 금액이 없거나 실패하면 분할 실행 종료"""
+        symbol = report.symbol
+        slice_usd = self.plan_slice_usd(symbol, report.remaining_usd)
+        fill = self.order_executor.execute_hedge(symbol, slice_usd)
+        report.last_slice_at = self.clock()
+        if fill is None:
+            self._finish(report, f"{len(report.slices) + 1}번째 조각 주문 실패")
+            return None
+
+        item = SliceFill(len(report.slices) + 1, slice_usd, fill)
+        report.slices.append(item)
+        report.remaining_usd -= slice_usd
+        logger.info(
+            f"{symbol} 조각 {item.index}: ${slice_usd:.2f} → "
+            f"현물 {fill.spot_quantity:.8f}, 선물 {fill.futures_size}, "
+            f"프리미엄 {fill.premium:.3f}% (남은 금액 ${max(report.remaining_usd, 0):.2f})"
+        )
+        if report.remaining_usd <= 0:
+            self._finish(report)
+        return item
+
+    def _finish(self, report: SliceReport, abort_reason: Optional[str] = None) -> None:
+        """분할 실행 종료 및 결과 요약 기록"""
+        with self._lock:
+            if self._active.get(report.symbol) is not report:
+                return
+            del self._active[report.symbol]
+        report.abort_reason = abort_reason
+        if abort_reason:
+            logger.warning(report.summary())
+        else:
+            logger.info(report.summary())
@@ -1,8 +1,54 @@
 """
 거래소 모듈
+
+어댑터는 사용 시점에 import 됨 (gate_api, jwt 등 무거운 의존성은 선택된 거래소만 로드)
 """
-from .upbit import UpbitExchange
-from .bithumb import BithumbExchange
-from .gateio import GateIOExchange
+import importlib
+
+# 거래소 ID -> (모듈, 클래스 이름)
+EXCHANGE_CLASSES = {
+    'upbit': ('src.exchanges.upbit', 'UpbitExchange'),
+    'bithumb': ('src.exchanges.bithumb', 'BithumbExchange'),
+    'gateio': ('src.exchanges.gateio', 'GateIOExchange'),
+    'binance': ('src.exchanges.binance_futures', 'BinanceFuturesExchange'),
+}
+
+# 한국 현물 거래소 ID
+KOREAN_EXCHANGE_IDS = ('upbit', 'bithumb')
+
+# 선물(USDT 무기한) 거래소 ID
+FUTURES_EXCHANGE_IDS = ('gateio', 'binance')
+
+# 패키지 속성 이름 -> 모듈 (from src.exchanges import X 호환)
+_LAZY_EXPORTS = {class_name: module_name for module_name, class_name in EXCHANGE_CLASSES.values()}
+_LAZY_EXPORTS['MarketRegistry'] = 'src.exchanges.market_registry'
+_LAZY_EXPORTS.update(dict.fromkeys(
+    ('ExchangeCapabilities', 'SpotExchange', 'FuturesExchange'), 'src.exchanges.base'
+))
+_LAZY_EXPORTS.update(dict.fromkeys(
+    ('HedgeSplitter', 'MultiVenueFuturesExchange', 'MultiVenueSpotExchange'), 'src.exchanges.multi_venue'
+))
+
+
+def get_exchange_class(exchange_id: str):
+    """거래소 ID로 어댑터 클래스 로드 (해당 어댑터 모듈만 import)"""
+    entry = EXCHANGE_CLASSES.get(exchange_id.lower())
+    if entry is None:
+        raise ValueError(f"지원하지 않는 거래소: {exchange_id}")
+    module_name, class_name = entry
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
 
-__all__ = ['UpbitExchange', 'BithumbExchange', 'GateIOExchange']
\ No newline at end of file
+__all__ = [
+    'UpbitExchange', 'BithumbExchange', 'GateIOExchange', 'BinanceFuturesExchange', 'MarketRegistry',
+    'ExchangeCapabilities', 'SpotExchange', 'FuturesExchange',
+    'HedgeSplitter', 'MultiVenueFuturesExchange', 'MultiVenueSpotExchange',
+    'KOREAN_EXCHANGE_IDS', 'FUTURES_EXCHANGE_IDS', 'get_exchange_class'
+]
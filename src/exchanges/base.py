@@ -0,0 +1,250 @@
+"""
+거래소 어댑터 공통 인터페이스
+
+어댑터는 지원하는 주문 방식을 ExchangeCapabilities로 미리 선언하고,
+주문 실행 모듈은 생성 시 한 번만 읽어 주문 전략을 정함 (주문마다 거래소 이름 비교 없음)
+
+모든 어댑터가 구현해야 하는 메서드는 추상 메서드, 역량에 따른 선택 메서드는
+미지원 시 None/False를 반환하는 기본 구현
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ExchangeCapabilities:
+    """거래소 주문 역량"""
+    quote_amount_buys: bool = False  # 시장가 매수를 KRW 금액으로 주문
+    quantity_precision: Optional[int] = None  # 주문 수량 소수점 자리수 (None: 제한 없음)
+    contract_sizing: bool = False  # 선물 주문을 정수 계약 수로 체결
+    batch_orders: bool = False  # 여러 주문 일괄 제출 지원
+    streaming: bool = False  # 웹소켓 시세 지원
+    maker_orders: bool = False  # post-only 지정가 주문 + 정정/취소 + 자동 취소 타이머 지원
+    limit_ioc_orders: bool = False  # 지정가 IOC 주문 (보호 가격까지만 체결, 잔량 즉시 취소) 지원
+    client_order_lookup: bool = False  # 클라이언트 주문 ID로 주문 조회 (재시작 후 주문 결과 확인)
+
+    def round_quantity(self, quantity: float) -> float:
+        """주문 수량을 거래소 정밀도에 맞춰 반올림"""
+        if self.quantity_precision is None:
+            return quantity
+        return round(quantity, self.quantity_precision)
+
+    def floor_quantity(self, quantity: float) -> float:
+        """주문 수량을 거래소 정밀도에 맞춰 내림 (보유량 전량 매도용)"""
+        if self.quantity_precision is None:
+            return quantity
+        step = Decimal(1).scaleb(-self.quantity_precision)
+        return float(Decimal(str(quantity)).quantize(step, rounding=ROUND_FLOOR))
+
+
+def format_price(price: float) -> str:
+    """주문 가격 문자열 (지수 표기 없는 10진수)"""
+    return format(Decimal(str(price)).normalize(), 'f')
+
+
+def tick_from_table(price: float, tick_table: Tuple[Tuple[float, float], ...]) -> float:
+    """(최소 가격, 호가 단위) 내림차순 표에서 가격의 호가 단위 조회"""
+    for min_price, tick in tick_table:
+        if price >= min_price:
+            return tick
+    return tick_table[-1][1]
+
+
+class ExchangeBase(ABC):
+    """거래소 어댑터 공통 기반 클래스"""
+
+    exchange_id: str = ''
+    capabilities = ExchangeCapabilities()
+
+    def get_tick_size(self, symbol: str, price: float) -> float:
+        """가격 호가 단위 (0이면 제한 없음)"""
+        return 0.0
+
+    def protected_price(self, symbol: str, side: str, reference_price: float, slippage_bps: float) -> float:
+        """기준 가격에서 슬리피지 허용폭만큼 불리한 지정가 (호가 단위로 허용폭 안쪽 반올림)
+
+        매수는 기준가 x (1 + bps) 이하 최대 호가, 매도는 기준가 x (1 - bps) 이상 최소 호가
+        """
+        ratio = Decimal(str(slippage_bps)) / Decimal(10000)
+        reference = Decimal(str(reference_price))
+        if side == 'buy':
+            limit, rounding = reference * (1 + ratio), ROUND_FLOOR
+        else:
+            limit, rounding = reference * (1 - ratio), ROUND_CEILING
+        tick = self.get_tick_size(symbol, reference_price)
+        if tick:
+            step = Decimal(str(tick))
+            limit = (limit / step).to_integral_value(rounding=rounding) * step
+        return float(limit)
+
+    @abstractmethod
+    def get_ticker(self, symbol: str) -> Optional[Dict]:
+        """시세 조회 (24시간 통계 포함)"""
+
+    @abstractmethod
+    def get_best_bid_ask(self, symbol: str) -> Optional[Dict]:
+        """최우선 호가 조회 ({'symbol', 'bid', 'ask', 'timestamp', 'quote_time'})
+
+        timestamp: 호가의 거래소 시각 (ms), quote_time: 로컬 시각으로 환산한 호가 시각 (초)
+        """
+
+    def get_best_bid_asks(self, symbols: List[str]) -> Dict[str, Dict]:
+        """여러 심볼 최우선 호가 조회 (일괄 API가 없으면 개별 조회)"""
+        quotes = {}
+        for symbol in symbols:
+            quote = self.get_best_bid_ask(symbol)
+            if quote:
+                quotes[symbol] = quote
+        return quotes
+
+    @abstractmethod
+    def get_balance(self, currency: str) -> Optional[Dict]:
+        """통화별 잔고 조회 ({'free', 'used', 'total'}, 조회 실패 시 None - 보유하지 않은 통화는 0)"""
+
+    @abstractmethod
+    def create_market_order(self, symbol: str, side: str, amount: float,
+                            params: Optional[Dict] = None) -> Optional[Dict]:
+        """시장가 주문"""
+
+    @abstractmethod
+    def get_markets(self) -> Dict:
+        """마켓 정보"""
+
+    def find_order_by_client_id(self, symbol: str, client_order_id: str, placed_at: float) -> Optional[Dict]:
+        """클라이언트 주문 ID로 주문 조회 (client_order_lookup 거래소 전용)
+
+        placed_at: 주문 전송 시각 (로컬, 조회 가능 기간 확인용)
+
+        Returns:
+            {'id', 'status', 'filled'} - filled는 주문 결과와 같은 단위 (contract_sizing 선물은 계약 수),
+            접수되지 않았으면 None (조회 실패/미지원은 예외 - 접수 여부를 알 수 없음)
+        """
+        raise NotImplementedError(f"{self.exchange_id} 클라이언트 주문 ID 조회 미지원")
+
+    def sync_clock(self) -> bool:
+        """서버 시각 API로 시계 오프셋 표본 기록 (API가 없는 거래소는 응답 Date 헤더로만 추정)"""
+        return False
+
+    @abstractmethod
+    def fetch_markets(self) -> Dict:
+        """전체 마켓 정보 다운로드"""
+
+    @property
+    def exchange(self):
+        """Compatibility property"""
+        return self
+
+
+class SpotExchange(ExchangeBase):
+    """한국 현물 거래소 인터페이스
+
+    create_market_order의 amount: 매수는 capabilities.quote_amount_buys이면 KRW 금액,
+    아니면 코인 개수 / 매도는 항상 코인 개수
+    """
+
+    # 주문 제한 정보가 없을 때 사용하는 최소 주문 금액
+    DEFAULT_MIN_ORDER_KRW = 0.0
+
+    @abstractmethod
+    def get_balances(self) -> Optional[Dict[str, Dict]]:
+        """전체 잔고 조회 ({통화: {'free', 'used', 'total'}})"""
+
+    def get_quantity_precision(self, symbol: str) -> Optional[int]:
+        """심볼별 주문 수량 정밀도"""
+        return self.capabilities.quantity_precision
+
+    def get_min_order_krw(self, symbol: str) -> float:
+        """최소 주문 금액 (마켓 정보 우선)"""
+        market = self.get_markets().get(symbol) or {}
+        return market.get('min_order_krw', self.DEFAULT_MIN_ORDER_KRW)
+
+    def create_limit_ioc_order(self, symbol: str, side: str, quantity: float,
+                               price: float) -> Optional[Dict]:
+        """지정가 IOC 주문 (quantity: 코인 개수, limit_ioc_orders 거래소 전용)
+
+        Returns:
+            {'id', 'symbol', 'side', 'amount', 'price', 'filled', 'remaining'} - 미체결 잔량은 취소됨
+        """
+        return None
+
+    def get_usdt_krw_price(self) -> Optional[float]:
+        """USDT/KRW 가격 (매수 기준 ask)"""
+        quote = self.get_best_bid_ask('USDT/KRW')
+        return quote['ask'] if quote else None
+
+
+class FuturesExchange(ExchangeBase):
+    """USDT 무기한 선물 거래소 인터페이스
+
+    create_market_order의 amount는 항상 코인 개수,
+    capabilities.contract_sizing 거래소는 create_contract_order로 계약 수를 직접 주문
+    """
+
+    @abstractmethod
+    def get_positions(self) -> Optional[List[Dict]]:
+        """열린 선물 포지션 목록 (조회 실패 시 None - 빈 목록은 포지션 없음)"""
+
+    def get_contract_size(self, symbol: str) -> float:
+        """계약 1개당 코인 개수 (계약 단위가 없으면 1)"""
+        market = self.get_markets().get(symbol) or {}
+        return market.get('contract_size', 1)
+
+    def get_quantity_step(self, symbol: str) -> float:
+        """주문 가능한 코인 개수 단위 (0이면 제한 없음)"""
+        if self.capabilities.contract_sizing:
+            return self.get_contract_size(symbol)
+        market = self.get_markets().get(symbol) or {}
+        return market.get('quantity_step', 0.0)
+
+    @abstractmethod
+    def set_leverage(self, symbol: str, leverage: int) -> bool:
+        """레버리지 설정"""
+
+    def create_contract_order(self, symbol: str, side: str, contracts: int,
+                              reduce_only: bool = False, price: Optional[float] = None) -> Optional[Dict]:
+        """계약 수 기준 시장가 주문 (contract_sizing 거래소 전용)
+
+        price가 있으면 지정가 IOC (limit_ioc_orders 거래소, 'filled'에 체결 계약 수)
+        """
+        return None
+
+    def close_position(self, symbol: str) -> Optional[Dict]:
+        """심볼 포지션 전체 청산 (기본: 포지션 조회 후 reduce-only 시장가, 포지션 없으면 None)"""
+        for position in self.get_positions() or []:
+            if position['symbol'] != symbol:
+                continue
+            side = 'buy' if position['side'] == 'short' else 'sell'
+            if self.capabilities.contract_sizing:
+                return self.create_contract_order(symbol, side, position['contracts'], reduce_only=True)
+            return self.create_market_order(symbol, side, position['contracts'], {'reduce_only': True})
+        return None
+
+    def create_post_only_order(self, symbol: str, side: str, contracts: int, price: float,
+                               reduce_only: bool = False) -> Optional[Dict]:
+        """계약 수 기준 post-only 지정가 주문 (maker_orders 거래소 전용, 즉시 체결되면 거부)"""
+        return None
+
+    def get_order(self, symbol: str, order_id) -> Optional[Dict]:
+        """주문 상태 조회 ({'id', 'status', 'amount', 'filled', 'price'})"""
+        return None
+
+    def amend_order(self, symbol: str, order_id, price: float) -> Optional[Dict]:
+        """미체결 지정가 주문 가격 정정"""
+        return None
+
+    def cancel_order(self, symbol: str, order_id) -> Optional[Dict]:
+        """미체결 주문 취소 (취소 시점 체결 수량 포함)"""
+        return None
+
+    def countdown_cancel(self, symbol: str, timeout: int) -> bool:
+        """timeout초 안에 다시 호출하지 않으면 심볼의 미체결 주문 전체 취소 (0이면 해제)"""
+        return False
+
+    def fetch_positions(self, symbols=None):
+        """Compatibility method for ccxt-style position fetching"""
+        positions = self.get_positions() or []
+        if symbols:
+            return [pos for pos in positions if pos['symbol'] in symbols]
+        return positions
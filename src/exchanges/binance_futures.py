@@ -0,0 +1,377 @@
+"""
+Binance USDⓈ-M 무기한 선물 거래소 클래스
+"""
+import hashlib
+import hmac
+import logging
+import time
+from decimal import Decimal, ROUND_DOWN
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+
+import requests
+
+from src.config import settings
+from src.exchanges import health
+from src.exchanges.clock_sync import clock_sync
+from src.exchanges.base import ExchangeCapabilities, FuturesExchange
+from src.exchanges.gateio_rest import json_loads
+from src.exchanges.order_ids import OrderOutcomeUnknown, new_client_order_id, submit_idempotent
+from src.utils.deadline import request_timeout
+
+logger = logging.getLogger(__name__)
+
+BINANCE_FUTURES_HOST = "https://fapi.binance.com"
+
+
+class BinanceApiError(RuntimeError):
+    """HTTP error response; Binance error body: {"code": -2019, "msg": "Margin is insufficient."}"""
+
+    def __init__(self, status: int, text: str):
+        super().__init__(f"HTTP {status}: {text[:200]}")
+        self.status = status
+        try:
+            self.code = json_loads(text).get('code')
+        except (ValueError, AttributeError):
+            self.code = None
+
+
+class BinanceFuturesExchange(FuturesExchange):
+    """Binance USDⓈ-M futures REST implementation"""
+
+    # Orders are sized in coins (stepSize from MARKET_LOT_SIZE), no contract multiplier;
+    # orders can be looked up by newClientOrderId
+    capabilities = ExchangeCapabilities(client_order_lookup=True)
+
+    RECV_WINDOW = 5000
+    # Error code for an unknown orderId / origClientOrderId
+    ORDER_NOT_FOUND = -2013
+
+    def __init__(self, api_credentials, market_registry=None, host: str = BINANCE_FUTURES_HOST,
+                 timeout: float = 10):
+        self.exchange_id = 'binance'
+
+        # Validate API credentials
+        if not api_credentials:
+            raise ValueError("API credentials not provided for Binance exchange")
+
+        self.api_key = api_credentials.get('apiKey')
+        self.api_secret = api_credentials.get('secret')
+
+        if not self.api_key or not self.api_secret:
+            raise ValueError("API key and secret are required for Binance exchange")
+
+        self.host = host.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json', 'X-MBX-APIKEY': self.api_key})
+        health.install(self.session, self.exchange_id, self._endpoint_group)
+
+        # With a registry, markets come from its disk cache (no blocking download here)
+        self.market_registry = market_registry
+        self._futures_markets = {}
+        if market_registry is None:
+            self._load_futures_markets()
+
+    # ---------- HTTP ----------
+
+    def _request(self, method: str, path: str, params: Optional[Dict] = None, signed: bool = False):
+        """REST request returning the decoded JSON body"""
+        params = dict(params or {})
+        if signed:
+            params['timestamp'] = int(time.time() * 1000)
+            params['recvWindow'] = self.RECV_WINDOW
+        query_string = urlencode(params)
+        if signed:
+            signature = hmac.new(
+                self.api_secret.encode('utf-8'), query_string.encode('utf-8'), hashlib.sha256
+            ).hexdigest()
+            query_string = f"{query_string}&signature={signature}"
+
+        url = f"{self.host}{path}"
+        if query_string:
+            url = f"{url}?{query_string}"
+
+        try:
+            response = self.session.request(method, url, timeout=request_timeout(self._budget(method, path, signed)))
+        except (requests.ReadTimeout, requests.ConnectionError) as e:
+            # The order may have reached the matching engine - outcome unknown, not failed
+            if method == 'POST' and path == '/fapi/v1/order':
+                raise OrderOutcomeUnknown(f"binance {method} {path}: {e}") from e
+            raise
+        if response.status_code >= 400:
+            raise BinanceApiError(response.status_code, response.text)
+        return json_loads(response.content)
+
+    @staticmethod
+    def _endpoint_group(method: str, path: str) -> str:
+        """Circuit breaker endpoint group"""
+        if method != 'GET':
+            return health.ORDER
+        if path.startswith(('/fapi/v1/ticker', '/fapi/v1/exchangeInfo', '/fapi/v1/time')):
+            return health.QUOTE
+        return health.ACCOUNT
+
+    def _budget(self, method: str, path: str, signed: bool) -> float:
+        """Per-endpoint timeout budget (orders / account reads / quotes)"""
+        if method != 'GET':
+            return settings.ORDER_TIMEOUT_SECONDS
+        if signed:
+            return settings.ACCOUNT_TIMEOUT_SECONDS
+        if path.startswith('/fapi/v1/ticker'):
+            return settings.QUOTE_TIMEOUT_SECONDS
+        return self.timeout
+
+    @staticmethod
+    def _to_market_id(symbol: str) -> str:
+        """XRP/USDT:USDT -> XRPUSDT"""
+        return symbol.replace('/USDT:USDT', 'USDT')
+
+    @staticmethod
+    def _to_symbol(market_id: str) -> str:
+        """XRPUSDT -> XRP/USDT:USDT"""
+        return f"{market_id[:-4]}/USDT:USDT"
+
+    # ---------- 마켓 ----------
+
+    @property
+    def futures_markets(self) -> Dict:
+        """Futures market information keyed by symbol"""
+        if self.market_registry is not None:
+            return self.market_registry.get_markets(self.exchange_id)
+        return self._futures_markets
+
+    def fetch_markets(self) -> Dict:
+        """Download all trading USDT perpetual contracts"""
+        markets = {}
+        info = self._request('GET', '/fapi/v1/exchangeInfo')
+        for item in info.get('symbols', []):
+            if (item.get('contractType') != 'PERPETUAL' or item.get('quoteAsset') != 'USDT'
+                    or item.get('status') != 'TRADING'):
+                continue
+            filters = {f['filterType']: f for f in item.get('filters', [])}
+            # Market orders are bounded by MARKET_LOT_SIZE (falls back to LOT_SIZE)
+            lot = filters.get('MARKET_LOT_SIZE') or filters.get('LOT_SIZE') or {}
+            underlying = item['baseAsset']
+            markets[f"{underlying}/USDT:USDT"] = {
+                'name': item['symbol'],
+                'contract_size': 1,
+                'underlying': underlying,
+                'quantity_step': float(lot.get('stepSize') or 0),
+                'min_quantity': float(lot.get('minQty') or 0)
+            }
+        return markets
+
+    def _load_futures_markets(self):
+        """Load futures market information"""
+        try:
+            self._futures_markets = self.fetch_markets()
+            logger.info(f"Loaded {len(self._futures_markets)} Binance futures markets")
+        except Exception as e:
+            logger.error(f"Failed to load Binance futures markets: {e}")
+
+    def get_markets(self) -> Dict:
+        """Get all markets"""
+        return self.futures_markets
+
+    def load_markets(self):
+        """Compatibility method for ccxt-style market loading"""
+        return self.futures_markets
+
+    # ---------- 시세 ----------
+
+    def sync_clock(self) -> bool:
+        """Record a clock-offset sample from /fapi/v1/time"""
+        try:
+            sent_at = clock_sync.clock()
+            server_time = self._request('GET', '/fapi/v1/time')['serverTime'] / 1000
+            clock_sync.record(self.exchange_id, server_time, sent_at, clock_sync.clock())
+            return True
+        except Exception as e:
+            logger.warning(f"Binance clock sync failed: {e}")
+            return False
+
+    def _quote_from_book(self, symbol: str, book: Dict) -> Dict:
+        """bookTicker entry -> top-of-book quote (sizes in coins, 'time' = book update time in ms)"""
+        return clock_sync.stamp(self.exchange_id, {
+            'symbol': symbol,
+            'bid': float(book['bidPrice']),
+            'ask': float(book['askPrice']),
+            'bid_size': float(book.get('bidQty') or 0),
+            'ask_size': float(book.get('askQty') or 0)
+        }, book.get('time'))
+
+    def get_best_bid_ask(self, symbol: str) -> Optional[Dict]:
+        """Get top-of-book bid/ask"""
+        try:
+            book = self._request('GET', '/fapi/v1/ticker/bookTicker',
+                                 {'symbol': self._to_market_id(symbol)})
+            return self._quote_from_book(symbol, book)
+        except Exception as e:
+            logger.error(f"Failed to get Binance best bid/ask for {symbol}: {e}")
+            return None
+
+    def get_best_bid_asks(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get top-of-book bid/ask for several contracts in one request"""
+        if len(symbols) == 1:
+            quote_data = self.get_best_bid_ask(symbols[0])
+            return {symbols[0]: quote_data} if quote_data else {}
+        try:
+            wanted = {self._to_market_id(symbol): symbol for symbol in symbols}
+            return {
+                wanted[book['symbol']]: self._quote_from_book(wanted[book['symbol']], book)
+                for book in self._request('GET', '/fapi/v1/ticker/bookTicker')
+                if book.get('symbol') in wanted
+            }
+        except Exception as e:
+            logger.error(f"Failed to get Binance best bid/asks: {e}")
+            return {}
+
+    def get_ticker(self, symbol: str) -> Optional[Dict]:
+        """Get ticker information (24h stats + top of book)"""
+        try:
+            stats = self._request('GET', '/fapi/v1/ticker/24hr', {'symbol': self._to_market_id(symbol)})
+            quote_data = self.get_best_bid_ask(symbol)
+            if not quote_data:
+                return None
+            return {
+                'symbol': symbol,
+                'last': float(stats['lastPrice']),
+                'bid': quote_data['bid'],
+                'ask': quote_data['ask'],
+                'high': float(stats.get('highPrice') or 0),
+                'low': float(stats.get('lowPrice') or 0),
+                'volume': float(stats.get('volume') or 0)
+            }
+        except Exception as e:
+            logger.error(f"Failed to get Binance ticker for {symbol}: {e}")
+            return None
+
+    # ---------- 계정 ----------
+
+    def get_balance(self, currency: str) -> Optional[Dict]:
+        """Get futures wallet balance for a currency"""
+        try:
+            for asset in self._request('GET', '/fapi/v2/balance', signed=True):
+                if asset.get('asset') == currency:
+                    total = float(asset.get('balance') or 0)
+                    free = float(asset.get('availableBalance') or 0)
+                    return {'free': free, 'used': max(total - free, 0.0), 'total': total}
+            return {'free': 0, 'used': 0, 'total': 0}
+        except Exception as e:
+            logger.error(f"Failed to get Binance balance for {currency}: {e}")
+            return None
+
+    def get_positions(self) -> Optional[List[Dict]]:
+        """Get all open futures positions (contracts == coins, None if the lookup failed)"""
+        try:
+            result = []
+            for pos in self._request('GET', '/fapi/v2/positionRisk', signed=True):
+                amount = float(pos.get('positionAmt') or 0)
+                if amount == 0:
+                    continue
+                result.append({
+                    'symbol': self._to_symbol(pos['symbol']),
+                    'side': 'short' if amount < 0 else 'long',
+                    'contracts': abs(amount),
+                    'notional': abs(float(pos.get('notional') or 0)),
+                    'mode': pos.get('positionSide', 'BOTH'),
+                    'mark_price': float(pos.get('markPrice') or 0),
+                    'entry_price': float(pos.get('entryPrice') or 0)
+                })
+            return result
+        except Exception as e:
+            logger.error(f"Failed to get Binance positions: {e}")
+            return None
+
+    def set_leverage(self, symbol: str, leverage: int) -> bool:
+        """Set leverage for a symbol"""
+        try:
+            self._request('POST', '/fapi/v1/leverage',
+                          {'symbol': self._to_market_id(symbol), 'leverage': int(leverage)}, signed=True)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set Binance leverage: {e}")
+            return False
+
+    # ---------- 주문 ----------
+
+    def _format_quantity(self, symbol: str, amount: float) -> str:
+        """Floor the quantity to the market step (no float artifacts in the request)"""
+        step = self.get_quantity_step(symbol)
+        quantity = Decimal(str(amount))
+        if step:
+            step_dec = Decimal(str(step))
+            quantity = (quantity / step_dec).to_integral_value(rounding=ROUND_DOWN) * step_dec
+        return format(quantity.normalize(), 'f')
+
+    def _submit_order(self, order_params: Dict) -> Optional[Dict]:
+        """Submit an order tagged with newClientOrderId; if no response arrives, look it up
+        by that ID and resubmit with the same ID only when Binance never accepted it"""
+        params = dict(order_params, newClientOrderId=new_client_order_id(self.exchange_id))
+        return submit_idempotent(
+            f"binance {params['symbol']} {params['side']} ({params['newClientOrderId']})",
+            lambda: self._request('POST', '/fapi/v1/order', params, signed=True),
+            lambda: self._find_order(params['symbol'], params['newClientOrderId'])
+        )
+
+    def _find_order(self, market_id: str, client_order_id: str) -> Optional[Dict]:
+        """Order by client order ID, or None if Binance has no such order"""
+        try:
+            return self._request('GET', '/fapi/v1/order',
+                                 {'symbol': market_id, 'origClientOrderId': client_order_id}, signed=True)
+        except BinanceApiError as e:
+            if e.code == self.ORDER_NOT_FOUND:
+                return None
+            raise
+
+    def find_order_by_client_id(self, symbol: str, client_order_id: str, placed_at: float) -> Optional[Dict]:
+        """Order by client order ID (filled in coins), or None if Binance never accepted it
+
+        (Binance purges only cancelled/expired orders without fills after 3 days - such a miss hides no fill)
+        """
+        data = self._find_order(self._to_market_id(symbol), client_order_id)
+        if data is None:
+            return None
+        return {
+            'id': data.get('orderId'),
+            'status': data.get('status'),
+            'filled': float(data.get('executedQty') or 0)
+        }
+
+    def create_market_order(self, symbol: str, side: str, amount: float,
+                            params: Optional[Dict] = None) -> Optional[Dict]:
+        """Create a market order (amount in coins)"""
+        try:
+            quantity = self._format_quantity(symbol, amount)
+            if Decimal(quantity) <= 0:
+                logger.error(f"Binance order quantity too small: {symbol} = {amount}")
+                return None
+
+            order_params = {
+                'symbol': self._to_market_id(symbol),
+                'side': side.upper(),
+                'type': 'MARKET',
+                'quantity': quantity,
+                'newOrderRespType': 'RESULT'
+            }
+            if params and params.get('reduce_only'):
+                order_params['reduceOnly'] = 'true'
+
+            response = self._submit_order(order_params)
+            if response is None:
+                return None
+
+            logger.info(f"Binance futures order placed: {symbol} {side} {quantity}")
+
+            return {
+                'id': str(response.get('orderId')),
+                'symbol': symbol,
+                'side': side,
+                'amount': float(quantity),
+                'status': response.get('status'),
+                'filled': float(response.get('executedQty') or 0)
+            }
+        except Exception as e:
+            logger.error(f"Failed to create Binance market order: {e}")
+            return None
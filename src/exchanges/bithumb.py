@@ -1,18 +1,56 @@
 import hashlib
 import hmac
 import base64
-import time
 import urllib.parse
 import requests
 import logging
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional
+
+from src.config import settings
+from src.exchanges import health
+from src.exchanges.clock_sync import clock_sync
+from src.exchanges.base import ExchangeCapabilities, SpotExchange, format_price, tick_from_table
+from src.exchanges.order_ids import OrderOutcomeUnknown, submit_idempotent
+from src.utils.deadline import current_deadline, mark_unknown, request_timeout
+from src.utils.hedged_request import HedgedRequester
+from src.utils.nonce import NonceGenerator
 
 logger = logging.getLogger(__name__)
 
-class BithumbExchange:
+# 모든 비공개 요청이 공유하는 nonce (동시 요청이 같은 밀리초 nonce로 거부되지 않도록)
+_nonces = NonceGenerator()
+
+class BithumbExchange(SpotExchange):
     """Bithumb Native API 거래소 구현"""
     
-    def __init__(self, api_key: str, api_secret: str):
+    # API 자동거래 수량 정밀도 / 최소 주문 금액
+    DEFAULT_QUANTITY_PRECISION = 4
+    DEFAULT_MIN_ORDER_KRW = 1000.0
+    
+    # 시장가 매수는 KRW 금액을 받아 4자리 코인 개수로 변환해서 주문
+    # 지정가 IOC는 지정가 주문 + 즉시 잔량 취소로 처리
+    capabilities = ExchangeCapabilities(
+        quote_amount_buys=True, quantity_precision=DEFAULT_QUANTITY_PRECISION,
+        limit_ioc_orders=True
+    )
+    
+    # KRW 마켓 호가 단위 ((최소 가격, 호가 단위), 가격 내림차순)
+    KRW_TICK_SIZES = (
+        (1_000_000, 1000), (500_000, 500), (100_000, 100), (50_000, 50),
+        (10_000, 10), (5_000, 5), (1_000, 1), (100, 0.1), (10, 0.01),
+        (1, 0.001), (0, 0.0001),
+    )
+    
+    # 응답 없는 주문 조회 시 제출 시각 허용 오차 (시계 오프셋 추정 오차 포함)
+    ORDER_LOOKUP_SLACK_SECONDS = 1.0
+    # 조회 결과 없음 (status 5600 메시지)
+    NO_RECORDS_MESSAGE = '존재하지 않습니다'
+    # 지정가 IOC 잔량 취소 시도 횟수 / 미체결 주문 상태 (order_detail order_status)
+    IOC_CANCEL_ATTEMPTS = 3
+    PENDING_STATUS = 'Pending'
+    
+    def __init__(self, api_key: str, api_secret: str, market_registry=None):
         self.exchange_id = 'bithumb'
         
         # Validate API credentials
@@ -25,16 +63,31 @@ class BithumbExchange:
         self.public_api_url = "https://api.bithumb.com/public"
         self.private_api_url = "https://api.bithumb.com"
 
+        self.market_registry = market_registry
+        # 공개 시세 GET 전용 (주문/계정 요청은 복제하지 않음)
+        self.hedged_requests = HedgedRequester(self.exchange_id)
+        
         self.session = requests.Session()
         self.session.headers.update({
             'Api-Key': self.api_key,
             'Api-Sign': '',
             'Api-Nonce': ''
         })
+        health.install(self.session, self.exchange_id, self._endpoint_group)
+        clock_sync.install(self.session, self.exchange_id)
+    
+    @staticmethod
+    def _endpoint_group(method: str, path: str) -> str:
+        """서킷 브레이커 엔드포인트 그룹 (/public 시세, /trade 주문, /info 조회)"""
+        if path.startswith('/public/'):
+            return health.QUOTE
+        if path.startswith('/trade/'):
+            return health.ORDER
+        return health.ACCOUNT
     
     def _create_signature(self, endpoint: str, params: Dict) -> Dict:
         """Create signature for private API calls"""
-        nonce = str(int(time.time() * 1000))
+        nonce = str(_nonces.next())
         
         # Create the message to sign
         data = endpoint + chr(0) + urllib.parse.urlencode(params) + chr(0) + nonce
@@ -56,18 +109,27 @@ class BithumbExchange:
             'Content-Type': 'application/x-www-form-urlencoded'
         }
     
-    def _public_api_call(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    def _public_api_call(self, endpoint: str, params: Optional[Dict] = None,
+                         query: Optional[Dict] = None) -> Optional[Dict]:
         """Make public API call"""
         try:
             url = f"{self.public_api_url}/{endpoint}"
             if params:
                 url += f"/{params.get('order_currency', 'ALL')}_{params.get('payment_currency', 'KRW')}"
             
-            response = self.session.get(url)
+            sent_at = clock_sync.clock()
+            response = self.hedged_requests.get(endpoint, lambda: self.session.get(
+                url, params=query, timeout=request_timeout(settings.QUOTE_TIMEOUT_SECONDS)
+            ))
             data = response.json()
             
             if data.get('status') == '0000':
-                return data.get('data')
+                # 시세 응답의 timestamp/date(ms)는 응답 생성 시각 - Date 헤더보다 정밀한 시계 표본
+                result = data.get('data')
+                server_ms = isinstance(result, dict) and (result.get('timestamp') or result.get('date'))
+                if server_ms:
+                    clock_sync.record(self.exchange_id, int(server_ms) / 1000, sent_at, clock_sync.clock())
+                return result
             else:
                 logger.error(f"API error: {data.get('message')}")
                 return None
@@ -75,19 +137,26 @@ class BithumbExchange:
             logger.error(f"Public API call failed: {e}")
             return None
     
-    def _private_api_call(self, endpoint: str, params: Dict) -> Optional[Dict]:
-        """Make private API call"""
+    def _private_post(self, endpoint: str, params: Dict) -> Dict:
+        """Signed private POST returning the raw response body"""
+        url = f"{self.private_api_url}{endpoint}"
+        headers = self._create_signature(endpoint, params)
+        
+        # /trade/* 는 주문 제출/취소, /info/* 는 조회
+        submits_order = endpoint.startswith('/trade/')
+        budget = settings.ORDER_TIMEOUT_SECONDS if submits_order else settings.ACCOUNT_TIMEOUT_SECONDS
+        response = self.session.post(url, headers=headers, data=params, timeout=request_timeout(budget))
+        return response.json()
+    
+    def _private_api_call(self, endpoint: str, params: Dict, raise_unknown: bool = False) -> Optional[Dict]:
+        """Make private API call (raise_unknown: 전송 오류를 None 대신 OrderOutcomeUnknown으로 올림)"""
         try:
-            url = f"{self.private_api_url}{endpoint}"
-            headers = self._create_signature(endpoint, params)
-            
-            response = self.session.post(url, headers=headers, data=params)
-            data = response.json()
+            data = self._private_post(endpoint, params)
             
             if data.get('status') == '0000':
                 # Return successful response
                 # For market orders, the response includes order_id directly
-                if endpoint in ['/trade/market_buy', '/trade/market_sell']:
+                if endpoint in ['/trade/market_buy', '/trade/market_sell', '/trade/place']:
                     return {'order_id': data.get('order_id')}
                 return data.get('data')
             else:
@@ -96,21 +165,84 @@ class BithumbExchange:
                 error_code = data.get('status', 'Unknown')
                 logger.error(f"API error [{error_code}]: {error_msg}")
                 return None  # Return None on error
+        except requests.RequestException as e:
+            # 주문은 전달됐을 수 있음 - 실패가 아닌 결과 미확인
+            if raise_unknown:
+                raise OrderOutcomeUnknown(f"bithumb {endpoint}: {e}") from e
+            if isinstance(e, requests.ReadTimeout) and endpoint.startswith('/trade/'):
+                mark_unknown(f"bithumb {endpoint}")
+            logger.error(f"Private API call failed: {e}")
+            return None
         except Exception as e:
             logger.error(f"Private API call failed: {e}")
             return None
     
+    def _private_query(self, endpoint: str, params: Dict) -> List[Dict]:
+        """목록 조회 - 내역 없음은 빈 목록, 그 외 오류는 예외 (없음과 조회 실패를 구분해야 하는 곳에서 사용)"""
+        data = self._private_post(endpoint, params)
+        if data.get('status') == '0000':
+            return data.get('data') or []
+        if data.get('status') == '5600' and self.NO_RECORDS_MESSAGE in data.get('message', ''):
+            return []
+        raise RuntimeError(f"Bithumb {endpoint} [{data.get('status')}]: {data.get('message')}")
+    
+    def _submit_order(self, endpoint: str, order_params: Dict) -> Optional[Dict]:
+        """주문 제출 - 응답이 없으면 접수 여부 확인 후 접수되지 않았을 때만 재제출
+        
+        빗썸 주문 API에는 클라이언트 주문 ID가 없어 제출 시각 이후 같은 방향/수량의
+        미체결 주문, 없으면 같은 방향 체결 내역으로 확인 (심볼별 주문은 한 번에 하나)
+        """
+        side = 'bid' if endpoint == '/trade/market_buy' or order_params.get('type') == 'bid' else 'ask'
+        submitted_at = []
+        
+        def submit():
+            submitted_at.append(clock_sync.clock())
+            return self._private_api_call(endpoint, order_params, raise_unknown=True)
+        
+        return submit_idempotent(
+            f"bithumb {endpoint} {order_params['order_currency']} {order_params['units']}",
+            submit,
+            lambda: self._find_recent_order(order_params, side, submitted_at[-1])
+        )
+    
+    def _find_recent_order(self, order_params: Dict, side: str, submitted_at: float) -> Optional[Dict]:
+        """submitted_at(로컬 시각) 이후 접수된 주문
+        
+        Returns:
+            미체결 주문이 있으면 {'order_id'}, 체결 내역만 있으면 {'order_id': None, 'units', 'total'},
+            없으면 None (조회 실패는 예외)
+        """
+        # 빗썸 order_date/transfer_date는 거래소 시각 (마이크로초)
+        since_us = (submitted_at + clock_sync.offset(self.exchange_id) - self.ORDER_LOOKUP_SLACK_SECONDS) * 1_000_000
+        currency = {key: order_params[key] for key in ('order_currency', 'payment_currency')}
+        units = float(order_params['units'])
+        
+        for order in self._private_query('/info/orders', dict(currency, type=side, count=100)):
+            if int(order.get('order_date') or 0) >= since_us and float(order.get('units') or 0) == units:
+                return {'order_id': order['order_id']}
+        
+        fills = [
+            fill for fill in self._private_query('/info/user_transactions', dict(
+                currency, searchGb='1' if side == 'bid' else '2', offset=0, count=50
+            ))
+            if int(fill.get('transfer_date') or 0) >= since_us
+        ]
+        if not fills:
+            return None
+        return {
+            'order_id': None,
+            'units': sum(float(fill.get('units') or 0) for fill in fills),
+            'total': sum(float(fill.get('amount') or 0) for fill in fills)
+        }
+    
     def get_ticker(self, symbol: str) -> Optional[Dict]:
-        """Get ticker information"""
+        """Get ticker information (includes 24h stats)"""
         try:
             # Convert symbol format: XRP/KRW -> XRP_KRW
             base, quote = symbol.split('/')
             
             # Get orderbook to get bid/ask prices
-            orderbook_data = self._public_api_call('orderbook', {
-                'order_currency': base,
-                'payment_currency': quote
-            })
+            quote_data = self.get_best_bid_ask(symbol)
             
             # Get ticker for last price
             ticker_data = self._public_api_call('ticker', {
@@ -130,11 +262,9 @@ class BithumbExchange:
                 }
                 
                 # Add bid/ask from orderbook if available
-                if orderbook_data:
-                    if 'bids' in orderbook_data and len(orderbook_data['bids']) > 0:
-                        result['bid'] = float(orderbook_data['bids'][0]['price'])
-                    if 'asks' in orderbook_data and len(orderbook_data['asks']) > 0:
-                        result['ask'] = float(orderbook_data['asks'][0]['price'])
+                if quote_data:
+                    result['bid'] = quote_data['bid']
+                    result['ask'] = quote_data['ask']
                 
                 return result
             return None
@@ -142,8 +272,68 @@ class BithumbExchange:
             logger.error(f"Failed to get ticker for {symbol}: {e}")
             return None
     
-    def get_balance(self, currency: str) -> Optional[Dict]:
-        """Get balance for a specific currency"""
+    def _top_of_book(self, symbol: str, orderbook: Dict, timestamp: Optional[str] = None) -> Optional[Dict]:
+        """Best bid/ask from an orderbook entry (timestamp: orderbook time in ms, None if either side is empty)"""
+        bids = orderbook.get('bids') or []
+        asks = orderbook.get('asks') or []
+        if not bids or not asks:
+            return None
+        return clock_sync.stamp(self.exchange_id, {
+            'symbol': symbol,
+            'bid': float(bids[0]['price']),
+            'ask': float(asks[0]['price']),
+            'bid_size': float(bids[0].get('quantity') or 0),
+            'ask_size': float(asks[0].get('quantity') or 0)
+        }, float(timestamp or orderbook.get('timestamp') or 0))
+    
+    def get_best_bid_ask(self, symbol: str) -> Optional[Dict]:
+        """Get top-of-book bid/ask (single orderbook request, depth 1)"""
+        try:
+            base, quote = symbol.split('/')
+            orderbook = self._public_api_call('orderbook', {
+                'order_currency': base,
+                'payment_currency': quote
+            }, query={'count': 1})
+            if not orderbook:
+                return None
+            return self._top_of_book(symbol, orderbook)
+        except Exception as e:
+            logger.error(f"Failed to get orderbook for {symbol}: {e}")
+            return None
+    
+    def get_best_bid_asks(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get top-of-book bid/ask for several markets (one ALL_<quote> request per quote currency)"""
+        if len(symbols) == 1:
+            quote_data = self.get_best_bid_ask(symbols[0])
+            return {symbols[0]: quote_data} if quote_data else {}
+        
+        by_quote: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            by_quote.setdefault(symbol.split('/')[1], []).append(symbol)
+        
+        quotes = {}
+        for quote, quote_symbols in by_quote.items():
+            try:
+                orderbooks = self._public_api_call('orderbook', {
+                    'order_currency': 'ALL',
+                    'payment_currency': quote
+                }, query={'count': 1})
+                if not orderbooks:
+                    continue
+                for symbol in quote_symbols:
+                    orderbook = orderbooks.get(symbol.split('/')[0])
+                    quote_data = (
+                        self._top_of_book(symbol, orderbook, orderbooks.get('timestamp'))
+                        if isinstance(orderbook, dict) else None
+                    )
+                    if quote_data:
+                        quotes[symbol] = quote_data
+            except Exception as e:
+                logger.error(f"Failed to get orderbooks for {quote} markets: {e}")
+        return quotes
+    
+    def get_balances(self) -> Optional[Dict[str, Dict]]:
+        """Get balances for all currencies in one request"""
         try:
             # Bithumb API는 currency를 'ALL'로 보내야 모든 잔고를 받을 수 있음
             # 특정 통화만 요청하면 오류 발생
@@ -153,30 +343,31 @@ class BithumbExchange:
             
             data = self._private_api_call('/info/balance', params)
             
-            if data and isinstance(data, dict):
-                # Bithumb returns balances with currency code in lowercase
-                currency_lower = currency.lower()
-                
-                # For KRW, directly use the provided values
-                if currency.upper() == 'KRW':
-                    total = float(data.get('total_krw', 0))
-                    in_use = float(data.get('in_use_krw', 0))
-                    available = float(data.get('available_krw', 0))
-                else:
-                    # For other currencies, use currency-specific keys
-                    total = float(data.get(f'total_{currency_lower}', 0))
-                    in_use = float(data.get(f'in_use_{currency_lower}', 0))
-                    available = float(data.get(f'available_{currency_lower}', 0))
-                
-                return {
-                    'free': available,
-                    'used': in_use,
-                    'total': total
+            if not data or not isinstance(data, dict):
+                return None
+            
+            # Bithumb returns balances with currency code in lowercase (total_xrp, in_use_xrp, ...)
+            balances = {}
+            for key in data:
+                if not key.startswith('total_'):
+                    continue
+                currency_lower = key[len('total_'):]
+                balances[currency_lower.upper()] = {
+                    'free': float(data.get(f'available_{currency_lower}', 0)),
+                    'used': float(data.get(f'in_use_{currency_lower}', 0)),
+                    'total': float(data.get(key, 0))
                 }
-            return {'free': 0, 'used': 0, 'total': 0}
+            return balances
         except Exception as e:
-            logger.error(f"Failed to get balance for {currency}: {e}")
-            return {'free': 0, 'used': 0, 'total': 0}
+            logger.error(f"Failed to get balances: {e}")
+            return None
+    
+    def get_balance(self, currency: str) -> Optional[Dict]:
+        """Get balance for a specific currency (None if the lookup failed)"""
+        balances = self.get_balances()
+        if balances is None:
+            return None
+        return balances.get(currency.upper(), {'free': 0, 'used': 0, 'total': 0})
     
     def create_market_order(self, symbol: str, side: str, amount: float, params: Optional[Dict] = None) -> Optional[Dict]:
         """Create a market order
@@ -193,7 +384,7 @@ class BithumbExchange:
             
             if side == 'buy':
                 # Get current price to calculate crypto units
-                ticker = self.get_ticker(symbol)
+                ticker = self.get_best_bid_ask(symbol)
                 if not ticker:
                     logger.error(f"Cannot get ticker for {symbol}")
                     return None
@@ -206,7 +397,7 @@ class BithumbExchange:
                 
                 # Calculate crypto units from KRW amount
                 # Bithumb API 자동거래는 4자리까지만 지원
-                crypto_units = round(amount / price, 4)
+                crypto_units = round(amount / price, self.get_quantity_precision(symbol))
                 
                 endpoint = '/trade/market_buy'
                 order_params = {
@@ -221,16 +412,16 @@ class BithumbExchange:
                 order_params = {
                     'order_currency': base,
                     'payment_currency': quote,
-                    'units': str(round(amount, 4))  # API 자동거래는 4자리까지 지원
+                    'units': str(round(amount, self.get_quantity_precision(symbol)))  # API 자동거래는 4자리까지 지원
                 }
             
-            data = self._private_api_call(endpoint, order_params)
+            data = self._submit_order(endpoint, order_params)
             
             if data:
                 logger.info(f"Market order placed: {symbol} {side} {amount}")
                 
                 # Parse response based on Bithumb's actual format
-                order_id = data.get('order_id', 'unknown')
+                order_id = data.get('order_id') or 'unknown'
                 
                 # Get executed amount and cost from response
                 if side == 'buy':
@@ -258,17 +449,121 @@ class BithumbExchange:
             logger.error(f"Failed to create market order: {e}")
             return None
     
+    def get_tick_size(self, symbol: str, price: float) -> float:
+        """KRW 마켓 호가 단위"""
+        return tick_from_table(price, self.KRW_TICK_SIZES)
+    
+    def create_limit_ioc_order(self, symbol: str, side: str, quantity: float,
+                               price: float) -> Optional[Dict]:
+        """지정가 IOC 주문 - 지정가 주문 후 남은 잔량을 바로 취소하고 체결 수량 확인"""
+        try:
+            base, quote = symbol.split('/')
+            order_type = 'bid' if side == 'buy' else 'ask'
+            units = round(quantity, self.get_quantity_precision(symbol))
+            data = self._submit_order('/trade/place', {
+                'order_currency': base,
+                'payment_currency': quote,
+                'units': str(units),
+                'price': format_price(price),
+                'type': order_type
+            })
+            if not data:
+                return None
+            if not data.get('order_id'):
+                # 응답 없이 전량 체결된 주문 (체결 내역으로 확인) - 취소할 잔량 없음
+                filled = min(data.get('units', 0.0), units)
+                logger.info(f"Limit IOC order (resolved from fills): {symbol} {side} {units} @ {price} → filled {filled}")
+                return {
+                    'id': None,
+                    'symbol': symbol,
+                    'side': side,
+                    'amount': units,
+                    'price': price,
+                    'status': 'completed',
+                    'filled': filled,
+                    'remaining': max(units - filled, 0.0)
+                }
+            
+            order_id = data['order_id']
+            order_ref = {'order_id': order_id, 'order_currency': base, 'payment_currency': quote}
+            detail = self._cancel_remainder(order_ref, order_type)
+            if detail is None:
+                # 잔량이 보호 가격에 남아 나중에 체결될 수 있음 - 체결 수량을 확정하지 않고 reconcile
+                mark_unknown(f"bithumb limit IOC {symbol} {order_id} 잔량 취소 미확인")
+                return None
+            filled = sum(float(fill.get('units') or 0) for fill in detail.get('contract') or [])
+            logger.info(f"Limit IOC order: {symbol} {side} {units} @ {price} → filled {filled}")
+            return {
+                'id': order_id,
+                'symbol': symbol,
+                'side': side,
+                'amount': units,
+                'price': price,
+                'status': detail.get('order_status', 'unknown'),
+                'filled': filled,
+                'remaining': max(units - filled, 0.0)
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to create limit IOC order: {e}")
+            return None
+    
+    def _cancel_remainder(self, order_ref: Dict, order_type: str) -> Optional[Dict]:
+        """지정가 주문 잔량 취소 - 주문이 더 이상 미체결 상태가 아닌 것을 확인한 주문 상세 반환
+        
+        빗썸 지정가 주문은 호가창에 남으므로 IOC는 이 취소에 달려 있음. 전량 체결된 주문은
+        취소 실패가 정상이라 취소 응답 대신 order_detail 상태로 확인하고, 아직 미체결이면 다시 취소
+        
+        Returns:
+            주문 상세 (order_status가 Pending이 아님), 끝내 확인하지 못하면 None
+        """
+        for attempt in range(self.IOC_CANCEL_ATTEMPTS):
+            if attempt > 0:
+                deadline = current_deadline()
+                delay = settings.ORDER_LOOKUP_DELAY_SECONDS
+                time.sleep(min(delay, deadline.remaining()) if deadline is not None else delay)
+            try:
+                cancel_status = self._private_post('/trade/cancel', dict(order_ref, type=order_type)).get('status')
+            except requests.RequestException as e:
+                cancel_status = str(e)
+            detail = self._private_api_call('/info/order_detail', order_ref)
+            if detail and detail.get('order_status') != self.PENDING_STATUS:
+                return detail
+            logger.warning(
+                f"Limit IOC remainder of {order_ref['order_id']} not confirmed cancelled "
+                f"(cancel {cancel_status}, status {detail.get('order_status') if detail else 'unknown'}) "
+                f"({attempt + 1}/{self.IOC_CANCEL_ATTEMPTS})"
+            )
+        return None
+    
     def get_markets(self) -> Dict:
-        """Get all markets"""
-        # For simplicity, return empty dict as we focus on KRW markets
+        """Get all markets (레지스트리가 없으면 빈 dict)"""
+        if self.market_registry is not None:
+            return self.market_registry.get_markets(self.exchange_id)
         return {}
     
-    def get_usdt_krw_price(self) -> Optional[float]:
-        """Get USDT/KRW price (ask price for buying)"""
-        ticker = self.get_ticker('USDT/KRW')
-        return ticker['ask'] if ticker else None
+    def fetch_markets(self) -> Dict:
+        """전체 KRW 마켓 목록 다운로드 (ticker/ALL_KRW)"""
+        data = self._public_api_call('ticker', {
+            'order_currency': 'ALL',
+            'payment_currency': 'KRW'
+        })
+        if not data:
+            return {}
+        
+        markets = {}
+        for base, item in data.items():
+            if not isinstance(item, dict):  # 'date' 등 메타 필드 제외
+                continue
+            markets[f"{base}/KRW"] = {
+                'base': base,
+                'quote': 'KRW',
+                'quantity_precision': self.DEFAULT_QUANTITY_PRECISION,
+                'min_order_krw': self.DEFAULT_MIN_ORDER_KRW
+            }
+        return markets
     
-    @property
-    def exchange(self):
-        """Compatibility property"""
-        return self
\ No newline at end of file
+    def get_quantity_precision(self, symbol: str) -> int:
+        """주문 수량 소수점 자리수"""
+        market = self.get_markets().get(symbol, {})
+        return market.get('quantity_precision', self.DEFAULT_QUANTITY_PRECISION)
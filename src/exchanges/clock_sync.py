@@ -0,0 +1,157 @@
+"""
+거래소 시계 오프셋 추정 / 호가 나이
+
+거래소 서버 시각 표본(서버 시각 API, 응답 본문 타임스탬프, HTTP Date 헤더)으로
+거래소별 시계 오프셋(거래소 시각 - 로컬 시각)을 추정. 표본마다 불확실성 = 왕복 시간/2 + 시각 해상도/2
++ 측정 후 경과 시간 × 최대 시계 drift, 최근 표본 중 불확실성이 가장 작은 표본의 오프셋 사용 (NTP 방식)
+
+호가에는 'timestamp'(거래소 시각, ms)와 'quote_time'(로컬 시각으로 환산, 초)을 붙여
+어느 거래소 호가든 time.time() - quote_time 으로 나이를 비교할 수 있게 함.
+거래소 시각을 환산한 호가에는 오프셋 불확실성 'quote_time_error'(초)도 붙여 나이 제한에 더함
+"""
+import logging
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Callable, Deque, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# 거래소별 보관 표본 수
+SAMPLE_WINDOW = 32
+# HTTP Date 헤더 해상도 (초)
+DATE_HEADER_RESOLUTION = 1.0
+# 로컬/거래소 시계 상대 drift 상한 (초/초) - 오래된 표본일수록 불확실성 증가
+MAX_CLOCK_DRIFT = 1e-4
+
+
+class ClockSample(NamedTuple):
+    """시계 오프셋 표본"""
+    offset: float  # 거래소 시각 - 로컬 시각 (초)
+    uncertainty: float  # 오차 범위 (초)
+    taken_at: float  # 측정 시각 (로컬)
+
+
+class ClockSync:
+    """거래소별 시계 오프셋 추정"""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self._samples: Dict[str, Deque[ClockSample]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, venue: str, server_time: float, sent_at: float, received_at: float,
+               resolution: float = 0.0) -> None:
+        """서버 시각 표본 기록 (server_time: 요청~응답 사이 거래소 시각, 초 단위 epoch)
+
+        resolution: 서버 시각의 해상도 (Date 헤더는 1초 - 초 단위 내림이므로 중간값 사용)
+        """
+        round_trip = max(received_at - sent_at, 0.0)
+        sample = ClockSample(
+            server_time + resolution / 2 - (sent_at + received_at) / 2,
+            round_trip / 2 + resolution / 2,
+            received_at
+        )
+        with self._lock:
+            self._samples.setdefault(venue, deque(maxlen=SAMPLE_WINDOW)).append(sample)
+
+    def _aged(self, sample: ClockSample, now: float) -> ClockSample:
+        """측정 후 시계 drift를 불확실성에 반영한 표본"""
+        return sample._replace(uncertainty=sample.uncertainty + max(now - sample.taken_at, 0.0) * MAX_CLOCK_DRIFT)
+
+    def best_sample(self, venue: str) -> Optional[ClockSample]:
+        """불확실성(drift 반영)이 가장 작은 최근 표본"""
+        with self._lock:
+            samples = list(self._samples.get(venue, ()))
+        now = self.clock()
+        return min((self._aged(sample, now) for sample in samples),
+                   key=lambda sample: sample.uncertainty, default=None)
+
+    def offset(self, venue: str) -> float:
+        """거래소 시각 - 로컬 시각 (초, 표본이 없으면 0)"""
+        sample = self.best_sample(venue)
+        return sample.offset if sample else 0.0
+
+    def uncertainty(self, venue: str) -> Optional[float]:
+        """오프셋 불확실성 (초, 표본이 없으면 None)"""
+        sample = self.best_sample(venue)
+        return sample.uncertainty if sample else None
+
+    def last_sample_at(self, venue: str) -> Optional[float]:
+        """마지막 표본 측정 시각 (로컬, 표본이 없으면 None)"""
+        with self._lock:
+            samples = self._samples.get(venue)
+            return samples[-1].taken_at if samples else None
+
+    def to_local(self, venue: str, exchange_time: float) -> float:
+        """거래소 시각(초) → 로컬 시각(초)"""
+        return exchange_time - self.offset(venue)
+
+    def stamp(self, venue: str, quote: Dict, exchange_ms: Optional[float] = None,
+              received_at: Optional[float] = None) -> Dict:
+        """호가에 거래소 시각/로컬 환산 시각 기록
+
+        거래소 타임스탬프가 없으면 수신 시각 기준 (거래소 쪽 지연은 알 수 없음)
+        """
+        if exchange_ms:
+            sample = self.best_sample(venue)
+            quote['timestamp'] = exchange_ms
+            quote['quote_time'] = exchange_ms / 1000 - (sample.offset if sample else 0.0)
+            if sample:
+                quote['quote_time_error'] = sample.uncertainty
+        else:
+            received_at = self.clock() if received_at is None else received_at
+            quote['timestamp'] = (received_at + self.offset(venue)) * 1000
+            quote['quote_time'] = received_at
+        return quote
+
+    def quote_age(self, quote: Dict) -> Optional[float]:
+        """호가 나이 (초, 시각 정보가 없으면 None)"""
+        quote_time = quote.get('quote_time')
+        if quote_time is None:
+            return None
+        return max(self.clock() - quote_time, 0.0)
+
+    def response_hook(self, venue: str):
+        """requests 응답 훅 - HTTP Date 헤더로 표본 기록"""
+        def hook(response, *args, **kwargs):
+            date = response.headers.get('Date')
+            if not date:
+                return
+            try:
+                server_time = parsedate_to_datetime(date).timestamp()
+            except (TypeError, ValueError):
+                return
+            received_at = self.clock()
+            sent_at = received_at - response.elapsed.total_seconds()
+            self.record(venue, server_time, sent_at, received_at, DATE_HEADER_RESOLUTION)
+        return hook
+
+    def install(self, session, venue: str) -> None:
+        """세션 응답마다 Date 헤더 표본 기록"""
+        session.hooks['response'].append(self.response_hook(venue))
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """모니터링용 거래소별 오프셋 {거래소: {'offset_ms', 'uncertainty_ms', 'samples'}}"""
+        with self._lock:
+            venues = {venue: list(samples) for venue, samples in self._samples.items()}
+        now = self.clock()
+        return {
+            venue: {
+                'offset_ms': best.offset * 1000,
+                'uncertainty_ms': best.uncertainty * 1000,
+                'samples': len(samples)
+            }
+            for venue, samples in sorted(venues.items())
+            for best in [min((self._aged(sample, now) for sample in samples), key=lambda sample: sample.uncertainty)]
+        }
+
+    def reset(self) -> None:
+        """모든 표본 삭제"""
+        with self._lock:
+            self._samples.clear()
+
+
+# 전역 시계 동기화 (모니터링은 clock_sync.snapshot())
+clock_sync = ClockSync()
@@ -1,17 +1,48 @@
 """
 Gate.io Native API 거래소 클래스
 """
-import gate_api
-from gate_api.exceptions import GateApiException
 import logging
+import threading
 from typing import Dict, Optional, List
 
+from src.config import settings
+from src.exchanges import health
+from src.exchanges.clock_sync import clock_sync
+from src.exchanges.base import ExchangeCapabilities, FuturesExchange, format_price
+from src.exchanges.order_batcher import OrderBatcher
+from src.exchanges.gateio_rest import (
+    GATE_API_HOST, GATE_API_PREFIX, GateRestClient, FuturesTickerRow, endpoint_group
+)
+from src.exchanges.order_ids import OrderOutcomeUnknown, new_client_order_id, submit_idempotent
+from src.utils.deadline import current_deadline, mark_unknown, request_timeout, use_deadline
+
 logger = logging.getLogger(__name__)
 
-class GateIOExchange:
+
+def _gate_api():
+    """Import gate_api on first use (the generated client loads hundreds of model modules)"""
+    import gate_api
+    return gate_api
+
+
+class GateIOExchange(FuturesExchange):
     """Gate.io Native API 거래소 구현"""
     
-    def __init__(self, api_credentials):
+    # Orders are sized in whole contracts (quanto_multiplier coins each);
+    # post-only (tif='poc') orders, amend/cancel, countdown-cancel, limit IOC, batch orders
+    # and lookup by client order ID (text) are supported
+    capabilities = ExchangeCapabilities(
+        contract_sizing=True, maker_orders=True, limit_ioc_orders=True, batch_orders=True,
+        client_order_lookup=True
+    )
+    
+    # Maximum orders per create_batch_futures_order call
+    BATCH_MAX_ORDERS = 10
+    # Finished orders stay queryable by text only this long (seconds)
+    TEXT_LOOKUP_SECONDS = 60
+    
+    def __init__(self, api_credentials, market_registry=None, host: str = GATE_API_HOST,
+                 batch_window: Optional[float] = None):
         self.exchange_id = 'gateio'
         
         # Validate API credentials
@@ -24,35 +55,109 @@ class GateIOExchange:
         if not self.api_key or not self.api_secret:
             raise ValueError("API key and secret are required for Gate.io exchange")
         
-        # Configure Gate.io API
-        configuration = gate_api.Configuration(
-            host="https://api.gateio.ws/api/v4",
-            key=self.api_key,
-            secret=self.api_secret
-        )
+        # Gate.io API client is created on first use (see futures_api)
+        self.api_client = None
+        self._futures_api = None
+        self._client_lock = threading.Lock()
+        self.host = host.rstrip('/')
+        # Raw-JSON client for hot market data / position reads
+        self.rest = GateRestClient(self.api_key, self.api_secret, host=self.host)
         
-        self.api_client = gate_api.ApiClient(configuration)
-        # Only futures API needed - Gate.io is used for shorting only
-        self.futures_api = gate_api.FuturesApi(self.api_client)
+        # Contract orders arriving within batch_window seconds are sent as one batch (0: off)
+        if batch_window is None:
+            batch_window = settings.FUTURES_BATCH_WINDOW_SECONDS if settings.FUTURES_BATCH_ENABLED else 0
+        self.batcher = (
+            OrderBatcher(self._submit_order_batch, batch_window, self.BATCH_MAX_ORDERS)
+            if batch_window > 0 else None
+        )
         
         # Load markets info
-        self.futures_markets = {}
-        self._load_futures_markets()
+        # With a registry, contracts come from its disk cache (no blocking download here)
+        self.market_registry = market_registry
+        self._futures_markets = {}
+        if market_registry is None:
+            self._load_futures_markets()
+    
+    @property
+    def futures_api(self):
+        """Futures API client (gate_api is imported on first access)"""
+        if self._futures_api is None:
+            with self._client_lock:
+                if self._futures_api is None:
+                    gate_api = _gate_api()
+                    configuration = gate_api.Configuration(
+                        host=f"{self.host}{GATE_API_PREFIX}",
+                        key=self.api_key,
+                        secret=self.api_secret
+                    )
+                    self.api_client = gate_api.ApiClient(configuration)
+                    self.api_client.request = self._with_deadline(self.api_client.request)
+                    # Only futures API needed - Gate.io is used for shorting only
+                    self._futures_api = gate_api.FuturesApi(self.api_client)
+        return self._futures_api
+    
+    @futures_api.setter
+    def futures_api(self, value):
+        self._futures_api = value
+    
+    @staticmethod
+    def _with_deadline(request):
+        """Wrap ApiClient.request: per-endpoint timeout budget capped by the current deadline,
+        recorded on the gateio circuit breaker"""
+        import urllib3
+        from urllib.parse import urlsplit
+        
+        def send(method, url, *args, **kwargs):
+            submits_order = method != 'GET'
+            if kwargs.get('_request_timeout') is None:
+                budget = settings.ORDER_TIMEOUT_SECONDS if submits_order else settings.ACCOUNT_TIMEOUT_SECONDS
+                timeout = request_timeout(budget)
+                kwargs['_request_timeout'] = (timeout, timeout)  # (connect, read)
+            group = endpoint_group(method, urlsplit(url).path)
+            try:
+                # gate_api raises ApiException for HTTP errors; 5xx/429 count as venue failures
+                return health.exchange_health.call(
+                    'gateio', group, lambda: request(method, url, *args, **kwargs), health.is_failed_response
+                )
+            except (urllib3.exceptions.ReadTimeoutError, urllib3.exceptions.ProtocolError) as e:
+                # The order may have been accepted - outcome unknown, not failed.
+                # New orders are resolved by client order ID (text) before any resubmit
+                if method == 'POST':
+                    raise OrderOutcomeUnknown(f"gateio {method} {url}: {e}") from e
+                if submits_order:
+                    mark_unknown(f"gateio {method} {url}")
+                raise
+        return send
+    
+    @property
+    def futures_markets(self) -> Dict:
+        """Futures market information keyed by symbol"""
+        if self.market_registry is not None:
+            return self.market_registry.get_markets(self.exchange_id)
+        return self._futures_markets
+    
+    def fetch_markets(self) -> Dict:
+        """Download all USDT futures contracts"""
+        markets = {}
+        contracts = self.futures_api.list_futures_contracts('usdt')
+        for contract in contracts:
+            # Extract underlying from contract name (e.g., BTC_USDT -> BTC)
+            underlying = contract.name.replace('_USDT', '')
+            symbol = f"{underlying}/USDT:USDT"
+            markets[symbol] = {
+                'name': contract.name,
+                'contract_size': float(contract.quanto_multiplier) if contract.quanto_multiplier else 1,
+                'underlying': underlying,
+                'min_contracts': int(contract.order_size_min) if contract.order_size_min else 1,
+                'price_tick': float(contract.order_price_round) if contract.order_price_round else 0.0
+            }
+        return markets
     
     def _load_futures_markets(self):
         """Load futures market information"""
         try:
-            contracts = self.futures_api.list_futures_contracts('usdt')
-            for contract in contracts:
-                # Extract underlying from contract name (e.g., BTC_USDT -> BTC)
-                underlying = contract.name.replace('_USDT', '')
-                symbol = f"{underlying}/USDT:USDT"
-                self.futures_markets[symbol] = {
-                    'name': contract.name,
-                    'contract_size': float(contract.quanto_multiplier) if contract.quanto_multiplier else 1,
-                    'underlying': underlying
-                }
-            logger.info(f"Loaded {len(self.futures_markets)} futures markets")
+            self._futures_markets = self.fetch_markets()
+            logger.info(f"Loaded {len(self._futures_markets)} futures markets")
         except Exception as e:
             logger.error(f"Failed to load futures markets: {e}")
     
@@ -85,92 +190,366 @@ class GateIOExchange:
             logger.error(f"Failed to get balance for {currency}: {e}")
             return None
     
+    @staticmethod
+    def _ticker_from_row(symbol: str, row: FuturesTickerRow) -> Dict:
+        """Convert a raw ticker row to the ticker dict used by the bot"""
+        return {
+            'symbol': symbol,
+            'last': row.last,
+            'bid': row.bid,
+            'ask': row.ask,
+            'high': row.high,
+            'low': row.low,
+            'volume': row.volume
+        }
+    
     def get_ticker(self, symbol: str) -> Optional[Dict]:
         """Get ticker information"""
         try:
             if ':USDT' in symbol:
                 # Futures ticker
                 contract = symbol.replace('/USDT:USDT', '_USDT')
-                tickers = self.futures_api.list_futures_tickers('usdt', contract=contract)
-                if tickers:
-                    ticker = tickers[0]
-                    return {
-                        'symbol': symbol,
-                        'last': float(ticker.last),
-                        'bid': float(ticker.highest_bid) if ticker.highest_bid else None,
-                        'ask': float(ticker.lowest_ask) if ticker.lowest_ask else None,
-                        'high': float(ticker.high_24h),
-                        'low': float(ticker.low_24h),
-                        'volume': float(ticker.volume_24h)
-                    }
+                rows = self.rest.list_tickers(contract)
+                if rows:
+                    return self._ticker_from_row(symbol, rows[0])
             # Only futures tickers are used
             return None
         except Exception as e:
             logger.error(f"Failed to get ticker for {symbol}: {e}")
             return None
     
+    def _quote_from_row(self, symbol: str, row: FuturesTickerRow, received_at: float) -> Dict:
+        """Top-of-book quote with level sizes converted from contracts to coins
+
+        Tickers carry no timestamp - the quote is stamped with the time the response arrived
+        """
+        contract_size = self.get_contract_size(symbol)
+        return clock_sync.stamp(self.exchange_id, {
+            'symbol': symbol,
+            'bid': row.bid,
+            'ask': row.ask,
+            'bid_size': row.bid_size * contract_size,
+            'ask_size': row.ask_size * contract_size
+        }, received_at=received_at)
+    
+    def get_best_bid_ask(self, symbol: str) -> Optional[Dict]:
+        """Get top-of-book bid/ask (single ticker request)"""
+        try:
+            contract = symbol.replace('/USDT:USDT', '_USDT')
+            rows = self.rest.list_tickers(contract)
+            if rows:
+                return self._quote_from_row(symbol, rows[0], clock_sync.clock())
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get best bid/ask for {symbol}: {e}")
+            return None
+    
+    def get_best_bid_asks(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get top-of-book bid/ask for several contracts in one request"""
+        if len(symbols) == 1:
+            quote_data = self.get_best_bid_ask(symbols[0])
+            return {symbols[0]: quote_data} if quote_data else {}
+        try:
+            wanted = set(symbols)
+            quotes = {}
+            rows = self.rest.list_tickers()
+            received_at = clock_sync.clock()
+            for row in rows:
+                symbol = f"{row.contract.replace('_USDT', '')}/USDT:USDT"
+                if symbol in wanted:
+                    quotes[symbol] = self._quote_from_row(symbol, row, received_at)
+            return quotes
+        except Exception as e:
+            logger.error(f"Failed to get best bid/asks: {e}")
+            return {}
+    
+    def sync_clock(self) -> bool:
+        """Record a clock-offset sample from /spot/time"""
+        try:
+            sent_at = clock_sync.clock()
+            server_time = self.rest.server_time()
+            clock_sync.record(self.exchange_id, server_time, sent_at, clock_sync.clock())
+            return True
+        except Exception as e:
+            logger.warning(f"Gate.io clock sync failed: {e}")
+            return False
+    
+    def get_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Get tickers for all USDT contracts in one request (optionally filtered)"""
+        try:
+            wanted = set(symbols) if symbols else None
+            tickers = {}
+            for row in self.rest.list_tickers():
+                symbol = f"{row.contract.replace('_USDT', '')}/USDT:USDT"
+                if wanted is None or symbol in wanted:
+                    tickers[symbol] = self._ticker_from_row(symbol, row)
+            return tickers
+        except Exception as e:
+            logger.error(f"Failed to get tickers: {e}")
+            return {}
+    
     def create_market_order(self, symbol: str, side: str, amount: float, params: Optional[Dict] = None) -> Optional[Dict]:
-        """Create a market order"""
+        """Create a market order (amount in coins, converted to contracts)"""
+        if ':USDT' not in symbol:
+            # Spot order - not implemented yet
+            logger.error("Spot orders not implemented in native API yet")
+            return None
+        
         try:
-            if ':USDT' in symbol:
-                # Futures order
-                contract = symbol.replace('/USDT:USDT', '_USDT')
-                
-                # Get contract size
-                contract_info = self.futures_markets.get(symbol, {})
-                contract_size = contract_info.get('contract_size', 1)
-                
-                # Convert amount to contracts
-                # OrderExecutor already converts to contracts via _calculate_futures_quantity
-                # So amount here is already in contracts
-                if params and params.get('from_order_executor'):
-                    # Amount is already in contracts from OrderExecutor
-                    # Round to nearest integer for minimum contract requirement
-                    contracts = round(amount)
-                else:
-                    # Direct API call, convert from coin amount to contracts
-                    contracts = round(amount / contract_size)
-                
-                if contracts < 1:
-                    logger.error(f"Contract amount too small: {amount} {symbol} = {contracts} contracts")
-                    return None
-                
-                # Create futures order
-                # Gate.io API requires size as string
-                size_str = str(contracts if side == 'buy' else -contracts)  # Negative for sell/short
-                
-                order = gate_api.FuturesOrder(
-                    contract=contract,
-                    size=size_str,  # String type as per API spec
-                    price='0',  # Market order
-                    tif='ioc',  # Immediate or cancel
-                    reduce_only=params.get('reduce_only', False) if params else False
-                )
-                
-                response = self.futures_api.create_futures_order('usdt', order)
-                
-                logger.info(f"Futures order placed: {symbol} {side} {contracts} contracts")
-                
-                return {
-                    'id': response.id,
-                    'symbol': symbol,
-                    'side': side,
-                    'amount': contracts,
-                    'status': response.status,
-                    'filled': response.size - response.left if response.left else response.size
-                }
-            else:
-                # Spot order - not implemented yet
-                logger.error("Spot orders not implemented in native API yet")
+            contracts = round(amount / self.get_contract_size(symbol))
+        except Exception as e:
+            logger.error(f"Failed to create market order: {e}")
+            return None
+        
+        reduce_only = params.get('reduce_only', False) if params else False
+        return self.create_contract_order(symbol, side, contracts, reduce_only)
+    
+    def get_tick_size(self, symbol: str, price: float) -> float:
+        """Order price tick (order_price_round)"""
+        market = self.get_markets().get(symbol) or {}
+        return market.get('price_tick', 0.0)
+    
+    def create_contract_order(self, symbol: str, side: str, contracts: int,
+                              reduce_only: bool = False, price: Optional[float] = None) -> Optional[Dict]:
+        """Create a futures order sized in contracts (market, or limit IOC when price is given)"""
+        gate_api = _gate_api()
+        try:
+            contract = symbol.replace('/USDT:USDT', '_USDT')
+            contracts = int(round(contracts))
+            
+            if contracts < 1:
+                logger.error(f"Contract amount too small: {symbol} = {contracts} contracts")
+                return None
+            
+            # Create futures order
+            # Gate.io API requires size as string
+            size_str = str(contracts if side == 'buy' else -contracts)  # Negative for sell/short
+            
+            order = gate_api.FuturesOrder(
+                contract=contract,
+                size=size_str,  # String type as per API spec
+                price=format_price(price) if price else '0',  # '0' = market order
+                tif='ioc',  # Immediate or cancel (unfilled remainder is cancelled)
+                reduce_only=reduce_only,
+                text=self._client_text()
+            )
+            
+            if self.batcher is not None:
+                # 배치는 먼저 들어온 주문의 스레드가 제출 - 결과 확인은 이 주문의 데드라인으로
+                return self.batcher.submit((symbol, order, current_deadline()))
+            
+            response = self._submit_order(order)
+            if response is None:
                 return None
-                
-        except GateApiException as ex:
+            
+            limit = f" @ {price}" if price else ""
+            logger.info(f"Futures order placed: {symbol} {side} {contracts} contracts{limit}")
+            return self._order_from_response(symbol, response)
+            
+        except gate_api.exceptions.GateApiException as ex:
             logger.error(f"Gate API exception: {ex.label}, {ex.message}")
             return None
         except Exception as e:
             logger.error(f"Failed to create market order: {e}")
             return None
     
+    def close_position(self, symbol: str) -> Optional[Dict]:
+        """Close the whole position with one order (size 0 + close flag, no position lookup)"""
+        gate_api = _gate_api()
+        try:
+            order = gate_api.FuturesOrder(
+                contract=symbol.replace('/USDT:USDT', '_USDT'),
+                size='0',
+                price='0',  # Market order
+                tif='ioc',
+                close=True,
+                text=self._client_text()
+            )
+            response = self._submit_order(order)
+            if response is None:
+                return None
+            logger.info(f"Futures position close order placed: {symbol}")
+            return self._order_from_response(symbol, response)
+        except gate_api.exceptions.GateApiException as ex:
+            logger.error(f"Gate API exception: {ex.label}, {ex.message}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to close position {symbol}: {e}")
+            return None
+    
+    def _submit_order_batch(self, intents: List) -> List[Optional[Dict]]:
+        """Submit (symbol, FuturesOrder, Deadline) intents in one request; results keep the input order
+
+        Runs on the thread of the first queued order, so unanswered orders are resolved
+        under the deadline of the leg that queued each one (lookup wait, unknown outcome)
+        """
+        gate_api = _gate_api()
+        try:
+            responses = self.futures_api.create_batch_futures_order(
+                'usdt', [order for _, order, _ in intents]
+            )
+        except gate_api.exceptions.GateApiException as ex:
+            logger.error(f"Gate API exception (batch of {len(intents)}): {ex.label}, {ex.message}")
+            return [None] * len(intents)
+        except OrderOutcomeUnknown as e:
+            logger.warning(f"No response for batch of {len(intents)} ({e}) - resolving each order by client ID")
+            return [self._resolve_unanswered(symbol, order, deadline) for symbol, order, deadline in intents]
+        
+        results = []
+        for (symbol, order, _), response in zip(intents, responses):
+            if response.succeeded:
+                logger.info(f"Futures order placed (batch): {symbol} size {order.size} price {order.price}")
+                results.append(self._order_from_response(symbol, response))
+            else:
+                logger.error(f"Batch order rejected: {symbol} size {order.size}: {response.label} {response.detail}")
+                results.append(None)
+        logger.info(f"Futures batch submitted: {len(intents)} orders in one request")
+        return results
+    
+    def _client_text(self) -> str:
+        """Client order ID for FuturesOrder.text (Gate requires the 't-' prefix)"""
+        return f"t-{new_client_order_id(self.exchange_id)}"
+    
+    def _submit_order(self, order):
+        """Submit a FuturesOrder; if no response arrives, look it up by its text and
+        resubmit with the same text only when Gate never accepted it"""
+        return submit_idempotent(
+            f"gateio {order.contract} {order.size} ({order.text})",
+            lambda: self.futures_api.create_futures_order('usdt', order),
+            lambda: self._find_order_by_text(order.text)
+        )
+    
+    def _find_order_by_text(self, text: str):
+        """FuturesOrder by client order ID, or None if Gate has no such order
+        (finished orders stay queryable by text for 60 seconds)"""
+        gate_api = _gate_api()
+        try:
+            return self.futures_api.get_futures_order('usdt', text)
+        except gate_api.exceptions.GateApiException as ex:
+            if ex.label == 'ORDER_NOT_FOUND':
+                return None
+            raise
+    
+    def find_order_by_client_id(self, symbol: str, client_order_id: str, placed_at: float) -> Optional[Dict]:
+        """Order by client order ID (filled in contracts), or None if Gate never accepted it
+
+        Gate forgets the text of finished orders after TEXT_LOOKUP_SECONDS, so a miss on an
+        older order is not proof that it was never accepted
+        """
+        response = self._find_order_by_text(f"t-{client_order_id}")
+        if response is not None:
+            return self._order_from_response(symbol, response)
+        if clock_sync.clock() - placed_at > self.TEXT_LOOKUP_SECONDS:
+            raise RuntimeError(f"gateio order {client_order_id} is past the text lookup window")
+        return None
+    
+    def _resolve_unanswered(self, symbol: str, order, deadline) -> Optional[Dict]:
+        """Batch order sent without a response: use the accepted order, or resubmit it alone
+        (an unresolved outcome is marked on the deadline of the leg that queued the order)"""
+        with use_deadline(deadline):
+            response = submit_idempotent(
+                f"gateio {order.contract} {order.size} ({order.text})",
+                lambda: self.futures_api.create_futures_order('usdt', order),
+                lambda: self._find_order_by_text(order.text),
+                unanswered=True
+            )
+        return self._order_from_response(symbol, response) if response is not None else None
+    
+    @staticmethod
+    def _order_from_response(symbol: str, response) -> Dict:
+        """Convert a FuturesOrder response (signed size/left strings) to an order dict"""
+        size = int(float(response.size or 0))
+        left = int(float(response.left or 0))
+        return {
+            'id': response.id,
+            'symbol': symbol,
+            'side': 'buy' if size > 0 else 'sell',
+            'amount': abs(size),
+            'status': response.status,
+            'price': float(response.price or 0),
+            'filled': abs(size) - abs(left),
+            'remaining': abs(left),
+            'finish_as': response.finish_as
+        }
+    
+    def create_post_only_order(self, symbol: str, side: str, contracts: int, price: float,
+                               reduce_only: bool = False) -> Optional[Dict]:
+        """Create a post-only limit order sized in contracts (rejected if it would take)"""
+        gate_api = _gate_api()
+        try:
+            contract = symbol.replace('/USDT:USDT', '_USDT')
+            contracts = int(round(contracts))
+            if contracts < 1:
+                logger.error(f"Contract amount too small: {symbol} = {contracts} contracts")
+                return None
+            
+            order = gate_api.FuturesOrder(
+                contract=contract,
+                size=str(contracts if side == 'buy' else -contracts),
+                price=format_price(price),
+                tif='poc',  # Pending-or-cancelled: maker only
+                reduce_only=reduce_only,
+                text=self._client_text()
+            )
+            response = self._submit_order(order)
+            if response is None:
+                return None
+            
+            logger.info(f"Post-only order placed: {symbol} {side} {contracts} contracts @ {price}")
+            return self._order_from_response(symbol, response)
+            
+        except gate_api.exceptions.GateApiException as ex:
+            logger.error(f"Gate API exception: {ex.label}, {ex.message}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to create post-only order: {e}")
+            return None
+    
+    def get_order(self, symbol: str, order_id) -> Optional[Dict]:
+        """Get order status"""
+        try:
+            response = self.futures_api.get_futures_order('usdt', str(order_id))
+            return self._order_from_response(symbol, response)
+        except Exception as e:
+            logger.error(f"Failed to get order {order_id}: {e}")
+            return None
+    
+    def amend_order(self, symbol: str, order_id, price: float) -> Optional[Dict]:
+        """Move an open limit order to a new price"""
+        gate_api = _gate_api()
+        try:
+            amendment = gate_api.FuturesOrderAmendment(price=format_price(price))
+            response = self.futures_api.amend_futures_order('usdt', str(order_id), amendment)
+            logger.info(f"Order amended: {symbol} {order_id} @ {price}")
+            return self._order_from_response(symbol, response)
+        except Exception as e:
+            logger.error(f"Failed to amend order {order_id}: {e}")
+            return None
+    
+    def cancel_order(self, symbol: str, order_id) -> Optional[Dict]:
+        """Cancel an open order (response carries the final fill)"""
+        try:
+            response = self.futures_api.cancel_futures_order('usdt', str(order_id))
+            logger.info(f"Order cancelled: {symbol} {order_id}")
+            return self._order_from_response(symbol, response)
+        except Exception as e:
+            logger.error(f"Failed to cancel order {order_id}: {e}")
+            return None
+    
+    def countdown_cancel(self, symbol: str, timeout: int) -> bool:
+        """Dead-man switch: cancel the contract's open orders unless re-armed within timeout seconds"""
+        gate_api = _gate_api()
+        try:
+            task = gate_api.CountdownCancelAllFuturesTask(
+                timeout=int(timeout),
+                contract=symbol.replace('/USDT:USDT', '_USDT')
+            )
+            self.futures_api.countdown_cancel_all_futures('usdt', task)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set countdown cancel for {symbol}: {e}")
+            return False
+    
     def get_markets(self) -> Dict:
         """Get all markets"""
         return self.futures_markets
@@ -186,51 +565,31 @@ class GateIOExchange:
             logger.error(f"Failed to set leverage: {e}")
             return False
     
-    def get_positions(self) -> List[Dict]:
-        """Get all futures positions"""
+    def get_positions(self) -> Optional[List[Dict]]:
+        """Get all futures positions (None if the lookup failed)"""
         try:
-            positions = self.futures_api.list_positions('usdt')
             result = []
             
-            for pos in positions:
+            for pos in self.rest.list_positions():
                 if pos.size != 0:  # Only include open positions
                     symbol = f"{pos.contract.replace('_USDT', '')}/USDT:USDT"
                     side = 'short' if pos.size < 0 else 'long'
-                    contracts = abs(pos.size)
-                    notional = abs(float(pos.value))
                     
                     result.append({
                         'symbol': symbol,
                         'side': side,
-                        'contracts': contracts,
-                        'notional': notional,
+                        'contracts': abs(pos.size),
+                        'notional': abs(pos.value),
                         'mode': pos.mode,
-                        'mark_price': float(pos.mark_price),
-                        'entry_price': float(pos.entry_price) if pos.entry_price else 0
+                        'mark_price': pos.mark,
+                        'entry_price': pos.entry
                     })
             
             return result
             
         except Exception as e:
             logger.error(f"Failed to get positions: {e}")
-            return []
-    
-    @property
-    def exchange(self):
-        """Compatibility property for accessing exchange methods"""
-        return self
-    
-    def fetch_positions(self, symbols=None):
-        """Compatibility method for ccxt-style position fetching"""
-        positions = self.get_positions()
-        if symbols:
-            # Filter by symbols if provided
-            filtered = []
-            for pos in positions:
-                if pos['symbol'] in symbols:
-                    filtered.append(pos)
-            return filtered
-        return positions
+            return None
     
     def load_markets(self):
         """Compatibility method for ccxt-style market loading"""
@@ -0,0 +1,170 @@
+"""
+Gate.io futures REST fast path
+
+Parses API responses straight into compact tuples of the fields we use,
+skipping gate_api model objects (one object per item + string->float conversion).
+"""
+import hashlib
+import hmac
+import json
+import logging
+import time
+from typing import Dict, List, NamedTuple, Optional
+from urllib.parse import urlencode
+
+import requests
+
+from src.config import settings
+from src.exchanges import health
+from src.utils.deadline import request_timeout
+from src.utils.hedged_request import HedgedRequester
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional - fall back to the stdlib decoder
+    json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+GATE_API_HOST = "https://api.gateio.ws"
+GATE_API_PREFIX = "/api/v4"
+
+
+class FuturesTickerRow(NamedTuple):
+    """Futures ticker fields used by the bot"""
+    contract: str
+    last: float
+    bid: Optional[float]
+    ask: Optional[float]
+    mark: float
+    high: float
+    low: float
+    volume: float
+    bid_size: float  # contracts at the best bid
+    ask_size: float  # contracts at the best ask
+
+
+class PositionRow(NamedTuple):
+    """Futures position fields used by the bot"""
+    contract: str
+    size: int
+    value: float
+    mark: float
+    entry: float
+    mode: str
+
+
+def _num(value) -> float:
+    """Gate returns numbers as strings; empty/missing -> 0"""
+    return float(value) if value else 0.0
+
+
+def _opt_num(value) -> Optional[float]:
+    """Empty/missing -> None (e.g. no bid on the book)"""
+    return float(value) if value else None
+
+
+def endpoint_group(method: str, path: str) -> str:
+    """Circuit breaker endpoint group for a Gate.io v4 path"""
+    if method != 'GET':
+        return health.ORDER
+    if any(part in path for part in ('/accounts', '/positions', '/orders', '/my_trades')):
+        return health.ACCOUNT
+    return health.QUOTE
+
+
+def parse_tickers(raw) -> List[FuturesTickerRow]:
+    """Parse /futures/usdt/tickers response body"""
+    return [
+        FuturesTickerRow(
+            item['contract'],
+            _num(item.get('last')),
+            _opt_num(item.get('highest_bid')),
+            _opt_num(item.get('lowest_ask')),
+            _num(item.get('mark_price')),
+            _num(item.get('high_24h')),
+            _num(item.get('low_24h')),
+            _num(item.get('volume_24h')),
+            _num(item.get('highest_size')),
+            _num(item.get('lowest_size'))
+        )
+        for item in json_loads(raw)
+    ]
+
+
+def parse_positions(raw) -> List[PositionRow]:
+    """Parse /futures/usdt/positions response body"""
+    return [
+        PositionRow(
+            item['contract'],
+            int(float(item.get('size') or 0)),
+            _num(item.get('value')),
+            _num(item.get('mark_price')),
+            _num(item.get('entry_price')),
+            item.get('mode', 'single')
+        )
+        for item in json_loads(raw)
+    ]
+
+
+class GateRestClient:
+    """Minimal signed HTTP client for the Gate.io v4 futures endpoints"""
+
+    def __init__(self, api_key: str, api_secret: str, host: str = GATE_API_HOST,
+                 timeout: float = 10):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.host = host.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json'})
+        health.install(self.session, 'gateio', endpoint_group)
+        # Public market data only - signed requests are never duplicated
+        self.hedged_requests = HedgedRequester('gateio')
+
+    def _sign_headers(self, method: str, path: str, query_string: str, body: str = '') -> Dict[str, str]:
+        """APIv4 signature headers (HMAC-SHA512)"""
+        timestamp = str(int(time.time()))
+        hashed_payload = hashlib.sha512(body.encode('utf-8')).hexdigest()
+        sign_string = f"{method}\n{path}\n{query_string}\n{hashed_payload}\n{timestamp}"
+        signature = hmac.new(
+            self.api_secret.encode('utf-8'), sign_string.encode('utf-8'), hashlib.sha512
+        ).hexdigest()
+        return {'KEY': self.api_key, 'Timestamp': timestamp, 'SIGN': signature}
+
+    def get(self, endpoint: str, params: Optional[Dict] = None, signed: bool = False) -> bytes:
+        """GET request returning the raw response body
+
+        Timeout: quote (public) or account (signed) budget, capped by self.timeout and the current deadline.
+        Public requests go through the hedged requester (duplicate after the endpoint's p90 when enabled).
+        """
+        path = f"{GATE_API_PREFIX}{endpoint}"
+        query_string = urlencode(params) if params else ''
+        headers = self._sign_headers('GET', path, query_string) if signed else None
+
+        url = f"{self.host}{path}"
+        if query_string:
+            url = f"{url}?{query_string}"
+
+        budget = settings.ACCOUNT_TIMEOUT_SECONDS if signed else settings.QUOTE_TIMEOUT_SECONDS
+        timeout = request_timeout(min(budget, self.timeout))
+        if signed:
+            response = self.session.get(url, headers=headers, timeout=timeout)
+        else:
+            response = self.hedged_requests.get(endpoint, lambda: self.session.get(url, timeout=timeout))
+        response.raise_for_status()
+        return response.content
+
+    def list_tickers(self, contract: Optional[str] = None) -> List[FuturesTickerRow]:
+        """Futures tickers (all USDT contracts when contract is None)"""
+        params = {'contract': contract} if contract else None
+        return parse_tickers(self.get('/futures/usdt/tickers', params))
+
+    def server_time(self) -> float:
+        """Gate.io server time (epoch seconds)"""
+        return json_loads(self.get('/spot/time'))['server_time'] / 1000
+
+    def list_positions(self) -> List[PositionRow]:
+        """Open and closed futures positions of the account"""
+        return parse_positions(self.get('/futures/usdt/positions', signed=True))
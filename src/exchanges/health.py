@@ -0,0 +1,228 @@
+"""
+거래소 상태 (서킷 브레이커)
+
+거래소 x 엔드포인트 그룹(시세/계정/주문)별로 최근 호출의 오류율과 지연을 추적해
+closed → open → half_open → closed 로 전환. open 상태의 시세/계정 요청은 네트워크에 나가지 않고
+바로 CircuitOpenError (사이클 시간 제한), 주문 요청은 청산이 막히지 않도록 차단하지 않고 기록만 함
+"""
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from functools import lru_cache
+from typing import Callable, Deque, Dict, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# 엔드포인트 그룹
+QUOTE = 'quote'  # 공개 시세/호가/마켓 정보
+ACCOUNT = 'account'  # 잔고/포지션/주문 조회
+ORDER = 'order'  # 주문 제출/정정/취소
+
+# open 상태에서도 차단하지 않는 그룹 (청산 주문은 항상 전송)
+NON_BLOCKING_GROUPS = frozenset({ORDER})
+
+
+class CircuitState(str, Enum):
+    """서킷 상태"""
+    CLOSED = 'closed'  # 정상
+    OPEN = 'open'  # 차단 (CIRCUIT_OPEN_SECONDS 동안)
+    HALF_OPEN = 'half_open'  # 시험 요청만 허용
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 요청을 보내지 않음"""
+
+
+def is_failed_response(response) -> bool:
+    """거래소 장애로 볼 HTTP 응답 (5xx, 429 요청 제한)"""
+    status = getattr(response, 'status_code', 200)
+    return status >= 500 or status == 429
+
+
+def is_failed_error(error: Exception) -> bool:
+    """거래소 장애로 볼 예외 - HTTP 상태가 있는 4xx 오류(잔고 부족 등 업무 오류)는 제외"""
+    status = getattr(error, 'status', None)
+    if isinstance(status, int) and 0 < status < 500 and status != 429:
+        return False
+    return True
+
+
+class CircuitBreaker:
+    """거래소 x 엔드포인트 그룹 하나의 서킷 브레이커"""
+
+    def __init__(self, name: str, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+        self.opened_at: Optional[float] = None
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=settings.CIRCUIT_WINDOW_SIZE)  # (실패, 지연)
+        self._probes = 0  # half_open에서 보낸 시험 요청 수
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """요청 허용 여부 (open 유지 시간이 지나면 half_open으로 전환 후 시험 요청 허용)"""
+        with self._lock:
+            if self.state == CircuitState.OPEN:
+                if self.clock() - self.opened_at < settings.CIRCUIT_OPEN_SECONDS:
+                    return False
+                self._transition(CircuitState.HALF_OPEN)
+            if self.state == CircuitState.HALF_OPEN:
+                if self._probes >= settings.CIRCUIT_HALF_OPEN_PROBES:
+                    return False
+                self._probes += 1
+            return True
+
+    def record(self, failed: bool, elapsed: float) -> None:
+        """호출 결과 기록 (지연이 CIRCUIT_SLOW_CALL_SECONDS 이상이면 느린 호출)"""
+        slow = elapsed >= settings.CIRCUIT_SLOW_CALL_SECONDS
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN:
+                if failed or slow:
+                    self._transition(CircuitState.OPEN)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= settings.CIRCUIT_HALF_OPEN_PROBES:
+                        self._transition(CircuitState.CLOSED)
+                return
+
+            self._outcomes.append((failed, slow))
+            if self.state == CircuitState.CLOSED and len(self._outcomes) >= settings.CIRCUIT_MIN_CALLS:
+                error_rate, slow_rate = self._rates()
+                if error_rate >= settings.CIRCUIT_ERROR_RATE or slow_rate >= settings.CIRCUIT_SLOW_CALL_RATE:
+                    self._transition(CircuitState.OPEN)
+
+    def _rates(self) -> Tuple[float, float]:
+        """최근 호출 오류율 / 느린 호출 비율"""
+        count = len(self._outcomes)
+        if not count:
+            return 0.0, 0.0
+        return (
+            sum(failed for failed, _ in self._outcomes) / count,
+            sum(slow for _, slow in self._outcomes) / count
+        )
+
+    def _transition(self, state: CircuitState) -> None:
+        """상태 전환 (lock 보유 상태에서 호출)"""
+        previous, self.state = self.state, state
+        self._probes = self._probe_successes = 0
+        if state == CircuitState.OPEN:
+            self.opened_at = self.clock()
+            error_rate, slow_rate = self._rates()
+            logger.warning(
+                f"🔌 {self.name} 서킷 open ({previous.value} → open) - "
+                f"오류율 {error_rate:.0%}, 느린 호출 {slow_rate:.0%}"
+            )
+        elif state == CircuitState.CLOSED:
+            self._outcomes.clear()
+            self.opened_at = None
+            logger.info(f"✅ {self.name} 서킷 closed - 정상 복구")
+
+    def snapshot(self) -> Dict:
+        """모니터링용 상태"""
+        with self._lock:
+            error_rate, slow_rate = self._rates()
+            return {
+                'state': self.state.value,
+                'calls': len(self._outcomes),
+                'error_rate': error_rate,
+                'slow_rate': slow_rate,
+                'opened_at': self.opened_at
+            }
+
+
+class ExchangeHealth:
+    """거래소 x 엔드포인트 그룹별 서킷 브레이커 모음"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, venue: str, group: str) -> CircuitBreaker:
+        """서킷 브레이커 조회 (없으면 생성)"""
+        key = (venue, group)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(f"{venue}/{group}", self.clock))
+        return breaker
+
+    def call(self, venue: str, group: str, send: Callable[[], T],
+             is_failure: Optional[Callable[[T], bool]] = None) -> T:
+        """서킷 확인 후 send() 실행하고 결과 기록 - 차단 그룹이 open이면 CircuitOpenError"""
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return send()
+
+        breaker = self.breaker(venue, group)
+        if not breaker.allow() and group not in NON_BLOCKING_GROUPS:
+            raise CircuitOpenError(f"{venue}/{group} circuit open")
+
+        started = self.clock()
+        try:
+            result = send()
+        except Exception as e:
+            breaker.record(is_failed_error(e), self.clock() - started)
+            raise
+        breaker.record(bool(is_failure and is_failure(result)), self.clock() - started)
+        return result
+
+    def is_degraded(self, venue: str) -> bool:
+        """거래소의 그룹 중 하나라도 closed가 아니면 True (신규 진입 보류 기준)"""
+        return any(
+            breaker.state != CircuitState.CLOSED
+            for (breaker_venue, _), breaker in list(self._breakers.items())
+            if breaker_venue == venue
+        )
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict]]:
+        """모니터링용 전체 상태 {거래소: {그룹: 상태}}"""
+        health: Dict[str, Dict[str, Dict]] = {}
+        for (venue, group), breaker in sorted(self._breakers.items()):
+            health.setdefault(venue, {})[group] = breaker.snapshot()
+        return health
+
+    def reset(self) -> None:
+        """모든 서킷 초기화"""
+        with self._lock:
+            self._breakers.clear()
+
+
+@lru_cache(maxsize=None)
+def _circuit_breaker_adapter():
+    """requests 전송 어댑터 클래스 (requests는 첫 세션 설치 시 import - 콜드 스타트 경로에서 제외)"""
+    from requests.adapters import HTTPAdapter
+
+    class CircuitBreakerAdapter(HTTPAdapter):
+        """requests 세션 전송 계층에서 서킷 확인/결과 기록 (호출 코드 수정 없이 모든 HTTP 요청에 적용)"""
+
+        def __init__(self, health: ExchangeHealth, venue: str, classify: Callable[[str, str], str], **kwargs):
+            super().__init__(**kwargs)
+            self.health = health
+            self.venue = venue
+            self.classify = classify
+
+        def send(self, request, **kwargs):
+            group = self.classify(request.method, urlsplit(request.url).path)
+            return self.health.call(
+                self.venue, group, lambda: super(CircuitBreakerAdapter, self).send(request, **kwargs),
+                is_failed_response
+            )
+
+    return CircuitBreakerAdapter
+
+
+def install(session, venue: str, classify: Callable[[str, str], str]) -> None:
+    """세션의 https 요청에 거래소 서킷 브레이커 적용"""
+    session.mount('https://', _circuit_breaker_adapter()(exchange_health, venue, classify))
+
+
+# 전역 거래소 상태 (모니터링은 exchange_health.snapshot())
+exchange_health = ExchangeHealth()
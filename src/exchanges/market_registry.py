@@ -0,0 +1,250 @@
+"""
+마켓 메타데이터 레지스트리 - 거래소별 마켓 정보를 디스크 캐시와 함께 관리
+"""
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+class MarketRegistry:
+    """거래소 마켓 정보 통합 레지스트리
+
+    - 거래소 어댑터의 fetch_markets()로 전체 마켓 목록을 한 번에 로드
+    - 디스크 캐시가 유효하면 네트워크 호출 없이 즉시 시작
+    - 캐시가 오래되면 캐시로 먼저 시작하고 백그라운드에서 갱신
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, ttl_minutes: Optional[float] = None):
+        self.cache_file = settings.MARKET_CACHE_FILE if cache_file is None else cache_file
+        ttl = settings.MARKET_CACHE_TTL_MINUTES if ttl_minutes is None else ttl_minutes
+        self.ttl_seconds = ttl * 60
+
+        # exchange_id -> symbol -> market info
+        self._markets: Dict[str, Dict[str, Dict]] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+        # (한국 거래소, 선물 거래소) -> 공통 심볼 집합 (마켓 갱신 시 무효화)
+        self._universe_cache: Dict[Tuple[str, str], Set[str]] = {}
+
+    # ---------- 조회 ----------
+
+    def get_markets(self, exchange_id: str) -> Dict[str, Dict]:
+        """거래소의 전체 마켓 정보 (갱신 시 통째로 교체되므로 읽기 전용으로 사용)"""
+        return self._markets.get(exchange_id, {})
+
+    def get_market(self, exchange_id: str, symbol: str) -> Optional[Dict]:
+        """개별 마켓 정보"""
+        return self._markets.get(exchange_id, {}).get(symbol)
+
+    def get_symbol_universe(self, korean_exchange_id: str, futures_exchange_id: str) -> Set[str]:
+        """
+        한국 KRW 마켓과 선물 USDT 무기한 계약에 모두 존재하는 심볼 집합
+
+        Returns:
+            기초자산 심볼 집합 (예: {'BTC', 'XRP'}), 마켓 정보가 없으면 빈 집합
+        """
+        key = (korean_exchange_id, futures_exchange_id)
+        universe = self._universe_cache.get(key)
+        if universe is not None:
+            return universe
+
+        korean_bases = {
+            info.get('base', symbol.split('/')[0])
+            for symbol, info in self.get_markets(korean_exchange_id).items()
+            if symbol.endswith('/KRW')
+        }
+        futures_bases = {
+            info.get('underlying', symbol.split('/')[0])
+            for symbol, info in self.get_markets(futures_exchange_id).items()
+            if symbol.endswith('/USDT:USDT')
+        }
+        universe = korean_bases & futures_bases
+
+        # 한쪽 마켓 정보가 아직 없으면 캐시하지 않음
+        if korean_bases and futures_bases:
+            self._universe_cache[key] = universe
+        return universe
+
+    def is_stale(self, exchange_id: str) -> bool:
+        """캐시 만료 여부"""
+        loaded_at = self._loaded_at.get(exchange_id)
+        if loaded_at is None:
+            return True
+        return time.time() - loaded_at > self.ttl_seconds
+
+    # ---------- 로드 / 갱신 ----------
+
+    def load(self, exchanges: Iterable) -> None:
+        """
+        마켓 정보 로드
+
+        캐시가 없는 거래소만 동기적으로 다운로드하고,
+        만료된 캐시는 그대로 사용하면서 백그라운드에서 갱신
+        """
+        self._load_cache()
+
+        missing = []
+        stale = []
+        for exchange in exchanges:
+            exchange_id = exchange.exchange_id
+            if not self._markets.get(exchange_id):
+                logger.info(f"{exchange_id} 마켓 캐시 없음 - 다운로드")
+                missing.append(exchange)
+            elif self.is_stale(exchange_id):
+                stale.append(exchange)
+            else:
+                logger.info(f"{exchange_id} 마켓 캐시 사용: {len(self._markets[exchange_id])}개")
+
+        if stale:
+            self.refresh_in_background(stale)
+
+        # 캐시가 없는 거래소는 동시에 다운로드
+        if len(missing) == 1:
+            self.refresh(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                list(executor.map(self.refresh, missing))
+
+    def refresh(self, exchange) -> bool:
+        """거래소 마켓 정보 다시 다운로드"""
+        exchange_id = exchange.exchange_id
+        try:
+            markets = exchange.fetch_markets()
+            if not markets:
+                logger.warning(f"{exchange_id} 마켓 정보가 비어있음 - 기존 정보 유지")
+                return False
+
+            with self._lock:
+                # 이전에 조회한 주문 제한 정보는 유지
+                previous = self._markets.get(exchange_id, {})
+                for symbol, info in markets.items():
+                    limits = previous.get(symbol, {}).get('limits')
+                    if limits and 'limits' not in info:
+                        info.update(limits)
+                        info['limits'] = limits
+
+                self._markets[exchange_id] = markets
+                self._loaded_at[exchange_id] = time.time()
+                self._universe_cache.clear()
+
+            logger.info(f"{exchange_id} 마켓 정보 갱신: {len(markets)}개")
+            self._save_cache()
+            return True
+
+        except Exception as e:
+            logger.error(f"{exchange_id} 마켓 정보 갱신 실패: {e}")
+            return False
+
+    def refresh_in_background(self, exchanges: List) -> threading.Thread:
+        """백그라운드 갱신 (이미 갱신 중인 거래소는 건너뜀)"""
+        targets = []
+        with self._lock:
+            for exchange in exchanges:
+                if exchange.exchange_id not in self._refreshing:
+                    self._refreshing.add(exchange.exchange_id)
+                    targets.append(exchange)
+
+        def _run():
+            for exchange in targets:
+                try:
+                    self.refresh(exchange)
+                finally:
+                    with self._lock:
+                        self._refreshing.discard(exchange.exchange_id)
+
+        thread = threading.Thread(target=_run, name='market-registry-refresh', daemon=True)
+        thread.start()
+        return thread
+
+    def refresh_limits(self, exchange, symbols: Iterable[str], background: bool = False) -> None:
+        """
+        심볼별 주문 제한 정보 조회 (업비트 orders/chance 등)
+
+        거래소가 fetch_order_limits를 제공하지 않으면 아무것도 하지 않음
+        """
+        fetch = getattr(exchange, 'fetch_order_limits', None)
+        if fetch is None:
+            return
+
+        if background:
+            threading.Thread(
+                target=self.refresh_limits, args=(exchange, list(symbols)),
+                name='market-registry-limits', daemon=True
+            ).start()
+            return
+
+        exchange_id = exchange.exchange_id
+        updated = False
+        for symbol in symbols:
+            market = self.get_market(exchange_id, symbol)
+            if market is None or market.get('limits'):
+                continue
+            limits = fetch(symbol)
+            if limits:
+                with self._lock:
+                    market.update(limits)
+                    market['limits'] = limits
+                updated = True
+
+        if updated:
+            self._save_cache()
+
+    # ---------- 디스크 캐시 ----------
+
+    def _load_cache(self) -> None:
+        """디스크 캐시 읽기"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get('version') != CACHE_VERSION:
+                logger.info("마켓 캐시 버전 불일치 - 무시")
+                return
+
+            with self._lock:
+                for exchange_id, entry in data.get('exchanges', {}).items():
+                    self._markets[exchange_id] = entry.get('markets', {})
+                    self._loaded_at[exchange_id] = entry.get('saved_at', 0)
+                self._universe_cache.clear()
+
+        except Exception as e:
+            logger.warning(f"마켓 캐시 읽기 실패: {e}")
+
+    def _save_cache(self) -> None:
+        """디스크 캐시 쓰기 (임시 파일에 쓴 뒤 교체)"""
+        if not self.cache_file:
+            return
+
+        try:
+            with self._lock:
+                data = {
+                    'version': CACHE_VERSION,
+                    'exchanges': {
+                        exchange_id: {
+                            'saved_at': self._loaded_at.get(exchange_id, 0),
+                            'markets': markets
+                        }
+                        for exchange_id, markets in self._markets.items()
+                    }
+                }
+                tmp_file = f"{self.cache_file}.tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_file, self.cache_file)
+
+        except Exception as e:
+            logger.warning(f"마켓 캐시 저장 실패: {e}")
@@ -0,0 +1,635 @@
+"""
+다중 거래소 합성 어댑터
+
+- MultiVenueFuturesExchange: 숏 헤지를 여러 USDT 무기한 선물 거래소에 최우선 호가 잔량 비례로 분할
+- MultiVenueSpotExchange: 한국 현물 주문을 호가가 가장 좋은 거래소로 라우팅
+
+두 어댑터 모두 FuturesExchange/SpotExchange 인터페이스를 그대로 구현하므로
+주문 실행/리밸런싱 모듈은 단일 거래소와 동일하게 사용
+"""
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from src.config import settings
+from src.exchanges.base import ExchangeBase, ExchangeCapabilities, FuturesExchange, SpotExchange
+from src.utils.deadline import bind
+
+logger = logging.getLogger(__name__)
+
+# 부동소수점 오차 허용치 (코인 개수)
+QUANTITY_EPSILON = 1e-9
+
+
+def _floor_to_step(quantity: float, step: float) -> float:
+    """주문 단위로 내림 (단위가 없으면 그대로)"""
+    if step <= 0:
+        return quantity
+    return math.floor(quantity / step + QUANTITY_EPSILON) * step
+
+
+class HedgeSplitter:
+    """최우선 호가 잔량 비례 주문 수량 분할"""
+
+    def split(
+        self, quantity: float, depths: Dict[str, float], steps: Dict[str, float],
+        remainder_venue: str, lot: float = 0.0,
+        min_quantities: Optional[Dict[str, float]] = None
+    ) -> Dict[str, float]:
+        """
+        전체 주문 수량을 거래소별로 분할
+
+        Args:
+            quantity: 전체 주문 코인 개수
+            depths: {거래소: 주문 방향 최우선 호가 잔량(코인)} - 시세 조회에 성공한 거래소만
+            steps: {거래소: 주문 단위(코인)}
+            remainder_venue: 반올림 나머지를 받는 거래소
+            lot: 합성 계약 크기 - 다른 거래소 조각을 이 단위로 내려서
+                 나머지 거래소 주문도 정수 계약이 되도록 함
+            min_quantities: {거래소: 최소 주문 코인 개수} - 미만 조각은 나머지로 합침
+
+        Returns:
+            {거래소: 코인 개수} (0인 거래소 제외)
+        """
+        if quantity <= 0:
+            return {}
+
+        total_depth = sum(depth for depth in depths.values() if depth > 0)
+        if remainder_venue not in depths or total_depth <= 0:
+            return {remainder_venue: quantity}
+
+        min_quantities = min_quantities or {}
+        allocation = {}
+        for venue, depth in depths.items():
+            if venue == remainder_venue or depth <= 0:
+                continue
+            share = _floor_to_step(quantity * depth / total_depth, lot)
+            share = _floor_to_step(share, steps.get(venue, 0.0))
+            if share <= 0 or share < min_quantities.get(venue, 0.0):
+                continue
+            allocation[venue] = share
+
+        remainder = quantity - sum(allocation.values())
+        if remainder > QUANTITY_EPSILON:
+            allocation[remainder_venue] = remainder
+        return allocation
+
+
+class _VenueGroup:
+    """여러 거래소 동시 호출 공통 (첫 번째 거래소가 주 거래소)"""
+
+    def _init_venues(self, venues: List[ExchangeBase], thread_name_prefix: str):
+        if not venues:
+            raise ValueError("거래소가 1개 이상 필요합니다")
+
+        self.venues: Dict[str, ExchangeBase] = {venue.exchange_id: venue for venue in venues}
+        self.primary = venues[0]
+        # 마켓 레지스트리/최소 주문 금액 조회는 주 거래소 ID 기준
+        self.exchange_id = self.primary.exchange_id
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(2, len(venues) * 2), thread_name_prefix=thread_name_prefix
+        )
+
+    def _call_all(self, call: Callable, venues: Optional[List[ExchangeBase]] = None,
+                  timeout: Optional[float] = None) -> Dict[str, object]:
+        """거래소별 동시 호출 - 제한 시간 안에 응답한 거래소 결과만 반환"""
+        venues = list(self.venues.values()) if venues is None else venues
+        call = bind(call)  # 호출 스레드의 데드라인을 거래소별 스레드로 전달
+        futures = {self._pool.submit(call, venue): venue.exchange_id for venue in venues}
+        done, pending = wait(futures, timeout=timeout)
+
+        for future in pending:
+            logger.warning(f"{futures[future]} 응답 지연 ({timeout}초 초과) - 제외")
+
+        results = {}
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                logger.error(f"{futures[future]} 호출 실패: {e}")
+        return results
+
+    def _venues_for(self, symbol: str) -> List[ExchangeBase]:
+        """심볼이 상장된 거래소 (주 거래소와 마켓 정보가 없는 거래소는 포함)"""
+        venues = []
+        for venue in self.venues.values():
+            markets = venue.get_markets()
+            if venue is self.primary or not markets or symbol in markets:
+                venues.append(venue)
+        return venues
+
+    def get_venue_quotes(self, symbol: str) -> Dict[str, Dict]:
+        """거래소별 최우선 호가 (제한 시간 안에 응답한 거래소만)"""
+        results = self._call_all(
+            lambda venue: venue.get_best_bid_ask(symbol), self._venues_for(symbol), self.quote_timeout
+        )
+        return {venue_id: quote for venue_id, quote in results.items() if quote}
+
+    @staticmethod
+    def _merge_quotes(symbol: str, quotes: List[Dict]) -> Optional[Dict]:
+        """거래소별 최우선 호가 -> 최고 매수/최저 매도 호가, 잔량 합계 (호가 시각은 가장 오래된 거래소 기준)"""
+        quotes = [quote for quote in quotes if quote and quote.get('bid') and quote.get('ask')]
+        if not quotes:
+            return None
+        merged = {
+            'symbol': symbol,
+            'bid': max(quote['bid'] for quote in quotes),
+            'ask': min(quote['ask'] for quote in quotes),
+            'bid_size': sum(quote.get('bid_size', 0) for quote in quotes),
+            'ask_size': sum(quote.get('ask_size', 0) for quote in quotes)
+        }
+        stamped = [quote for quote in quotes if quote.get('quote_time') is not None]
+        if stamped:
+            oldest = min(stamped, key=lambda quote: quote['quote_time'])
+            merged['timestamp'], merged['quote_time'] = oldest.get('timestamp'), oldest['quote_time']
+            if 'quote_time_error' in oldest:
+                merged['quote_time_error'] = oldest['quote_time_error']
+        return merged
+
+    def get_best_bid_ask(self, symbol: str) -> Optional[Dict]:
+        """전체 거래소 통합 최우선 호가"""
+        return self._merge_quotes(symbol, list(self.get_venue_quotes(symbol).values()))
+
+    def get_best_bid_asks(self, symbols: List[str]) -> Dict[str, Dict]:
+        """여러 심볼 통합 최우선 호가 (거래소별 일괄 조회 동시 실행)"""
+        results = self._call_all(
+            lambda venue: venue.get_best_bid_asks(symbols), timeout=self.quote_timeout
+        )
+        quotes = {}
+        for symbol in symbols:
+            merged = self._merge_quotes(
+                symbol, [venue_quotes.get(symbol) for venue_quotes in results.values() if venue_quotes]
+            )
+            if merged:
+                quotes[symbol] = merged
+        return quotes
+
+    def get_markets(self) -> Dict:
+        """주 거래소 마켓 정보"""
+        return self.primary.get_markets()
+
+    def fetch_markets(self) -> Dict:
+        """주 거래소 마켓 정보 다운로드"""
+        return self.primary.fetch_markets()
+
+    def sync_clock(self) -> bool:
+        """거래소별 시계 동기화 (한 곳이라도 표본을 기록하면 True)"""
+        return any(self._call_all(lambda venue: venue.sync_clock()).values())
+
+
+class MultiVenueFuturesExchange(_VenueGroup, FuturesExchange):
+    """여러 선물 거래소를 하나의 선물 거래소처럼 사용하는 합성 어댑터
+
+    - 첫 번째 거래소가 주 거래소: 마켓 정보/계약 크기/최소 주문 금액 기준
+    - 신규 주문은 최우선 호가 잔량 비례, 청산(reduce_only)은 보유 포지션 비례로 분할
+    - 시세 응답이 늦거나 실패한 거래소는 이번 주문에서 제외하고,
+      주문이 실패한 조각은 체결된 다른 거래소로 재주문
+    """
+
+    # 주문 수량은 주 거래소 계약 단위 (다른 거래소 조각도 이 단위로 맞춤)
+    capabilities = ExchangeCapabilities(contract_sizing=True)
+
+    def __init__(self, venues: List[FuturesExchange], quote_timeout: Optional[float] = None,
+                 splitter: Optional[HedgeSplitter] = None):
+        self._init_venues(venues, 'futures-venue')
+        self.quote_timeout = settings.HEDGE_SPLIT_QUOTE_TIMEOUT if quote_timeout is None else quote_timeout
+        self.splitter = splitter or HedgeSplitter()
+
+    # ---------- 마켓 ----------
+
+    @property
+    def futures_markets(self) -> Dict:
+        """Compatibility property"""
+        return self.primary.get_markets()
+
+    def get_contract_size(self, symbol: str) -> float:
+        """합성 계약 크기 (주 거래소 계약 크기)"""
+        return self.primary.get_contract_size(symbol)
+
+    # ---------- 시세 ----------
+
+    def get_ticker(self, symbol: str) -> Optional[Dict]:
+        """주 거래소 시세 (실패 시 다른 거래소)"""
+        for venue in self._venues_for(symbol):
+            ticker = venue.get_ticker(symbol)
+            if ticker:
+                return ticker
+        return None
+
+    # ---------- 계정 ----------
+
+    def get_balance(self, currency: str) -> Optional[Dict]:
+        """전체 거래소 잔고 합계"""
+        balances = [
+            balance for balance in self._call_all(lambda venue: venue.get_balance(currency)).values()
+            if balance
+        ]
+        if not balances:
+            return None
+        return {key: sum(balance.get(key, 0) for balance in balances) for key in ('free', 'used', 'total')}
+
+    def get_venue_positions(self) -> Dict[str, List[Dict]]:
+        """거래소별 포지션 목록 (조회 실패 거래소 제외)"""
+        return {
+            venue_id: positions
+            for venue_id, positions in self._call_all(lambda venue: venue.get_positions()).items()
+            if positions is not None
+        }
+
+    def get_positions(self) -> Optional[List[Dict]]:
+        """심볼별 합산 포지션 (contracts는 합성 계약 수, venues는 거래소별 코인 개수)
+
+        한 거래소라도 조회에 실패하면 None (일부 거래소만 합산하면 포지션이 작게 보임)
+        """
+        venue_positions = self.get_venue_positions()
+        if len(venue_positions) < len(self.venues):
+            return None
+
+        totals: Dict[str, Dict] = {}
+        for venue_id, positions in venue_positions.items():
+            venue = self.venues[venue_id]
+            for position in positions:
+                symbol = position['symbol']
+                coins = position['contracts'] * venue.get_contract_size(symbol)
+                signed_coins = -coins if position['side'] == 'short' else coins
+
+                total = totals.setdefault(symbol, {
+                    'coins': 0.0, 'notional': 0.0,
+                    'mark_price': position.get('mark_price', 0), 'venues': {}
+                })
+                total['coins'] += signed_coins
+                total['notional'] += position.get('notional', 0)
+                total['venues'][venue_id] = signed_coins
+
+        result = []
+        for symbol, total in totals.items():
+            if abs(total['coins']) <= QUANTITY_EPSILON:
+                continue
+            result.append({
+                'symbol': symbol,
+                'side': 'short' if total['coins'] < 0 else 'long',
+                'contracts': abs(total['coins']) / self.get_contract_size(symbol),
+                'notional': total['notional'],
+                'mode': 'multi_venue',
+                'mark_price': total['mark_price'],
+                'venues': total['venues']
+            })
+        return result
+
+    def set_leverage(self, symbol: str, leverage: int) -> bool:
+        """모든 거래소 레버리지 설정"""
+        results = self._call_all(lambda venue: venue.set_leverage(symbol, leverage), self._venues_for(symbol))
+        return len(results) == len(self._venues_for(symbol)) and all(results.values())
+
+    # ---------- 주문 분할 ----------
+
+    def _allocate_by_depth(self, symbol: str, side: str, quantity: float) -> Dict[str, float]:
+        """신규 주문: 주문 방향 최우선 호가 잔량 비례 분할"""
+        quotes = self.get_venue_quotes(symbol)
+        # 매도(숏)는 매수 호가, 매수는 매도 호가를 소진
+        size_key, price_key = ('bid_size', 'bid') if side == 'sell' else ('ask_size', 'ask')
+        depths = {venue_id: quote.get(size_key, 0) for venue_id, quote in quotes.items()}
+
+        if self.primary.exchange_id in depths:
+            remainder_venue = self.primary.exchange_id
+        elif depths:
+            # 주 거래소 응답 지연/실패 - 잔량이 가장 많은 거래소가 나머지를 받음
+            remainder_venue = max(depths, key=depths.get)
+            logger.warning(f"{symbol} 주 거래소 시세 없음 - {remainder_venue}로 대체")
+        else:
+            return {self.primary.exchange_id: quantity}
+
+        steps = {venue_id: self.venues[venue_id].get_quantity_step(symbol) for venue_id in depths}
+        min_quantities = {
+            venue_id: settings.MIN_ORDER_SIZES.get(venue_id, 0) / quotes[venue_id][price_key]
+            for venue_id in depths if quotes[venue_id].get(price_key)
+        }
+        return self.splitter.split(
+            quantity, depths, steps, remainder_venue, self.get_contract_size(symbol), min_quantities
+        )
+
+    def _allocate_reduce(self, symbol: str, side: str, quantity: float) -> Dict[str, float]:
+        """청산 주문: 거래소별 보유 포지션 비례 분할 (보유량 초과 없음)"""
+        target_side = 'short' if side == 'buy' else 'long'
+        held = {}
+        for venue_id, positions in self.get_venue_positions().items():
+            for position in positions:
+                if position['symbol'] == symbol and position['side'] == target_side:
+                    held[venue_id] = position['contracts'] * self.venues[venue_id].get_contract_size(symbol)
+
+        if not held:
+            return {}
+        if quantity >= sum(held.values()) - QUANTITY_EPSILON:
+            # 전량 청산
+            return held
+
+        remainder_venue = self.primary.exchange_id if self.primary.exchange_id in held else max(held, key=held.get)
+        steps = {venue_id: self.venues[venue_id].get_quantity_step(symbol) for venue_id in held}
+        allocation = self.splitter.split(
+            quantity, held, steps, remainder_venue, self.get_contract_size(symbol)
+        )
+        return {venue_id: min(amount, held[venue_id]) for venue_id, amount in allocation.items()}
+
+    @staticmethod
+    def _place_on_venue(venue: FuturesExchange, symbol: str, side: str, quantity: float,
+                        reduce_only: bool) -> Optional[Dict]:
+        """거래소 주문 방식에 맞춰 조각 주문"""
+        if venue.capabilities.contract_sizing:
+            contracts = round(quantity / venue.get_contract_size(symbol))
+            return venue.create_contract_order(symbol, side, contracts, reduce_only)
+        params = {'reduce_only': True} if reduce_only else None
+        return venue.create_market_order(symbol, side, quantity, params)
+
+    def _place_slices(self, symbol: str, side: str, allocation: Dict[str, float],
+                      reduce_only: bool) -> Dict[str, Dict]:
+        """조각 동시 주문 - 성공한 거래소 주문 결과만 반환"""
+        results = self._call_all(
+            lambda venue: self._place_on_venue(
+                venue, symbol, side, allocation[venue.exchange_id], reduce_only
+            ),
+            [self.venues[venue_id] for venue_id in allocation]
+        )
+        return {venue_id: order for venue_id, order in results.items() if order}
+
+    def create_market_order(self, symbol: str, side: str, amount: float,
+                            params: Optional[Dict] = None) -> Optional[Dict]:
+        """시장가 주문 (amount: 코인 개수) - 거래소별 분할 주문"""
+        reduce_only = params.get('reduce_only', False) if params else False
+        try:
+            if reduce_only:
+                allocation = self._allocate_reduce(symbol, side, amount)
+            else:
+                allocation = self._allocate_by_depth(symbol, side, amount)
+        except Exception as e:
+            logger.error(f"{symbol} 주문 분할 실패: {e}")
+            return None
+
+        if not allocation:
+            logger.error(f"{symbol} 주문 가능한 선물 거래소 없음")
+            return None
+
+        orders = self._place_slices(symbol, side, allocation, reduce_only)
+        filled = {venue_id: allocation[venue_id] for venue_id in orders}
+
+        failed = {venue_id: quantity for venue_id, quantity in allocation.items() if venue_id not in orders}
+        if failed and not reduce_only:
+            # 실패한 조각은 주문이 성공한 거래소로 재주문 (주 거래소 우선)
+            fallbacks = sorted(orders, key=lambda venue_id: venue_id != self.primary.exchange_id)
+            for venue_id, quantity in failed.items():
+                for fallback_id in fallbacks:
+                    logger.warning(f"{venue_id} 주문 실패 - {fallback_id}로 재주문: {symbol} {quantity}")
+                    order = self._place_on_venue(self.venues[fallback_id], symbol, side, quantity, False)
+                    if order:
+                        orders[f"{fallback_id}:{venue_id}"] = order
+                        filled[fallback_id] = filled.get(fallback_id, 0) + quantity
+                        break
+                else:
+                    logger.error(f"{symbol} {venue_id} 조각 재주문 실패: {quantity}")
+        elif failed:
+            logger.error(f"{symbol} 청산 조각 실패: {failed}")
+
+        if not orders:
+            return None
+
+        total = sum(filled.values())
+        logger.info(f"{symbol} 선물 분할 주문: {side} {total} ({', '.join(f'{v}={q}' for v, q in filled.items())})")
+        return {
+            'id': ','.join(str(order.get('id')) for order in orders.values()),
+            'symbol': symbol,
+            'side': side,
+            'amount': total / self.get_contract_size(symbol),
+            'status': 'finished' if total >= amount - QUANTITY_EPSILON else 'partial',
+            'filled': total / self.get_contract_size(symbol),
+            'venues': filled
+        }
+
+    def create_contract_order(self, symbol: str, side: str, contracts: int,
+                              reduce_only: bool = False, price: Optional[float] = None) -> Optional[Dict]:
+        """합성 계약 수 기준 시장가 주문 (지정가 IOC는 미지원 - limit_ioc_orders 아님)"""
+        if price is not None:
+            logger.error(f"{symbol} 선물 분할 주문은 지정가 IOC 미지원 - 주문 안 함 (price {price})")
+            return None
+        quantity = contracts * self.get_contract_size(symbol)
+        return self.create_market_order(
+            symbol, side, quantity, {'reduce_only': True} if reduce_only else None
+        )
+
+
+class MultiVenueSpotExchange(_VenueGroup, SpotExchange):
+    """한국 현물 거래소 여러 곳을 하나의 현물 거래소처럼 사용하는 합성 어댑터
+
+    - 최우선 호가는 거래소 중 최저 매도/최고 매수 호가
+      (프리미엄 계산이 진입은 가장 싼 매도 호가, 청산은 가장 비싼 매수 호가 기준)
+    - 매수(KRW 금액)는 매도 호가가 가장 낮은 거래소, 매도는 매수 호가가 가장 높은 거래소로 주문
+      (해당 거래소 잔고가 부족하면 다음 거래소로 나눠 주문)
+    - 주문 후 거래소별 보유량을 fill listener로 알림 (PositionManager가 거래소별 보유량 관리)
+    """
+
+    def __init__(self, venues: List[SpotExchange], quote_timeout: Optional[float] = None):
+        buy_modes = {venue.capabilities.quote_amount_buys for venue in venues}
+        if len(buy_modes) > 1:
+            raise ValueError("매수 주문 방식(KRW 금액/수량)이 다른 거래소는 함께 사용할 수 없습니다")
+
+        self._init_venues(venues, 'spot-venue')
+        self.quote_timeout = settings.SPOT_ROUTE_QUOTE_TIMEOUT if quote_timeout is None else quote_timeout
+        # 수량 정밀도는 가장 거친 거래소 기준 (어느 거래소로 보내도 그대로 주문 가능)
+        precisions = [
+            venue.capabilities.quantity_precision for venue in venues
+            if venue.capabilities.quantity_precision is not None
+        ]
+        self.capabilities = ExchangeCapabilities(
+            quote_amount_buys=buy_modes.pop(),
+            quantity_precision=min(precisions) if precisions else None
+        )
+        self._fill_listeners: List[Callable[[str, str, float], None]] = []
+
+    def add_fill_listener(self, listener: Callable[[str, str, float], None]) -> None:
+        """주문 후 호출할 콜백 등록: listener(심볼, 거래소 ID, 해당 거래소 보유량)"""
+        self._fill_listeners.append(listener)
+
+    # ---------- 시세 / 마켓 ----------
+
+    def get_ticker(self, symbol: str) -> Optional[Dict]:
+        """주 거래소 시세 (bid/ask는 전체 거래소 최우선 호가)"""
+        ticker = self.primary.get_ticker(symbol)
+        quote = self.get_best_bid_ask(symbol)
+        if ticker and quote:
+            ticker = dict(ticker, bid=quote['bid'], ask=quote['ask'])
+        return ticker
+
+    def get_min_order_krw(self, symbol: str) -> float:
+        """최소 주문 금액 (가장 큰 거래소 기준)"""
+        return max(venue.get_min_order_krw(symbol) for venue in self._venues_for(symbol))
+
+    # ---------- 잔고 ----------
+
+    def get_venue_balances(self) -> Dict[str, Dict[str, Dict]]:
+        """거래소별 전체 잔고 ({거래소: {통화: 잔고}}, 조회 실패 거래소 제외)"""
+        return {
+            venue_id: balances
+            for venue_id, balances in self._call_all(lambda venue: venue.get_balances()).items()
+            if balances is not None
+        }
+
+    def get_balances(self) -> Optional[Dict[str, Dict]]:
+        """전체 거래소 잔고 합계"""
+        venue_balances = self.get_venue_balances()
+        if not venue_balances:
+            return None
+
+        totals: Dict[str, Dict] = {}
+        for balances in venue_balances.values():
+            for currency, balance in balances.items():
+                total = totals.setdefault(currency, {'free': 0.0, 'used': 0.0, 'total': 0.0})
+                for key in total:
+                    total[key] += balance.get(key, 0)
+        return totals
+
+    def get_balance(self, currency: str) -> Optional[Dict]:
+        """통화별 잔고 합계"""
+        balances = self.get_balances()
+        if balances is None:
+            return None
+        return balances.get(currency, {'free': 0, 'used': 0, 'total': 0})
+
+    # ---------- 주문 라우팅 ----------
+
+    def _route(self, amount: float, ranked: List[str], capacity: Optional[Dict[str, float]],
+               minimums: Dict[str, float]) -> Dict[str, float]:
+        """
+        호가 순위대로 거래소 잔고만큼 주문량 배정
+
+        Args:
+            amount: 주문량 (매수는 KRW, 매도는 코인 개수)
+            ranked: 호가가 좋은 순서의 거래소 ID
+            capacity: {거래소: 주문 가능량} (None이면 잔고 조회 실패 - 최적 거래소로 전량)
+            minimums: {거래소: 최소 주문량}
+
+        Returns:
+            {거래소: 주문량}, 잔고가 부족하면 빈 dict
+        """
+        if capacity is None:
+            return {ranked[0]: amount}
+
+        allocation = {}
+        remaining = amount
+        for venue_id in ranked:
+            if remaining <= QUANTITY_EPSILON:
+                break
+            take = min(remaining, capacity.get(venue_id, 0.0))
+            if take <= 0 or take < minimums.get(venue_id, 0.0):
+                continue
+            allocation[venue_id] = take
+            remaining -= take
+
+        if remaining > QUANTITY_EPSILON:
+            return {}
+        return allocation
+
+    def _route_order(self, symbol: str, side: str, amount: float) -> Dict[str, float]:
+        """주문 방향 최우선 호가 기준 거래소별 주문량"""
+        quotes = self.get_venue_quotes(symbol)
+        if not quotes:
+            logger.warning(f"{symbol} 거래소별 호가 없음 - {self.primary.exchange_id}로 주문")
+            return {self.primary.exchange_id: amount}
+
+        base = symbol.split('/')[0]
+        venue_balances = self.get_venue_balances()
+
+        if side == 'buy':
+            ranked = sorted(quotes, key=lambda venue_id: quotes[venue_id]['ask'])
+            currency = 'KRW'
+            minimums = {venue_id: self.venues[venue_id].get_min_order_krw(symbol) for venue_id in ranked}
+        else:
+            ranked = sorted(quotes, key=lambda venue_id: quotes[venue_id]['bid'], reverse=True)
+            currency = base
+            minimums = {
+                venue_id: self.venues[venue_id].get_min_order_krw(symbol) / quotes[venue_id]['bid']
+                for venue_id in ranked
+            }
+
+        capacity = None
+        if venue_balances:
+            capacity = {
+                venue_id: venue_balances.get(venue_id, {}).get(currency, {}).get('free', 0.0)
+                for venue_id in ranked
+            }
+        allocation = self._route(amount, ranked, capacity, minimums)
+
+        if allocation and side == 'buy' and self.capabilities.quote_amount_buys:
+            # KRW 금액은 정수로 나눠 주문 - 나머지는 이미 배분받은 거래소 중 잔고에 들어가는 최적 거래소,
+            # 들어갈 곳이 없으면 버림 (배분 없는 거래소로 1원 미만 주문을 보내지 않음)
+            allocation = {venue_id: float(int(krw)) for venue_id, krw in allocation.items() if int(krw) > 0}
+            remainder = amount - sum(allocation.values())
+            for venue_id in ranked:
+                if venue_id in allocation and (
+                    capacity is None or allocation[venue_id] + remainder <= capacity[venue_id]
+                ):
+                    allocation[venue_id] += remainder
+                    break
+        elif allocation:
+            # 잔고를 넘지 않도록 거래소 수량 정밀도로 내림
+            for venue_id, quantity in allocation.items():
+                precision = self.venues[venue_id].capabilities.quantity_precision
+                if precision is not None:
+                    allocation[venue_id] = _floor_to_step(quantity, 10 ** -precision)
+        return allocation
+
+    def _notify_fills(self, symbol: str, venue_ids: List[str]) -> None:
+        """주문한 거래소의 보유량을 listener에 전달"""
+        if not self._fill_listeners:
+            return
+        base = symbol.split('/')[0]
+        balances = self._call_all(
+            lambda venue: venue.get_balance(base), [self.venues[venue_id] for venue_id in venue_ids]
+        )
+        for venue_id, balance in balances.items():
+            if balance is None:
+                continue
+            for listener in self._fill_listeners:
+                listener(base, venue_id, balance.get('total', 0))
+
+    def create_market_order(self, symbol: str, side: str, amount: float,
+                            params: Optional[Dict] = None) -> Optional[Dict]:
+        """시장가 주문 - 호가가 가장 좋은 거래소로 라우팅"""
+        try:
+            allocation = self._route_order(symbol, side, amount)
+        except Exception as e:
+            logger.error(f"{symbol} 주문 라우팅 실패: {e}")
+            return None
+
+        if not allocation:
+            logger.error(f"{symbol} {side} 주문 가능한 거래소 없음 (잔고 부족): {amount}")
+            return None
+
+        results = self._call_all(
+            lambda venue: venue.create_market_order(symbol, side, allocation[venue.exchange_id], params),
+            [self.venues[venue_id] for venue_id in allocation]
+        )
+        orders = {venue_id: order for venue_id, order in results.items() if order}
+
+        if len(orders) < len(allocation):
+            failed = [venue_id for venue_id in allocation if venue_id not in orders]
+            logger.error(f"{symbol} {side} 주문 실패 거래소: {', '.join(failed)}")
+
+        self._notify_fills(symbol, list(orders))
+        if not orders:
+            return None
+
+        logger.info(
+            f"{symbol} {side} 라우팅: "
+            + ', '.join(f"{venue_id}={allocation[venue_id]}" for venue_id in orders)
+        )
+        if len(orders) == 1:
+            venue_id, order = next(iter(orders.items()))
+            return dict(order, venue=venue_id)
+        return {
+            'id': ','.join(str(order.get('id')) for order in orders.values()),
+            'symbol': symbol,
+            'side': side,
+            'amount': sum(allocation[venue_id] for venue_id in orders),
+            'status': 'done' if len(orders) == len(allocation) else 'partial',
+            'filled': sum(order.get('filled', 0) or 0 for order in orders.values()),
+            'venues': {venue_id: allocation[venue_id] for venue_id in orders}
+        }
@@ -0,0 +1,75 @@
+"""
+주문 배치 수집기 - 짧은 결정 창 안에 들어온 주문을 모아 일괄 주문 API 한 번으로 제출
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingOrder:
+    """제출 대기 중인 주문 1건 (결과는 배치 제출 후 채워짐)"""
+
+    def __init__(self, intent: Any):
+        self.intent = intent
+        self.result: Any = None
+        self.done = threading.Event()
+
+
+class OrderBatcher:
+    """여러 스레드의 주문을 모아 일괄 제출
+
+    - 빈 창에 처음 들어온 주문의 스레드가 window초 기다린 뒤 모인 주문을 한 번에 제출 (별도 스레드 없음)
+    - 창 안에 max_size건이 모이면 기다리지 않고 바로 제출
+    - 결과는 제출 순서대로 각 주문에 돌려줌 (submit_batch는 입력과 같은 길이의 리스트 반환)
+    """
+
+    def __init__(self, submit_batch: Callable[[List[Any]], List[Any]], window: float, max_size: int):
+        self.submit_batch = submit_batch
+        self.window = window
+        self.max_size = max_size
+        self._pending: List[_PendingOrder] = []
+        self._lock = threading.Lock()
+        self._full = threading.Event()
+
+    def submit(self, intent: Any) -> Any:
+        """주문 추가 후 배치 결과 대기"""
+        order = _PendingOrder(intent)
+        with self._lock:
+            self._pending.append(order)
+            leader = len(self._pending) == 1
+            if leader:
+                self._full.clear()
+            elif len(self._pending) >= self.max_size:
+                self._full.set()
+
+        if leader:
+            self._full.wait(self.window)
+            self._flush()
+        order.done.wait()
+        return order.result
+
+    def _flush(self) -> None:
+        """모인 주문 제출 (max_size 단위로 나눠 제출)"""
+        with self._lock:
+            batch, self._pending = self._pending, []
+
+        for start in range(0, len(batch), self.max_size):
+            chunk = batch[start:start + self.max_size]
+            results = self._submit_chunk([order.intent for order in chunk])
+            for order, result in zip(chunk, results):
+                order.result = result
+                order.done.set()
+
+    def _submit_chunk(self, intents: List[Any]) -> List[Optional[Any]]:
+        """일괄 제출 (실패 시 전부 None)"""
+        started = time.monotonic()
+        try:
+            results = list(self.submit_batch(intents))
+        except Exception as e:
+            logger.error(f"배치 주문 제출 실패 ({len(intents)}건): {e}")
+            results = []
+        logger.debug(f"배치 주문 {len(intents)}건 제출 ({(time.monotonic() - started) * 1000:.0f}ms)")
+        return results + [None] * (len(intents) - len(results))
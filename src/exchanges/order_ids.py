@@ -0,0 +1,116 @@
+"""
+주문 클라이언트 ID / 안전한 재시도
+
+모든 주문에 클라이언트가 만든 ID를 붙이고, 응답을 받지 못한 주문(타임아웃, 연결 끊김)은
+같은 ID로 거래소에서 조회한 뒤 접수되지 않은 것이 확인될 때만 같은 ID로 다시 제출.
+중복 체결 없이 짧은 주문 타임아웃을 쓸 수 있게 함
+"""
+import contextvars
+import functools
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Set, TypeVar
+
+from src.config import settings
+from src.utils.deadline import current_deadline, mark_unknown
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class OrderOutcomeUnknown(Exception):
+    """주문 요청이 거래소에 도달했는지 알 수 없음 (응답 타임아웃, 전송 후 연결 끊김)"""
+
+
+class _AssignedId:
+    """주문 의도에 미리 정한 클라이언트 주문 ID - 거래소별 첫 주문에만 사용"""
+
+    def __init__(self, client_id: str):
+        self.client_id = client_id
+        self._claimed: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def claim(self, venue: str) -> bool:
+        with self._lock:
+            if venue in self._claimed:
+                return False
+            self._claimed.add(venue)
+            return True
+
+
+_assigned: contextvars.ContextVar[Optional[_AssignedId]] = contextvars.ContextVar('client_order_id', default=None)
+
+
+def new_client_order_id(venue: str = '') -> str:
+    """클라이언트 주문 ID (24자 영숫자 - Gate text 't-' 뒤 28바이트 제한 안)
+
+    assign_client_order_id 안에서는 거래소별 첫 주문에 지정된 ID 사용 (되돌리기/재주문 등 이후 주문은 새 ID)
+    """
+    assigned = _assigned.get()
+    if assigned is not None and assigned.claim(venue):
+        return assigned.client_id
+    return f"hp{uuid.uuid4().hex[:22]}"
+
+
+@contextmanager
+def assign_client_order_id(client_id: str) -> Iterator[str]:
+    """이 안에서 보내는 주문에 client_id 사용 - 저널에 먼저 기록한 ID로 재시작 후 주문 조회"""
+    token = _assigned.set(_AssignedId(client_id))
+    try:
+        yield client_id
+    finally:
+        _assigned.reset(token)
+
+
+def with_client_order_id(client_id: str, func: Callable[..., T]) -> Callable[..., T]:
+    """func 안에서 보내는 주문에 client_id 사용 (스레드 풀 submit용)"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with assign_client_order_id(client_id):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def submit_idempotent(label: str, submit: Callable[[], T], lookup: Callable[[], Optional[T]],
+                      unanswered: bool = False) -> Optional[T]:
+    """주문 제출 - 결과를 모르면 클라이언트 ID로 조회하고 없을 때만 같은 ID로 재제출
+
+    submit: 응답을 받지 못하면 OrderOutcomeUnknown (거부는 그 외 예외 또는 None 반환)
+    lookup: 접수된 주문이 있으면 반환, 없으면 None, 조회 자체가 실패하면 예외
+    unanswered: 이미 한 번 보냈지만 응답이 없었음 (일괄 주문) - 조회부터 시작
+
+    Returns:
+        주문 응답 - 접수되지 않은 것이 확인되면 None,
+        끝내 확인하지 못하면 None + 현재 데드라인에 결과 미확인으로 기록
+    """
+    retries = settings.ORDER_SUBMIT_RETRIES
+    for attempt in range(retries + 1):
+        if attempt > 0 or not unanswered:
+            try:
+                return submit()
+            except OrderOutcomeUnknown as e:
+                logger.warning(f"{label} 주문 응답 없음 ({e}) - 클라이언트 ID로 접수 여부 확인")
+
+        # 체결 엔진 반영 대기 (데드라인 남은 시간 안에서)
+        deadline = current_deadline()
+        delay = settings.ORDER_LOOKUP_DELAY_SECONDS
+        time.sleep(min(delay, deadline.remaining()) if deadline is not None else delay)
+        try:
+            found = lookup()
+        except Exception as e:
+            logger.error(f"{label} 주문 조회 실패: {e}")
+            break
+        if found is not None:
+            logger.info(f"{label} 주문 접수 확인 - 재제출 안 함")
+            return found
+        if attempt == retries:
+            logger.error(f"{label} 주문 미접수 확인 - 재시도 횟수 초과")
+            return None
+        logger.warning(f"{label} 주문 미접수 확인 - 같은 ID로 재제출 ({attempt + 1}/{retries})")
+
+    mark_unknown(label)
+    return None
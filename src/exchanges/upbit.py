@@ -1,17 +1,43 @@
 import jwt
 import uuid
 import hashlib
+import time
 import requests
 import logging
 from urllib.parse import urlencode
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+from src.config import settings
+from src.exchanges import health
+from src.exchanges.clock_sync import clock_sync
+from src.exchanges.base import ExchangeCapabilities, SpotExchange, format_price, tick_from_table
+from src.exchanges.order_ids import OrderOutcomeUnknown, new_client_order_id, submit_idempotent
+from src.utils.deadline import request_timeout
+from src.utils.hedged_request import HedgedRequester
 
 logger = logging.getLogger(__name__)
 
-class UpbitExchange:
+class UpbitExchange(SpotExchange):
     """Upbit Native API 거래소 구현"""
     
-    def __init__(self, api_key: str, api_secret: str):
+    # 시장가 매수는 KRW 금액(정수 원)으로 주문, 지정가 IOC(time_in_force='ioc'), identifier로 주문 조회 지원
+    capabilities = ExchangeCapabilities(quote_amount_buys=True, limit_ioc_orders=True, client_order_lookup=True)
+    
+    # KRW 마켓 호가 단위 ((최소 가격, 호가 단위), 가격 내림차순)
+    KRW_TICK_SIZES = (
+        (2_000_000, 1000), (1_000_000, 500), (500_000, 100), (100_000, 50),
+        (10_000, 10), (1_000, 1), (100, 0.1), (10, 0.01), (1, 0.001),
+        (0.1, 0.0001), (0.01, 0.00001), (0.001, 0.000001), (0.0001, 0.0000001),
+        (0, 0.00000001),
+    )
+    # IOC 주문 최종 상태 확인 (체결 엔진 반영 대기)
+    IOC_STATUS_RETRIES = 5
+    IOC_STATUS_INTERVAL = 0.1
+    
+    # 주문 제한 정보가 없을 때 사용하는 최소 주문 금액
+    DEFAULT_MIN_ORDER_KRW = 5000.0
+    
+    def __init__(self, api_key: str, api_secret: str, market_registry=None):
         self.exchange_id = 'upbit'
         self.api_key = api_key
         self.api_secret = api_secret
@@ -19,6 +45,21 @@ class UpbitExchange:
         self.api_url = "https://api.upbit.com"
         
         self.session = requests.Session()
+        health.install(self.session, self.exchange_id, self._endpoint_group)
+        # 업비트는 서버 시각 API가 없어 응답 Date 헤더로 시계 오프셋 추정
+        clock_sync.install(self.session, self.exchange_id)
+        self.market_registry = market_registry
+        # 공개 시세 GET 전용 (주문/계정 요청은 복제하지 않음)
+        self.hedged_requests = HedgedRequester(self.exchange_id)
+    
+    @staticmethod
+    def _endpoint_group(method: str, path: str) -> str:
+        """서킷 브레이커 엔드포인트 그룹"""
+        if path in ('/v1/ticker', '/v1/orderbook', '/v1/market/all'):
+            return health.QUOTE
+        if method != 'GET' and path.startswith('/v1/order'):
+            return health.ORDER
+        return health.ACCOUNT
     
     def _create_jwt_token(self, query: Optional[Dict] = None) -> str:
         """Create JWT token for authentication"""
@@ -40,22 +81,30 @@ class UpbitExchange:
         jwt_token = jwt.encode(payload, self.api_secret)
         return jwt_token
     
-    def _api_call(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
-        """Make API call"""
+    def _api_call(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                  raise_unknown: bool = False) -> Optional[Dict]:
+        """Make API call (raise_unknown: 전송 오류를 None 대신 OrderOutcomeUnknown으로 올림)"""
         try:
             url = f"{self.api_url}{endpoint}"
             
             if method == 'GET':
-                jwt_token = self._create_jwt_token()
+                # 쿼리가 있는 GET 요청도 query_hash 필요
+                jwt_token = self._create_jwt_token(params)
                 headers = {'Authorization': f'Bearer {jwt_token}'}
-                response = self.session.get(url, headers=headers, params=params)
+                response = self.session.get(
+                    url, headers=headers, params=params,
+                    timeout=request_timeout(settings.ACCOUNT_TIMEOUT_SECONDS)
+                )
             else:  # POST
                 jwt_token = self._create_jwt_token(params)
                 headers = {
                     'Authorization': f'Bearer {jwt_token}',
                     'Content-Type': 'application/json'
                 }
-                response = self.session.post(url, headers=headers, json=params)
+                response = self.session.post(
+                    url, headers=headers, json=params,
+                    timeout=request_timeout(settings.ORDER_TIMEOUT_SECONDS)
+                )
             
             if response.status_code == 200 or response.status_code == 201:
                 return response.json()
@@ -63,36 +112,33 @@ class UpbitExchange:
                 logger.error(f"API error: {response.status_code} - {response.text}")
                 return None
                 
+        except requests.RequestException as e:
+            # 주문은 전달됐을 수 있음 - 실패가 아닌 결과 미확인 (identifier로 조회 후 재제출)
+            if raise_unknown:
+                raise OrderOutcomeUnknown(f"upbit {method} {endpoint}: {e}") from e
+            logger.error(f"API call failed: {e}")
+            return None
         except Exception as e:
             logger.error(f"API call failed: {e}")
             return None
     
     def get_ticker(self, symbol: str) -> Optional[Dict]:
-        """Get ticker information with bid/ask from orderbook"""
+        """Get ticker information with bid/ask from orderbook (includes 24h stats)"""
         try:
             # Convert symbol format: XRP/KRW -> KRW-XRP
             base, quote = symbol.split('/')
             market = f"{quote}-{base}"
             
             # Get orderbook for bid/ask prices
-            orderbook_url = f"{self.api_url}/v1/orderbook"
-            orderbook_response = self.session.get(orderbook_url, params={'markets': market})
-            
-            bid_price = None
-            ask_price = None
-            
-            if orderbook_response.status_code == 200:
-                orderbook_data = orderbook_response.json()
-                if orderbook_data and len(orderbook_data) > 0:
-                    orderbook = orderbook_data[0]
-                    if 'orderbook_units' in orderbook and len(orderbook['orderbook_units']) > 0:
-                        # Get best bid and ask
-                        bid_price = float(orderbook['orderbook_units'][0]['bid_price'])
-                        ask_price = float(orderbook['orderbook_units'][0]['ask_price'])
+            quote_data = self.get_best_bid_ask(symbol) or {}
+            bid_price = quote_data.get('bid')
+            ask_price = quote_data.get('ask')
             
             # Get ticker for last price and other info
             ticker_url = f"{self.api_url}/v1/ticker"
-            ticker_response = self.session.get(ticker_url, params={'markets': market})
+            ticker_response = self.hedged_requests.get('/v1/ticker', lambda: self.session.get(
+                ticker_url, params={'markets': market}, timeout=request_timeout(settings.QUOTE_TIMEOUT_SECONDS)
+            ))
             
             if ticker_response.status_code == 200:
                 ticker_data = ticker_response.json()
@@ -112,28 +158,72 @@ class UpbitExchange:
             logger.error(f"Failed to get ticker for {symbol}: {e}")
             return None
     
-    def get_balance(self, currency: str) -> Optional[Dict]:
-        """Get balance for a specific currency"""
+    def get_best_bid_ask(self, symbol: str) -> Optional[Dict]:
+        """Get top-of-book bid/ask (single orderbook request)"""
+        return self.get_best_bid_asks([symbol]).get(symbol)
+    
+    def get_best_bid_asks(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get top-of-book bid/ask for several markets in one orderbook request"""
+        try:
+            # Convert symbol format: XRP/KRW -> KRW-XRP
+            markets = {}
+            for symbol in symbols:
+                base, quote = symbol.split('/')
+                markets[f"{quote}-{base}"] = symbol
+            
+            response = self.hedged_requests.get('/v1/orderbook', lambda: self.session.get(
+                f"{self.api_url}/v1/orderbook", params={'markets': ','.join(markets)},
+                timeout=request_timeout(settings.QUOTE_TIMEOUT_SECONDS)
+            ))
+            if response.status_code != 200:
+                logger.error(f"Orderbook error: {response.status_code} - {response.text}")
+                return {}
+            
+            quotes = {}
+            for orderbook in response.json():
+                symbol = markets.get(orderbook.get('market'))
+                units = orderbook.get('orderbook_units')
+                if symbol and units:
+                    quotes[symbol] = clock_sync.stamp(self.exchange_id, {
+                        'symbol': symbol,
+                        'bid': float(units[0]['bid_price']),
+                        'ask': float(units[0]['ask_price']),
+                        'bid_size': float(units[0].get('bid_size') or 0),
+                        'ask_size': float(units[0].get('ask_size') or 0)
+                    }, orderbook.get('timestamp'))
+            return quotes
+        except Exception as e:
+            logger.error(f"Failed to get orderbook for {symbols}: {e}")
+            return {}
+    
+    def get_balances(self) -> Optional[Dict[str, Dict]]:
+        """Get balances for all currencies in one request"""
         try:
             data = self._api_call('GET', '/v1/accounts')
+            if data is None:
+                return None
             
-            if data:
-                for account in data:
-                    if account['currency'] == currency:
-                        balance = float(account['balance'])
-                        locked = float(account['locked'])
-                        
-                        return {
-                            'free': balance - locked,
-                            'used': locked,
-                            'total': balance
-                        }
-            
-            return {'free': 0, 'used': 0, 'total': 0}
+            balances = {}
+            for account in data:
+                balance = float(account['balance'])
+                locked = float(account['locked'])
+                balances[account['currency']] = {
+                    'free': balance - locked,
+                    'used': locked,
+                    'total': balance
+                }
+            return balances
             
         except Exception as e:
-            logger.error(f"Failed to get balance for {currency}: {e}")
+            logger.error(f"Failed to get balances: {e}")
+            return None
+    
+    def get_balance(self, currency: str) -> Optional[Dict]:
+        """Get balance for a specific currency (None if the lookup failed)"""
+        balances = self.get_balances()
+        if balances is None:
             return None
+        return balances.get(currency, {'free': 0, 'used': 0, 'total': 0})
     
     def create_market_order(self, symbol: str, side: str, amount: float, params: Optional[Dict] = None) -> Optional[Dict]:
         """Create a market order
@@ -168,7 +258,7 @@ class UpbitExchange:
                 
                 logger.info(f"Sell order: {amount} {base}")
             
-            data = self._api_call('POST', '/v1/orders', order_params)
+            data = self._submit_order(order_params)
             
             if data:
                 logger.info(f"Market order placed: {symbol} {side} {amount}")
@@ -186,17 +276,133 @@ class UpbitExchange:
             logger.error(f"Failed to create market order: {e}")
             return None
     
+    def _submit_order(self, order_params: Dict) -> Optional[Dict]:
+        """주문 제출 (identifier = 클라이언트 주문 ID) - 응답이 없으면 identifier로 조회 후 재제출
+
+        업비트는 같은 identifier 주문을 거부하므로 재제출이 중복 주문이 되지 않음
+        """
+        params = dict(order_params, identifier=new_client_order_id(self.exchange_id))
+        return submit_idempotent(
+            f"upbit {params['market']} {params['side']} ({params['identifier']})",
+            lambda: self._api_call('POST', '/v1/orders', params, raise_unknown=True),
+            lambda: self._find_order_by_identifier(params['identifier'])
+        )
+    
+    def _find_order_by_identifier(self, identifier: str) -> Optional[Dict]:
+        """identifier로 주문 조회 - 없으면 None (404 order_not_found)
+
+        그 외 오류(429, 5xx, 전송 오류)는 접수 여부를 알 수 없으므로 예외 - 재제출하지 않음
+        """
+        params = {'identifier': identifier}
+        response = self.session.get(
+            f"{self.api_url}/v1/order",
+            headers={'Authorization': f'Bearer {self._create_jwt_token(params)}'},
+            params=params, timeout=request_timeout(settings.ACCOUNT_TIMEOUT_SECONDS)
+        )
+        if response.status_code == 200:
+            return response.json()
+        if response.status_code == 404:
+            return None
+        raise RuntimeError(f"upbit order lookup failed: {response.status_code} - {response.text}")
+    
+    def find_order_by_client_id(self, symbol: str, client_order_id: str, placed_at: float) -> Optional[Dict]:
+        """identifier로 주문 조회 (filled: 체결 코인 개수) - 접수되지 않았으면 None"""
+        data = self._find_order_by_identifier(client_order_id)
+        if data is None:
+            return None
+        return {
+            'id': data.get('uuid'),
+            'status': data.get('state'),
+            'filled': float(data.get('executed_volume') or 0)
+        }
+    
+    def get_tick_size(self, symbol: str, price: float) -> float:
+        """KRW 마켓 호가 단위"""
+        return tick_from_table(price, self.KRW_TICK_SIZES)
+    
+    def create_limit_ioc_order(self, symbol: str, side: str, quantity: float,
+                               price: float) -> Optional[Dict]:
+        """지정가 IOC 주문 - price보다 불리한 가격으로는 체결되지 않고 잔량은 취소됨"""
+        try:
+            base, quote = symbol.split('/')
+            order_params = {
+                'market': f"{quote}-{base}",
+                'side': 'bid' if side == 'buy' else 'ask',
+                'volume': str(round(quantity, 8)),
+                'price': format_price(price),
+                'ord_type': 'limit',
+                'time_in_force': 'ioc'
+            }
+            data = self._submit_order(order_params)
+            if not data:
+                return None
+            
+            order_id = data.get('uuid')
+            # 주문 응답은 접수 시점 상태 - 체결/취소가 끝난 최종 상태 조회
+            for _ in range(self.IOC_STATUS_RETRIES):
+                if data.get('state') in ('done', 'cancel'):
+                    break
+                time.sleep(self.IOC_STATUS_INTERVAL)
+                data = self._api_call('GET', '/v1/order', {'uuid': order_id}) or data
+            
+            filled = float(data.get('executed_volume') or 0)
+            logger.info(f"Limit IOC order: {symbol} {side} {quantity} @ {price} → filled {filled}")
+            return {
+                'id': order_id,
+                'symbol': symbol,
+                'side': side,
+                'amount': quantity,
+                'price': price,
+                'status': data.get('state'),
+                'filled': filled,
+                'remaining': max(quantity - filled, 0.0)
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to create limit IOC order: {e}")
+            return None
+    
     def get_markets(self) -> Dict:
-        """Get all markets - Not needed for spot trading"""
-        # Upbit은 현물 거래소이므로 계약 크기 정보 불필요
+        """Get all markets (레지스트리가 없으면 빈 dict)"""
+        if self.market_registry is not None:
+            return self.market_registry.get_markets(self.exchange_id)
         return {}
     
-    def get_usdt_krw_price(self) -> Optional[float]:
-        """Get USDT/KRW price (ask price for buying)"""
-        ticker = self.get_ticker('USDT/KRW')
-        return ticker['ask'] if ticker else None
+    def fetch_markets(self) -> Dict:
+        """전체 KRW 마켓 목록 다운로드 (/v1/market/all)"""
+        response = self.session.get(
+            f"{self.api_url}/v1/market/all", params={'isDetails': 'false'},
+            timeout=request_timeout(settings.ACCOUNT_TIMEOUT_SECONDS)
+        )
+        response.raise_for_status()
+        
+        markets = {}
+        for item in response.json():
+            quote, base = item['market'].split('-', 1)
+            if quote != 'KRW':
+                continue
+            markets[f"{base}/{quote}"] = {
+                'market': item['market'],
+                'base': base,
+                'quote': quote,
+                'min_order_krw': self.DEFAULT_MIN_ORDER_KRW
+            }
+        return markets
     
-    @property
-    def exchange(self):
-        """Compatibility property"""
-        return self
\ No newline at end of file
+    def fetch_order_limits(self, symbol: str) -> Optional[Dict]:
+        """심볼별 주문 제한 조회 (/v1/orders/chance)"""
+        base, quote = symbol.split('/')
+        data = self._api_call('GET', '/v1/orders/chance', {'market': f"{quote}-{base}"})
+        if not data or 'market' not in data:
+            return None
+        
+        market = data['market']
+        bid = market.get('bid') or {}
+        ask = market.get('ask') or {}
+        return {
+            'min_order_krw': float(bid.get('min_total') or self.DEFAULT_MIN_ORDER_KRW),
+            'min_sell_krw': float(ask.get('min_total') or self.DEFAULT_MIN_ORDER_KRW),
+            'max_order_krw': float(market.get('max_total') or 0),
+            'bid_fee': float(data.get('bid_fee') or 0),
+            'ask_fee': float(data.get('ask_fee') or 0)
+        }
@@ -1,5 +1,8 @@
 """관리자 모듈"""
 from .position_manager import PositionManager
 from .timer_manager import TimerManager
+from .residual_ledger import ResidualLedger
+from .order_journal import OrderJournal
+from .state_store import StateStore
 
-__all__ = ['PositionManager', 'TimerManager']
\ No newline at end of file
+__all__ = ['PositionManager', 'TimerManager', 'ResidualLedger', 'OrderJournal', 'StateStore']
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+주문 선기록 저널 - 주문 의도/결과를 추가 전용 파일에 먼저 기록해 프로세스가 죽어도 복구
+
+- 의도(intent): 주문을 보내기 전에 디스크에 기록 (fsync 완료까지 대기)
+- 결과(legs) / 완료(done): 대기 없이 추가 (다음 fsync에 함께 기록)
+- 그룹 커밋: 기록 스레드가 fsync 하는 동안 들어온 기록은 다음 fsync 한 번에 모아서 기록
+- 시작 시 완료 기록이 없는 의도를 찾아 심볼별 확인(reconcile) 대상으로 넘김 - 의도에 기록한
+  클라이언트 주문 ID로 거래소에서 주문 결과를 조회하고, 조회할 수 없으면 실제 잔고/포지션으로 확인
+"""
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class OrderJournal:
+    """주문 의도/결과 선기록 (JSON Lines, 스레드 안전)"""
+
+    def __init__(self, journal_file: Optional[str] = None):
+        self.journal_file = settings.ORDER_JOURNAL_FILE if journal_file is None else journal_file
+        self._cond = threading.Condition()
+        self._pending: List[str] = []  # 아직 파일에 쓰지 않은 기록
+        self._last_seq = 0
+        self._durable_seq = 0  # fsync 완료된 마지막 기록 번호
+        self._closed = False
+        self._file = None
+        self._writer: Optional[threading.Thread] = None
+        # 완료되지 않은 의도 (intent id -> 의도 기록)
+        self.open_intents: Dict[int, Dict] = {}
+
+        if self.journal_file:
+            self._recover()
+            self._file = open(self.journal_file, 'a', encoding='utf-8')
+            self._writer = threading.Thread(target=self._write_loop, name='order-journal', daemon=True)
+            self._writer.start()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.journal_file)
+
+    # ---------- 기록 ----------
+
+    def begin(self, symbol: str, operation: str, **details) -> int:
+        """주문 의도 기록 - 디스크에 기록된 뒤 반환 (이후 주문 전송)
+
+        Returns:
+            intent id (결과/완료 기록에 사용)
+        """
+        # 기록 시각은 재시작 후 주문 조회 가능 기간 확인에도 사용
+        record = dict(details, event='intent', symbol=symbol, operation=operation, time=time.time())
+        intent_id = self._append(record)
+        with self._cond:
+            self.open_intents[intent_id] = record
+        self._wait_durable(intent_id)
+        return intent_id
+
+    def record(self, intent_id: int, **outcome) -> None:
+        """주문 결과 기록 (대기 없음)"""
+        self._append(dict(outcome, event='legs', intent=intent_id))
+
+    def complete(self, intent_id: int) -> None:
+        """의도 완료 - 양쪽 결과가 확정되고 부분 체결 처리까지 끝남 (대기 없음)"""
+        with self._cond:
+            if self.open_intents.pop(intent_id, None) is None:
+                return
+        self._append({'event': 'done', 'intent': intent_id})
+
+    def intents_for(self, symbol: str) -> Dict[int, Dict]:
+        """심볼의 미완료 의도 (intent id -> 의도 기록)"""
+        with self._cond:
+            return {intent_id: record for intent_id, record in self.open_intents.items() if record['symbol'] == symbol}
+
+    def resolve_symbol(self, symbol: str) -> None:
+        """심볼의 미완료 의도를 모두 완료 처리 (주문 조회 또는 실제 잔고/포지션으로 확인 후)"""
+        for intent_id in self.intents_for(symbol):
+            self.complete(intent_id)
+
+    def incomplete_symbols(self) -> List[str]:
+        """완료되지 않은 의도가 남은 심볼"""
+        with self._cond:
+            return sorted({record['symbol'] for record in self.open_intents.values()})
+
+    def close(self) -> None:
+        """남은 기록을 쓰고 종료"""
+        if self._writer is None:
+            return
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        self._file.close()
+        self._writer = None
+
+    def _append(self, record: Dict) -> int:
+        with self._cond:
+            self._last_seq += 1
+            seq = self._last_seq
+            if self.enabled:
+                record = dict({'time': time.time()}, **record, seq=seq)
+                self._pending.append(json.dumps(record, ensure_ascii=False) + '\n')
+                self._cond.notify_all()
+            return seq
+
+    def _wait_durable(self, seq: int) -> None:
+        if not self.enabled:
+            return
+        with self._cond:
+            while self._durable_seq < seq and self._writer is not None:
+                self._cond.wait()
+
+    # ---------- 기록 스레드 (그룹 커밋) ----------
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+                batch_seq = self._last_seq
+            try:
+                self._file.write(''.join(batch))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                # 기록 실패로 주문이 멈추지 않도록 대기는 풀어줌 (복구 정보는 잃을 수 있음)
+                logger.critical(f"주문 저널 기록 실패: {e}")
+            with self._cond:
+                self._durable_seq = batch_seq
+                self._cond.notify_all()
+
+    # ---------- 복구 ----------
+
+    def _recover(self) -> None:
+        """저널을 읽어 미완료 의도를 찾고 파일을 미완료 기록만 남기도록 압축"""
+        records = []
+        try:
+            with open(self.journal_file, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # 쓰는 도중 죽어 잘린 마지막 줄
+                        logger.warning(f"주문 저널 손상된 기록 무시: {line[:80]!r}")
+        except FileNotFoundError:
+            return
+
+        for record in records:
+            self._last_seq = max(self._last_seq, record.get('seq', 0))
+            if record.get('event') == 'intent':
+                self.open_intents[record['seq']] = record
+            elif record.get('event') == 'done':
+                self.open_intents.pop(record.get('intent'), None)
+
+        kept = [
+            record for record in records
+            if record.get('seq') in self.open_intents or record.get('intent') in self.open_intents
+        ]
+        tmp_file = f"{self.journal_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + '\n' for record in kept)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.journal_file)
+
+        for record in self.open_intents.values():
+            logger.critical(
+                f"{record['symbol']} 완료되지 않은 주문 발견 ({record['operation']}, "
+                f"seq {record['seq']}) - 실제 잔고/포지션 확인 전까지 새 주문 보류"
+            )
@@ -2,8 +2,10 @@
 포지션 관리 모듈
 """
 import logging
-from typing import Dict
-from dataclasses import dataclass
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+
+from src.managers.state_store import StateStore
 
 logger = logging.getLogger(__name__)
 
@@ -13,18 +15,22 @@ class Position:
     """포지션 정보를 담는 클래스"""
     symbol: str
     value_usd: float = 0.0
-    spot_amount: float = 0.0
+    spot_amount: float = 0.0  # 계좌 스냅샷의 현물 매도 가능 수량 (잔고 확인 시 갱신)
     futures_contracts: int = 0
     entry_price: float = 0.0
     long_value: float = 0.0  # 롱 포지션 가치 (현물)
     short_value: float = 0.0  # 숏 포지션 가치 (선물)
+    spot_venues: Dict[str, float] = field(default_factory=dict)  # 한국 거래소별 현물 보유량 (여러 곳 사용 시)
 
 
 class PositionManager:
     """포지션을 관리하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, state_store: Optional[StateStore] = None):
         self.positions: Dict[str, Position] = {}
+        # 포지션 가치는 바뀔 때마다 저장, 이전 실행 값은 심볼 등록 시 사용
+        self.state_store = state_store or StateStore('')
+        self.restored_values: Dict[str, float] = self.state_store.load_positions()
     
     def get_position(self, symbol: str) -> Position:
         """심볼의 포지션 조회 (없으면 새로 생성)"""
@@ -36,8 +42,34 @@ class PositionManager:
         """포지션 값 업데이트"""
         position = self.get_position(symbol)
         position.value_usd += value_change
+        self.state_store.save_position(symbol, position.value_usd)
         logger.info(f"{symbol} 포지션 업데이트: ${position.value_usd:.2f}")
     
+    def set_value(self, symbol: str, value_usd: float) -> None:
+        """포지션 가치 설정 (실제 잔고/포지션 확인 결과)"""
+        self.get_position(symbol).value_usd = value_usd
+        self.state_store.save_position(symbol, value_usd)
+    
+    def set_spot_venue_amount(self, symbol: str, venue_id: str, amount: float) -> None:
+        """한국 거래소별 현물 보유량 기록 (주문 라우팅 후 호출)"""
+        position = self.get_position(symbol)
+        if amount > 0:
+            position.spot_venues[venue_id] = amount
+        else:
+            position.spot_venues.pop(venue_id, None)
+    
+    def sync_spot_venues(self, symbols: List[str], venue_balances: Dict[str, Dict[str, Dict]]) -> None:
+        """거래소별 전체 잔고로 심볼별 현물 보유량 초기화 ({거래소: {통화: 잔고}})"""
+        for symbol in symbols:
+            for venue_id, balances in venue_balances.items():
+                amount = balances.get(symbol, {}).get('total', 0)
+                self.set_spot_venue_amount(symbol, venue_id, amount)
+            venues = self.get_position(symbol).spot_venues
+            if venues:
+                logger.info(
+                    f"{symbol} 거래소별 현물: " + ', '.join(f"{v} {a:.8g}" for v, a in venues.items())
+                )
+    
     def get_existing_positions(self, symbol: str, korean_exchange, futures_exchange) -> float:
         """기존 헤징 포지션 조회 - 현물과 선물 모두 확인하여 균형 검증"""
         try:
@@ -46,11 +78,11 @@ class PositionManager:
             balance = korean_exchange.get_balance(symbol)
             
             if balance and balance.get('total', 0) > 0:
-                korean_ticker = korean_exchange.get_ticker(f"{symbol}/KRW")
+                korean_ticker = korean_exchange.get_best_bid_ask(f"{symbol}/KRW")
                 if korean_ticker and 'bid' in korean_ticker:  # bid 사용 (매도 시 가격)
                     krw_value = balance['total'] * korean_ticker['bid']
                     
-                    usdt_krw_ticker = korean_exchange.get_ticker('USDT/KRW')
+                    usdt_krw_ticker = korean_exchange.get_best_bid_ask('USDT/KRW')
                     if usdt_krw_ticker and 'ask' in usdt_krw_ticker:  # ask 사용 (KRW->USD)
                         spot_value_usd = krw_value / usdt_krw_ticker['ask']
                         logger.info(f"현물 {symbol} 포지션: ${spot_value_usd:.2f}")
@@ -59,6 +91,8 @@ class PositionManager:
             futures_value_usd = 0.0
             try:
                 positions = futures_exchange.get_positions()
+                if positions is None:
+                    raise RuntimeError("포지션 목록 없음")
                 futures_symbol = f"{symbol}/USDT:USDT"
                 
                 for pos in positions:
@@ -70,29 +104,98 @@ class PositionManager:
                 logger.warning(f"선물 포지션 조회 실패: {e}")
             
             # 3. 포지션 균형 검증
-            if spot_value_usd > 0 or futures_value_usd > 0:
-                gap = abs(spot_value_usd - futures_value_usd)
-                
-                if gap > 10.0:  # $10 이상 차이
-                    logger.warning(
-                        f"⚠️ {symbol} 헤지 불균형 감지!\n"
-                        f"  현물: ${spot_value_usd:.2f}\n"
-                        f"  선물: ${futures_value_usd:.2f}\n"
-                        f"  갭: ${gap:.2f}\n"
-                        f"  → 리밸런싱 필요!"
-                    )
-                    
-                    # 더 작은 값 반환 (안전한 쪽 선택)
-                    return min(spot_value_usd, futures_value_usd)
-                else:
-                    logger.info(f"✅ {symbol} 헤지 균형 양호 (갭: ${gap:.2f})")
-                    return (spot_value_usd + futures_value_usd) / 2  # 평균값 반환
+            return self._reconcile_existing(symbol, spot_value_usd, futures_value_usd)
             
+        except Exception as e:
+            logger.error(f"{symbol} 기존 포지션 조회 실패: {e}")
             return 0.0
+    
+    def get_existing_positions_bulk(
+        self, symbols: List[str], korean_exchange, futures_exchange
+    ) -> Dict[str, float]:
+        """
+        여러 심볼의 기존 헤징 포지션을 한 번에 조회
+        
+        전체 잔고 1회 + 전체 선물 포지션 1회 조회 후, 잔고가 있는 심볼만 호가 일괄 조회
+        
+        Returns:
+            심볼별 포지션 가치 (USD)
+        """
+        result = {symbol: 0.0 for symbol in symbols}
+        try:
+            balances = korean_exchange.get_balances() or {}
+            
+            futures_values: Dict[str, float] = {}
+            try:
+                positions = futures_exchange.get_positions()
+                if positions is None:
+                    raise RuntimeError("포지션 목록 없음")
+                for pos in positions:
+                    if pos.get('side') == 'short':
+                        futures_values[pos.get('symbol')] = abs(pos.get('notional', 0))
+            except Exception as e:
+                logger.warning(f"선물 포지션 조회 실패: {e}")
+            
+            held = [
+                symbol for symbol in symbols
+                if balances.get(symbol, {}).get('total', 0) > 0
+                or futures_values.get(f"{symbol}/USDT:USDT", 0) > 0
+            ]
+            if not held:
+                return result
+            
+            # USDT/KRW 환율과 현물 보유 심볼 호가를 한 번에 조회 (환율은 ask 사용: KRW->USD)
+            spot_symbols = [
+                f"{symbol}/KRW" for symbol in held
+                if balances.get(symbol, {}).get('total', 0) > 0
+            ]
+            quotes = korean_exchange.get_best_bid_asks(['USDT/KRW'] + spot_symbols) or {}
+            usdt_krw_ticker = quotes.get('USDT/KRW')
+            usdt_krw_ask = usdt_krw_ticker.get('ask') if usdt_krw_ticker else None
+            
+            for symbol in held:
+                self.get_position(symbol).spot_amount = balances.get(symbol, {}).get('free', 0)
+                spot_value_usd = 0.0
+                total = balances.get(symbol, {}).get('total', 0)
+                if total > 0 and usdt_krw_ask:
+                    korean_ticker = quotes.get(f"{symbol}/KRW")
+                    if korean_ticker and korean_ticker.get('bid'):  # bid 사용 (매도 시 가격)
+                        spot_value_usd = total * korean_ticker['bid'] / usdt_krw_ask
+                        logger.info(f"현물 {symbol} 포지션: ${spot_value_usd:.2f}")
+                
+                futures_value_usd = futures_values.get(f"{symbol}/USDT:USDT", 0.0)
+                if futures_value_usd:
+                    logger.info(f"선물 {symbol} 숏 포지션: ${futures_value_usd:.2f}")
+                
+                result[symbol] = self._reconcile_existing(symbol, spot_value_usd, futures_value_usd)
+            
+            return result
             
         except Exception as e:
-            logger.error(f"{symbol} 기존 포지션 조회 실패: {e}")
+            logger.error(f"기존 포지션 일괄 조회 실패: {e}")
+            return result
+    
+    def _reconcile_existing(self, symbol: str, spot_value_usd: float, futures_value_usd: float) -> float:
+        """현물/선물 가치로 기존 헤지 포지션 가치 결정"""
+        if spot_value_usd <= 0 and futures_value_usd <= 0:
             return 0.0
+        
+        gap = abs(spot_value_usd - futures_value_usd)
+        
+        if gap > 10.0:  # $10 이상 차이
+            logger.warning(
+                f"⚠️ {symbol} 헤지 불균형 감지!\n"
+                f"  현물: ${spot_value_usd:.2f}\n"
+                f"  선물: ${futures_value_usd:.2f}\n"
+                f"  갭: ${gap:.2f}\n"
+                f"  → 리밸런싱 필요!"
+            )
+            
+            # 더 작은 값 반환 (안전한 쪽 선택)
+            return min(spot_value_usd, futures_value_usd)
+        
+        logger.info(f"✅ {symbol} 헤지 균형 양호 (갭: ${gap:.2f})")
+        return (spot_value_usd + futures_value_usd) / 2  # 평균값 반환
     
     def should_build_position(self, symbol: str, premium: float, max_position_usd: float) -> bool:
         """포지션을 구축해야 하는지 판단"""
@@ -109,6 +212,8 @@ class PositionManager:
     
     def remove_position(self, symbol: str) -> None:
         """포지션 제거"""
+        self.restored_values.pop(symbol, None)
+        self.state_store.delete_position(symbol)
         if symbol in self.positions:
             del self.positions[symbol]
             logger.info(f"{symbol} 포지션 제거됨")
\ No newline at end of file
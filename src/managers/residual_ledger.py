@@ -0,0 +1,81 @@
+"""
+잔여 갭 장부 - 최소 주문 단위 미만의 헤지 갭을 이월하여 다음 주문에서 상쇄
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResidualGap:
+    """심볼별 잔여 갭"""
+    symbol: str
+    quantity: float = 0.0  # 현물 - 선물 코인 개수 (양수: 현물 초과, 음수: 선물 초과)
+    price_usd: float = 0.0  # 갭 평가 기준 가격 (USD)
+    updated_at: Optional[datetime] = None
+
+    @property
+    def value_usd(self) -> float:
+        """갭의 USD 가치 (절대값)"""
+        return abs(self.quantity) * self.price_usd
+
+
+class ResidualLedger:
+    """심볼별 잔여 헤지 갭을 관리하는 클래스"""
+
+    def __init__(self, threshold_usd: Optional[float] = None):
+        self.threshold_usd = (
+            settings.REBALANCE_THRESHOLD_USD if threshold_usd is None else threshold_usd
+        )
+        self.gaps: Dict[str, ResidualGap] = {}
+
+    def get_gap(self, symbol: str) -> float:
+        """이월된 갭 수량 (현물 - 선물)"""
+        gap = self.gaps.get(symbol)
+        return gap.quantity if gap else 0.0
+
+    def gap_usd(self, symbol: str) -> float:
+        """이월된 갭의 USD 가치"""
+        gap = self.gaps.get(symbol)
+        return gap.value_usd if gap else 0.0
+
+    def record(self, symbol: str, quantity_gap: float, price_usd: float) -> None:
+        """실제 측정된 갭으로 장부 갱신"""
+        self.gaps[symbol] = ResidualGap(
+            symbol=symbol,
+            quantity=quantity_gap,
+            price_usd=price_usd,
+            updated_at=datetime.now()
+        )
+        logger.debug(f"{symbol} 잔여 갭 기록: {quantity_gap:+.8f}개 (${abs(quantity_gap) * price_usd:.2f})")
+
+    def add(self, symbol: str, quantity_delta: float, price_usd: Optional[float] = None) -> None:
+        """주문 결과로 생긴 예상 갭 누적"""
+        gap = self.gaps.get(symbol)
+        if gap is None:
+            gap = self.gaps[symbol] = ResidualGap(symbol=symbol)
+
+        gap.quantity += quantity_delta
+        if price_usd:
+            gap.price_usd = price_usd
+        gap.updated_at = datetime.now()
+
+    def needs_correction(self, symbol: str) -> bool:
+        """누적 갭이 리밸런싱 임계값을 넘었는지 확인"""
+        return self.gap_usd(symbol) > self.threshold_usd
+
+    def clear(self, symbol: str) -> None:
+        """갭 초기화 (보정 주문 완료 후)"""
+        if symbol in self.gaps:
+            self.gaps[symbol].quantity = 0.0
+            self.gaps[symbol].updated_at = datetime.now()
+
+    def remove_symbol(self, symbol: str) -> None:
+        """심볼 제거"""
+        if symbol in self.gaps:
+            del self.gaps[symbol]
@@ -0,0 +1,107 @@
+"""
+봇 상태 저장소 - 포지션 가치, 이익 실현 타이머, 실패 횟수를 SQLite(WAL)에 보관해 재시작 시 복원
+
+- 값이 바뀔 때마다 해당 행만 기록 (WAL + synchronous=NORMAL: 커밋마다 fsync 없음)
+- 시작 시 테이블별 한 번의 조회로 일괄 로드
+"""
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    symbol TEXT PRIMARY KEY,
+    value_usd REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stage_timers (
+    symbol TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    started_at REAL,
+    PRIMARY KEY (symbol, level)
+);
+CREATE TABLE IF NOT EXISTS failed_attempts (
+    symbol TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+"""
+
+
+class StateStore:
+    """심볼별 봇 상태 저장소 (스레드 안전, 파일이 없으면 메모리에만 유지)"""
+
+    def __init__(self, db_file: Optional[str] = None):
+        self.db_file = settings.STATE_DB_FILE if db_file is None else db_file
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_file or ':memory:', check_same_thread=False, isolation_level=None)
+        if self.db_file:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    def _execute(self, sql: str, params: tuple = ()) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(sql, params)
+        except sqlite3.Error as e:
+            # 상태 저장 실패로 거래가 멈추지 않도록 기록만 (재시작 시 실시간 조회로 대체)
+            logger.error(f"상태 저장 실패: {e}")
+
+    def _query(self, sql: str) -> list:
+        with self._lock:
+            return self._conn.execute(sql).fetchall()
+
+    # ---------- 포지션 ----------
+
+    def save_position(self, symbol: str, value_usd: float) -> None:
+        self._execute(
+            'INSERT OR REPLACE INTO positions (symbol, value_usd, updated_at) VALUES (?, ?, ?)',
+            (symbol, value_usd, time.time())
+        )
+
+    def delete_position(self, symbol: str) -> None:
+        self._execute('DELETE FROM positions WHERE symbol = ?', (symbol,))
+
+    def load_positions(self) -> Dict[str, float]:
+        """심볼별 포지션 가치 (USD)"""
+        return {symbol: value_usd for symbol, value_usd in self._query('SELECT symbol, value_usd FROM positions')}
+
+    # ---------- 이익 실현 타이머 ----------
+
+    def save_timer(self, symbol: str, level: int, started_at: Optional[datetime]) -> None:
+        self._execute(
+            'INSERT OR REPLACE INTO stage_timers (symbol, level, started_at) VALUES (?, ?, ?)',
+            (symbol, level, started_at.timestamp() if started_at else None)
+        )
+
+    def delete_timers(self, symbol: str) -> None:
+        self._execute('DELETE FROM stage_timers WHERE symbol = ?', (symbol,))
+
+    def load_timers(self) -> Dict[str, Dict[int, Optional[datetime]]]:
+        """심볼별 {목표 프리미엄: 타이머 시작 시각}"""
+        timers: Dict[str, Dict[int, Optional[datetime]]] = {}
+        for symbol, level, started_at in self._query('SELECT symbol, level, started_at FROM stage_timers'):
+            timers.setdefault(symbol, {})[level] = datetime.fromtimestamp(started_at) if started_at else None
+        return timers
+
+    # ---------- 실패 횟수 ----------
+
+    def save_failures(self, symbol: str, count: int) -> None:
+        self._execute('INSERT OR REPLACE INTO failed_attempts (symbol, count) VALUES (?, ?)', (symbol, count))
+
+    def delete_failures(self, symbol: str) -> None:
+        self._execute('DELETE FROM failed_attempts WHERE symbol = ?', (symbol,))
+
+    def load_failures(self) -> Dict[str, int]:
+        return dict(self._query('SELECT symbol, count FROM failed_attempts'))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 
 from src.config import settings
+from src.managers.state_store import StateStore
 
 logger = logging.getLogger(__name__)
 
@@ -10,19 +11,26 @@ logger = logging.getLogger(__name__)
 class TimerManager:
     """이익 실현 타이머를 관리하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, state_store: Optional[StateStore] = None):
         self.timer_duration = timedelta(minutes=settings.STAGE_TIMER_MINUTES)
         self.stage_timers: Dict[str, Dict[int, Optional[datetime]]] = {}
+        # 타이머는 바뀔 때마다 저장, 이전 실행의 쿨다운은 심볼 초기화 시 복원
+        self.state_store = state_store or StateStore('')
+        self._restored = self.state_store.load_timers()
     
     def initialize_symbol(self, symbol: str) -> None:
-        """심볼별 타이머 초기화"""
+        """심볼별 타이머 초기화 (저장된 쿨다운이 있으면 복원)"""
         if symbol not in self.stage_timers:
+            restored = self._restored.pop(symbol, {})
             # settings.PROFIT_STAGES에서 동적으로 타이머 레벨 생성
             self.stage_timers[symbol] = {}
             for target_premium, _ in settings.PROFIT_STAGES:
                 if target_premium < 100:  # 100% 이상은 즉시 실행이므로 타이머 불필요
-                    self.stage_timers[symbol][target_premium] = None
-            logger.info(f"{symbol} 타이머 초기화됨")
+                    self.stage_timers[symbol][target_premium] = restored.get(target_premium)
+            if any(restored.values()):
+                logger.info(f"{symbol} 타이머 복원됨: {self.get_timer_status(symbol)}")
+            else:
+                logger.info(f"{symbol} 타이머 초기화됨")
     
     def check_profit_taking(
         self, symbol: str, premium: float, profit_stages: list
@@ -82,18 +90,28 @@ class TimerManager:
         """타이머 설정"""
         if symbol in self.stage_timers:
             self.stage_timers[symbol][premium_level] = datetime.now()
+            self.state_store.save_timer(symbol, premium_level, self.stage_timers[symbol][premium_level])
+    
+    def restore_timer(self, symbol: str, premium_level: int, started_at: Optional[datetime]) -> None:
+        """타이머를 이전 값으로 되돌림 (이익 실현 실패 시)"""
+        if symbol in self.stage_timers:
+            self.stage_timers[symbol][premium_level] = started_at
+            self.state_store.save_timer(symbol, premium_level, started_at)
     
     def reset_timer(self, symbol: str, premium_level: int) -> None:
         """타이머 리셋"""
         if symbol in self.stage_timers:
             old_timer = self.stage_timers[symbol].get(premium_level)
             self.stage_timers[symbol][premium_level] = None
+            self.state_store.save_timer(symbol, premium_level, None)
             logger.info(f"{symbol} {premium_level}% 타이머 리셋됨")
             return old_timer
         return None
     
     def remove_symbol(self, symbol: str) -> None:
         """심볼 제거"""
+        self._restored.pop(symbol, None)
+        self.state_store.delete_timers(symbol)
         if symbol in self.stage_timers:
             del self.stage_timers[symbol]
             logger.info(f"{symbol} 타이머 제거됨")
@@ -1,4 +1,5 @@
 """유틸리티 모듈"""
 from .logger import setup_logging
+from .startup_profiler import StartupProfiler
 
-__all__ = ['setup_logging']
\ No newline at end of file
+__all__ = ['setup_logging', 'StartupProfiler']
\ No newline at end of file
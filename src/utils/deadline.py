@@ -0,0 +1,124 @@
+"""
+요청 데드라인 유틸리티 - 사이클/주문 단위 제한 시간을 모든 거래소 HTTP 호출까지 전달
+"""
+import contextvars
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# 스레드 결과 대기 시 데드라인 뒤에 더 기다리는 여유 (HTTP 타임아웃 예외가 올라올 시간)
+RESULT_GRACE_SECONDS = 1.0
+
+_current: contextvars.ContextVar[Optional['Deadline']] = contextvars.ContextVar('deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """데드라인이 지나 요청을 보내지 않음"""
+
+
+class Deadline:
+    """제한 시각과 그 안에서 결과를 알 수 없게 된 주문 요청 목록
+
+    주문 제출 요청이 응답 대기 중 시간 초과되면 거래소에 주문이 들어갔는지 알 수 없음 -
+    unknown_orders에 남겨 호출 측이 실제 잔고/포지션으로 확인(reconcile)하도록 함
+    """
+
+    def __init__(self, seconds: float, parent: Optional['Deadline'] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.expires_at = clock() + seconds
+        if parent is not None:
+            self.expires_at = min(self.expires_at, parent.expires_at)
+        self.parent = parent
+        self.unknown_orders: List[str] = []
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 지났으면 0)"""
+        return max(0.0, self.expires_at - self.clock())
+
+    def timeout(self, budget: float) -> float:
+        """요청 제한 시간 - 엔드포인트 예산과 남은 시간 중 작은 값 (이미 지났으면 DeadlineExceeded)"""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("deadline exceeded before request")
+        return min(budget, remaining)
+
+    def result_timeout(self) -> float:
+        """스레드 결과 대기 시간 (남은 시간 + 여유)"""
+        return self.remaining() + RESULT_GRACE_SECONDS
+
+    def mark_unknown(self, description: str) -> None:
+        """결과 미확인 주문 기록 (상위 데드라인에도 전달)"""
+        with self._lock:
+            self.unknown_orders.append(description)
+        if self.parent is not None:
+            self.parent.mark_unknown(description)
+
+    @property
+    def outcome_unknown(self) -> bool:
+        """결과 미확인 주문 존재 여부"""
+        return bool(self.unknown_orders)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 스레드의 데드라인 (없으면 None)"""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[Deadline]:
+    """with 블록 안의 요청에 제한 시간 적용 (바깥 데드라인보다 늦어지지 않음)"""
+    deadline = Deadline(seconds, parent=_current.get())
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def use_deadline(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """with 블록 안에서 다른 스레드의 데드라인 사용 (None이면 데드라인 없음)
+
+    다른 스레드가 맡긴 작업을 대신 처리할 때 시간 제한/결과 미확인 기록을 맡긴 쪽에 적용
+    """
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def bind(func: Callable[..., T]) -> Callable[..., T]:
+    """현재 데드라인(과 지정된 클라이언트 주문 ID 등 컨텍스트 변수)을 다른 스레드에서도 쓰도록
+    함수에 묶음 (스레드 풀 submit/map용)"""
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # 같은 함수를 여러 스레드에서 동시에 실행할 수 있도록 호출마다 복사본에서 실행
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper
+
+
+def request_timeout(budget: float) -> float:
+    """엔드포인트 예산에 현재 데드라인 적용"""
+    deadline = _current.get()
+    return budget if deadline is None else deadline.timeout(budget)
+
+
+def mark_unknown(description: str) -> None:
+    """현재 데드라인에 결과 미확인 주문 기록"""
+    logger.error(f"주문 결과 미확인 (응답 시간 초과): {description}")
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.mark_unknown(description)
+
@@ -0,0 +1,147 @@
+"""
+헤지 요청 유틸리티 - 멱등 공개 시세 GET의 꼬리 지연 단축
+
+1차 요청이 엔드포인트의 최근 p90 지연 안에 응답하지 않으면 같은 요청을 1건 더 보내고
+먼저 도착한 응답을 사용. 주문/계정 요청에는 절대 사용하지 않음 (복제 요청 = 중복 주문)
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, TypeVar
+
+from src.config import settings
+from src.utils.deadline import bind
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# 엔드포인트별 지연 표본 수 / p90 계산에 필요한 최소 표본 수
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+# 헤지 통계 로그 주기 (요청 수)
+REPORT_EVERY = 1000
+
+
+@dataclass
+class HedgeStats:
+    """엔드포인트별 헤지 통계"""
+    requests: int = 0
+    hedged: int = 0  # 복제 요청을 보낸 횟수
+    hedge_wins: int = 0  # 복제 요청 응답이 먼저 도착한 횟수
+    budget_skips: int = 0  # p90을 넘겼지만 예산 초과로 복제하지 않은 횟수
+
+    @property
+    def win_rate(self) -> float:
+        """복제 요청 승률"""
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class HedgedRequester:
+    """거래소별 헤지 GET 실행기
+
+    settings.HEDGED_REQUESTS_ENABLED가 꺼져 있으면 요청을 그대로 실행 (스레드 없음).
+    복제 요청은 전체 요청의 HEDGED_REQUEST_MAX_RATIO 이하로 제한
+    """
+
+    def __init__(self, name: str, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.clock = clock
+        self.stats: Dict[str, HedgeStats] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._requests = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """요청 스레드 풀 (처음 헤지 요청 시 생성)"""
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=settings.HEDGED_REQUEST_MAX_WORKERS,
+                        thread_name_prefix=f"hedged-{self.name}"
+                    )
+        return self._pool
+
+    def get(self, endpoint: str, send: Callable[[], T]) -> T:
+        """send() 실행 - 엔드포인트 p90 안에 응답이 없으면 1회 복제, 먼저 성공한 응답 반환
+
+        둘 다 실패하면 1차 요청의 예외를 그대로 올림
+        """
+        if not settings.HEDGED_REQUESTS_ENABLED:
+            return send()
+
+        with self._lock:
+            stats = self.stats.setdefault(endpoint, HedgeStats())
+            stats.requests += 1
+            self._requests += 1
+            report = self._requests % REPORT_EVERY == 0
+        if report:
+            self.report()
+
+        send = bind(send)  # 호출 스레드의 데드라인을 요청 스레드로 전달
+        primary = self.pool.submit(self._timed, endpoint, send)
+        delay = self.hedge_delay(endpoint)
+        if delay is None or wait([primary], timeout=delay).done:
+            return primary.result()
+
+        if not self._take_budget(stats):
+            return primary.result()
+        hedge = self.pool.submit(self._timed, endpoint, send)
+        return self._first_success(stats, primary, hedge)
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """복제 요청까지 대기 시간 - 최근 지연 p90 (표본이 부족하면 None: 복제 안 함)"""
+        with self._lock:
+            samples = sorted(self._latencies.get(endpoint, ()))
+        if len(samples) < MIN_LATENCY_SAMPLES:
+            return None
+        return samples[int(0.9 * (len(samples) - 1))]
+
+    def _take_budget(self, stats: HedgeStats) -> bool:
+        """복제 예산 확인 (전체 요청 대비 비율 상한)"""
+        with self._lock:
+            if self._hedges + 1 > self._requests * settings.HEDGED_REQUEST_MAX_RATIO:
+                stats.budget_skips += 1
+                return False
+            self._hedges += 1
+            stats.hedged += 1
+            return True
+
+    def _timed(self, endpoint: str, send: Callable[[], T]) -> T:
+        """요청 실행 후 성공한 응답의 지연 기록"""
+        started = self.clock()
+        result = send()
+        elapsed = self.clock() - started
+        with self._lock:
+            self._latencies.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW)).append(elapsed)
+        return result
+
+    def _first_success(self, stats: HedgeStats, primary: Future, hedge: Future):
+        """먼저 성공한 응답 반환 (늦은 쪽은 HTTP 타임아웃까지 백그라운드에서 끝남)"""
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            stats.hedge_wins += 1
+                    return future.result()
+        return primary.result()
+
+    def report(self) -> None:
+        """엔드포인트별 헤지 통계 로그 출력"""
+        with self._lock:
+            lines = [
+                f"  {endpoint}: 요청 {s.requests}, 복제 {s.hedged}, 복제 승 {s.hedge_wins} "
+                f"({s.win_rate:.0%}), 예산 초과 {s.budget_skips}"
+                for endpoint, s in self.stats.items()
+            ]
+        logger.info(f"📡 {self.name} 헤지 요청 통계\n" + "\n".join(lines))
@@ -0,0 +1,29 @@
+"""
+API nonce 생성기 - 동시 비공개 요청에서도 겹치지 않는 밀리초 nonce
+"""
+import threading
+import time
+from typing import Callable
+
+
+class NonceGenerator:
+    """엄격히 증가하는 밀리초 nonce (스레드 안전)
+
+    생성 시 벽시계(ms)를 기준으로 잡고 이후에는 monotonic 경과 시간만 더함 (시스템 시계 조정에 영향 없음).
+    같은 밀리초에 여러 요청이 오면 직전 값 + 1
+    """
+
+    def __init__(self, wall_clock: Callable[[], float] = time.time,
+                 monotonic: Callable[[], float] = time.monotonic):
+        self._monotonic = monotonic
+        self._base_ms = int(wall_clock() * 1000)
+        self._base_monotonic = monotonic()
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def next(self) -> int:
+        """다음 nonce"""
+        with self._lock:
+            now_ms = self._base_ms + int((self._monotonic() - self._base_monotonic) * 1000)
+            self._last = max(now_ms, self._last + 1)
+            return self._last
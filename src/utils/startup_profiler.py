@@ -0,0 +1,55 @@
+"""
+시작 시간 측정 유틸리티
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# 단계 이름 → 로그 표시 이름
+STAGE_LABELS = {
+    'imports': '모듈 import',
+    'exchange_init': '거래소 초기화',
+    'market_load': '마켓 정보 로드',
+    'validation': '심볼 검증',
+    'position_discovery': '기존 포지션 조회',
+    'initial_rebalance': '초기 리밸런싱',
+}
+
+
+class StartupProfiler:
+    """시작 단계별 소요 시간 기록"""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """단계 소요 시간 누적"""
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록 소요 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    @property
+    def total(self) -> float:
+        """전체 소요 시간"""
+        return sum(self.stages.values())
+
+    def report(self) -> None:
+        """단계별 소요 시간 로그 출력"""
+        lines = [
+            f"  {STAGE_LABELS.get(name, name)}: {seconds * 1000:.0f}ms"
+            for name, seconds in self.stages.items()
+        ]
+        logger.info(f"⏱️ 시작 시간 {self.total:.2f}초\n" + "\n".join(lines))
@@ -0,0 +1,202 @@
+"""
+전체 청산 빠른 경로 (Gate.io 포지션 청산 주문 + 현물 스냅샷 매도) 테스트
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.hedge_bot import HedgeBot
+from src.core.order_executor import OrderExecutor
+from src.exchanges.binance_futures import BinanceFuturesExchange
+from src.exchanges.bithumb import BithumbExchange
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.upbit import UpbitExchange
+from tests.exchanges.venue_stubs import BinanceStub, GateStub
+
+CREDENTIALS = {'apiKey': 'key', 'secret': 'secret'}
+
+
+@pytest.fixture
+def gate_stub():
+    with GateStub() as stub:
+        stub.positions['XRP_USDT'] = -12
+        yield stub
+
+
+@pytest.fixture
+def korean():
+    exchange = Mock()
+    exchange.exchange_id = 'upbit'
+    exchange.capabilities = UpbitExchange.capabilities
+    exchange.create_market_order.return_value = {'id': 'spot-1'}
+    exchange.get_balance.return_value = {'free': 119.99999999, 'used': 0.0, 'total': 119.99999999}
+    exchange.get_best_bid_ask.return_value = {'bid': 800.0, 'ask': 801.0}
+    exchange.get_min_order_krw.return_value = 5000
+    return exchange
+
+
+class TestClosePosition:
+    """선물 포지션 전체 청산 주문"""
+
+    def test_gate_sends_close_order_without_lookup(self, gate_stub):
+        gate = GateIOExchange(CREDENTIALS, host=gate_stub.url)
+
+        order = gate.close_position('XRP/USDT:USDT')
+
+        assert gate_stub.orders[0]['size'] == '0'
+        assert gate_stub.orders[0]['close'] is True
+        assert gate_stub.orders[0]['tif'] == 'ioc'
+        assert gate_stub.positions['XRP_USDT'] == 0
+        assert order['status'] == 'finished'
+
+    def test_default_closes_via_reduce_only_order(self):
+        with BinanceStub() as stub:
+            stub.positions['XRPUSDT'] = -30.0
+            binance = BinanceFuturesExchange(CREDENTIALS, host=stub.url)
+
+            assert binance.close_position('XRP/USDT:USDT')
+
+            assert stub.orders[0]['side'] == 'BUY'
+            assert stub.orders[0]['reduceOnly'] == 'true'
+            assert stub.positions['XRPUSDT'] == 0
+
+
+class TestSpotBalanceLookup:
+    """현물 잔고 조회 실패는 0 잔고와 구분"""
+
+    @pytest.mark.parametrize('exchange_class', [UpbitExchange, BithumbExchange])
+    def test_failed_lookup_returns_none(self, exchange_class):
+        exchange = exchange_class('key', 'secret')
+        exchange.get_balances = Mock(return_value=None)
+
+        assert exchange.get_balance('XRP') is None
+
+    @pytest.mark.parametrize('exchange_class', [UpbitExchange, BithumbExchange])
+    def test_missing_currency_is_zero(self, exchange_class):
+        exchange = exchange_class('key', 'secret')
+        exchange.get_balances = Mock(return_value={})
+
+        assert exchange.get_balance('XRP') == {'free': 0, 'used': 0, 'total': 0}
+
+
+class TestCloseAllPosition:
+    """OrderExecutor 전체 청산"""
+
+    def test_sells_snapshot_before_balance_lookup(self, korean, gate_stub):
+        korean.capabilities = BithumbExchange.capabilities
+        korean.get_balance.side_effect = lambda _: (
+            {'free': 0.0, 'used': 0.0, 'total': 0.0} if korean.create_market_order.called else None
+        )
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+        executor.residual_ledger.add('XRP', 0.4)
+
+        assert executor.close_all_position('XRP', 120.00009)
+
+        # 잔고 조회는 스냅샷 매도 후 남은 현물 확인에만 사용
+        korean.create_market_order.assert_called_once_with('XRP/KRW', 'sell', 120.0)
+        korean.get_balance.assert_called_once_with('XRP')
+        assert gate_stub.positions['XRP_USDT'] == 0
+        assert executor.residual_ledger.get_gap('XRP') == 0
+
+    def test_spot_added_after_snapshot_is_swept(self, korean, gate_stub):
+        # 스냅샷(100개) 이후 리밸런싱으로 현물 20개 추가 매수
+        korean.get_balance.return_value = {'free': 20.0, 'used': 0.0, 'total': 20.0}
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert executor.close_all_position('XRP', 100.0)
+
+        sells = [call.args for call in korean.create_market_order.call_args_list]
+        assert sells == [('XRP/KRW', 'sell', 100.0), ('XRP/KRW', 'sell', 20.0)]
+
+    def test_failed_sweep_keeps_symbol_open(self, korean, gate_stub):
+        korean.get_balance.return_value = {'free': 20.0, 'used': 0.0, 'total': 20.0}
+        korean.create_market_order.side_effect = [{'id': 'spot-1'}, None]
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert not executor.close_all_position('XRP', 100.0)
+
+    def test_failed_balance_lookup_after_snapshot_fails(self, korean, gate_stub):
+        korean.get_balance.return_value = None
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert not executor.close_all_position('XRP', 100.0)
+
+    def test_failed_balance_lookup_without_snapshot_fails(self, korean, gate_stub):
+        korean.get_balance.return_value = None
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert not executor.close_all_position('XRP', 0.0)
+        korean.create_market_order.assert_not_called()
+
+    def test_dust_after_snapshot_not_swept(self, korean, gate_stub):
+        korean.get_balance.return_value = {'free': 0.5, 'used': 0.0, 'total': 0.5}  # 400원
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert executor.close_all_position('XRP', 100.0)
+
+        korean.create_market_order.assert_called_once_with('XRP/KRW', 'sell', 100.0)
+
+    def test_rejected_snapshot_retries_with_fresh_balance(self, korean, gate_stub):
+        korean.create_market_order.side_effect = [None, {'id': 'spot-2'}]
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert executor.close_all_position('XRP', 125.0)
+
+        sells = [call.args for call in korean.create_market_order.call_args_list]
+        # 잔고는 내림 (반올림하면 보유량 초과)
+        assert sells == [('XRP/KRW', 'sell', 125.0), ('XRP/KRW', 'sell', 119.99999999)]
+
+    def test_no_snapshot_fetches_balance(self, korean, gate_stub):
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert executor.close_all_position('XRP', 0.0)
+
+        korean.get_balance.assert_called_once_with('XRP')
+
+    def test_already_flat_futures_counts_as_closed(self, korean, gate_stub):
+        gate_stub.reject_contracts.add('XRP_USDT')
+        gate_stub.positions.clear()
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert executor.close_all_position('XRP', 120.0)
+
+    def test_rejected_close_with_open_position_fails(self, korean, gate_stub):
+        gate_stub.reject_contracts.add('XRP_USDT')
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+
+        assert not executor.close_all_position('XRP', 120.0)
+
+    def test_rejected_close_with_failed_lookup_fails(self, korean, gate_stub):
+        gate_stub.reject_contracts.add('XRP_USDT')
+        gate_stub.fail_positions = True
+        executor = OrderExecutor(korean, GateIOExchange(CREDENTIALS, host=gate_stub.url))
+        executor.residual_ledger.add('XRP', 0.4)
+
+        assert not executor.close_all_position('XRP', 120.0)
+        # 숏이 남아 있을 수 있으므로 잔여 갭 유지
+        assert executor.residual_ledger.get_gap('XRP') == 0.4
+
+
+class TestHedgeBotCloseAll:
+    """HedgeBot 전체 청산 경로"""
+
+    def test_uses_position_snapshot(self, korean):
+        bot = HedgeBot(korean, Mock())
+        bot.symbols = ['XRP']
+        bot.order_executor.close_all_position = Mock(return_value=True)
+        bot.position_manager.get_position('XRP').spot_amount = 120.0
+        bot.position_manager.get_position('XRP').value_usd = 60.0
+
+        bot._close_all_position('XRP', -0.5)
+
+        bot.order_executor.close_all_position.assert_called_once_with('XRP', 120.0)
+        assert bot.symbols == []
+
+    def test_failure_drops_snapshot(self, korean):
+        bot = HedgeBot(korean, Mock())
+        bot.order_executor.close_all_position = Mock(return_value=False)
+        bot.position_manager.get_position('XRP').spot_amount = 120.0
+
+        bot._close_all_position('XRP', -0.5)
+
+        assert bot.position_manager.get_position('XRP').spot_amount == 0.0
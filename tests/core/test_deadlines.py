@@ -0,0 +1,142 @@
+"""
+요청 데드라인 전달 / 결과 미확인(reconcile) 상태 테스트
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from src.config import settings
+from src.core.hedge_bot import HedgeBot
+from src.core.order_executor import OrderExecutor
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.upbit import UpbitExchange
+from src.utils.deadline import Deadline, DeadlineExceeded, bind, current_deadline, deadline_scope, request_timeout
+from tests.exchanges.venue_stubs import GateStub
+
+CREDENTIALS = {'apiKey': 'key', 'secret': 'secret'}
+
+
+class TestDeadline:
+    """데드라인 계산 / 스레드 전달"""
+
+    def test_budget_capped_by_remaining_time(self):
+        assert request_timeout(5.0) == 5.0
+        with deadline_scope(1.0):
+            assert request_timeout(5.0) <= 1.0
+            assert request_timeout(0.2) == 0.2
+
+    def test_nested_scope_never_extends_outer(self):
+        with deadline_scope(0.5) as outer:
+            with deadline_scope(60) as inner:
+                assert inner.expires_at == outer.expires_at
+                inner.mark_unknown('order')
+        assert outer.unknown_orders == ['order']
+
+    def test_expired_deadline_refuses_request(self):
+        now = [0.0]
+        deadline = Deadline(1.0, clock=lambda: now[0])
+        now[0] = 2.0
+
+        with pytest.raises(DeadlineExceeded):
+            deadline.timeout(5.0)
+
+    def test_bind_carries_deadline_to_worker_thread(self):
+        with deadline_scope(10) as deadline:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(bind(current_deadline)).result() is deadline
+                assert executor.submit(current_deadline).result() is None
+
+
+class TestExchangeTimeouts:
+    """거래소 호출에 엔드포인트 예산 적용"""
+
+    def test_upbit_order_uses_order_budget(self, monkeypatch):
+        monkeypatch.setattr(settings, 'ORDER_TIMEOUT_SECONDS', 7.0)
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.post.return_value = Mock(status_code=201, json=Mock(return_value={'uuid': 'u-1'}))
+
+        exchange._api_call('POST', '/v1/orders', {'market': 'KRW-XRP'})
+        assert exchange.session.post.call_args[1]['timeout'] == 7.0
+
+        with deadline_scope(2.0):
+            exchange._api_call('POST', '/v1/orders', {'market': 'KRW-XRP'})
+        assert exchange.session.post.call_args[1]['timeout'] <= 2.0
+
+    def test_stalled_gate_order_marked_unknown(self):
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url)
+            stub.delay = 1.0
+
+            started = time.monotonic()
+            with deadline_scope(0.3) as deadline:
+                order = gate.create_contract_order('XRP/USDT:USDT', 'sell', 3)
+
+            assert order is None
+            assert time.monotonic() - started < 0.9
+            assert deadline.outcome_unknown
+            # 거래소는 응답만 늦었을 뿐 주문을 받음 - 실패로 처리하면 안 되는 이유
+            time.sleep(1.0)
+            assert stub.positions == {'XRP_USDT': -3}
+
+
+def _korean():
+    exchange = Mock()
+    exchange.exchange_id = 'upbit'
+    exchange.capabilities = UpbitExchange.capabilities
+    exchange.get_best_bid_ask.side_effect = lambda symbol: (
+        {'bid': 1399.0, 'ask': 1400.0} if symbol == 'USDT/KRW' else {'bid': 699.0, 'ask': 700.0}
+    )
+    exchange.get_balance.return_value = {'free': 10_000_000.0, 'used': 0.0, 'total': 10_000_000.0}
+    exchange.create_market_order.return_value = {'id': 'spot-1'}
+    return exchange
+
+
+def _hanging_futures(release: threading.Event):
+    exchange = Mock()
+    exchange.exchange_id = 'gateio'
+    exchange.capabilities = GateIOExchange.capabilities
+    exchange.get_best_bid_ask.return_value = {'bid': 0.5, 'ask': 0.5001}
+    exchange.get_markets.return_value = {'XRP/USDT:USDT': {'contract_size': 10}}
+    exchange.get_contract_size.return_value = 10
+    exchange.get_balance.return_value = {'free': 1000.0, 'used': 0.0, 'total': 1000.0}
+    exchange.create_contract_order.side_effect = lambda *args, **kwargs: release.wait(5)
+    return exchange
+
+
+class TestUnknownOutcome:
+    """응답 없는 주문 → 결과 미확인 → reconcile"""
+
+    def test_hung_leg_returns_at_deadline_without_unwind(self, monkeypatch):
+        monkeypatch.setattr(settings, 'HEDGE_DEADLINE_SECONDS', 0.2)
+        release = threading.Event()
+        korean = _korean()
+        executor = OrderExecutor(korean, _hanging_futures(release))
+
+        started = time.monotonic()
+        fill = executor.execute_hedge('XRP', 50)
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert fill is None
+        assert elapsed < 3.0
+        assert executor.reconcile_symbols == {'XRP'}
+        # 선물 결과를 모르므로 현물을 되팔지 않음
+        assert [call.args[1] for call in korean.create_market_order.call_args_list] == ['buy']
+
+    def test_bot_reconciles_before_new_orders(self):
+        bot = HedgeBot(_korean(), Mock())
+        bot.order_executor.reconcile_symbols.add('XRP')
+        bot.position_manager.get_existing_positions_bulk = Mock(return_value={'XRP': 48.0})
+        bot.position_balancer.rebalance_position = Mock(return_value=True)
+        bot._build_position = Mock()
+
+        bot.process_symbol('XRP')
+
+        bot._build_position.assert_not_called()
+        bot.position_balancer.rebalance_position.assert_called_once_with('XRP')
+        assert bot.position_manager.get_position('XRP').value_usd == 48.0
+        assert bot.order_executor.reconcile_symbols == set()
@@ -0,0 +1,169 @@
+"""
+거래소 역량 기반 주문 전략 테스트
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.order_executor import OrderExecutor
+from src.exchanges.base import ExchangeCapabilities, FuturesExchange, SpotExchange
+from src.exchanges.bithumb import BithumbExchange
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.upbit import UpbitExchange
+
+
+def _exchanges(spot_capabilities, futures_capabilities):
+    korean = Mock()
+    korean.exchange_id = 'upbit'
+    korean.capabilities = spot_capabilities
+    korean.create_market_order = Mock(return_value={'id': 'spot'})
+
+    futures = Mock()
+    futures.exchange_id = 'gateio'
+    futures.capabilities = futures_capabilities
+    futures.create_market_order = Mock(return_value={'id': 'futures'})
+    futures.create_contract_order = Mock(return_value={'id': 'futures'})
+    futures.get_markets = Mock(return_value={'XRP/USDT:USDT': {'contract_size': 10}})
+    return korean, futures
+
+
+class TestDeclaredCapabilities:
+    """어댑터별 역량 선언"""
+
+    def test_adapters_implement_interfaces(self):
+        assert issubclass(UpbitExchange, SpotExchange)
+        assert issubclass(BithumbExchange, SpotExchange)
+        assert issubclass(GateIOExchange, FuturesExchange)
+
+    def test_required_methods_are_abstract(self):
+        class PartialFutures(FuturesExchange):
+            def get_positions(self):
+                return []
+
+        with pytest.raises(TypeError, match='set_leverage'):
+            PartialFutures()
+
+    def test_optional_methods_default_to_unsupported(self):
+        futures = Mock(spec=FuturesExchange)
+
+        assert FuturesExchange.create_post_only_order(futures, 'XRP/USDT:USDT', 'sell', 1, 0.5) is None
+        assert FuturesExchange.countdown_cancel(futures, 'XRP/USDT:USDT', 10) is False
+        assert SpotExchange.create_limit_ioc_order(Mock(spec=SpotExchange), 'XRP/KRW', 'buy', 1, 700) is None
+
+    def test_capability_flags(self):
+        assert UpbitExchange.capabilities.quote_amount_buys
+        assert UpbitExchange.capabilities.quantity_precision is None
+        assert BithumbExchange.capabilities.quantity_precision == 4
+        assert GateIOExchange.capabilities.contract_sizing
+
+    def test_round_quantity(self):
+        assert BithumbExchange.capabilities.round_quantity(1.23456) == 1.2346
+        assert UpbitExchange.capabilities.round_quantity(1.23456) == 1.23456
+
+
+class TestResolvedStrategies:
+    """OrderExecutor는 생성 시 결정된 전략으로 주문"""
+
+    def test_contract_venue_gets_contracts(self):
+        korean, futures = _exchanges(UpbitExchange.capabilities, GateIOExchange.capabilities)
+        executor = OrderExecutor(korean, futures)
+
+        assert executor._calculate_futures_quantity('XRP', 200) == 20
+        assert executor._execute_concurrent_orders('XRP', 200, 20, 'open', spot_amount=140000)
+
+        futures.create_contract_order.assert_called_once_with(
+            'XRP/USDT:USDT', 'sell', 20, reduce_only=False
+        )
+        futures.create_market_order.assert_not_called()
+        korean.create_market_order.assert_called_once_with('XRP/KRW', 'buy', 140000)
+
+    def test_close_uses_reduce_only(self):
+        korean, futures = _exchanges(BithumbExchange.capabilities, GateIOExchange.capabilities)
+        executor = OrderExecutor(korean, futures)
+
+        executor._execute_concurrent_orders('XRP', 200, 20, 'close')
+
+        futures.create_contract_order.assert_called_once_with(
+            'XRP/USDT:USDT', 'buy', 20, reduce_only=True
+        )
+
+    def test_partial_recovery_closes_in_contracts(self):
+        korean, futures = _exchanges(UpbitExchange.capabilities, GateIOExchange.capabilities)
+        korean.create_market_order.return_value = None
+        executor = OrderExecutor(korean, futures)
+
+        assert not executor._execute_concurrent_orders('XRP', 200, 20, 'open', spot_amount=140000)
+
+        # 선물만 체결 → 같은 계약 수를 reduce_only로 되돌림
+        assert futures.create_contract_order.call_args_list[-1].args == ('XRP/USDT:USDT', 'buy', 20)
+        assert futures.create_contract_order.call_args_list[-1].kwargs == {'reduce_only': True}
+
+    def test_partly_placed_short_returns_placed_size(self):
+        korean, futures = _exchanges(UpbitExchange.capabilities, GateIOExchange.capabilities)
+        futures.create_contract_order.return_value = {'id': 'futures', 'filled': 12, 'status': 'partial'}
+        executor = OrderExecutor(korean, futures)
+
+        assert executor._execute_concurrent_orders('XRP', 200, 20, 'open', spot_amount=140000) == 12
+
+    def test_partial_short_gap_goes_to_ledger(self):
+        korean, futures = _exchanges(UpbitExchange.capabilities, GateIOExchange.capabilities)
+        korean.get_best_bid_ask.side_effect = lambda symbol: (
+            {'bid': 1379.0, 'ask': 1380.0} if symbol == 'USDT/KRW' else {'bid': 699.0, 'ask': 700.0}
+        )
+        korean.get_balance.return_value = {'free': 10_000_000}
+        futures.get_best_bid_ask.return_value = {'bid': 0.5, 'ask': 0.5002}
+        futures.get_balance.return_value = {'free': 10_000}
+        futures.create_contract_order.return_value = {'id': 'futures', 'filled': 5, 'status': 'partial'}
+        executor = OrderExecutor(korean, futures)
+
+        fill = executor.execute_hedge('XRP', 100)
+
+        # 주문된 5계약만 헤지 - 나머지 계약만큼 현물 초과분은 잔여 갭으로 기록
+        requested = futures.create_contract_order.call_args.args[2]
+        assert fill.futures_size == 5
+        assert executor.residual_ledger.get_gap('XRP') == pytest.approx(
+            fill.spot_quantity - 5 * 10, abs=1e-6
+        )
+        assert requested > 5
+
+    def test_unfilled_short_unwinds_spot(self):
+        korean, futures = _exchanges(UpbitExchange.capabilities, GateIOExchange.capabilities)
+        futures.create_contract_order.return_value = {'id': 'futures', 'filled': 0, 'status': 'finished'}
+        executor = OrderExecutor(korean, futures)
+
+        assert executor._execute_concurrent_orders('XRP', 200, 20, 'open', spot_amount=140000) is None
+        korean.create_market_order.assert_called_with('XRP/KRW', 'sell', 200)
+
+    def test_quantity_venue_gets_coins(self):
+        korean, futures = _exchanges(UpbitExchange.capabilities, ExchangeCapabilities())
+        executor = OrderExecutor(korean, futures)
+
+        assert executor._calculate_futures_quantity('XRP', 200) == 200
+        executor._execute_concurrent_orders('XRP', 200, 200, 'close')
+
+        futures.create_market_order.assert_called_once_with(
+            'XRP/USDT:USDT', 'buy', 200, {'reduce_only': True}
+        )
+        futures.create_contract_order.assert_not_called()
+
+
+class TestGateIOOrderSizing:
+    """Gate.io 주문 수량 변환"""
+
+    def test_market_order_converts_coins_to_contracts(self):
+        exchange = GateIOExchange({'apiKey': 'key', 'secret': 'secret'}, market_registry=Mock())
+        exchange.market_registry.get_markets.return_value = {
+            'XRP/USDT:USDT': {'contract_size': 10}
+        }
+        exchange.create_contract_order = Mock(return_value={'id': '1'})
+
+        exchange.create_market_order('XRP/USDT:USDT', 'buy', 200, {'reduce_only': True})
+
+        exchange.create_contract_order.assert_called_once_with('XRP/USDT:USDT', 'buy', 20, True)
+
+    def test_contract_order_rejects_zero(self):
+        exchange = GateIOExchange({'apiKey': 'key', 'secret': 'secret'}, market_registry=Mock())
+        exchange.futures_api = Mock()
+
+        assert exchange.create_contract_order('XRP/USDT:USDT', 'sell', 0) is None
+        exchange.futures_api.create_futures_order.assert_not_called()
@@ -0,0 +1,138 @@
+"""
+주문 실행 스케줄러 (우선순위 큐 + 동시 실행 제한) 테스트
+"""
+import threading
+from unittest.mock import MagicMock, Mock
+
+from src.config import settings
+from src.core.execution_scheduler import ExecutionPriority, ExecutionScheduler
+from src.core.hedge_bot import HedgeBot
+
+WAIT = 2
+
+
+def _blocking(started: threading.Event, release: threading.Event, log=None, name=None):
+    def action():
+        if log is not None:
+            log.append(name)
+        started.set()
+        release.wait(WAIT)
+    return action
+
+
+class TestExecutionScheduler:
+    """우선순위 / 동시 실행 제한 / 역압"""
+
+    def test_exits_run_before_queued_entries(self):
+        scheduler = ExecutionScheduler(max_concurrency=1, max_per_venue=1)
+        started, release = threading.Event(), threading.Event()
+        order = []
+
+        with scheduler.cycle():
+            scheduler.submit('A', ExecutionPriority.BUILD, _blocking(started, release, order, 'build-A'))
+            assert started.wait(WAIT)
+            scheduler.submit('B', ExecutionPriority.BUILD, lambda: order.append('build-B'))
+            scheduler.submit('C', ExecutionPriority.REBALANCE, lambda: order.append('rebalance-C'))
+            scheduler.submit('D', ExecutionPriority.CLOSE_PARTIAL, lambda: order.append('partial-D'))
+            scheduler.submit('E', ExecutionPriority.CLOSE_ALL, lambda: order.append('close-E'))
+            release.set()
+
+        assert order == ['build-A', 'close-E', 'partial-D', 'rebalance-C', 'build-B']
+
+    def test_reserved_slot_lets_exit_start_during_entries(self):
+        scheduler = ExecutionScheduler(max_concurrency=2, max_per_venue=2, reserved_exit_slots=1)
+        started, release = threading.Event(), threading.Event()
+        closed = threading.Event()
+        second_build = Mock()
+
+        with scheduler.cycle():
+            scheduler.submit('A', ExecutionPriority.BUILD, _blocking(started, release))
+            assert started.wait(WAIT)
+            scheduler.submit('B', ExecutionPriority.BUILD, second_build)
+            scheduler.submit('C', ExecutionPriority.CLOSE_ALL, closed.set)
+
+            # 진입 A가 실행 중이어도 청산은 전용 슬롯에서 바로 실행, 진입 B는 대기
+            assert closed.wait(WAIT)
+            second_build.assert_not_called()
+            release.set()
+
+        second_build.assert_called_once()
+
+    def test_per_venue_limit(self):
+        scheduler = ExecutionScheduler(max_concurrency=4, max_per_venue=1, reserved_exit_slots=0)
+        started, release = threading.Event(), threading.Event()
+        other_venue = threading.Event()
+        same_venue = Mock()
+
+        with scheduler.cycle():
+            scheduler.submit('A', ExecutionPriority.BUILD, _blocking(started, release), ['upbit'])
+            assert started.wait(WAIT)
+            scheduler.submit('B', ExecutionPriority.BUILD, same_venue, ['upbit'])
+            scheduler.submit('C', ExecutionPriority.BUILD, other_venue.set, ['bithumb'])
+
+            assert other_venue.wait(WAIT)
+            same_venue.assert_not_called()
+            release.set()
+
+        same_venue.assert_called_once()
+
+    def test_entry_backpressure(self):
+        scheduler = ExecutionScheduler(max_concurrency=1, max_per_venue=1, max_pending_entries=1)
+        started, release = threading.Event(), threading.Event()
+
+        with scheduler.cycle():
+            scheduler.submit('A', ExecutionPriority.BUILD, _blocking(started, release))
+            assert started.wait(WAIT)
+            assert scheduler.submit('B', ExecutionPriority.BUILD, Mock())
+            assert not scheduler.submit('C', ExecutionPriority.BUILD, Mock())
+            # 청산은 역압 대상 아님
+            assert scheduler.submit('D', ExecutionPriority.CLOSE_ALL, Mock())
+            release.set()
+
+    def test_outside_cycle_runs_inline(self):
+        scheduler = ExecutionScheduler(max_concurrency=2, max_per_venue=2)
+        action = Mock(side_effect=RuntimeError("boom"))
+
+        assert scheduler.submit('A', ExecutionPriority.BUILD, action)
+        action.assert_called_once()
+
+
+class TestHedgeBotScheduling:
+    """HedgeBot 판단 결과의 우선순위"""
+
+    def _bot(self):
+        korean, futures = Mock(), Mock()
+        korean.exchange_id, futures.exchange_id = 'upbit', 'gateio'
+        bot = HedgeBot(korean, futures)
+        bot.execution_scheduler = MagicMock()
+        bot.premium_calculator.calculate = Mock(return_value=-1.0)
+        return bot
+
+    def test_entry_submitted_as_build(self, monkeypatch):
+        monkeypatch.setattr(settings, 'BUILD_POSITION_PREMIUM', 0.0)
+        bot = self._bot()
+
+        bot.process_symbol('XRP')
+
+        symbol, priority, _, venues = bot.execution_scheduler.submit.call_args[0]
+        assert (symbol, priority, venues) == ('XRP', ExecutionPriority.BUILD, ('upbit', 'gateio'))
+
+    def test_full_close_submitted_first_priority(self, monkeypatch):
+        monkeypatch.setattr(settings, 'BUILD_POSITION_PREMIUM', -5.0)
+        bot = self._bot()
+        bot.position_manager.get_position('XRP').value_usd = 100.0
+        bot.timer_manager.check_profit_taking = Mock(return_value=(-1.0, 100))
+
+        bot.process_symbol('XRP')
+
+        assert bot.execution_scheduler.submit.call_args[0][1] == ExecutionPriority.CLOSE_ALL
+
+    def test_cycle_wraps_symbol_processing(self):
+        bot = self._bot()
+        bot.symbols = ['XRP']
+        bot.process_symbol = Mock()
+
+        bot.run_cycle()
+
+        bot.execution_scheduler.cycle.assert_called_once()
+        bot.process_symbol.assert_called_once_with('XRP')
@@ -0,0 +1,242 @@
+"""
+메이커 실행 (선물 post-only + 체결분 현물 매수) 테스트 - Gate.io 로컬 스텁 서버 사용
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from src.config import settings
+from src.core.hedge_bot import HedgeBot
+from src.core.maker_executor import MakerHedgeExecutor
+from src.core.order_executor import OrderExecutor
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.upbit import UpbitExchange
+from src.managers.order_journal import OrderJournal
+from tests.exchanges.venue_stubs import GateStub
+
+CREDENTIALS = {'apiKey': 'key', 'secret': 'secret'}
+SYMBOL = 'XRP/USDT:USDT'
+
+
+@pytest.fixture
+def maker_settings(monkeypatch):
+    monkeypatch.setattr(settings, 'MAKER_MAX_WAIT_SECONDS', 3.0)
+    monkeypatch.setattr(settings, 'MAKER_POLL_INTERVAL_SECONDS', 1.0)
+    monkeypatch.setattr(settings, 'MAKER_COUNTDOWN_SECONDS', 10)
+    monkeypatch.setattr(settings, 'MAKER_MAX_REPRICE_PCT', 0.2)
+
+
+@pytest.fixture
+def gate_stub():
+    with GateStub(contract_size=10, bid=0.5, ask=0.5002) as stub:
+        yield stub
+
+
+@pytest.fixture
+def gate(gate_stub):
+    return GateIOExchange(CREDENTIALS, host=gate_stub.url)
+
+
+@pytest.fixture
+def korean():
+    exchange = Mock()
+    exchange.exchange_id = 'upbit'
+    exchange.capabilities = UpbitExchange.capabilities
+    # XRP 700원 / USDT 1400원 -> $0.5
+    exchange.get_best_bid_ask.side_effect = lambda symbol: (
+        {'bid': 1399.0, 'ask': 1400.0} if symbol == 'USDT/KRW' else {'bid': 699.0, 'ask': 700.0}
+    )
+    exchange.get_balance.return_value = {'free': 10_000_000.0, 'used': 0.0, 'total': 10_000_000.0}
+    exchange.get_min_order_krw.return_value = 5000.0
+    exchange.create_market_order.side_effect = lambda symbol, side, amount, params=None: {
+        'id': 'spot-1', 'symbol': symbol, 'side': side, 'amount': amount
+    }
+    return exchange
+
+
+class _FakeClock:
+    """sleep 호출만큼 시간이 흐르는 시계 (sleep마다 스텁 체결 이벤트 실행)"""
+
+    def __init__(self, events=None):
+        self.now = 0.0
+        self.events = list(events or [])
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        if self.events:
+            self.events.pop(0)()
+
+
+def _executor(korean, gate, clock):
+    order_executor = OrderExecutor(korean, gate)
+    return MakerHedgeExecutor(order_executor, sleep=clock.sleep, clock=clock)
+
+
+class TestGatePostOnlyOrders:
+    """Gate.io post-only / 정정 / 취소 / 자동 취소 타이머"""
+
+    def test_post_only_order_rests(self, gate, gate_stub):
+        order = gate.create_post_only_order(SYMBOL, 'sell', 5, 0.5002)
+
+        assert gate_stub.orders[0]['tif'] == 'poc'
+        assert gate_stub.orders[0]['price'] == '0.5002'
+        assert gate_stub.orders[0]['size'] == '-5'
+        assert order['status'] == 'open'
+        assert order['amount'] == 5 and order['filled'] == 0
+
+    def test_amend_and_cancel(self, gate, gate_stub):
+        order = gate.create_post_only_order(SYMBOL, 'sell', 5, 0.5002)
+        gate_stub.fill(order['id'], 2)
+
+        amended = gate.amend_order(SYMBOL, order['id'], 0.5001)
+        cancelled = gate.cancel_order(SYMBOL, order['id'])
+
+        assert amended['price'] == 0.5001
+        assert cancelled['status'] == 'finished'
+        assert cancelled['filled'] == 2
+
+    def test_countdown_cancel(self, gate, gate_stub):
+        assert gate.countdown_cancel(SYMBOL, 10)
+        assert gate.countdown_cancel(SYMBOL, 0)
+        assert gate_stub.countdowns == [10, 0]
+
+
+class TestMakerHedgeExecutor:
+    """체결분 현물 헤지"""
+
+    def test_fills_trigger_spot_buys(self, maker_settings, korean, gate, gate_stub):
+        clock = _FakeClock([lambda: gate_stub.fill(1, 4), lambda: gate_stub.fill(1, 6)])
+        executor = _executor(korean, gate, clock)
+
+        fill = executor.execute_hedge('XRP', 50)
+
+        assert gate_stub.orders[0]['size'] == '-10'
+        # 4계약(40개) -> 28,000원, 6계약(60개) -> 42,000원
+        buys = [call.args for call in korean.create_market_order.call_args_list]
+        assert buys == [('XRP/KRW', 'buy', 28000.0), ('XRP/KRW', 'buy', 42000.0)]
+        assert fill.futures_size == 10
+        assert fill.spot_quantity == pytest.approx(100)
+        assert fill.futures_bid_price == 0.5002
+        assert gate_stub.resting[1]['finish_as'] == 'filled'
+        assert gate_stub.countdowns[-1] == 0
+
+    def test_timeout_cancels_remaining(self, maker_settings, korean, gate, gate_stub):
+        clock = _FakeClock([lambda: gate_stub.fill(1, 3)])
+        executor = _executor(korean, gate, clock)
+
+        fill = executor.execute_hedge('XRP', 50)
+
+        assert fill.futures_size == 3
+        assert gate_stub.resting[1]['finish_as'] == 'cancelled'
+        korean.create_market_order.assert_called_once_with('XRP/KRW', 'buy', 21000.0)
+
+    def test_no_fill_returns_none(self, maker_settings, korean, gate, gate_stub):
+        executor = _executor(korean, gate, _FakeClock())
+
+        assert executor.execute_hedge('XRP', 50) is None
+        korean.create_market_order.assert_not_called()
+        assert gate_stub.resting[1]['finish_as'] == 'cancelled'
+
+    def test_reprices_down_to_new_best_ask(self, maker_settings, korean, gate, gate_stub):
+        def lower_ask():
+            gate_stub.book['lowest_ask'] = '0.5001'
+        clock = _FakeClock([lower_ask])
+        executor = _executor(korean, gate, clock)
+
+        executor.execute_hedge('XRP', 50)
+
+        assert gate_stub.resting[1]['price'] == '0.5001'
+
+    def test_reprice_limited(self, maker_settings, korean, gate, gate_stub):
+        def crash_ask():
+            gate_stub.book['lowest_ask'] = '0.49'
+        executor = _executor(korean, gate, _FakeClock([crash_ask]))
+
+        executor.execute_hedge('XRP', 50)
+
+        assert gate_stub.resting[1]['price'] == '0.5002'
+
+    def test_failed_spot_buy_unwinds_short(self, maker_settings, korean, gate, gate_stub):
+        korean.create_market_order.side_effect = None
+        korean.create_market_order.return_value = None
+        executor = _executor(korean, gate, _FakeClock([lambda: gate_stub.fill(1, 4)]))
+
+        assert executor.execute_hedge('XRP', 50) is None
+
+        unwind = gate_stub.orders[-1]
+        assert unwind['size'] == '4' and unwind['reduce_only'] is True
+        assert gate_stub.positions['XRP_USDT'] == 0
+        assert gate_stub.resting[1]['finish_as'] == 'cancelled'
+
+    def test_carry_netted_in_spot_buys(self, maker_settings, korean, gate, gate_stub):
+        clock = _FakeClock([lambda: gate_stub.fill(1, 4), lambda: gate_stub.fill(1, 6)])
+        executor = _executor(korean, gate, clock)
+        executor.order_executor.residual_ledger.add('XRP', 20.0)  # 이전 주문의 현물 초과 20개
+
+        fill = executor.execute_hedge('XRP', 50)
+
+        # 첫 체결 40개 중 20개는 이월 갭으로 상쇄 -> 20개(14,000원)만 매수
+        buys = [call.args for call in korean.create_market_order.call_args_list]
+        assert buys == [('XRP/KRW', 'buy', 14000.0), ('XRP/KRW', 'buy', 42000.0)]
+        assert fill.spot_quantity == pytest.approx(80)
+        assert executor.order_executor.residual_ledger.get_gap('XRP') == pytest.approx(0)
+
+    def test_dust_fill_still_reported(self, maker_settings, korean, gate, gate_stub):
+        korean.get_min_order_krw.return_value = 10_000.0  # 1계약(10개) = 7,000원
+        executor = _executor(korean, gate, _FakeClock([lambda: gate_stub.fill(1, 1)]))
+
+        fill = executor.execute_hedge('XRP', 50)
+
+        # 현물은 못 샀지만 숏 1계약은 살아 있음 - 헤지 결과로 반환하고 갭은 장부에
+        korean.create_market_order.assert_not_called()
+        assert fill.futures_size == 1 and fill.spot_quantity == 0
+        assert executor.order_executor.residual_ledger.get_gap('XRP') == pytest.approx(-10)
+
+    def test_work_loop_journaled(self, maker_settings, korean, gate, gate_stub, tmp_path):
+        journal = OrderJournal(str(tmp_path / 'orders.jsonl'))
+        open_during_work = []
+
+        def fill_and_check():
+            gate_stub.fill(1, 10)
+            open_during_work.extend(journal.incomplete_symbols())
+        order_executor = OrderExecutor(korean, gate, journal=journal)
+        clock = _FakeClock([fill_and_check])
+        executor = MakerHedgeExecutor(order_executor, sleep=clock.sleep, clock=clock)
+
+        executor.execute_hedge('XRP', 50)
+        journal.close()
+
+        # 진행 중에는 미완료 의도 - 재시작하면 reconcile 대상
+        assert open_during_work == ['XRP']
+        assert journal.incomplete_symbols() == []
+        reopened = OrderJournal(str(tmp_path / 'orders.jsonl'))
+        assert reopened.incomplete_symbols() == []
+        reopened.close()
+
+    def test_taker_fallback_without_maker_orders(self, korean):
+        futures = Mock()
+        futures.capabilities = Mock(maker_orders=False, contract_sizing=True)
+        order_executor = Mock(korean_exchange=korean, futures_exchange=futures)
+
+        MakerHedgeExecutor(order_executor).execute_hedge('XRP', 50)
+
+        order_executor.execute_hedge.assert_called_once_with('XRP', 50)
+
+
+class TestHedgeBotExecutionMode:
+    """EXECUTION_MODE 설정"""
+
+    def test_maker_mode_wires_executor(self, monkeypatch, korean, gate):
+        monkeypatch.setattr(settings, 'EXECUTION_MODE', 'maker')
+        bot = HedgeBot(korean, gate)
+
+        assert isinstance(bot.hedge_executor, MakerHedgeExecutor)
+        assert bot.sliced_executor.order_executor is bot.hedge_executor
+
+    def test_taker_mode_default(self, korean, gate):
+        bot = HedgeBot(korean, gate)
+
+        assert bot.hedge_executor is bot.order_executor
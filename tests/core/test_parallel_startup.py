@@ -0,0 +1,79 @@
+"""
+병렬 시작 (심볼 온보딩) 테스트
+"""
+import threading
+import time
+from unittest.mock import Mock
+
+from src.core.hedge_bot import HedgeBot
+from src.utils.startup_profiler import StartupProfiler
+
+
+def _slow_exchanges(delay=0.05):
+    """시세 조회가 느린 가짜 거래소 (마켓 정보 없음 → 시세 조회로 검증)"""
+    active = {'now': 0, 'max': 0}
+    lock = threading.Lock()
+
+    def slow_ticker(symbol):
+        with lock:
+            active['now'] += 1
+            active['max'] = max(active['max'], active['now'])
+        time.sleep(delay)
+        with lock:
+            active['now'] -= 1
+        return None if symbol.startswith('BAD') else {'bid': 1.0, 'ask': 1.0}
+
+    korean = Mock()
+    korean.exchange_id = 'upbit'
+    korean.get_best_bid_ask = Mock(side_effect=slow_ticker)
+    korean.get_best_bid_asks = Mock(side_effect=lambda symbols: {
+        symbol: {'bid': 1.0, 'ask': 1.0} for symbol in symbols
+    })
+    korean.get_balances = Mock(return_value={})
+
+    futures = Mock()
+    futures.exchange_id = 'gateio'
+    futures.get_best_bid_ask = Mock(side_effect=slow_ticker)
+    futures.get_positions = Mock(return_value=[])
+    return korean, futures, active
+
+
+class TestParallelStartup:
+    """HedgeBot.add_symbols 동시 처리 테스트"""
+
+    def test_validation_runs_concurrently_and_keeps_order(self):
+        korean, futures, active = _slow_exchanges()
+        bot = HedgeBot(korean, futures)
+        symbols = ['XRP', 'BAD1', 'ETH', 'BTC', 'DOGE', 'SOL']
+
+        start = time.perf_counter()
+        added = bot.add_symbols(symbols)
+        elapsed = time.perf_counter() - start
+
+        assert added == ['XRP', 'ETH', 'BTC', 'DOGE', 'SOL']
+        assert bot.symbols == added
+        assert active['max'] > 1
+        # 순차 실행이면 11회 * 0.05초 이상
+        assert elapsed < 11 * 0.05
+
+    def test_profiler_records_stages(self):
+        korean, futures, _ = _slow_exchanges(delay=0)
+        korean.get_balances.return_value = {'XRP': {'free': 1, 'used': 0, 'total': 1}}
+        bot = HedgeBot(korean, futures)
+        bot.position_balancer.rebalance_position = Mock(return_value=True)
+        profiler = StartupProfiler()
+
+        bot.add_symbols(['XRP', 'ETH'], profiler)
+
+        assert set(profiler.stages) == {'validation', 'position_discovery', 'initial_rebalance'}
+        bot.position_balancer.rebalance_position.assert_called_once_with('XRP')
+
+    def test_profiler_accumulates(self):
+        profiler = StartupProfiler()
+        profiler.record('imports', 0.5)
+        with profiler.stage('imports'):
+            pass
+        profiler.report()
+
+        assert profiler.stages['imports'] >= 0.5
+        assert profiler.total == profiler.stages['imports']
@@ -11,6 +11,9 @@ import logging
 # Import the module to test
 from src.core.position_balancer import PositionBalancer, PositionBalance
 from src.config import settings
+from src.exchanges.bithumb import BithumbExchange
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.upbit import UpbitExchange
 
 # Configure logging for tests
 logging.basicConfig(level=logging.INFO)
@@ -25,9 +28,11 @@ class TestPositionBalancer:
         """Create mock exchange objects"""
         korean_exchange = Mock()
         korean_exchange.exchange_id = 'upbit'
+        korean_exchange.capabilities = UpbitExchange.capabilities
         
         futures_exchange = Mock()
         futures_exchange.exchange_id = 'gateio'
+        futures_exchange.capabilities = GateIOExchange.capabilities
         
         return korean_exchange, futures_exchange
     
@@ -126,7 +131,7 @@ class TestPositionBalancer:
         }
         
         # Mock ticker
-        korean_exchange.get_ticker.side_effect = [
+        korean_exchange.get_best_bid_ask.side_effect = [
             {'bid': 1500.0, 'ask': 1510.0},  # XRP/KRW
             {'bid': 1370.0, 'ask': 1380.0}   # USDT/KRW
         ]
@@ -277,7 +282,7 @@ class TestPositionBalancer:
         _, futures_exchange = mock_exchanges
         
         # Mock ticker
-        futures_exchange.get_ticker.return_value = {
+        futures_exchange.get_best_bid_ask.return_value = {
             'bid': 1.10,
             'ask': 1.11
         }
@@ -311,7 +316,7 @@ class TestPositionBalancer:
         korean_exchange.exchange_id = 'upbit'
         
         # Mock tickers
-        korean_exchange.get_ticker.side_effect = [
+        korean_exchange.get_best_bid_ask.side_effect = [
             {'bid': 1370.0, 'ask': 1380.0},  # USDT/KRW
             {'bid': 1490.0, 'ask': 1500.0}   # XRP/KRW
         ]
@@ -496,7 +501,7 @@ class TestPositionBalancer:
         korean_exchange.exchange_id = 'bithumb'
         
         # Mock tickers
-        korean_exchange.get_ticker.side_effect = [
+        korean_exchange.get_best_bid_ask.side_effect = [
             {'bid': 1490.0, 'ask': 1500.0},  # XRP/KRW
             {'bid': 1370.0, 'ask': 1380.0}   # USDT/KRW
         ]
@@ -525,7 +530,7 @@ class TestPositionBalancer:
         _, futures_exchange = mock_exchanges
         
         # Mock ticker
-        futures_exchange.get_ticker.return_value = {
+        futures_exchange.get_best_bid_ask.return_value = {
             'bid': 1.10,
             'ask': 1.11
         }
@@ -549,13 +554,15 @@ class TestPositionBalancer:
         assert call_args[1]['amount'] == pytest.approx(45.05, rel=0.01)  # 50/1.11
         assert call_args[1]['params'] == {'reduce_only': True}
     
-    def test_close_excess_spot_bithumb_rounding(self, balancer, mock_exchanges):
+    def test_close_excess_spot_bithumb_rounding(self, mock_exchanges, mock_managers):
         """Test Bithumb 4-digit rounding for spot orders"""
-        korean_exchange, _ = mock_exchanges
+        korean_exchange, futures_exchange = mock_exchanges
         korean_exchange.exchange_id = 'bithumb'
+        korean_exchange.capabilities = BithumbExchange.capabilities
+        balancer = PositionBalancer(*mock_managers, korean_exchange, futures_exchange)
         
         # Mock tickers
-        korean_exchange.get_ticker.side_effect = [
+        korean_exchange.get_best_bid_ask.side_effect = [
             {'bid': 1490.123456, 'ask': 1500.0},  # XRP/KRW
             {'bid': 1370.0, 'ask': 1380.789}      # USDT/KRW
         ]
@@ -0,0 +1,85 @@
+"""
+헤지 수량 솔버 테스트
+"""
+import pytest
+
+from src.core.quantity_solver import HedgeQuantitySolver
+from src.exchanges.base import ExchangeCapabilities
+from src.exchanges.bithumb import BithumbExchange
+from src.exchanges.upbit import UpbitExchange
+
+BITHUMB = BithumbExchange.capabilities
+UPBIT = UpbitExchange.capabilities
+
+
+class TestHedgeQuantitySolver:
+    """HedgeQuantitySolver 테스트"""
+
+    def test_bithumb_rounds_units_to_four_decimals(self):
+        solver = HedgeQuantitySolver(BITHUMB)
+        units, krw_amount = solver.spot_fill(1.23456, 10000)
+
+        assert units == 1.2346
+        assert krw_amount == pytest.approx(12346)
+
+    def test_upbit_buys_by_integer_krw(self):
+        solver = HedgeQuantitySolver(UPBIT)
+        quantity, krw_amount = solver.spot_fill(3.3333, 1501)
+
+        assert krw_amount == float(round(3.3333 * 1501))
+        assert quantity == pytest.approx(krw_amount / 1501)
+
+    def test_unrestricted_spot_uses_exact_quantity(self):
+        solver = HedgeQuantitySolver(ExchangeCapabilities())
+        units, krw_amount = solver.spot_fill(1.23456, 10000)
+
+        assert units == 1.23456
+        assert krw_amount == pytest.approx(12345.6)
+
+    def test_solve_picks_contracts_closest_to_target(self):
+        solver = HedgeQuantitySolver(UPBIT)
+        # 계약 크기 10, 선물가 $0.5 → $100 = 20계약
+        result = solver.solve(100.0, 0.5, 10, 700, 1400)
+
+        assert result is not None
+        assert result.contracts == 20
+        assert result.futures_quantity == 200
+        assert result.spot_order_amount == 140000
+        assert result.mismatch_pct <= solver.tolerance_pct
+
+    def test_solve_respects_bithumb_precision(self):
+        # 계약 크기 0.00001 → 빗썸 4자리와 맞으려면 10계약 단위여야 함
+        solver = HedgeQuantitySolver(BITHUMB, tolerance_pct=0.01)
+        result = solver.solve(50.0, 100000, 0.00001, 140_000_000, 1400)
+
+        assert result is not None
+        assert result.contracts % 10 == 0
+        assert result.spot_quantity == pytest.approx(result.futures_quantity)
+        assert result.mismatch_pct == pytest.approx(0, abs=1e-9)
+
+    def test_solve_falls_back_to_least_mismatch(self):
+        solver = HedgeQuantitySolver(BITHUMB, tolerance_pct=0.0, search_window=0)
+        result = solver.solve(53.0, 100000, 0.00001, 140_000_000, 1400)
+
+        assert result is not None
+        assert result.mismatch_pct > 0
+
+    def test_solve_below_one_contract_skipped(self):
+        solver = HedgeQuantitySolver(UPBIT)
+
+        # $1 = 0.01 계약 → 1계약으로 올리지 않음
+        assert solver.solve(1.0, 100.0, 1, 140000, 1400) is None
+
+    def test_solve_rounds_up_to_one_contract_from_half(self):
+        solver = HedgeQuantitySolver(UPBIT)
+        result = solver.solve(60.0, 100.0, 1, 140000, 1400)
+
+        assert result is not None
+        assert result.contracts == 1
+
+    def test_solve_invalid_inputs(self):
+        solver = HedgeQuantitySolver(UPBIT)
+
+        assert solver.solve(0, 1.0, 1, 1400, 1400) is None
+        assert solver.solve(100, 0, 1, 1400, 1400) is None
+        assert solver.solve(100, 1.0, 1, 0, 1400) is None
@@ -0,0 +1,223 @@
+"""
+분할 실행 (SlicedExecutor) 테스트
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from src.config import settings
+from src.core.hedge_bot import HedgeBot
+from src.core.order_executor import HedgeFill
+from src.core.sliced_executor import SlicedExecutor
+
+
+def _fill(amount_usd, krw_ask=1000.0):
+    # USDT/KRW 1400, 선물 bid 0.7 -> 프리미엄 (1000/1400/0.7 - 1) * 100 ≈ 2.04%
+    return HedgeFill('XRP', amount_usd / 0.7, amount_usd / 7, amount_usd, krw_ask, 0.7, 1400.0)
+
+
+@pytest.fixture
+def slice_settings(monkeypatch):
+    monkeypatch.setattr(settings, 'SLICED_EXECUTION_ENABLED', True)
+    monkeypatch.setattr(settings, 'SLICE_DEPTH_FRACTION', 0.5)
+    monkeypatch.setattr(settings, 'SLICE_MIN_USD', 20.0)
+    monkeypatch.setattr(settings, 'SLICE_MAX_USD', 200.0)
+    monkeypatch.setattr(settings, 'SLICE_INTERVAL_SECONDS', 1.5)
+    monkeypatch.setattr(settings, 'SLICE_MAX_PREMIUM_DRIFT', 0.3)
+
+
+@pytest.fixture
+def korean():
+    exchange = Mock()
+    # 최우선 매도 잔량 140개 x 1000원 / 1400 = $100 -> 조각 $50
+    exchange.get_best_bid_asks.return_value = {
+        'XRP/KRW': {'bid': 999.0, 'ask': 1000.0, 'ask_size': 140.0},
+        'USDT/KRW': {'bid': 1399.0, 'ask': 1400.0},
+    }
+    return exchange
+
+
+@pytest.fixture
+def order_executor():
+    executor = Mock()
+    executor.execute_hedge.side_effect = lambda symbol, amount_usd: _fill(amount_usd)
+    return executor
+
+
+@pytest.fixture
+def premium_calculator():
+    calculator = Mock()
+    calculator.calculate.return_value = 2.0
+    return calculator
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def clock():
+    return Mock(return_value=100.0)
+
+
+@pytest.fixture
+def sliced(order_executor, premium_calculator, korean, sleeps, clock):
+    return SlicedExecutor(order_executor, premium_calculator, korean, sleep=sleeps.append, clock=clock)
+
+
+class TestSlicePlanning:
+    """조각 크기 계산"""
+
+    def test_slice_sized_from_depth(self, slice_settings, sliced):
+        assert sliced.plan_slice_usd('XRP', 500) == pytest.approx(50.0)
+
+    def test_slice_clamped_to_max(self, slice_settings, sliced, korean):
+        korean.get_best_bid_asks.return_value['XRP/KRW']['ask_size'] = 100000.0
+
+        assert sliced.plan_slice_usd('XRP', 1000) == 200.0
+
+    def test_small_tail_merged(self, slice_settings, sliced):
+        assert sliced.plan_slice_usd('XRP', 65) == 65
+
+    def test_no_depth_uses_max(self, slice_settings, sliced, korean):
+        korean.get_best_bid_asks.return_value = {}
+
+        assert sliced.plan_slice_usd('XRP', 1000) == 200.0
+
+    def test_should_slice(self, slice_settings, sliced, monkeypatch):
+        assert sliced.should_slice(100)
+        assert not sliced.should_slice(30)
+        monkeypatch.setattr(settings, 'SLICED_EXECUTION_ENABLED', False)
+        assert not sliced.should_slice(1000)
+
+
+class TestSlicedExecution:
+    """조각 실행 / 중단 / 리포트"""
+
+    def test_executes_all_slices_with_pacing(self, slice_settings, sliced, order_executor, sleeps):
+        report = sliced.execute('XRP', 200, decision_premium=2.0)
+
+        assert [item.requested_usd for item in report.slices] == [50.0, 50.0, 50.0, 50.0]
+        assert order_executor.execute_hedge.call_count == 4
+        assert sleeps == [1.5, 1.5, 1.5]
+        assert report.executed_usd == pytest.approx(200)
+        assert report.abort_reason is None
+        assert report.achieved_premium == pytest.approx((1000 / 1400 / 0.7 - 1) * 100)
+
+    def test_aborts_on_premium_deterioration(self, slice_settings, sliced, premium_calculator):
+        premium_calculator.calculate.side_effect = [2.1, 2.5]
+
+        report = sliced.execute('XRP', 200, decision_premium=2.0)
+
+        assert len(report.slices) == 2
+        assert report.executed_usd == pytest.approx(100)
+        assert '프리미엄 악화' in report.abort_reason
+
+    def test_aborts_on_failed_slice(self, slice_settings, sliced, order_executor):
+        order_executor.execute_hedge.side_effect = [_fill(50), None]
+
+        report = sliced.execute('XRP', 200, decision_premium=2.0)
+
+        assert report.executed_usd == pytest.approx(50)
+        assert report.abort_reason == '2번째 조각 주문 실패'
+
+    def test_summary_reports_premium_difference(self, slice_settings, sliced):
+        report = sliced.execute('XRP', 100, decision_premium=2.0)
+
+        assert '달성 프리미엄' in report.summary()
+        assert '결정 2.000%' in report.summary()
+
+
+class TestStepwiseExecution:
+    """사이클마다 조각 1개 (조각 사이 대기 없이 반환)"""
+
+    def test_start_runs_first_slice_only(self, slice_settings, sliced, order_executor, sleeps):
+        report = sliced.start('XRP', 200, decision_premium=2.0)
+
+        assert order_executor.execute_hedge.call_count == 1
+        assert sleeps == []
+        assert report.remaining_usd == pytest.approx(150)
+        assert sliced.has_active('XRP')
+
+    def test_next_slice_waits_for_interval(self, slice_settings, sliced, clock):
+        sliced.start('XRP', 200, decision_premium=2.0)
+
+        assert not sliced.is_due('XRP')
+        clock.return_value = 101.5
+        assert sliced.is_due('XRP')
+
+    def test_runs_to_completion(self, slice_settings, sliced, order_executor):
+        report = sliced.start('XRP', 200, decision_premium=2.0)
+        while sliced.has_active('XRP'):
+            sliced.execute_next('XRP', 2.1)
+
+        assert order_executor.execute_hedge.call_count == 4
+        assert report.executed_usd == pytest.approx(200)
+        assert report.abort_reason is None
+
+    def test_drift_aborts_plan(self, slice_settings, sliced, order_executor):
+        report = sliced.start('XRP', 200, decision_premium=2.0)
+
+        assert sliced.execute_next('XRP', 2.5) is None
+
+        assert not sliced.has_active('XRP')
+        assert order_executor.execute_hedge.call_count == 1
+        assert '프리미엄 악화' in report.abort_reason
+
+    def test_cancel(self, slice_settings, sliced):
+        report = sliced.start('XRP', 200, decision_premium=2.0)
+
+        sliced.cancel('XRP', '심볼 청산')
+
+        assert not sliced.has_active('XRP')
+        assert report.abort_reason == '심볼 청산'
+
+
+class TestHedgeBotIntegration:
+    """HedgeBot 포지션 구축 연동"""
+
+    def test_partial_slices_update_position(self, slice_settings, monkeypatch):
+        monkeypatch.setattr(settings, 'POSITION_INCREMENT_USD', 200.0)
+        bot = HedgeBot(Mock(), Mock())
+        report = Mock(executed_usd=100.0)
+        bot.sliced_executor.start = Mock(return_value=report)
+        bot.position_balancer.rebalance_position = Mock()
+
+        bot._build_position('XRP', premium=2.0)
+
+        bot.sliced_executor.start.assert_called_once_with('XRP', 200.0, 2.0)
+        assert bot.position_manager.get_position('XRP').value_usd == 100.0
+
+    def test_remaining_slices_run_one_per_cycle(self, slice_settings, monkeypatch, korean):
+        monkeypatch.setattr(settings, 'POSITION_INCREMENT_USD', 200.0)
+        monkeypatch.setattr(settings, 'SLICE_INTERVAL_SECONDS', 0.0)
+        bot = HedgeBot(korean, Mock())
+        bot.symbols = ['XRP']
+        bot.sliced_executor.korean_exchange = korean
+        bot.hedge_executor.execute_hedge = Mock(side_effect=lambda symbol, amount_usd: _fill(amount_usd))
+        bot.premium_calculator.calculate = Mock(return_value=2.0)
+        bot.position_balancer.rebalance_position = Mock()
+        bot._degraded_venues = Mock(return_value=[])
+
+        bot._build_position('XRP', premium=2.0)
+        assert bot.position_manager.get_position('XRP').value_usd == pytest.approx(50)
+
+        bot.run_cycle()
+
+        # 사이클 하나에 조각 하나 - 새 진입 판단 없이 남은 조각만 이어서 실행
+        assert bot.hedge_executor.execute_hedge.call_count == 2
+        assert bot.position_manager.get_position('XRP').value_usd == pytest.approx(100)
+        assert bot.sliced_executor.has_active('XRP')
+
+    def test_disabled_uses_single_order(self, monkeypatch):
+        monkeypatch.setattr(settings, 'SLICED_EXECUTION_ENABLED', False)
+        bot = HedgeBot(Mock(), Mock())
+        bot.order_executor.execute_hedge = Mock(return_value=_fill(200.0))
+        bot.sliced_executor.execute = Mock()
+        bot.position_balancer.rebalance_position = Mock()
+
+        bot._build_position('XRP', premium=2.0)
+
+        bot.sliced_executor.execute.assert_not_called()
+        bot.order_executor.execute_hedge.assert_called_once()
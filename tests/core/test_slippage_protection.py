@@ -0,0 +1,212 @@
+"""
+슬리피지 상한 (양쪽 지정가 IOC) 테스트
+"""
+from unittest.mock import ANY, Mock
+
+import pytest
+
+from src.config import settings
+from src.core.hedge_bot import HedgeBot
+from src.core.order_executor import OrderExecutor
+from src.exchanges.bithumb import BithumbExchange
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.upbit import UpbitExchange
+from src.utils.deadline import deadline_scope
+from tests.exchanges.venue_stubs import GateStub
+
+CREDENTIALS = {'apiKey': 'key', 'secret': 'secret'}
+
+
+@pytest.fixture
+def protection(monkeypatch):
+    monkeypatch.setattr(settings, 'SLIPPAGE_PROTECTION_ENABLED', True)
+    monkeypatch.setattr(settings, 'MAX_SLIPPAGE_BPS', 30.0)
+
+
+class TestProtectedPrice:
+    """보호 가격 계산 (호가 단위 안쪽으로 반올림)"""
+
+    def test_upbit_buy_rounds_down_to_tick(self):
+        exchange = UpbitExchange('key', 'secret')
+
+        # 701 x 1.003 = 703.103 -> 0.1원 단위 내림
+        assert exchange.protected_price('XRP/KRW', 'buy', 701.0, 30) == pytest.approx(703.1)
+        # 55,000 x 1.003 = 55,165 -> 10원 단위 내림
+        assert exchange.protected_price('ETC/KRW', 'buy', 55000.0, 30) == 55160.0
+
+    def test_bithumb_sell_rounds_up_to_tick(self):
+        exchange = BithumbExchange('key', 'secret')
+
+        # 7,000 x 0.997 = 6,979 -> 5원 단위 올림
+        assert exchange.protected_price('XRP/KRW', 'sell', 7000.0, 30) == 6980.0
+
+    def test_gate_uses_contract_price_tick(self):
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url)
+            gate._futures_markets['XRP/USDT:USDT']['price_tick'] = 0.0001
+
+            # 0.5 x 0.997 = 0.4985 -> 그대로
+            assert gate.protected_price('XRP/USDT:USDT', 'sell', 0.5, 30) == pytest.approx(0.4985)
+            assert gate.protected_price('XRP/USDT:USDT', 'sell', 0.50003, 30) == pytest.approx(0.4986)
+
+
+class TestLimitIocOrders:
+    """거래소별 지정가 IOC 주문"""
+
+    def test_upbit_sends_ioc_and_reads_final_state(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.IOC_STATUS_INTERVAL = 0
+        exchange._api_call = Mock(side_effect=[
+            {'uuid': 'u-1', 'state': 'wait', 'executed_volume': '0'},
+            {'uuid': 'u-1', 'state': 'cancel', 'executed_volume': '60.5'},
+        ])
+
+        order = exchange.create_limit_ioc_order('XRP/KRW', 'buy', 100, 703.1)
+
+        params = exchange._api_call.call_args_list[0][0][2]
+        assert params == {
+            'market': 'KRW-XRP', 'side': 'bid', 'volume': '100', 'price': '703.1',
+            'ord_type': 'limit', 'time_in_force': 'ioc', 'identifier': ANY
+        }
+        assert exchange._api_call.call_args_list[1][0][:2] == ('GET', '/v1/order')
+        assert order['filled'] == 60.5
+        assert order['remaining'] == pytest.approx(39.5)
+
+    def test_bithumb_places_then_cancels_remainder(self):
+        exchange = BithumbExchange('key', 'secret')
+        exchange._private_api_call = Mock(side_effect=[
+            {'order_id': 'C0001'},
+            {'order_status': 'Completed', 'contract': [{'units': '30'}, {'units': '20'}]},
+        ])
+        # 전량 체결되어 취소 실패
+        exchange._private_post = Mock(return_value={'status': '5600', 'message': '거래 체결내역이 존재하지 않습니다.'})
+
+        order = exchange.create_limit_ioc_order('XRP/KRW', 'sell', 50.00004, 6980.0)
+
+        endpoints = [call[0][0] for call in exchange._private_api_call.call_args_list]
+        assert endpoints == ['/trade/place', '/info/order_detail']
+        assert exchange._private_post.call_args[0][0] == '/trade/cancel'
+        place = exchange._private_api_call.call_args_list[0][0][1]
+        assert place['units'] == '50.0' and place['price'] == '6980' and place['type'] == 'ask'
+        assert order['filled'] == 50.0 and order['remaining'] == 0.0
+
+    def test_bithumb_rejected_cancel_is_retried(self, monkeypatch):
+        monkeypatch.setattr(settings, 'ORDER_LOOKUP_DELAY_SECONDS', 0.0)
+        exchange = BithumbExchange('key', 'secret')
+        exchange._private_api_call = Mock(side_effect=[
+            {'order_id': 'C0001'},
+            {'order_status': 'Pending', 'contract': [{'units': '20'}]},
+            {'order_status': 'Cancel', 'contract': [{'units': '20'}]},
+        ])
+        exchange._private_post = Mock(side_effect=[
+            {'status': '5900', 'message': 'Too Many Requests'},
+            {'status': '0000'},
+        ])
+
+        order = exchange.create_limit_ioc_order('XRP/KRW', 'sell', 50, 6980.0)
+
+        assert exchange._private_post.call_count == 2
+        assert order['filled'] == 20.0 and order['remaining'] == 30.0
+
+    def test_bithumb_unconfirmed_cancel_marks_unknown(self, monkeypatch):
+        monkeypatch.setattr(settings, 'ORDER_LOOKUP_DELAY_SECONDS', 0.0)
+        exchange = BithumbExchange('key', 'secret')
+        exchange._private_api_call = Mock(side_effect=[{'order_id': 'C0001'}] + [
+            {'order_status': 'Pending', 'contract': [{'units': '20'}]}
+        ] * BithumbExchange.IOC_CANCEL_ATTEMPTS)
+        exchange._private_post = Mock(return_value={'status': '5500', 'message': 'Internal Server Error'})
+
+        with deadline_scope(5) as deadline:
+            order = exchange.create_limit_ioc_order('XRP/KRW', 'sell', 50, 6980.0)
+
+        # 잔량이 호가창에 남아 있을 수 있음 - 체결 20개로 확정하지 않고 reconcile
+        assert order is None
+        assert deadline.outcome_unknown
+        assert exchange._private_post.call_count == BithumbExchange.IOC_CANCEL_ATTEMPTS
+
+    def test_gate_limit_ioc_contract_order(self):
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url)
+
+            order = gate.create_contract_order('XRP/USDT:USDT', 'sell', 4, price=0.4985)
+
+            assert stub.orders[0]['price'] == '0.4985'
+            assert stub.orders[0]['tif'] == 'ioc'
+            assert order['filled'] == 4 and order['remaining'] == 0
+
+
+def _korean():
+    exchange = Mock()
+    exchange.exchange_id = 'upbit'
+    exchange.capabilities = UpbitExchange.capabilities
+    exchange.get_best_bid_ask.side_effect = lambda symbol: (
+        {'bid': 1399.0, 'ask': 1400.0} if symbol == 'USDT/KRW' else {'bid': 699.0, 'ask': 700.0}
+    )
+    exchange.get_balance.return_value = {'free': 10_000_000.0, 'used': 0.0, 'total': 10_000_000.0}
+    exchange.protected_price.return_value = 702.1
+    return exchange
+
+
+def _futures(filled):
+    exchange = Mock()
+    exchange.exchange_id = 'gateio'
+    exchange.capabilities = GateIOExchange.capabilities
+    exchange.get_best_bid_ask.return_value = {'bid': 0.5, 'ask': 0.5001}
+    exchange.get_markets.return_value = {'XRP/USDT:USDT': {'contract_size': 10}}
+    exchange.get_balance.return_value = {'free': 1000.0, 'used': 0.0, 'total': 1000.0}
+    exchange.protected_price.return_value = 0.4985
+    exchange.create_contract_order.side_effect = lambda symbol, side, contracts, reduce_only=False, price=None: {
+        'id': 1, 'amount': contracts, 'filled': contracts if price is None else filled
+    }
+    return exchange
+
+
+class TestProtectedHedge:
+    """OrderExecutor 지정가 IOC 헤지"""
+
+    def test_partial_fill_reported_and_gap_recorded(self, protection):
+        korean = _korean()
+        korean.create_limit_ioc_order.return_value = {'filled': 60.0, 'remaining': 40.0}
+        futures = _futures(filled=7)
+        executor = OrderExecutor(korean, futures)
+
+        fill = executor.execute_hedge('XRP', 50)
+
+        korean.create_limit_ioc_order.assert_called_once_with('XRP/KRW', 'buy', pytest.approx(100), 702.1)
+        assert futures.create_contract_order.call_args[0] == ('XRP/USDT:USDT', 'sell', 10, False, 0.4985)
+        assert fill.spot_quantity == 60.0 and fill.futures_size == 7
+        assert fill.filled_ratio == pytest.approx(0.6)
+        # 현물 60 - 선물 70 = -10
+        assert executor.residual_ledger.get_gap('XRP') == pytest.approx(-10)
+
+    def test_one_leg_unfilled_unwinds_other(self, protection):
+        korean = _korean()
+        korean.create_limit_ioc_order.return_value = {'filled': 0.0, 'remaining': 100.0}
+        futures = _futures(filled=5)
+        executor = OrderExecutor(korean, futures)
+
+        assert executor.execute_hedge('XRP', 50) is None
+
+        unwind = futures.create_contract_order.call_args_list[-1]
+        assert unwind[0][:3] == ('XRP/USDT:USDT', 'buy', 5)
+        assert unwind[1] == {'reduce_only': True}
+
+    def test_disabled_uses_market_orders(self):
+        korean = _korean()
+        korean.create_market_order.return_value = {'id': 'spot'}
+        futures = _futures(filled=0)
+        executor = OrderExecutor(korean, futures)
+
+        assert executor.execute_hedge('XRP', 50).filled_ratio == 1.0
+        korean.create_limit_ioc_order.assert_not_called()
+
+    def test_position_grows_by_filled_ratio(self, protection, monkeypatch):
+        monkeypatch.setattr(settings, 'POSITION_INCREMENT_USD', 50.0)
+        korean = _korean()
+        korean.create_limit_ioc_order.return_value = {'filled': 60.0, 'remaining': 40.0}
+        bot = HedgeBot(korean, _futures(filled=6))
+        bot.position_balancer.rebalance_position = Mock()
+
+        bot._build_position('XRP')
+
+        assert bot.position_manager.get_position('XRP').value_usd == pytest.approx(30.0)
@@ -0,0 +1,107 @@
+"""
+심볼 유니버스 조회 및 기존 포지션 일괄 조회 테스트
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.hedge_bot import HedgeBot
+from src.exchanges.market_registry import MarketRegistry
+from src.managers.position_manager import PositionManager
+
+
+@pytest.fixture
+def registry():
+    registry = MarketRegistry(cache_file='')
+    registry._markets = {
+        'upbit': {
+            'XRP/KRW': {'base': 'XRP', 'quote': 'KRW'},
+            'BTC/KRW': {'base': 'BTC', 'quote': 'KRW'},
+            'ONLYKR/KRW': {'base': 'ONLYKR', 'quote': 'KRW'},
+        },
+        'gateio': {
+            'XRP/USDT:USDT': {'underlying': 'XRP', 'contract_size': 10},
+            'BTC/USDT:USDT': {'underlying': 'BTC', 'contract_size': 0.0001},
+            'ONLYGATE/USDT:USDT': {'underlying': 'ONLYGATE', 'contract_size': 1},
+        },
+    }
+    return registry
+
+
+@pytest.fixture
+def exchanges():
+    korean = Mock()
+    korean.exchange_id = 'upbit'
+    korean.get_balances = Mock(return_value={
+        'XRP': {'free': 100.0, 'used': 0, 'total': 100.0},
+        'KRW': {'free': 1_000_000, 'used': 0, 'total': 1_000_000},
+    })
+    quotes = {
+        'USDT/KRW': {'bid': 1390.0, 'ask': 1400.0},
+        'XRP/KRW': {'bid': 700.0, 'ask': 701.0},
+    }
+    korean.get_best_bid_asks = Mock(side_effect=lambda symbols: {
+        symbol: quotes[symbol] for symbol in symbols if symbol in quotes
+    })
+
+    futures = Mock()
+    futures.exchange_id = 'gateio'
+    futures.get_positions = Mock(return_value=[
+        {'symbol': 'XRP/USDT:USDT', 'side': 'short', 'contracts': 10, 'notional': 50.0},
+    ])
+    return korean, futures
+
+
+class TestSymbolUniverse:
+    """공통 심볼 집합 테스트"""
+
+    def test_universe_is_intersection(self, registry):
+        assert registry.get_symbol_universe('upbit', 'gateio') == {'XRP', 'BTC'}
+
+    def test_universe_cache_invalidated_on_refresh(self, registry):
+        registry.get_symbol_universe('upbit', 'gateio')
+        exchange = Mock()
+        exchange.exchange_id = 'gateio'
+        exchange.fetch_markets = Mock(return_value={
+            'XRP/USDT:USDT': {'underlying': 'XRP', 'contract_size': 10},
+        })
+        registry.refresh(exchange)
+
+        assert registry.get_symbol_universe('upbit', 'gateio') == {'XRP'}
+
+    def test_add_symbols_uses_set_lookup(self, registry, exchanges):
+        korean, futures = exchanges
+        bot = HedgeBot(korean, futures, registry)
+        bot.position_balancer.rebalance_position = Mock(return_value=True)
+
+        added = bot.add_symbols(['XRP', 'BTC', 'ONLYKR'])
+
+        assert added == ['XRP', 'BTC']
+        # 심볼 검증 자체에는 시세 조회를 쓰지 않음 (BTC는 잔고가 없어 호가 조회도 없음)
+        korean.get_best_bid_asks.assert_called_once_with(['USDT/KRW', 'XRP/KRW'])
+        korean.get_ticker.assert_not_called()
+        futures.get_ticker.assert_not_called()
+        futures.get_best_bid_ask.assert_not_called()
+        korean.get_balances.assert_called_once()
+        futures.get_positions.assert_called_once()
+
+
+class TestBulkExistingPositions:
+    """기존 포지션 일괄 조회 테스트"""
+
+    def test_bulk_discovery_values(self, exchanges):
+        korean, futures = exchanges
+        values = PositionManager().get_existing_positions_bulk(['XRP', 'BTC'], korean, futures)
+
+        # 현물: 100 * 700 / 1400 = $50, 선물: $50
+        assert values['XRP'] == pytest.approx(50.0)
+        assert values['BTC'] == 0.0
+
+    def test_bulk_discovery_imbalance_takes_smaller(self, exchanges):
+        korean, futures = exchanges
+        futures.get_positions.return_value = [
+            {'symbol': 'XRP/USDT:USDT', 'side': 'short', 'contracts': 4, 'notional': 20.0},
+        ]
+        values = PositionManager().get_existing_positions_bulk(['XRP'], korean, futures)
+
+        assert values['XRP'] == pytest.approx(20.0)
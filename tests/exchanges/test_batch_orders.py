@@ -0,0 +1,146 @@
+"""
+선물 일괄 주문 (OrderBatcher + Gate.io create_batch_futures_order) 테스트
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from src.config import settings
+from src.core.execution_scheduler import ExecutionPriority
+from src.core.hedge_bot import HedgeBot
+from src.core.order_executor import OrderExecutor
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.order_batcher import OrderBatcher
+from src.exchanges.order_ids import OrderOutcomeUnknown
+from src.utils.deadline import deadline_scope
+from tests.exchanges.venue_stubs import GateStub
+
+CREDENTIALS = {'apiKey': 'key', 'secret': 'secret'}
+
+
+def _submit_concurrently(func, args_list):
+    with ThreadPoolExecutor(max_workers=len(args_list)) as executor:
+        return list(executor.map(lambda args: func(*args), args_list))
+
+
+class TestOrderBatcher:
+    """결정 창 안의 주문 수집"""
+
+    def test_concurrent_orders_share_one_batch(self):
+        calls = []
+
+        def submit_batch(intents):
+            calls.append(list(intents))
+            return [f"result-{intent}" for intent in intents]
+        batcher = OrderBatcher(submit_batch, window=0.2, max_size=10)
+
+        results = _submit_concurrently(batcher.submit, [('a',), ('b',), ('c',)])
+
+        assert results == ['result-a', 'result-b', 'result-c']
+        assert len(calls) == 1 and sorted(calls[0]) == ['a', 'b', 'c']
+
+    def test_full_batch_flushes_without_waiting(self):
+        batcher = OrderBatcher(lambda intents: list(intents), window=30, max_size=2)
+
+        results = _submit_concurrently(batcher.submit, [(1,), (2,)])
+
+        assert sorted(results) == [1, 2]
+
+    def test_failed_submission_returns_none(self):
+        def submit_batch(intents):
+            raise RuntimeError("boom")
+        batcher = OrderBatcher(submit_batch, window=0, max_size=10)
+
+        assert batcher.submit('a') is None
+
+
+class TestGateBatchOrders:
+    """Gate.io 배치 제출"""
+
+    def test_orders_batched_and_mapped_back(self):
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url, batch_window=0.2)
+            stub.reject_contracts.add('ADA_USDT')
+
+            results = _submit_concurrently(gate.create_contract_order, [
+                ('XRP/USDT:USDT', 'sell', 3), ('DOGE/USDT:USDT', 'sell', 5), ('ADA/USDT:USDT', 'buy', 2, True)
+            ])
+
+            assert stub.batches == [3]
+            xrp, doge, ada = results
+            assert xrp['symbol'] == 'XRP/USDT:USDT' and xrp['filled'] == 3
+            assert doge['symbol'] == 'DOGE/USDT:USDT' and doge['side'] == 'sell'
+            assert ada is None
+            assert stub.positions == {'XRP_USDT': -3, 'DOGE_USDT': -5}
+
+    def test_unanswered_batch_marks_each_legs_deadline(self, monkeypatch):
+        monkeypatch.setattr(settings, 'ORDER_LOOKUP_DELAY_SECONDS', 0.0)
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url, batch_window=0.2)
+            gate.futures_api.create_batch_futures_order = Mock(side_effect=OrderOutcomeUnknown('timeout'))
+            gate.futures_api.get_futures_order = Mock(side_effect=RuntimeError('503'))
+
+            def leg(symbol):
+                with deadline_scope(5) as deadline:
+                    return gate.create_contract_order(symbol, 'sell', 3), deadline.unknown_orders
+
+            results = _submit_concurrently(leg, [('XRP/USDT:USDT',), ('DOGE/USDT:USDT',)])
+
+        # 배치를 제출한 스레드가 아니라 주문을 넣은 각 스레드의 데드라인에 결과 미확인 기록
+        (xrp, xrp_unknown), (doge, doge_unknown) = results
+        assert xrp is None and doge is None
+        assert len(xrp_unknown) == 1 and 'XRP_USDT' in xrp_unknown[0]
+        assert len(doge_unknown) == 1 and 'DOGE_USDT' in doge_unknown[0]
+
+    def test_single_request_path_when_disabled(self):
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url, batch_window=0)
+
+            gate.create_contract_order('XRP/USDT:USDT', 'sell', 3)
+
+            assert stub.batches == []
+            assert len(stub.orders) == 1
+
+
+class TestConcurrentCycle:
+    """배치 사용 시 사이클: 판단은 순서대로, 주문 작업은 동시 실행"""
+
+    def test_decisions_sequential_orders_concurrent(self, monkeypatch):
+        monkeypatch.setattr(settings, 'FUTURES_BATCH_ENABLED', True)
+        bot = HedgeBot(Mock(), Mock())
+        bot.symbols = ['XRP', 'DOGE']
+        decided = []
+        barrier = threading.Barrier(2, timeout=2)
+
+        def process_symbol(symbol):
+            decided.append((symbol, threading.current_thread() is threading.main_thread()))
+            bot._schedule(symbol, ExecutionPriority.BUILD, barrier.wait)
+        bot.process_symbol = process_symbol
+
+        assert bot.run_cycle()
+
+        assert decided == [('XRP', True), ('DOGE', True)]
+        assert not barrier.broken
+
+    def test_concurrent_entries_reserve_krw(self):
+        korean, futures = Mock(), Mock()
+        korean.get_balance.return_value = {'free': 100_000}
+        futures.get_balance.return_value = {'free': 1_000}
+        executor = OrderExecutor(korean, futures)
+        barrier = threading.Barrier(2, timeout=2)
+
+        def enter(_):
+            with executor.reserve_balances(70_000, 50) as reserved:
+                barrier.wait()  # 두 주문이 동시에 진행 중
+                return reserved
+
+        assert sorted(_submit_concurrently(enter, [(0,), (1,)])) == [False, True]
+        with executor.reserve_balances(70_000, 50) as reserved:
+            assert reserved  # 끝난 주문의 예약은 해제
+
+    def test_failure_counts_not_lost(self):
+        bot = HedgeBot(Mock(), Mock())
+
+        _submit_concurrently(bot._handle_failure, [('XRP',)] * 16)
+
+        assert bot.failed_attempts == {'XRP': 16}
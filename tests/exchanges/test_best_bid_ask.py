@@ -0,0 +1,136 @@
+"""
+최우선 호가 조회 (get_best_bid_ask / get_best_bid_asks) 테스트
+"""
+import json
+from unittest.mock import ANY, Mock
+
+from src.exchanges.bithumb import BithumbExchange
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.upbit import UpbitExchange
+
+
+def _response(payload, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.json = Mock(return_value=payload)
+    return response
+
+
+class TestUpbitBestBidAsk:
+    """업비트: orderbook 1회 요청"""
+
+    def test_single_request(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.return_value = _response([
+            {'market': 'KRW-XRP', 'orderbook_units': [
+                {'bid_price': 700.0, 'ask_price': 701.0, 'bid_size': 1200.5, 'ask_size': 800.0}
+            ]},
+        ])
+
+        quote = exchange.get_best_bid_ask('XRP/KRW')
+
+        assert quote == {
+            'symbol': 'XRP/KRW', 'bid': 700.0, 'ask': 701.0, 'bid_size': 1200.5, 'ask_size': 800.0,
+            'timestamp': ANY, 'quote_time': ANY
+        }
+        assert exchange.session.get.call_count == 1
+        assert exchange.session.get.call_args[0][0].endswith('/v1/orderbook')
+
+    def test_batch_uses_one_request(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.return_value = _response([
+            {'market': 'KRW-XRP', 'orderbook_units': [{'bid_price': 700.0, 'ask_price': 701.0}]},
+            {'market': 'KRW-USDT', 'orderbook_units': [{'bid_price': 1390.0, 'ask_price': 1400.0}]},
+        ])
+
+        quotes = exchange.get_best_bid_asks(['XRP/KRW', 'USDT/KRW'])
+
+        assert quotes['USDT/KRW']['ask'] == 1400.0
+        assert quotes['XRP/KRW']['bid'] == 700.0
+        assert exchange.session.get.call_args[1]['params'] == {'markets': 'KRW-XRP,KRW-USDT'}
+
+    def test_error_returns_none(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.return_value = _response([], status_code=500)
+
+        assert exchange.get_best_bid_ask('XRP/KRW') is None
+
+
+class TestBithumbBestBidAsk:
+    """빗썸: depth 1 orderbook 요청"""
+
+    def test_single_request_depth_one(self):
+        exchange = BithumbExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.return_value = _response({'status': '0000', 'data': {
+            'bids': [{'price': '700', 'quantity': '1'}], 'asks': [{'price': '701', 'quantity': '2.5'}]
+        }})
+
+        quote = exchange.get_best_bid_ask('XRP/KRW')
+
+        assert quote == {'symbol': 'XRP/KRW', 'bid': 700.0, 'ask': 701.0, 'bid_size': 1.0, 'ask_size': 2.5,
+                         'timestamp': ANY, 'quote_time': ANY}
+        url = exchange.session.get.call_args[0][0]
+        assert url.endswith('/orderbook/XRP_KRW')
+        assert exchange.session.get.call_args[1]['params'] == {'count': 1}
+
+    def test_batch_uses_all_market_request(self):
+        exchange = BithumbExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.return_value = _response({'status': '0000', 'data': {
+            'timestamp': '1700000000000',
+            'payment_currency': 'KRW',
+            'XRP': {'bids': [{'price': '700'}], 'asks': [{'price': '701'}]},
+            'USDT': {'bids': [{'price': '1390'}], 'asks': [{'price': '1400'}]},
+        }})
+
+        quotes = exchange.get_best_bid_asks(['XRP/KRW', 'USDT/KRW', 'NONE/KRW'])
+
+        assert exchange.session.get.call_count == 1
+        assert exchange.session.get.call_args[0][0].endswith('/orderbook/ALL_KRW')
+        assert quotes['USDT/KRW']['ask'] == 1400.0
+        assert 'NONE/KRW' not in quotes
+
+    def test_one_sided_book_is_no_quote(self):
+        exchange = BithumbExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.return_value = _response({'status': '0000', 'data': {
+            'bids': [{'price': '700', 'quantity': '1'}], 'asks': []
+        }})
+
+        assert exchange.get_best_bid_ask('XRP/KRW') is None
+
+        exchange.session.get.return_value = _response({'status': '0000', 'data': {
+            'XRP': {'bids': [], 'asks': [{'price': '701'}]},
+            'USDT': {'bids': [{'price': '1390'}], 'asks': [{'price': '1400'}]},
+        }})
+
+        assert list(exchange.get_best_bid_asks(['XRP/KRW', 'USDT/KRW'])) == ['USDT/KRW']
+
+
+class TestGateIOBestBidAsk:
+    """Gate.io: 티커 1회 요청"""
+
+    def test_single_and_batch(self):
+        registry = Mock()
+        registry.get_markets.return_value = {'XRP/USDT:USDT': {'contract_size': 10}}
+        exchange = GateIOExchange({'apiKey': 'key', 'secret': 'secret'}, market_registry=registry)
+        exchange.rest.get = Mock(return_value=json.dumps([
+            {'contract': 'XRP_USDT', 'last': '0.5', 'highest_bid': '0.4999', 'lowest_ask': '0.5001',
+             'highest_size': '120', 'lowest_size': '80'},
+            {'contract': 'BTC_USDT', 'last': '60000', 'highest_bid': '59999', 'lowest_ask': '60001'},
+        ]).encode())
+
+        quotes = exchange.get_best_bid_asks(['XRP/USDT:USDT', 'BTC/USDT:USDT'])
+
+        assert exchange.rest.get.call_count == 1
+        assert quotes['BTC/USDT:USDT'] == {
+            'symbol': 'BTC/USDT:USDT', 'bid': 59999.0, 'ask': 60001.0, 'bid_size': 0.0, 'ask_size': 0.0,
+            'timestamp': ANY, 'quote_time': ANY
+        }
+        # 호가 잔량은 계약 수 x 계약 크기 (코인 개수)
+        assert quotes['XRP/USDT:USDT']['bid_size'] == 1200
+        assert quotes['XRP/USDT:USDT']['ask_size'] == 800
@@ -0,0 +1,71 @@
+"""
+빗썸 비공개 요청 nonce 테스트
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.exchanges.bithumb import BithumbExchange
+from src.utils.nonce import NonceGenerator
+from tests.exchanges.venue_stubs import BithumbStub
+
+SECRET = 'bithumb-secret'
+
+
+class TestNonceGenerator:
+    """엄격히 증가하는 nonce"""
+
+    def test_same_millisecond_still_increases(self):
+        generator = NonceGenerator(wall_clock=lambda: 1_700_000_000.0, monotonic=lambda: 5.0)
+
+        assert [generator.next() for _ in range(3)] == [1_700_000_000_000, 1_700_000_000_001, 1_700_000_000_002]
+
+    def test_wall_clock_jump_back_ignored(self):
+        wall = [1_700_000_000.0]
+        monotonic = [0.0]
+        generator = NonceGenerator(wall_clock=lambda: wall[0], monotonic=lambda: monotonic[0])
+        first = generator.next()
+
+        wall[0] -= 60  # 시스템 시계 뒤로 조정
+        monotonic[0] += 0.010
+
+        assert generator.next() == first + 10
+
+    def test_unique_across_threads(self):
+        generator = NonceGenerator(monotonic=lambda: 0.0)  # 시계가 멈춰도 겹치지 않아야 함
+        start = threading.Barrier(8)
+
+        def draw():
+            start.wait()
+            return [generator.next() for _ in range(500)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            batches = list(executor.map(lambda _: draw(), range(8)))
+
+        nonces = [nonce for batch in batches for nonce in batch]
+        assert len(set(nonces)) == len(nonces)
+        assert all(batch == sorted(batch) for batch in batches)
+
+
+class TestBithumbConcurrentPrivateCalls:
+    """동시 비공개 요청 스트레스 테스트 (로컬 스텁이 nonce/서명 검증)"""
+
+    def test_concurrent_calls_never_reuse_nonce(self):
+        with BithumbStub(SECRET) as stub:
+            # 거래소 인스턴스가 여러 개여도 nonce는 공유
+            exchanges = [BithumbExchange('key', SECRET) for _ in range(2)]
+            for exchange in exchanges:
+                exchange.private_api_url = stub.url
+            start = threading.Barrier(16)
+
+            def hammer(index):
+                start.wait()
+                exchange = exchanges[index % 2]
+                return [exchange.get_balance('XRP')['total'] for _ in range(25)]
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(hammer, range(16)))
+
+        assert stub.rejected == []
+        assert all(total == 100.0 for batch in results for total in batch)
+        assert len(stub.nonces) == 16 * 25
+        assert len(set(stub.nonces)) == len(stub.nonces)
@@ -0,0 +1,211 @@
+"""
+거래소 시계 오프셋 추정 / 호가 나이 테스트
+"""
+from datetime import timedelta
+from email.utils import formatdate
+from unittest.mock import Mock
+
+import pytest
+
+from src.config import settings
+from src.core.hedge_bot import HedgeBot
+from src.core.premium_calculator import PremiumCalculator
+from src.exchanges.clock_sync import MAX_CLOCK_DRIFT, ClockSync, clock_sync
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.multi_venue import MultiVenueSpotExchange
+from src.exchanges.upbit import UpbitExchange
+from tests.exchanges.venue_stubs import GateStub
+
+
+@pytest.fixture(autouse=True)
+def clean_clock_sync():
+    clock_sync.reset()
+    yield
+    clock_sync.reset()
+
+
+class TestClockSync:
+    """오프셋 추정"""
+
+    def test_offset_from_round_trip_midpoint(self):
+        sync = ClockSync(clock=lambda: 100.2)
+        # 로컬 100.0에 보내고 100.2에 받음, 서버는 중간(100.1)에 100.6을 응답 → 오프셋 +0.5
+        sync.record('gateio', 100.6, 100.0, 100.2)
+
+        assert sync.offset('gateio') == pytest.approx(0.5)
+        assert sync.best_sample('gateio').uncertainty == pytest.approx(0.1)
+
+    def test_lowest_uncertainty_sample_wins(self):
+        sync = ClockSync()
+        sync.record('upbit', 1000.0, 990.0, 1000.0)  # 왕복 10초 - 부정확
+        sync.record('upbit', 2000.3, 2000.0, 2000.02)
+        sync.record('upbit', 3000.0, 2999.0, 3000.0, resolution=1.0)
+
+        assert sync.offset('upbit') == pytest.approx(0.29)
+
+    def test_date_header_sample(self):
+        now = [1_700_000_000.4]
+        sync = ClockSync(clock=lambda: now[0])
+        response = Mock(headers={'Date': formatdate(1_700_000_002, usegmt=True)},
+                        elapsed=timedelta(milliseconds=200))
+
+        sync.response_hook('upbit')(response)
+
+        # 서버 시각은 초 단위 내림 → 2.5초 중간값, 로컬 중간값 0.3초 → 오프셋 +2.2초 (±0.6초)
+        sample = sync.best_sample('upbit')
+        assert sample.offset == pytest.approx(2.2)
+        assert sample.uncertainty == pytest.approx(0.6)
+
+    def test_quote_age_uses_exchange_time(self):
+        now = [5000.0]
+        sync = ClockSync(clock=lambda: now[0])
+        sync.record('bithumb', 5003.0, 5000.0, 5000.0)  # 거래소 시계가 3초 빠름
+
+        quote = sync.stamp('bithumb', {'bid': 1.0, 'ask': 1.1}, exchange_ms=5002_500)
+
+        assert quote['quote_time'] == pytest.approx(4999.5)
+        assert sync.quote_age(quote) == pytest.approx(0.5)
+
+    def test_old_sample_loses_to_fresh_one_as_clocks_drift(self):
+        now = [1000.0]
+        sync = ClockSync(clock=lambda: now[0])
+        sync.record('gateio', 1000.5, 1000.0, 1000.0)  # 정확한 표본
+        now[0] = 1000.0 + 0.1 / MAX_CLOCK_DRIFT
+        sync.record('gateio', now[0] + 0.8, now[0] - 0.04, now[0])  # 불확실성 0.02초
+
+        assert sync.uncertainty('gateio') == pytest.approx(0.02)
+        assert sync.offset('gateio') == pytest.approx(0.82)
+        assert sync.last_sample_at('gateio') == now[0]
+
+    def test_converted_quote_carries_offset_error(self):
+        now = [5000.0]
+        sync = ClockSync(clock=lambda: now[0])
+        sync.record('upbit', 5003.0, 4999.8, 5000.0, resolution=1.0)
+
+        converted = sync.stamp('upbit', {'bid': 1.0, 'ask': 1.1}, exchange_ms=5003_000)
+        received = sync.stamp('upbit', {'bid': 1.0, 'ask': 1.1})
+
+        assert converted['quote_time_error'] == pytest.approx(0.6)
+        assert 'quote_time_error' not in received
+
+    def test_unstamped_quote_has_no_age(self):
+        assert clock_sync.quote_age({'bid': 1.0, 'ask': 1.1}) is None
+
+
+class TestExchangeQuotes:
+    """거래소 호가에 시각 기록"""
+
+    def test_upbit_orderbook_timestamp(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.return_value = Mock(status_code=200, json=Mock(return_value=[{
+            'market': 'KRW-XRP', 'timestamp': 1_700_000_000_000,
+            'orderbook_units': [{'bid_price': 699, 'ask_price': 700, 'bid_size': 1, 'ask_size': 2}]
+        }]))
+
+        quote = exchange.get_best_bid_ask('XRP/KRW')
+
+        assert quote['timestamp'] == 1_700_000_000_000
+        assert quote['quote_time'] == pytest.approx(1_700_000_000.0)
+
+    def test_gate_sync_clock_and_receipt_stamp(self):
+        with GateStub() as stub:
+            stub.clock_offset = 5.0
+            gate = GateIOExchange({'apiKey': 'key', 'secret': 'secret'}, host=stub.url)
+
+            assert gate.sync_clock()
+            quote = gate.get_best_bid_ask('XRP/USDT:USDT')
+
+        assert clock_sync.offset('gateio') == pytest.approx(5.0, abs=0.1)
+        assert clock_sync.quote_age(quote) < 1.0
+
+    def test_merged_quote_keeps_oldest_time(self):
+        quotes = [
+            {'bid': 699.0, 'ask': 700.0, 'timestamp': 2000, 'quote_time': 2.0},
+            {'bid': 698.0, 'ask': 701.0, 'timestamp': 1000, 'quote_time': 1.0, 'quote_time_error': 0.6},
+        ]
+
+        merged = MultiVenueSpotExchange._merge_quotes('XRP/KRW', quotes)
+
+        assert (merged['timestamp'], merged['quote_time']) == (1000, 1.0)
+        assert merged['quote_time_error'] == 0.6
+
+
+class TestStaleQuoteGuard:
+    """오래된 호가로는 프리미엄 계산 안 함"""
+
+    def _calculator(self, futures_quote_time, korean_quote=None):
+        now = clock_sync.clock()
+        korean = Mock()
+        korean.get_best_bid_ask.side_effect = lambda symbol: (
+            {'bid': 1399.0, 'ask': 1400.0, 'quote_time': now} if symbol == 'USDT/KRW'
+            else {'bid': 699.0, 'ask': 700.0, 'quote_time': now, **(korean_quote or {})}
+        )
+        futures = Mock()
+        futures.get_best_bid_ask.return_value = {'bid': 0.5, 'ask': 0.5001, 'quote_time': futures_quote_time(now)}
+        return PremiumCalculator(korean, futures)
+
+    def test_fresh_quotes_give_premium(self):
+        assert self._calculator(lambda now: now - 0.1).calculate('XRP') is not None
+
+    def test_stale_leg_refused(self):
+        calculator = self._calculator(lambda now: now - settings.MAX_QUOTE_AGE_SECONDS - 1)
+
+        assert calculator.calculate('XRP') is None
+
+    def test_guard_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, 'MAX_QUOTE_AGE_SECONDS', 0)
+        calculator = self._calculator(lambda now: now - 60)
+
+        assert calculator.calculate('XRP') is not None
+
+    def test_budget_widened_by_offset_error(self):
+        # Date 헤더로 환산한 호가 - 제한보다 0.4초 오래돼 보여도 오프셋 오차(±0.6초) 안
+        calculator = self._calculator(lambda now: now, {
+            'quote_time': clock_sync.clock() - settings.MAX_QUOTE_AGE_SECONDS - 0.4, 'quote_time_error': 0.6
+        })
+
+        assert calculator.calculate('XRP') is not None
+
+    def test_stale_beyond_offset_error_refused(self):
+        calculator = self._calculator(lambda now: now, {
+            'quote_time': clock_sync.clock() - settings.MAX_QUOTE_AGE_SECONDS - 1, 'quote_time_error': 0.6
+        })
+
+        assert calculator.calculate('XRP') is None
+
+
+class TestPeriodicClockSync:
+    """시작 후에도 주기적으로 서버 시각 재측정"""
+
+    def _bot(self, monkeypatch, now):
+        monkeypatch.setattr(clock_sync, 'clock', lambda: now[0])
+        korean, futures = Mock(exchange_id='upbit'), Mock(exchange_id='gateio')
+        return HedgeBot(korean, futures), futures
+
+    def test_resync_after_interval(self, monkeypatch):
+        now = [1000.0]
+        bot, futures = self._bot(monkeypatch, now)
+
+        bot.run_cycle()
+        futures.sync_clock.assert_not_called()
+
+        now[0] += settings.CLOCK_SYNC_INTERVAL_SECONDS
+        bot.run_cycle()
+        bot.run_cycle()
+
+        futures.sync_clock.assert_called_once()
+        bot.korean_exchange.sync_clock.assert_called_once()
+
+    def test_sync_failure_does_not_stop_cycle(self, monkeypatch):
+        now = [1000.0]
+        bot, futures = self._bot(monkeypatch, now)
+        futures.sync_clock.side_effect = RuntimeError('down')
+        bot.process_symbol = Mock()
+        bot.symbols = ['XRP']
+
+        now[0] += settings.CLOCK_SYNC_INTERVAL_SECONDS
+        bot.run_cycle()
+
+        bot.process_symbol.assert_called_once_with('XRP')
+        bot.korean_exchange.sync_clock.assert_called_once()
@@ -0,0 +1,156 @@
+"""
+거래소 서킷 브레이커 / 상태 테스트
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from src.config import settings
+from src.core.execution_scheduler import ExecutionPriority
+from src.core.hedge_bot import HedgeBot
+from src.exchanges import health
+from src.exchanges.health import CircuitBreaker, CircuitOpenError, CircuitState, ExchangeHealth, exchange_health
+from src.exchanges.upbit import UpbitExchange
+
+
+@pytest.fixture(autouse=True)
+def clean_health():
+    exchange_health.reset()
+    yield
+    exchange_health.reset()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(settings.CIRCUIT_MIN_CALLS):
+        breaker.record(True, 0.01)
+
+
+class TestCircuitBreaker:
+    """closed → open → half_open → closed 전환"""
+
+    def test_opens_on_error_rate(self):
+        breaker = CircuitBreaker('bithumb/quote')
+        for _ in range(settings.CIRCUIT_MIN_CALLS - 1):
+            breaker.record(True, 0.01)
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record(True, 0.01)
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_opens_on_slow_calls(self):
+        breaker = CircuitBreaker('gateio/quote')
+        for _ in range(settings.CIRCUIT_MIN_CALLS):
+            breaker.record(False, settings.CIRCUIT_SLOW_CALL_SECONDS + 1)
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_probes_close_circuit(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker('upbit/quote', clock)
+        _trip(breaker)
+        clock.now += settings.CIRCUIT_OPEN_SECONDS
+
+        for _ in range(settings.CIRCUIT_HALF_OPEN_PROBES):
+            assert breaker.allow()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.allow()  # 시험 요청 수 초과
+
+        for _ in range(settings.CIRCUIT_HALF_OPEN_PROBES):
+            breaker.record(False, 0.01)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker('upbit/quote', clock)
+        _trip(breaker)
+        clock.now += settings.CIRCUIT_OPEN_SECONDS
+
+        assert breaker.allow()
+        breaker.record(True, 0.01)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.opened_at == clock.now
+
+
+class TestExchangeHealth:
+    """그룹별 차단 / 오류 분류"""
+
+    def test_open_quote_group_fails_fast(self):
+        registry = ExchangeHealth()
+        _trip(registry.breaker('bithumb', health.QUOTE))
+        send = Mock()
+
+        with pytest.raises(CircuitOpenError):
+            registry.call('bithumb', health.QUOTE, send)
+        send.assert_not_called()
+        assert registry.is_degraded('bithumb')
+        assert not registry.is_degraded('upbit')
+
+    def test_orders_never_blocked(self):
+        registry = ExchangeHealth()
+        _trip(registry.breaker('gateio', health.ORDER))
+
+        assert registry.call('gateio', health.ORDER, lambda: 'filled') == 'filled'
+
+    def test_business_errors_not_counted(self):
+        registry = ExchangeHealth()
+        error = Exception('INSUFFICIENT_AVAILABLE')
+        error.status = 400
+
+        for _ in range(settings.CIRCUIT_MIN_CALLS):
+            with pytest.raises(Exception):
+                registry.call('gateio', health.ORDER, Mock(side_effect=error))
+
+        assert registry.snapshot()['gateio']['order']['error_rate'] == 0.0
+
+    def test_session_adapter_records_5xx(self):
+        exchange = UpbitExchange('key', 'secret')
+        with patch.object(HTTPAdapter, 'send', return_value=Mock(status_code=503, text='busy')):
+            for _ in range(settings.CIRCUIT_MIN_CALLS):
+                exchange.get_best_bid_asks(['XRP/KRW'])
+
+        assert exchange_health.snapshot()['upbit']['quote']['state'] == 'open'
+        with patch.object(HTTPAdapter, 'send') as send:
+            assert exchange.get_best_bid_asks(['XRP/KRW']) == {}
+        send.assert_not_called()
+
+
+class TestHedgeBotDegradedVenue:
+    """상태 저하 거래소: 신규 진입 보류, 청산 허용"""
+
+    def _bot(self, premium: float, position_value: float):
+        korean, futures = Mock(), Mock()
+        korean.exchange_id, futures.exchange_id = 'bithumb', 'gateio'
+        bot = HedgeBot(korean, futures)
+        bot.premium_calculator.calculate = Mock(return_value=premium)
+        bot.position_manager.update_position('XRP', position_value)
+        bot._schedule = Mock(return_value=True)
+        bot.timer_manager.check_profit_taking = Mock(return_value=(100, 100))
+        return bot
+
+    def test_entry_skipped_on_degraded_venue(self):
+        bot = self._bot(premium=-1.0, position_value=0.0)
+        _trip(exchange_health.breaker('bithumb', health.QUOTE))
+
+        bot.process_symbol('XRP')
+
+        bot._schedule.assert_not_called()
+        assert bot.get_health()['bithumb']['quote']['state'] == 'open'
+
+    def test_exit_allowed_on_degraded_venue(self):
+        bot = self._bot(premium=120.0, position_value=500.0)
+        _trip(exchange_health.breaker('gateio', health.ORDER))
+
+        bot.process_symbol('XRP')
+
+        assert bot._schedule.call_args[0][1] == ExecutionPriority.CLOSE_ALL
@@ -0,0 +1,97 @@
+"""
+Gate.io REST fast path 테스트
+"""
+import json
+from unittest.mock import Mock
+
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.gateio_rest import GateRestClient, parse_positions, parse_tickers
+
+TICKERS = [
+    {'contract': 'XRP_USDT', 'last': '0.5', 'highest_bid': '0.4999', 'lowest_ask': '0.5001',
+     'mark_price': '0.5', 'high_24h': '0.52', 'low_24h': '0.48', 'volume_24h': '12345'},
+    {'contract': 'GNO_USDT', 'last': '150', 'highest_bid': '', 'lowest_ask': '',
+     'mark_price': '150.1', 'high_24h': '155', 'low_24h': '149', 'volume_24h': '10'},
+]
+
+POSITIONS = [
+    {'contract': 'XRP_USDT', 'size': -20, 'value': '10.0', 'mark_price': '0.5',
+     'entry_price': '0.51', 'mode': 'single'},
+    {'contract': 'BTC_USDT', 'size': 0, 'value': '0', 'mark_price': '60000',
+     'entry_price': '', 'mode': 'single'},
+]
+
+
+def _exchange():
+    exchange = GateIOExchange({'apiKey': 'key', 'secret': 'secret'}, market_registry=Mock())
+    exchange.rest.get = Mock()
+    return exchange
+
+
+class TestParsing:
+    """응답 파싱 테스트"""
+
+    def test_parse_tickers(self):
+        rows = parse_tickers(json.dumps(TICKERS).encode())
+
+        assert rows[0].contract == 'XRP_USDT'
+        assert rows[0].bid == 0.4999
+        assert rows[0].ask == 0.5001
+        assert rows[1].bid is None
+        assert rows[1].mark == 150.1
+
+    def test_parse_positions(self):
+        rows = parse_positions(json.dumps(POSITIONS).encode())
+
+        assert rows[0].size == -20
+        assert rows[0].value == 10.0
+        assert rows[1].entry == 0.0
+
+    def test_signed_request_headers(self):
+        client = GateRestClient('key', 'secret')
+        headers = client._sign_headers('GET', '/api/v4/futures/usdt/positions', '')
+
+        assert headers['KEY'] == 'key'
+        assert len(headers['SIGN']) == 128
+        assert headers['Timestamp'].isdigit()
+
+
+class TestGateIOFastPath:
+    """GateIOExchange가 raw JSON 경로를 사용하는지 테스트"""
+
+    def test_get_ticker(self):
+        exchange = _exchange()
+        exchange.rest.get.return_value = json.dumps(TICKERS[:1]).encode()
+
+        ticker = exchange.get_ticker('XRP/USDT:USDT')
+
+        assert ticker['bid'] == 0.4999
+        assert ticker['ask'] == 0.5001
+        exchange.rest.get.assert_called_once_with('/futures/usdt/tickers', {'contract': 'XRP_USDT'})
+
+    def test_get_tickers_single_request(self):
+        exchange = _exchange()
+        exchange.rest.get.return_value = json.dumps(TICKERS).encode()
+
+        tickers = exchange.get_tickers(['GNO/USDT:USDT'])
+
+        assert list(tickers) == ['GNO/USDT:USDT']
+        assert exchange.rest.get.call_count == 1
+
+    def test_get_positions_skips_empty(self):
+        exchange = _exchange()
+        exchange.rest.get.return_value = json.dumps(POSITIONS).encode()
+
+        positions = exchange.get_positions()
+
+        assert len(positions) == 1
+        assert positions[0]['symbol'] == 'XRP/USDT:USDT'
+        assert positions[0]['side'] == 'short'
+        assert positions[0]['contracts'] == 20
+        assert positions[0]['notional'] == 10.0
+
+    def test_get_ticker_error_returns_none(self):
+        exchange = _exchange()
+        exchange.rest.get.side_effect = Exception("timeout")
+
+        assert exchange.get_ticker('XRP/USDT:USDT') is None
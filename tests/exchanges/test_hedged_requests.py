@@ -0,0 +1,103 @@
+"""
+공개 시세 GET 헤지 요청 테스트
+"""
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.config import settings
+from src.exchanges.upbit import UpbitExchange
+from src.utils.hedged_request import MIN_LATENCY_SAMPLES, HedgedRequester
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(settings, 'HEDGED_REQUESTS_ENABLED', True)
+    monkeypatch.setattr(settings, 'HEDGED_REQUEST_MAX_RATIO', 1.0)
+
+
+def _warm(requester: HedgedRequester, endpoint: str, latency: float = 0.01) -> None:
+    """p90 계산용 지연 표본 채우기"""
+    for _ in range(MIN_LATENCY_SAMPLES):
+        requester.get(endpoint, lambda: time.sleep(latency))
+
+
+class TestHedgedRequester:
+    """헤지 타이밍 / 예산 / 통계"""
+
+    def test_disabled_runs_inline(self):
+        requester = HedgedRequester('upbit')
+        caller = threading.get_ident()
+
+        assert requester.get('/v1/orderbook', threading.get_ident) == caller
+        assert requester.stats == {}
+
+    def test_no_hedge_until_enough_samples(self, enabled):
+        requester = HedgedRequester('upbit')
+        send = Mock(side_effect=lambda: time.sleep(0.05) or 'ok')
+
+        assert requester.get('/v1/orderbook', send) == 'ok'
+        assert requester.hedge_delay('/v1/orderbook') is None
+        assert send.call_count == 1
+
+    def test_slow_primary_hedged_and_hedge_wins(self, enabled):
+        requester = HedgedRequester('upbit')
+        _warm(requester, '/v1/orderbook')
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(1.0)  # 꼬리 지연
+                return 'primary'
+            return 'hedge'
+
+        started = time.monotonic()
+        assert requester.get('/v1/orderbook', send) == 'hedge'
+        assert time.monotonic() - started < 0.5
+
+        stats = requester.stats['/v1/orderbook']
+        assert (stats.hedged, stats.hedge_wins) == (1, 1)
+
+    def test_failed_hedge_falls_back_to_primary(self, enabled):
+        requester = HedgedRequester('bithumb')
+        _warm(requester, 'orderbook')
+        calls = []
+
+        def send():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                return 'primary'
+            raise ConnectionError('reset')
+
+        assert requester.get('orderbook', send) == 'primary'
+        assert requester.stats['orderbook'].hedge_wins == 0
+
+    def test_budget_caps_duplicates(self, enabled, monkeypatch):
+        requester = HedgedRequester('upbit')
+        _warm(requester, '/v1/ticker')
+        monkeypatch.setattr(settings, 'HEDGED_REQUEST_MAX_RATIO', 0.0)
+        send = Mock(side_effect=lambda: time.sleep(0.1) or 'ok')
+
+        assert requester.get('/v1/ticker', send) == 'ok'
+        assert send.call_count == 1
+        assert requester.stats['/v1/ticker'].budget_skips == 1
+
+
+class TestExchangeUsage:
+    """공개 시세만 헤지, 주문은 복제하지 않음"""
+
+    def test_upbit_orders_never_hedged(self, enabled):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.return_value = Mock(status_code=200, json=Mock(return_value=[]))
+        exchange.session.post.return_value = Mock(status_code=201, json=Mock(return_value={'uuid': 'u-1'}))
+
+        exchange.get_best_bid_asks(['XRP/KRW'])
+        exchange._api_call('POST', '/v1/orders', {'market': 'KRW-XRP'})
+
+        assert list(exchange.hedged_requests.stats) == ['/v1/orderbook']
+        assert exchange.session.post.call_count == 1
@@ -0,0 +1,100 @@
+"""
+마켓 레지스트리 테스트 (네트워크 없이 가짜 거래소 사용)
+"""
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.exchanges.market_registry import MarketRegistry, CACHE_VERSION
+
+
+def _fake_exchange(exchange_id='gateio', markets=None):
+    exchange = Mock()
+    exchange.exchange_id = exchange_id
+    exchange.fetch_markets = Mock(return_value=markets or {
+        'XRP/USDT:USDT': {'name': 'XRP_USDT', 'contract_size': 10.0, 'underlying': 'XRP'}
+    })
+    return exchange
+
+
+class TestMarketRegistry:
+    """MarketRegistry 테스트"""
+
+    def test_load_without_cache_downloads_and_persists(self, tmp_path):
+        cache_file = tmp_path / 'markets.json'
+        registry = MarketRegistry(str(cache_file), ttl_minutes=60)
+        exchange = _fake_exchange()
+
+        registry.load([exchange])
+
+        exchange.fetch_markets.assert_called_once()
+        assert registry.get_market('gateio', 'XRP/USDT:USDT')['contract_size'] == 10.0
+        saved = json.loads(cache_file.read_text())
+        assert 'XRP/USDT:USDT' in saved['exchanges']['gateio']['markets']
+
+    def test_fresh_cache_skips_network(self, tmp_path):
+        cache_file = tmp_path / 'markets.json'
+        MarketRegistry(str(cache_file), ttl_minutes=60).load([_fake_exchange()])
+
+        exchange = _fake_exchange()
+        registry = MarketRegistry(str(cache_file), ttl_minutes=60)
+        registry.load([exchange])
+
+        exchange.fetch_markets.assert_not_called()
+        assert not registry.is_stale('gateio')
+        assert registry.get_markets('gateio')['XRP/USDT:USDT']['underlying'] == 'XRP'
+
+    def test_stale_cache_refreshes_in_background(self, tmp_path):
+        cache_file = tmp_path / 'markets.json'
+        cache_file.write_text(json.dumps({
+            'version': CACHE_VERSION,
+            'exchanges': {'gateio': {
+                'saved_at': time.time() - 7200,
+                'markets': {'OLD/USDT:USDT': {'contract_size': 1}}
+            }}
+        }))
+        exchange = _fake_exchange()
+        registry = MarketRegistry(str(cache_file), ttl_minutes=60)
+
+        registry.load([exchange])
+
+        for _ in range(100):
+            if registry.get_market('gateio', 'XRP/USDT:USDT'):
+                break
+            time.sleep(0.01)
+        assert registry.get_market('gateio', 'XRP/USDT:USDT') is not None
+        assert not registry.is_stale('gateio')
+
+    def test_failed_refresh_keeps_previous_markets(self, tmp_path):
+        registry = MarketRegistry(str(tmp_path / 'markets.json'))
+        exchange = _fake_exchange()
+        registry.refresh(exchange)
+
+        exchange.fetch_markets.side_effect = Exception("network down")
+        assert registry.refresh(exchange) is False
+        assert registry.get_market('gateio', 'XRP/USDT:USDT') is not None
+
+    def test_refresh_limits_merges_and_survives_refresh(self, tmp_path):
+        registry = MarketRegistry(str(tmp_path / 'markets.json'))
+        exchange = _fake_exchange('upbit', {'XRP/KRW': {'base': 'XRP', 'min_order_krw': 5000.0}})
+        exchange.fetch_order_limits = Mock(return_value={'min_order_krw': 5500.0})
+        registry.refresh(exchange)
+
+        registry.refresh_limits(exchange, ['XRP/KRW', 'NONE/KRW'])
+        assert registry.get_market('upbit', 'XRP/KRW')['min_order_krw'] == 5500.0
+
+        exchange.fetch_markets.return_value = {'XRP/KRW': {'base': 'XRP', 'min_order_krw': 5000.0}}
+        registry.refresh(exchange)
+        assert registry.get_market('upbit', 'XRP/KRW')['min_order_krw'] == 5500.0
+        exchange.fetch_order_limits.assert_called_once_with('XRP/KRW')
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        cache_file = tmp_path / 'markets.json'
+        cache_file.write_text('{not json')
+        exchange = _fake_exchange()
+        registry = MarketRegistry(str(cache_file))
+
+        registry.load([exchange])
+        exchange.fetch_markets.assert_called_once()
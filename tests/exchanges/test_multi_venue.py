@@ -0,0 +1,148 @@
+"""
+다중 선물 거래소 헤지 분할 테스트 (Binance 어댑터 + 로컬 스텁 서버)
+"""
+from unittest.mock import ANY
+
+import pytest
+
+from src.exchanges.binance_futures import BinanceFuturesExchange
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.multi_venue import HedgeSplitter, MultiVenueFuturesExchange
+from tests.exchanges.venue_stubs import BinanceStub, GateStub
+
+CREDENTIALS = {'apiKey': 'key', 'secret': 'secret'}
+SYMBOL = 'XRP/USDT:USDT'
+
+
+@pytest.fixture
+def gate_stub():
+    with GateStub() as stub:
+        yield stub
+
+
+@pytest.fixture
+def binance_stub():
+    with BinanceStub() as stub:
+        yield stub
+
+
+@pytest.fixture
+def venues(gate_stub, binance_stub):
+    # market_registry 없이 생성 -> 스텁에서 마켓 정보 로드
+    gate = GateIOExchange(CREDENTIALS, host=gate_stub.url)
+    binance = BinanceFuturesExchange(CREDENTIALS, host=binance_stub.url)
+    return MultiVenueFuturesExchange([gate, binance], quote_timeout=0.3)
+
+
+class TestHedgeSplitter:
+    """잔량 비례 분할"""
+
+    def test_split_by_depth(self):
+        allocation = HedgeSplitter().split(
+            400, {'gateio': 3000, 'binance': 1000}, {'gateio': 10, 'binance': 0.1}, 'gateio', lot=10
+        )
+
+        assert allocation == {'binance': 100, 'gateio': 300}
+
+    def test_secondary_slices_are_whole_lots(self):
+        allocation = HedgeSplitter().split(
+            400, {'gateio': 2000, 'binance': 1000}, {'gateio': 10, 'binance': 0.1}, 'gateio', lot=10
+        )
+
+        # 133.3 -> 130 (주 거래소 나머지 270 = 27계약)
+        assert allocation['binance'] == pytest.approx(130)
+        assert allocation['gateio'] == pytest.approx(270)
+
+    def test_small_slice_folds_into_remainder(self):
+        allocation = HedgeSplitter().split(
+            40, {'gateio': 3000, 'binance': 1000}, {'gateio': 10, 'binance': 0.1}, 'gateio',
+            lot=10, min_quantities={'binance': 20}
+        )
+
+        assert allocation == {'gateio': 40}
+
+    def test_missing_remainder_venue_takes_all(self):
+        allocation = HedgeSplitter().split(100, {'binance': 1000}, {'binance': 0.1}, 'gateio')
+
+        assert allocation == {'gateio': 100}
+
+
+class TestBinanceFuturesExchange:
+    """Binance 어댑터 (스텁 서버)"""
+
+    def test_markets_and_quote(self, binance_stub):
+        exchange = BinanceFuturesExchange(CREDENTIALS, host=binance_stub.url)
+
+        assert exchange.get_markets()[SYMBOL]['quantity_step'] == 0.1
+        assert exchange.get_best_bid_ask(SYMBOL) == {
+            'symbol': SYMBOL, 'bid': 0.5, 'ask': 0.5002, 'bid_size': 1000.0, 'ask_size': 1000.0,
+            'timestamp': ANY, 'quote_time': ANY
+        }
+
+    def test_order_quantity_floored_and_signed(self, binance_stub):
+        exchange = BinanceFuturesExchange(CREDENTIALS, host=binance_stub.url)
+
+        order = exchange.create_market_order(SYMBOL, 'sell', 12.37)
+
+        assert order['amount'] == 12.3
+        sent = binance_stub.orders[0]
+        assert sent['quantity'] == '12.3'
+        assert sent['side'] == 'SELL'
+        assert 'signature' in sent and 'reduceOnly' not in sent
+        assert exchange.get_positions()[0]['contracts'] == 12.3
+
+
+class TestMultiVenueFuturesExchange:
+    """분할 주문 / 포지션 합산 / 장애 대응"""
+
+    def test_quote_includes_gate_depth_in_coins(self, venues):
+        quotes = venues.get_venue_quotes(SYMBOL)
+
+        assert quotes['gateio']['bid_size'] == 3000  # 300계약 x 10
+        assert quotes['binance']['bid_size'] == 1000
+
+    def test_short_split_by_depth(self, venues, gate_stub, binance_stub):
+        order = venues.create_contract_order(SYMBOL, 'sell', 40)
+
+        assert order['amount'] == 40
+        assert gate_stub.orders[0]['size'] == '-30'
+        assert binance_stub.orders[0]['quantity'] == '100'
+
+        position = venues.get_positions()[0]
+        assert position['side'] == 'short'
+        assert position['contracts'] == pytest.approx(40)
+        assert position['venues'] == {'gateio': -300, 'binance': -100}
+
+    def test_reduce_only_closes_each_venue(self, venues, gate_stub, binance_stub):
+        venues.create_contract_order(SYMBOL, 'sell', 40)
+
+        order = venues.create_contract_order(SYMBOL, 'buy', 40, reduce_only=True)
+
+        assert order['amount'] == 40
+        assert gate_stub.orders[1]['size'] == '30' and gate_stub.orders[1]['reduce_only']
+        assert binance_stub.orders[1]['reduceOnly'] == 'true'
+        assert venues.get_positions() == []
+
+    def test_limit_price_rejected_without_orders(self, venues, gate_stub, binance_stub):
+        # 보호 가격 헤지와 같은 위치 인자 호출 - TypeError 대신 주문 없이 거부
+        assert venues.create_contract_order(SYMBOL, 'sell', 40, False, 0.4985) is None
+        assert gate_stub.orders == [] and binance_stub.orders == []
+
+    def test_slow_venue_excluded(self, venues, gate_stub, binance_stub):
+        binance_stub.delay = 0.6
+
+        venues.create_contract_order(SYMBOL, 'sell', 40)
+
+        assert gate_stub.orders[0]['size'] == '-40'
+        assert binance_stub.orders == []
+
+    def test_failed_slice_rerouted(self, venues, gate_stub, binance_stub):
+        binance_stub.fail_orders = True
+
+        order = venues.create_contract_order(SYMBOL, 'sell', 40)
+
+        assert order['amount'] == 40
+        assert [o['size'] for o in gate_stub.orders] == ['-30', '-10']
+
+    def test_balance_summed(self, venues):
+        assert venues.get_balance('USDT') == {'free': 1200.0, 'used': 300.0, 'total': 1500.0}
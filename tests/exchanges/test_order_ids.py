@@ -0,0 +1,220 @@
+"""
+클라이언트 주문 ID / 조회 후 재제출 테스트
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from src.config import settings
+from src.exchanges.binance_futures import BinanceFuturesExchange
+from src.exchanges.bithumb import BithumbExchange
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.order_ids import (
+    OrderOutcomeUnknown, assign_client_order_id, new_client_order_id, submit_idempotent
+)
+from src.exchanges.upbit import UpbitExchange
+from src.utils.deadline import bind, deadline_scope
+from tests.exchanges.venue_stubs import BinanceStub, BithumbStub, GateStub
+
+CREDENTIALS = {'apiKey': 'key', 'secret': 'secret'}
+
+
+@pytest.fixture(autouse=True)
+def short_order_timeout(monkeypatch):
+    # 스텁 지연(stall_seconds)보다 짧은 주문 타임아웃
+    monkeypatch.setattr(settings, 'ORDER_TIMEOUT_SECONDS', 0.3)
+    monkeypatch.setattr(settings, 'ORDER_LOOKUP_DELAY_SECONDS', 0.0)
+
+
+class TestSubmitIdempotent:
+    """응답 없는 주문: 조회 → 있으면 사용, 없으면 재제출, 확인 불가면 결과 미확인"""
+
+    def test_found_order_not_resubmitted(self):
+        submit = Mock(side_effect=OrderOutcomeUnknown('timeout'))
+
+        assert submit_idempotent('order', submit, lambda: {'id': 1}) == {'id': 1}
+        assert submit.call_count == 1
+
+    def test_missing_order_resubmitted(self):
+        submit = Mock(side_effect=[OrderOutcomeUnknown('timeout'), {'id': 2}])
+
+        assert submit_idempotent('order', submit, lambda: None) == {'id': 2}
+        assert submit.call_count == 2
+
+    def test_lookup_failure_marks_unknown(self):
+        submit = Mock(side_effect=OrderOutcomeUnknown('timeout'))
+
+        with deadline_scope(5) as deadline:
+            assert submit_idempotent('order', submit, Mock(side_effect=RuntimeError('503'))) is None
+
+        assert submit.call_count == 1
+        assert deadline.unknown_orders == ['order']
+
+    def test_confirmed_absent_after_retries_is_plain_failure(self):
+        submit = Mock(side_effect=OrderOutcomeUnknown('timeout'))
+
+        with deadline_scope(5) as deadline:
+            assert submit_idempotent('order', submit, lambda: None) is None
+
+        assert submit.call_count == settings.ORDER_SUBMIT_RETRIES + 1
+        assert not deadline.outcome_unknown
+
+    def test_client_ids_fit_gate_text(self):
+        ids = {new_client_order_id() for _ in range(100)}
+
+        assert len(ids) == 100
+        assert all(len(client_id) <= 28 and client_id.isalnum() for client_id in ids)
+
+
+class TestAssignedClientOrderId:
+    """저널에 먼저 기록한 ID를 거래소별 첫 주문에 사용"""
+
+    def test_first_order_per_venue_uses_assigned_id(self):
+        with assign_client_order_id('hpassigned'):
+            first, second = new_client_order_id('gateio'), new_client_order_id('gateio')
+            other_venue = new_client_order_id('binance')
+
+        assert (first, other_venue) == ('hpassigned', 'hpassigned')
+        assert second != 'hpassigned'
+        assert new_client_order_id('gateio') != 'hpassigned'
+
+    def test_assigned_id_follows_bound_worker_threads(self):
+        with assign_client_order_id('hpassigned'), ThreadPoolExecutor(max_workers=2) as executor:
+            ids = list(executor.map(bind(new_client_order_id), ['gateio', 'binance']))
+
+        assert ids == ['hpassigned', 'hpassigned']
+
+
+class TestGateClientOrderId:
+    """Gate text 필드로 접수 여부 확인"""
+
+    def test_lost_response_not_duplicated(self):
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url)
+            stub.lose_responses = 1
+
+            order = gate.create_contract_order('XRP/USDT:USDT', 'sell', 3)
+
+        assert order['amount'] == 3
+        assert len(stub.orders) == 1
+        assert stub.orders[0]['text'].startswith('t-')
+        assert stub.positions == {'XRP_USDT': -3}
+
+    def test_find_by_client_id(self):
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url)
+            with assign_client_order_id('hpcrashed'):
+                gate.create_contract_order('XRP/USDT:USDT', 'sell', 3)
+
+            found = gate.find_order_by_client_id('XRP/USDT:USDT', 'hpcrashed', time.time())
+            missing = gate.find_order_by_client_id('XRP/USDT:USDT', 'hpnever', time.time())
+            with pytest.raises(RuntimeError):
+                # 끝난 주문의 text는 60초 뒤 조회되지 않음 - 없다고 단정할 수 없음
+                gate.find_order_by_client_id('XRP/USDT:USDT', 'hpnever', time.time() - 120)
+
+        assert found['filled'] == 3
+        assert missing is None
+
+    def test_lost_request_resubmitted_with_same_text(self):
+        with GateStub() as stub:
+            gate = GateIOExchange(CREDENTIALS, host=stub.url)
+            stub.lose_requests = 1
+
+            order = gate.create_contract_order('XRP/USDT:USDT', 'buy', 2)
+            time.sleep(stub.stall_seconds)
+
+        assert order['amount'] == 2
+        assert stub.positions == {'XRP_USDT': 2}
+
+
+class TestOtherVenues:
+    """업비트 identifier / 바이낸스 newClientOrderId / 빗썸 체결 내역 조회"""
+
+    def test_upbit_looks_up_identifier(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.post.side_effect = requests.ReadTimeout('read timed out')
+        exchange.session.get.return_value = Mock(status_code=200, json=Mock(return_value={'uuid': 'u-1'}))
+
+        order = exchange.create_market_order('XRP/KRW', 'sell', 10)
+
+        assert order['id'] == 'u-1'
+        identifier = exchange.session.post.call_args[1]['json']['identifier']
+        assert exchange.session.get.call_args[1]['params'] == {'identifier': identifier}
+        assert exchange.session.post.call_count == 1
+
+    def test_upbit_lookup_error_not_resubmitted(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.post.side_effect = requests.ReadTimeout('read timed out')
+        exchange.session.get.return_value = Mock(status_code=429, text='too many requests')
+
+        with deadline_scope(5) as deadline:
+            assert exchange.create_market_order('XRP/KRW', 'sell', 10) is None
+
+        # 조회 실패는 미접수가 아님 - 같은 identifier로 재제출하지 않고 결과 미확인
+        assert exchange.session.post.call_count == 1
+        assert deadline.outcome_unknown
+
+    def test_upbit_order_not_found_resubmitted(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.post.side_effect = [
+            requests.ReadTimeout('read timed out'),
+            Mock(status_code=201, json=Mock(return_value={'uuid': 'u-2', 'state': 'wait'}))
+        ]
+        exchange.session.get.return_value = Mock(status_code=404, text='order_not_found')
+
+        order = exchange.create_market_order('XRP/KRW', 'sell', 10)
+
+        assert order['id'] == 'u-2'
+        assert exchange.session.post.call_count == 2
+
+    def test_upbit_find_by_client_id(self):
+        exchange = UpbitExchange('key', 'secret')
+        exchange.session = Mock()
+        exchange.session.get.side_effect = [
+            Mock(status_code=200, json=Mock(return_value={'uuid': 'u-1', 'state': 'done', 'executed_volume': '10'})),
+            Mock(status_code=404, text='order_not_found')
+        ]
+
+        assert exchange.find_order_by_client_id('XRP/KRW', 'hp1', 0) == {'id': 'u-1', 'status': 'done', 'filled': 10.0}
+        assert exchange.find_order_by_client_id('XRP/KRW', 'hp2', 0) is None
+
+    def test_binance_find_by_client_id(self):
+        with BinanceStub() as stub:
+            binance = BinanceFuturesExchange(CREDENTIALS, host=stub.url)
+            with assign_client_order_id('hpcrashed'):
+                binance.create_market_order('XRP/USDT:USDT', 'sell', 10)
+
+            found = binance.find_order_by_client_id('XRP/USDT:USDT', 'hpcrashed', 0)
+            missing = binance.find_order_by_client_id('XRP/USDT:USDT', 'hpnever', 0)
+
+        assert found['filled'] == 10
+        assert missing is None
+
+    def test_binance_lost_response_not_duplicated(self):
+        with BinanceStub() as stub:
+            binance = BinanceFuturesExchange(CREDENTIALS, host=stub.url)
+            stub.lose_responses = 1
+
+            order = binance.create_market_order('XRP/USDT:USDT', 'sell', 10)
+
+        assert order['filled'] == 10
+        assert len(stub.orders) == 1
+        assert stub.positions == {'XRPUSDT': -10}
+
+    def test_bithumb_lost_response_found_in_fills(self):
+        with BithumbStub('secret') as stub:
+            bithumb = BithumbExchange('key', 'secret')
+            bithumb.private_api_url = stub.url
+            stub.lose_responses = 1
+
+            order = bithumb.create_market_order('XRP/KRW', 'sell', 5)
+
+        assert len(stub.orders) == 1
+        assert order['filled'] == 5
+        assert order['cost'] == 5 * stub.price
@@ -0,0 +1,151 @@
+"""
+한국 거래소 동시 사용 (업비트 + 빗썸) 최적 호가 라우팅 테스트
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.hedge_bot import HedgeBot
+from src.core.premium_calculator import PremiumCalculator
+from src.exchanges.bithumb import BithumbExchange
+from src.exchanges.multi_venue import MultiVenueSpotExchange
+from src.exchanges.upbit import UpbitExchange
+
+
+def _venue(exchange_class, exchange_id, bid, ask, balances, min_order_krw):
+    venue = Mock()
+    venue.exchange_id = exchange_id
+    venue.capabilities = exchange_class.capabilities
+    venue.get_markets.return_value = {}
+    venue.get_best_bid_ask.side_effect = lambda symbol: {'symbol': symbol, 'bid': bid, 'ask': ask}
+    venue.get_balances.side_effect = lambda: balances
+    venue.get_balance.side_effect = lambda currency: balances.get(currency, {'free': 0, 'used': 0, 'total': 0})
+    venue.get_min_order_krw.return_value = min_order_krw
+    venue.create_market_order.side_effect = lambda symbol, side, amount, params=None: {
+        'id': f"{exchange_id}-1", 'symbol': symbol, 'side': side, 'amount': amount, 'filled': 0
+    }
+    return venue
+
+
+@pytest.fixture
+def upbit():
+    # 매수 호가가 더 높음 (매도 유리)
+    return _venue(UpbitExchange, 'upbit', bid=990.0, ask=1000.0, balances={
+        'KRW': {'free': 30000.0, 'used': 0.0, 'total': 30000.0},
+        'XRP': {'free': 30.0, 'used': 0.0, 'total': 30.0},
+    }, min_order_krw=5000.0)
+
+
+@pytest.fixture
+def bithumb():
+    # 매도 호가가 더 낮음 (매수 유리)
+    return _venue(BithumbExchange, 'bithumb', bid=985.0, ask=995.0, balances={
+        'KRW': {'free': 100000.0, 'used': 0.0, 'total': 100000.0},
+        'XRP': {'free': 20.0, 'used': 0.0, 'total': 20.0},
+    }, min_order_krw=1000.0)
+
+
+@pytest.fixture
+def spot(upbit, bithumb):
+    return MultiVenueSpotExchange([upbit, bithumb], quote_timeout=1.0)
+
+
+class TestQuotes:
+    """통합 호가"""
+
+    def test_best_ask_and_bid_across_venues(self, spot):
+        quote = spot.get_best_bid_ask('XRP/KRW')
+
+        assert quote['ask'] == 995.0  # 빗썸
+        assert quote['bid'] == 990.0  # 업비트
+
+    def test_premium_uses_cheaper_ask(self, spot):
+        futures = Mock()
+        futures.get_best_bid_ask.return_value = {'bid': 0.7, 'ask': 0.71}
+        calculator = PremiumCalculator(spot, futures)
+
+        premium = calculator.calculate('XRP')
+
+        # USDT/KRW도 같은 스텁 호가 (ask 995)
+        assert premium == pytest.approx((995.0 / 995.0 / 0.7 - 1) * 100)
+
+    def test_capabilities_use_coarsest_precision(self, spot):
+        assert spot.capabilities.quote_amount_buys is True
+        assert spot.capabilities.quantity_precision == BithumbExchange.DEFAULT_QUANTITY_PRECISION
+        assert spot.get_min_order_krw('XRP/KRW') == 5000.0
+
+    def test_balances_summed(self, spot):
+        assert spot.get_balance('XRP') == {'free': 50.0, 'used': 0.0, 'total': 50.0}
+
+
+class TestRouting:
+    """주문 라우팅"""
+
+    def test_buy_routes_to_cheaper_ask(self, spot, upbit, bithumb):
+        order = spot.create_market_order('XRP/KRW', 'buy', 50000)
+
+        bithumb.create_market_order.assert_called_once_with('XRP/KRW', 'buy', 50000.0, None)
+        upbit.create_market_order.assert_not_called()
+        assert order['venue'] == 'bithumb'
+
+    def test_krw_remainder_not_sent_to_unfunded_best_venue(self, upbit):
+        # 매도 호가가 가장 낮은 빗썸에 KRW 없음 - 나머지 0.5원도 빗썸으로 가면 안 됨
+        bithumb = _venue(BithumbExchange, 'bithumb', bid=985.0, ask=995.0, balances={
+            'KRW': {'free': 0.0, 'used': 0.0, 'total': 0.0},
+        }, min_order_krw=1000.0)
+        spot = MultiVenueSpotExchange([upbit, bithumb], quote_timeout=1.0)
+
+        spot.create_market_order('XRP/KRW', 'buy', 20000.5)
+
+        upbit.create_market_order.assert_called_once_with('XRP/KRW', 'buy', 20000.5, None)
+        bithumb.create_market_order.assert_not_called()
+
+    def test_sell_routes_to_richer_bid(self, spot, upbit, bithumb):
+        spot.create_market_order('XRP/KRW', 'sell', 10)
+
+        upbit.create_market_order.assert_called_once_with('XRP/KRW', 'sell', 10, None)
+        bithumb.create_market_order.assert_not_called()
+
+    def test_sell_spills_to_next_venue(self, spot, upbit, bithumb):
+        order = spot.create_market_order('XRP/KRW', 'sell', 45)
+
+        upbit.create_market_order.assert_called_once_with('XRP/KRW', 'sell', 30.0, None)
+        bithumb.create_market_order.assert_called_once_with('XRP/KRW', 'sell', 15.0, None)
+        assert order['venues'] == {'upbit': 30.0, 'bithumb': 15.0}
+
+    def test_insufficient_balance_rejected(self, spot, upbit, bithumb):
+        assert spot.create_market_order('XRP/KRW', 'sell', 60) is None
+        upbit.create_market_order.assert_not_called()
+        bithumb.create_market_order.assert_not_called()
+
+    def test_slow_venue_excluded(self, upbit, bithumb):
+        import time
+
+        def slow_quote(symbol):
+            time.sleep(0.3)
+            return {'symbol': symbol, 'bid': 985.0, 'ask': 995.0}
+        bithumb.get_best_bid_ask.side_effect = slow_quote
+        spot = MultiVenueSpotExchange([upbit, bithumb], quote_timeout=0.05)
+
+        spot.create_market_order('XRP/KRW', 'buy', 20000)
+
+        upbit.create_market_order.assert_called_once()
+        bithumb.create_market_order.assert_not_called()
+
+
+class TestPositionTracking:
+    """PositionManager 거래소별 보유량"""
+
+    def test_fill_updates_venue_amounts(self, spot, bithumb):
+        bot = HedgeBot(spot, Mock())
+
+        spot.create_market_order('XRP/KRW', 'buy', 50000)
+
+        assert bot.position_manager.get_position('XRP').spot_venues == {'bithumb': 20.0}
+
+    def test_sync_from_venue_balances(self, spot):
+        bot = HedgeBot(spot, Mock())
+
+        bot.position_manager.sync_spot_venues(['XRP'], spot.get_venue_balances())
+
+        assert bot.position_manager.get_position('XRP').spot_venues == {'upbit': 30.0, 'bithumb': 20.0}
@@ -0,0 +1,347 @@
+"""
+거래소 REST 스텁 서버 (로컬 HTTP)
+
+실제 거래소 대신 127.0.0.1 임의 포트에서 응답하며,
+호가/포지션/주문 상태를 메모리에 두고 받은 주문을 기록함
+"""
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """요청을 서버에 연결된 StubVenue로 전달"""
+
+    def _dispatch(self, method: str):
+        parts = urlsplit(self.path)
+        query = dict(parse_qsl(parts.query))
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        if not raw:
+            body = None
+        elif self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+            body = dict(parse_qsl(raw.decode()))
+        else:
+            body = json.loads(raw)
+
+        venue = self.server.venue
+        if venue.delay:
+            time.sleep(venue.delay)
+        status, payload = venue.handle_request(method, parts.path, query, body, self.headers)
+
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    """동시 연결 스트레스 테스트용 (기본 listen backlog 5는 연결이 리셋됨)"""
+    request_queue_size = 64
+    daemon_threads = True
+
+
+class StubVenue:
+    """거래소 스텁 공통 (with 문으로 서버 시작/종료)"""
+
+    def __init__(self):
+        self.delay = 0.0  # 모든 응답 지연 (초)
+        self.fail_orders = False  # 주문 요청에 오류 응답
+        # 응답 유실 흉내 (클라이언트 타임아웃보다 길게 지연)
+        self.lose_requests = 0  # 다음 N건 주문은 처리하지 않음
+        self.lose_responses = 0  # 다음 N건 주문은 처리하고 응답만 지연
+        self.stall_seconds = 1.0
+        self.orders = []
+        self._lock = threading.Lock()
+        self.server = _StubServer(('127.0.0.1', 0), _Handler)
+        self.server.venue = self
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def handle_request(self, method: str, path: str, query: Dict, body, headers) -> Tuple[int, object]:
+        """헤더가 필요한 스텁은 재정의"""
+        return self.handle(method, path, query, body)
+
+    def handle(self, method: str, path: str, query: Dict, body) -> Tuple[int, object]:
+        raise NotImplementedError
+
+    def _stall(self, counter: str) -> bool:
+        """lose_requests / lose_responses 가 남아 있으면 하나 차감하고 지연"""
+        with self._lock:
+            stalled = getattr(self, counter) > 0
+            if stalled:
+                setattr(self, counter, getattr(self, counter) - 1)
+        if stalled:
+            time.sleep(self.stall_seconds)
+        return stalled
+
+    def _lossy(self, place):
+        """주문 처리에 요청/응답 유실 적용"""
+        if self._stall('lose_requests'):
+            return 503, {'message': 'request lost'}
+        result = place()
+        self._stall('lose_responses')
+        return result
+
+
+class GateStub(StubVenue):
+    """Gate.io v4 USDT 선물 스텁 (수량은 계약 단위)"""
+
+    def __init__(self, contract_size: float = 10, bid: float = 0.5, ask: float = 0.5002,
+                 bid_size: int = 300, ask_size: int = 300):
+        super().__init__()
+        self.contract_size = contract_size
+        self.book = {'highest_bid': str(bid), 'lowest_ask': str(ask),
+                     'highest_size': bid_size, 'lowest_size': ask_size}
+        self.positions: Dict[str, int] = {}  # contract -> signed contracts
+        self.resting: Dict[int, Dict] = {}  # post-only 미체결 주문 (id -> 주문)
+        self.countdowns = []  # 받은 자동 취소 타이머 (초)
+        self.batches = []  # 받은 일괄 주문 요청별 주문 수
+        self.reject_contracts = set()  # 주문을 거부할 계약
+        self.fail_positions = False  # 포지션 조회에 오류 응답
+        self.clock_offset = 0.0  # 서버 시계 오프셋 (초)
+        self.by_text: Dict[str, Dict] = {}  # 클라이언트 주문 ID(text) -> 주문
+
+    def fill(self, order_id: int, contracts: int):
+        """미체결 주문 일부 체결 (테스트에서 호출)"""
+        with self._lock:
+            order = self.resting[order_id]
+            signed = contracts if int(order['size']) > 0 else -contracts
+            order['left'] = str(int(order['left']) - signed)
+            self.positions[order['contract']] = self.positions.get(order['contract'], 0) + signed
+            if int(order['left']) == 0:
+                order.update(status='finished', finish_as='filled')
+
+    def handle(self, method, path, query, body):
+        if path.startswith('/api/v4/futures/usdt/orders/'):
+            key = path.rsplit('/', 1)[1]
+            # 주문 ID 또는 클라이언트 주문 ID(text)
+            order = self.by_text.get(key) if key.startswith('t-') else self.resting.get(int(key))
+            if order is None:
+                return 404, {'label': 'ORDER_NOT_FOUND', 'message': path}
+            with self._lock:
+                if method == 'PUT' and order['status'] == 'open':
+                    order['price'] = body['price']
+                elif method == 'DELETE' and order['status'] == 'open':
+                    order.update(status='finished', finish_as='cancelled')
+            return 200, order
+        if path == '/api/v4/spot/time':
+            return 200, {'server_time': int((time.time() + self.clock_offset) * 1000)}
+        if path == '/api/v4/futures/usdt/countdown_cancel_all':
+            self.countdowns.append(body['timeout'])
+            return 200, {'contract': body.get('contract', '')}
+        if path == '/api/v4/futures/usdt/contracts':
+            return 200, [{'name': 'XRP_USDT', 'quanto_multiplier': str(self.contract_size),
+                          'order_size_min': 1}]
+        if path == '/api/v4/futures/usdt/tickers':
+            return 200, [dict(self.book, contract='XRP_USDT', last=self.book['highest_bid'],
+                              mark_price=self.book['highest_bid'])]
+        if path == '/api/v4/futures/usdt/positions':
+            if self.fail_positions:
+                return 503, {'label': 'SERVER_ERROR', 'message': 'stub failure'}
+            return 200, [
+                {'contract': contract, 'size': size, 'value': str(abs(size) * self.contract_size * 0.5),
+                 'mark_price': '0.5', 'entry_price': '0.5', 'mode': 'single'}
+                for contract, size in self.positions.items()
+            ]
+        if path == '/api/v4/futures/usdt/accounts':
+            return 200, {'total': '1000', 'available': '800', 'position_margin': '200', 'order_margin': '0'}
+        if path == '/api/v4/futures/usdt/batch_orders' and method == 'POST':
+            self.batches.append(len(body))
+            results = []
+            for item in body:
+                status, payload = self._place(item)
+                if status == 201:
+                    results.append(dict(payload, succeeded=True))
+                else:
+                    results.append({'succeeded': False, 'label': payload['label'], 'detail': payload['message']})
+            return 200, results
+        if path == '/api/v4/futures/usdt/orders' and method == 'POST':
+            return self._lossy(lambda: self._place(body))
+        return 404, {'label': 'NOT_FOUND', 'message': path}
+
+    def _place(self, body):
+        """주문 1건 처리 (단건/일괄 공통)"""
+        if self.fail_orders or body['contract'] in self.reject_contracts:
+            return 400, {'label': 'INSUFFICIENT_AVAILABLE', 'message': 'stub failure'}
+        size = int(body['size'])
+        if body.get('tif') == 'poc':
+            with self._lock:
+                self.orders.append(body)
+                order_id = len(self.orders)
+                self.resting[order_id] = {
+                    'id': order_id, 'contract': body['contract'], 'size': str(size),
+                    'price': body['price'], 'left': str(size), 'status': 'open', 'tif': 'poc',
+                    'text': body.get('text')
+                }
+                self.by_text[body.get('text')] = self.resting[order_id]
+            return 201, self.resting[order_id]
+        with self._lock:
+            self.orders.append(body)
+            if body.get('close'):
+                # size 0 + close: 포지션 전체 청산
+                size = -self.positions.get(body['contract'], 0)
+            self.positions[body['contract']] = self.positions.get(body['contract'], 0) + size
+            order_id = len(self.orders)
+            order = {'id': order_id, 'contract': body['contract'], 'size': str(size),
+                     'price': '0', 'left': '0', 'status': 'finished', 'text': body.get('text')}
+            self.by_text[body.get('text')] = order
+        return 201, order
+
+
+class BinanceStub(StubVenue):
+    """Binance USDⓈ-M 선물 스텁 (수량은 코인 단위)"""
+
+    def __init__(self, step: str = '0.1', bid: float = 0.5, ask: float = 0.5002,
+                 bid_qty: float = 1000, ask_qty: float = 1000):
+        super().__init__()
+        self.step = step
+        self.book = {'bidPrice': str(bid), 'bidQty': str(bid_qty),
+                     'askPrice': str(ask), 'askQty': str(ask_qty)}
+        self.positions: Dict[str, float] = {}  # symbol -> signed coins
+        self.by_client_id: Dict[str, Dict] = {}  # newClientOrderId -> 주문
+
+    def handle(self, method, path, query, body):
+        if path == '/fapi/v1/exchangeInfo':
+            return 200, {'symbols': [{
+                'symbol': 'XRPUSDT', 'baseAsset': 'XRP', 'quoteAsset': 'USDT',
+                'contractType': 'PERPETUAL', 'status': 'TRADING',
+                'filters': [{'filterType': 'MARKET_LOT_SIZE', 'stepSize': self.step, 'minQty': self.step}]
+            }]}
+        if path == '/fapi/v1/ticker/bookTicker':
+            book = dict(self.book, symbol='XRPUSDT')
+            return 200, book if 'symbol' in query else [book]
+        if path == '/fapi/v2/positionRisk':
+            return 200, [
+                {'symbol': symbol, 'positionAmt': str(amount), 'notional': str(amount * 0.5),
+                 'markPrice': '0.5', 'entryPrice': '0.5', 'positionSide': 'BOTH'}
+                for symbol, amount in self.positions.items()
+            ]
+        if path == '/fapi/v2/balance':
+            return 200, [{'asset': 'USDT', 'balance': '500', 'availableBalance': '400'}]
+        if path == '/fapi/v1/order' and method == 'POST':
+            if 'signature' not in query:
+                return 400, {'code': -1102, 'msg': 'signature missing'}
+            if self.fail_orders:
+                return 400, {'code': -2019, 'msg': 'Margin is insufficient.'}
+            return self._lossy(lambda: self._place(query))
+        if path == '/fapi/v1/order' and method == 'GET':
+            order = self.by_client_id.get(query.get('origClientOrderId'))
+            if order is None:
+                return 400, {'code': -2013, 'msg': 'Order does not exist.'}
+            return 200, order
+        return 404, {'code': -5000, 'msg': path}
+
+    def _place(self, query):
+        quantity = float(query['quantity'])
+        signed = quantity if query['side'] == 'BUY' else -quantity
+        with self._lock:
+            self.orders.append(query)
+            self.positions[query['symbol']] = self.positions.get(query['symbol'], 0) + signed
+            order = {'orderId': len(self.orders), 'clientOrderId': query.get('newClientOrderId'),
+                     'status': 'FILLED', 'executedQty': query['quantity']}
+            self.by_client_id[query.get('newClientOrderId')] = order
+        return 200, order
+
+
+class BithumbStub(StubVenue):
+    """빗썸 비공개 API 스텁 - 서명 검증, 이미 쓴 nonce / 서버 시각과 동떨어진 nonce 거부"""
+
+    NONCE_TOLERANCE_MS = 30_000
+
+    def __init__(self, api_secret: str):
+        super().__init__()
+        self.api_secret = api_secret
+        self.nonces = []  # 받은 nonce (도착 순)
+        self.rejected = []  # (nonce, 사유)
+        self.transactions = []  # 체결 내역 (최신순)
+        self.price = 700.0  # 시장가 체결 가격
+
+    def handle_request(self, method, path, query, body, headers):
+        nonce = headers.get('Api-Nonce', '')
+        reason = self._check(path, body or {}, nonce, headers.get('Api-Sign', ''))
+        with self._lock:
+            if reason is None and nonce in self.nonces:
+                reason = 'nonce already used'
+            if reason is not None:
+                self.rejected.append((nonce, reason))
+                return 200, {'status': '5100', 'message': f'Bad Request.({reason})'}
+            self.nonces.append(nonce)
+        return self.handle(method, path, query, body)
+
+    def _check(self, path, params, nonce, sign):
+        """nonce 형식/시각, 서명 확인 (문제 없으면 None)"""
+        if not nonce.isdigit():
+            return 'nonce format'
+        if abs(int(nonce) - time.time() * 1000) > self.NONCE_TOLERANCE_MS:
+            return 'nonce out of range'
+        message = path + chr(0) + urlencode(params) + chr(0) + nonce
+        digest = hmac.new(self.api_secret.encode(), message.encode(), hashlib.sha512).hexdigest()
+        if base64.b64encode(digest.encode()).decode() != sign:
+            return 'signature'
+        return None
+
+    def handle(self, method, path, query, body):
+        if path == '/info/balance':
+            return 200, {'status': '0000', 'data': {
+                'total_krw': '1000000', 'in_use_krw': '0', 'available_krw': '1000000',
+                'total_xrp': '100', 'in_use_xrp': '0', 'available_xrp': '100'
+            }}
+        if path in ('/trade/market_buy', '/trade/market_sell'):
+            return self._lossy(lambda: self._fill_market(path, body))
+        if path == '/info/orders':
+            # 시장가 주문은 즉시 체결 - 미체결 주문 없음
+            return 200, {'status': '5600', 'message': '거래 진행중인 내역이 존재하지 않습니다.'}
+        if path == '/info/user_transactions':
+            search = '0' if body['searchGb'] == '1' else '1'  # 응답 search: 0 매수, 1 매도
+            return 200, {'status': '0000', 'data': [
+                fill for fill in self.transactions if fill['search'] == search
+            ][:int(body.get('count', 20))]}
+        return 200, {'status': '5600', 'message': f'unknown endpoint {path}'}
+
+    def _fill_market(self, path, body):
+        """시장가 주문 즉시 전량 체결"""
+        units = float(body['units'])
+        with self._lock:
+            self.orders.append(body)
+            order_id = f"C{len(self.orders):04d}"
+            self.transactions.insert(0, {
+                'search': '0' if path.endswith('buy') else '1',
+                'transfer_date': str(int(time.time() * 1_000_000)),
+                'units': body['units'], 'price': str(self.price), 'amount': str(units * self.price)
+            })
+        return 200, {'status': '0000', 'order_id': order_id}
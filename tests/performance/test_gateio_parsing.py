@@ -0,0 +1,128 @@
+"""
+Gate.io 시세/포지션 파싱 성능 벤치마크 (gate_api 모델 경로 vs raw JSON 경로)
+
+직접 실행하면 결과 표 출력:
+    python tests/performance/test_gateio_parsing.py
+"""
+import json
+import os
+import sys
+import time
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.exchanges.gateio_rest import json_loads, parse_positions, parse_tickers
+
+CONTRACTS = 600
+
+
+def _ticker_payload(count: int = CONTRACTS) -> bytes:
+    """전체 USDT 계약 티커 응답과 비슷한 크기의 JSON"""
+    return json.dumps([
+        {
+            'contract': f'C{i}_USDT', 'last': '1.2345', 'change_percentage': '0.5',
+            'total_size': '100000', 'low_24h': '1.1', 'high_24h': '1.3', 'volume_24h': '123456',
+            'volume_24h_btc': '1', 'volume_24h_usd': '150000', 'volume_24h_base': '120000',
+            'volume_24h_quote': '150000', 'volume_24h_settle': '150000', 'mark_price': '1.2346',
+            'funding_rate': '0.0001', 'funding_rate_indicative': '0.0001', 'index_price': '1.2344',
+            'quanto_base_rate': '', 'lowest_ask': '1.2347', 'lowest_size': '100',
+            'highest_bid': '1.2344', 'highest_size': '200'
+        }
+        for i in range(count)
+    ]).encode()
+
+
+def _position_payload(count: int = 20) -> bytes:
+    return json.dumps([
+        {
+            'user': 1, 'contract': f'C{i}_USDT', 'size': -10, 'leverage': '1', 'risk_limit': '1000000',
+            'leverage_max': '100', 'maintenance_rate': '0.005', 'value': '12.34', 'margin': '12.34',
+            'entry_price': '1.23', 'liq_price': '2.4', 'mark_price': '1.234', 'unrealised_pnl': '0',
+            'realised_pnl': '0', 'history_pnl': '0', 'last_close_pnl': '0', 'realised_point': '0',
+            'history_point': '0', 'adl_ranking': 5, 'pending_orders': 0, 'mode': 'single'
+        }
+        for i in range(count)
+    ]).encode()
+
+
+class _Response:
+    """gate_api ApiClient.deserialize가 읽는 응답 객체"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+def _model_tickers(api_client, raw: bytes):
+    """기존 경로: 모델 객체 생성 후 문자열 필드를 float 변환"""
+    result = []
+    for ticker in api_client.deserialize(_Response(raw), 'list[FuturesTicker]'):
+        result.append((
+            ticker.contract,
+            float(ticker.last),
+            float(ticker.highest_bid) if ticker.highest_bid else None,
+            float(ticker.lowest_ask) if ticker.lowest_ask else None,
+            float(ticker.mark_price),
+            float(ticker.high_24h),
+            float(ticker.low_24h),
+            float(ticker.volume_24h),
+            float(ticker.highest_size) if ticker.highest_size else 0.0,
+            float(ticker.lowest_size) if ticker.lowest_size else 0.0
+        ))
+    return result
+
+
+def _best_of(func, repeat: int = 5) -> float:
+    """가장 빠른 실행 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(repeat: int = 5) -> dict:
+    import gate_api
+
+    api_client = gate_api.ApiClient(gate_api.Configuration())
+    tickers = _ticker_payload()
+    positions = _position_payload()
+
+    return {
+        'tickers_model': _best_of(lambda: _model_tickers(api_client, tickers), repeat),
+        'tickers_raw': _best_of(lambda: parse_tickers(tickers), repeat),
+        'positions_model': _best_of(lambda: api_client.deserialize(_Response(positions), 'list[Position]'), repeat),
+        'positions_raw': _best_of(lambda: parse_positions(positions), repeat),
+    }
+
+
+def test_raw_parsing_matches_model_path():
+    import gate_api
+
+    api_client = gate_api.ApiClient(gate_api.Configuration())
+    raw = _ticker_payload(10)
+
+    assert [tuple(row) for row in parse_tickers(raw)] == _model_tickers(api_client, raw)
+
+
+def test_raw_parsing_is_faster():
+    results = run_benchmark(repeat=3)
+
+    assert results['tickers_raw'] < results['tickers_model']
+    assert results['positions_raw'] < results['positions_model']
+
+
+def main():
+    results = run_benchmark()
+    print("=" * 60)
+    print(f"⏱️  Gate.io 파싱 벤치마크 (JSON 디코더: {json_loads.__module__})")
+    print("=" * 60)
+    for name in ('tickers', 'positions'):
+        model = results[f'{name}_model'] * 1000
+        raw = results[f'{name}_raw'] * 1000
+        print(f"{name:10s} 모델 {model:8.2f}ms | raw {raw:8.2f}ms | {model / raw:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ def create_mock_exchange(response_time_ms=50):
         return None
     
     mock.get_ticker = get_ticker_with_delay
+    mock.get_best_bid_ask = get_ticker_with_delay
     return mock
 
 def test_current_implementation():
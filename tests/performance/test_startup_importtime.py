@@ -0,0 +1,121 @@
+"""
+콜드 스타트 import 시간 벤치마크 (python -X importtime 기반)
+
+측정은 매번 새 인터프리터(subprocess)에서 실행: pytest 프로세스에는 이미 import된 모듈이 남아 있어
+같은 프로세스에서 측정하면 어떤 모듈이 새로 로드되는지/얼마나 걸리는지 알 수 없음
+
+직접 실행하면 모듈별 누적 import 시간 상위 목록을 출력:
+    python tests/performance/test_startup_importtime.py
+"""
+import os
+import subprocess
+import sys
+from typing import Dict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure_imports(code: str) -> Dict[str, int]:
+    """
+    새 인터프리터에서 코드를 실행하고 -X importtime 결과 파싱
+
+    Returns:
+        {모듈 이름: 누적 import 시간(us)} (처음 import된 모듈만 기록됨)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        # 형식: "import time:   self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        try:
+            _, cumulative, module = line.split('|', 2)
+            timings[module.strip()] = int(cumulative.strip())
+        except ValueError:
+            continue
+    return timings
+
+
+class TestStartupImportTime:
+    """선택된 거래소 어댑터만 로드되는지 확인"""
+
+    def test_exchanges_package_is_lazy(self):
+        timings = measure_imports('import src.exchanges')
+
+        assert 'src.exchanges.upbit' not in timings
+        assert 'src.exchanges.gateio' not in timings
+        assert 'gate_api' not in timings
+
+    def test_korean_adapter_does_not_load_gate_api(self):
+        timings = measure_imports(
+            "import sys\n"
+            "from src.exchanges import get_exchange_class\n"
+            "get_exchange_class('upbit')\n"
+            "assert 'src.exchanges.upbit' in sys.modules\n"
+            "assert 'src.exchanges.bithumb' not in sys.modules"
+        )
+
+        assert 'jwt' in timings
+        assert 'gate_api' not in timings
+
+    def test_gateio_defers_gate_api_until_used(self):
+        timings = measure_imports(
+            "import sys\n"
+            "from src.exchanges import get_exchange_class\n"
+            "get_exchange_class('gateio')\n"
+            "assert 'src.exchanges.gateio' in sys.modules"
+        )
+
+        assert 'gate_api' not in timings
+
+    def test_gateio_client_loads_gate_api_on_first_use(self):
+        timings = measure_imports(
+            "from src.exchanges.gateio import GateIOExchange\n"
+            "ex = GateIOExchange({'apiKey': 'k', 'secret': 's'}, market_registry=object())\n"
+            "ex.futures_api"
+        )
+
+        assert 'gate_api' in timings
+
+    def test_core_defers_requests(self):
+        # requests는 거래소 어댑터 생성(HTTP 세션 설치) 시점에 로드
+        timings = measure_imports('import src.core')
+
+        assert 'src.exchanges.health' in timings
+        assert 'requests' not in timings
+
+    def test_lazy_package_attribute(self):
+        from src.exchanges import get_exchange_class
+        import src.exchanges as exchanges
+
+        assert exchanges.UpbitExchange is get_exchange_class('upbit')
+
+
+def main():
+    """모듈별 누적 import 시간 출력"""
+    scenarios = {
+        'core + 레지스트리': 'import src.core, src.exchanges.market_registry',
+        'upbit 선택': "from src.exchanges import get_exchange_class; get_exchange_class('upbit')",
+        'gateio 선택': "from src.exchanges import get_exchange_class; get_exchange_class('gateio')",
+        'gate_api 클라이언트': 'import gate_api',
+    }
+
+    print("=" * 60)
+    print("⏱️  콜드 스타트 import 시간")
+    print("=" * 60)
+    for name, code in scenarios.items():
+        timings = measure_imports(code)
+        top = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:5]
+        total_ms = top[0][1] / 1000 if top else 0
+        print(f"\n{name}: {total_ms:.1f}ms")
+        for module, cumulative in top:
+            print(f"  {cumulative / 1000:8.1f}ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
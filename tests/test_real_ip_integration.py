@@ -142,12 +142,14 @@ def test_real_ip_integration():
         mock_bithumb = Mock()
         mock_bithumb.exchange_id = 'bithumb'
         mock_bithumb.get_ticker = Mock(return_value={'last': 10000, 'bid': 9990, 'ask': 10010})
+        mock_bithumb.get_best_bid_ask = Mock(return_value={'bid': 9990, 'ask': 10010})
         mock_bithumb.get_balance = Mock(return_value={'free': 0, 'used': 0, 'total': 0})
         mock_bithumb.create_market_order = Mock(return_value={'id': 'test', 'status': 'closed'})
         
         mock_gateio = Mock()
         mock_gateio.exchange_id = 'gateio'
         mock_gateio.get_ticker = Mock(return_value={'last': 7.5, 'bid': 7.49, 'ask': 7.51})
+        mock_gateio.get_best_bid_ask = Mock(return_value={'bid': 7.49, 'ask': 7.51})
         mock_gateio.get_positions = Mock(return_value=[])
         mock_gateio.create_market_order = Mock(return_value={'id': 'test', 'status': 'filled'})
         mock_gateio.get_markets = Mock(return_value={'IP/USDT:USDT': {'contract_size': 1}})
@@ -0,0 +1,189 @@
+"""
+주문 선기록 저널 테스트
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.hedge_bot import HedgeBot
+from src.core.order_executor import OrderExecutor
+from src.exchanges.gateio import GateIOExchange
+from src.exchanges.upbit import UpbitExchange
+from src.managers.order_journal import OrderJournal
+from tests.exchanges.venue_stubs import GateStub
+
+CREDENTIALS = {'apiKey': 'key', 'secret': 'secret'}
+
+
+@pytest.fixture
+def journal_file(tmp_path):
+    return str(tmp_path / 'order_journal.jsonl')
+
+
+def _exchanges():
+    korean, futures = Mock(), Mock()
+    korean.exchange_id, futures.exchange_id = 'upbit', 'gateio'
+    korean.capabilities = UpbitExchange.capabilities
+    futures.capabilities = GateIOExchange.capabilities
+    korean.create_market_order.return_value = {'id': 'spot-1', 'filled': 100.0}
+    futures.create_contract_order.return_value = None  # 선물 주문 실패 → 현물 되돌리기
+    return korean, futures
+
+
+class TestOrderJournal:
+    """기록 / 재시작 복구 / 압축"""
+
+    def test_incomplete_intent_survives_restart(self, journal_file):
+        journal = OrderJournal(journal_file)
+        done = journal.begin('BTC', 'open', spot_quantity=0.01)
+        journal.begin('XRP', 'open', spot_quantity=100.0)
+        journal.complete(done)
+        journal.close()
+
+        recovered = OrderJournal(journal_file)
+
+        assert recovered.incomplete_symbols() == ['XRP']
+        # 완료된 의도는 압축으로 제거
+        with open(journal_file) as f:
+            assert [json.loads(line)['symbol'] for line in f] == ['XRP']
+        recovered.close()
+
+    def test_intent_is_on_disk_before_begin_returns(self, journal_file):
+        journal = OrderJournal(journal_file)
+        journal.begin('XRP', 'close_all')
+
+        # close() 없이 (프로세스가 죽은 것처럼) 파일만 다시 읽음
+        assert OrderJournal(journal_file).incomplete_symbols() == ['XRP']
+
+    def test_torn_last_line_ignored(self, journal_file):
+        journal = OrderJournal(journal_file)
+        journal.begin('XRP', 'open')
+        journal.close()
+        with open(journal_file, 'a') as f:
+            f.write('{"event": "done", "int')
+
+        recovered = OrderJournal(journal_file)
+
+        assert recovered.incomplete_symbols() == ['XRP']
+        recovered.resolve_symbol('XRP')
+        recovered.close()
+        assert OrderJournal(journal_file).incomplete_symbols() == []
+
+    def test_concurrent_intents_share_fsync(self, journal_file):
+        journal = OrderJournal(journal_file)
+        fsync = os.fsync
+        calls = []
+
+        def slow_fsync(fd):
+            calls.append(fd)
+            time.sleep(0.005)
+            fsync(fd)
+
+        start = threading.Barrier(32)
+
+        def begin(index):
+            start.wait()
+            return journal.begin(f"SYM{index}", 'open')
+
+        with patch('src.managers.order_journal.os.fsync', side_effect=slow_fsync):
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                intents = list(executor.map(begin, range(32)))
+        journal.close()
+
+        assert len(set(intents)) == 32
+        assert len(calls) < 32  # 그룹 커밋
+        assert len(OrderJournal(journal_file).incomplete_symbols()) == 32
+
+    def test_outcome_append_is_cheap(self, journal_file):
+        journal = OrderJournal(journal_file)
+        intent = journal.begin('XRP', 'open')
+
+        started = time.perf_counter()
+        for _ in range(1000):
+            journal.record(intent, spot={'id': 'spot-1', 'filled': 1.0, 'status': 'done'}, futures=True, unknown=[])
+        per_append = (time.perf_counter() - started) / 1000
+        journal.close()
+
+        assert per_append < 0.001
+
+
+class TestExecutorJournal:
+    """주문 실행 중 프로세스 종료 → 재시작 시 reconcile"""
+
+    def test_crash_during_partial_execution_is_reconciled(self, journal_file):
+        korean, futures = _exchanges()
+        executor = OrderExecutor(korean, futures, journal=OrderJournal(journal_file))
+        executor._handle_partial_execution = Mock(side_effect=KeyboardInterrupt)
+
+        with pytest.raises(KeyboardInterrupt):
+            executor._execute_concurrent_orders('XRP', 100.0, 10, 'open', spot_amount=70_000)
+
+        korean, futures = _exchanges()
+        korean.find_order_by_client_id.side_effect = RuntimeError('503')
+        futures.find_order_by_client_id.return_value = None
+        bot = HedgeBot(korean, futures, order_journal=OrderJournal(journal_file))
+        assert bot.order_executor.reconcile_symbols == {'XRP'}
+
+        bot.position_manager.get_existing_positions_bulk = Mock(return_value={'XRP': 0.0})
+        bot.position_balancer.rebalance_position = Mock(return_value=True)
+        bot._reconcile_symbol('XRP')
+
+        # 현물 주문을 조회할 수 없으면 실제 잔고/포지션으로 확인
+        bot.position_balancer.rebalance_position.assert_called_once_with('XRP')
+        assert bot.order_executor.journal.incomplete_symbols() == []
+
+    def test_crash_after_orders_accepted_is_recovered_by_lookup(self, journal_file):
+        with GateStub() as stub:
+            korean = _exchanges()[0]
+            executor = OrderExecutor(
+                korean, GateIOExchange(CREDENTIALS, host=stub.url), journal=OrderJournal(journal_file)
+            )
+            # 양쪽 주문이 거래소에 접수된 직후 (결과 기록 전) 프로세스 종료
+            executor.journal.record = Mock(side_effect=KeyboardInterrupt)
+            with pytest.raises(KeyboardInterrupt):
+                executor._execute_concurrent_orders('XRP', 100.0, 5, 'open', spot_amount=70_000)
+            intent = next(iter(OrderJournal(journal_file).open_intents.values()))
+            client_ids = intent['client_ids']
+
+            korean = _exchanges()[0]
+            korean.find_order_by_client_id.side_effect = lambda symbol, client_id, placed_at: (
+                {'id': 'spot-1', 'status': 'done', 'filled': 100.0} if client_id == client_ids['spot'] else None
+            )
+            journal = OrderJournal(journal_file)
+            bot = HedgeBot(korean, GateIOExchange(CREDENTIALS, host=stub.url), order_journal=journal)
+            bot.residual_ledger.threshold_usd = 1000.0
+            bot.position_manager.get_existing_positions_bulk = Mock(return_value={'XRP': 25.0})
+            bot.position_balancer.rebalance_position = Mock(return_value=True)
+
+            bot._reconcile_symbol('XRP')
+            journal.close()
+
+        assert stub.orders[0]['text'] == f"t-{client_ids['futures']}"
+        with open(journal_file) as f:
+            recovered = [json.loads(line)['recovered'] for line in f if '"recovered"' in line]
+        assert recovered[0]['spot'] == {'id': 'spot-1', 'status': 'done', 'filled': 100.0}
+        assert recovered[0]['futures']['filled'] == 5
+        # 현물 100개 - 선물 5계약 x 10개 = 50개 현물 초과를 장부에 기록 (잔고 기준 확인 없음)
+        assert bot.residual_ledger.get_gap('XRP') == pytest.approx(50.0)
+        bot.position_balancer.rebalance_position.assert_not_called()
+        assert bot.order_executor.reconcile_symbols == set()
+        assert journal.incomplete_symbols() == []
+
+    def test_completed_orders_leave_no_intent(self, journal_file):
+        korean, futures = _exchanges()
+        journal = OrderJournal(journal_file)
+        executor = OrderExecutor(korean, futures, journal=journal)
+
+        assert not executor._execute_concurrent_orders('XRP', 100.0, 10, 'open', spot_amount=70_000)
+        journal.close()
+
+        with open(journal_file) as f:
+            events = [json.loads(line) for line in f]
+        assert [event['event'] for event in events] == ['intent', 'legs', 'done']
+        assert events[1]['spot'] == {'id': 'spot-1', 'filled': 100.0, 'status': None}
+        assert events[1]['futures'] is False
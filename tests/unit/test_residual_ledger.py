@@ -0,0 +1,110 @@
+"""
+잔여 갭 장부 테스트
+"""
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.position_balancer import PositionBalancer, PositionBalance
+from src.core.quantity_solver import HedgeQuantitySolver
+from src.exchanges.upbit import UpbitExchange
+from src.managers.residual_ledger import ResidualLedger
+
+
+def _balance(spot_quantity, futures_quantity, price=10.0):
+    gap = abs(spot_quantity - futures_quantity)
+    pct = gap / max(spot_quantity, futures_quantity) * 100
+    return PositionBalance(
+        symbol='XRP',
+        spot_quantity=spot_quantity,
+        futures_quantity=futures_quantity,
+        spot_value_usd=spot_quantity * price,
+        futures_value_usd=futures_quantity * price,
+        quantity_gap=gap,
+        gap_percentage=pct,
+        is_balanced=pct <= 1.0,
+        needs_rebalancing=pct >= 2.0,
+        timestamp=datetime.now()
+    )
+
+
+class TestResidualLedger:
+    """ResidualLedger 테스트"""
+
+    def test_record_and_gap_usd(self):
+        ledger = ResidualLedger(threshold_usd=15.0)
+        ledger.record('XRP', -1.5, 2.0)
+
+        assert ledger.get_gap('XRP') == -1.5
+        assert ledger.gap_usd('XRP') == pytest.approx(3.0)
+        assert not ledger.needs_correction('XRP')
+
+    def test_add_accumulates_until_threshold(self):
+        ledger = ResidualLedger(threshold_usd=15.0)
+        for _ in range(3):
+            ledger.add('XRP', 0.4, 10.0)
+        assert not ledger.needs_correction('XRP')
+
+        ledger.add('XRP', 0.4)
+        assert ledger.gap_usd('XRP') == pytest.approx(16.0)
+        assert ledger.needs_correction('XRP')
+
+    def test_clear_and_remove(self):
+        ledger = ResidualLedger()
+        ledger.record('XRP', 3.0, 1.0)
+        ledger.clear('XRP')
+        assert ledger.get_gap('XRP') == 0.0
+
+        ledger.remove_symbol('XRP')
+        assert 'XRP' not in ledger.gaps
+        assert ledger.get_gap('UNKNOWN') == 0.0
+
+    def test_solver_nets_carried_gap(self):
+        # 현물 5개 초과 이월 → 이번 증분에서 현물을 5개 덜 매수
+        solver = HedgeQuantitySolver(UpbitExchange.capabilities)
+        result = solver.solve(100.0, 0.5, 10, 700, 1400, carry_quantity=5.0)
+
+        assert result.futures_quantity == 200
+        assert result.spot_quantity == pytest.approx(195)
+        assert abs(result.residual_quantity) < 0.01
+
+
+class TestBalancerCarry:
+    """PositionBalancer 잔여 갭 이월 테스트"""
+
+    @pytest.fixture
+    def balancer(self):
+        korean_exchange = Mock()
+        korean_exchange.exchange_id = 'upbit'
+        futures_exchange = Mock()
+        futures_exchange.exchange_id = 'gateio'
+        return PositionBalancer(
+            Mock(), Mock(), korean_exchange, futures_exchange,
+            ResidualLedger(threshold_usd=15.0)
+        )
+
+    def test_sub_threshold_gap_is_carried(self, balancer):
+        # 3% 갭이지만 $10 → 주문 없이 이월
+        balancer.check_position_balance = Mock(return_value=_balance(100.0, 97.0, price=10 / 3))
+        balancer._add_futures_short_by_quantity = Mock(return_value=True)
+
+        assert balancer.rebalance_position('XRP') is True
+        balancer._add_futures_short_by_quantity.assert_not_called()
+        assert balancer.residual_ledger.get_gap('XRP') == pytest.approx(3.0)
+
+    def test_over_threshold_gap_is_corrected(self, balancer):
+        balancer.check_position_balance = Mock(return_value=_balance(100.0, 97.0))
+        balancer._add_futures_short_by_quantity = Mock(return_value=True)
+
+        assert balancer.rebalance_position('XRP') is True
+        balancer._add_futures_short_by_quantity.assert_called_once_with('XRP', 3.0)
+        assert balancer.residual_ledger.get_gap('XRP') == 0.0
+
+    def test_ledger_threshold_alone_decides(self, balancer):
+        # 1.5% 갭 (2% 미만)이어도 $150이면 보정
+        balancer.check_position_balance = Mock(return_value=_balance(1000.0, 985.0))
+        balancer._add_futures_short_by_quantity = Mock(return_value=True)
+
+        assert balancer.rebalance_position('XRP') is True
+        balancer._add_futures_short_by_quantity.assert_called_once_with('XRP', 15.0)
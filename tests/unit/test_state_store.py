@@ -0,0 +1,101 @@
+"""
+상태 저장소 테스트 - 재시작 후 포지션/쿨다운/실패 횟수 유지
+"""
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.config import settings
+from src.core.hedge_bot import HedgeBot
+from src.managers.state_store import StateStore
+from src.managers.timer_manager import TimerManager
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    return str(tmp_path / 'hedge_state.db')
+
+
+def _bot(store: StateStore) -> HedgeBot:
+    korean, futures = Mock(), Mock()
+    korean.exchange_id, futures.exchange_id = 'upbit', 'gateio'
+    registry = Mock()
+    registry.get_symbol_universe.return_value = {'XRP'}
+    return HedgeBot(korean, futures, registry, state_store=store)
+
+
+class TestStateStore:
+    """테이블별 저장 / 일괄 로드"""
+
+    def test_round_trip_across_reopen(self, db_file):
+        store = StateStore(db_file)
+        started = datetime.now().replace(microsecond=0)
+        store.save_position('XRP', 480.5)
+        store.save_timer('XRP', 30, started)
+        store.save_timer('XRP', 50, None)
+        store.save_failures('XRP', 2)
+        store.close()
+
+        reopened = StateStore(db_file)
+
+        assert reopened._query('PRAGMA journal_mode') == [('wal',)]
+        assert reopened.load_positions() == {'XRP': 480.5}
+        assert reopened.load_timers() == {'XRP': {30: started, 50: None}}
+        assert reopened.load_failures() == {'XRP': 2}
+
+    def test_empty_file_name_keeps_state_in_memory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        store = StateStore('')
+        store.save_position('XRP', 1.0)
+
+        assert store.load_positions() == {'XRP': 1.0}
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestRestart:
+    """재시작 후 복원"""
+
+    def test_cooldown_survives_restart(self, db_file):
+        timers = TimerManager(StateStore(db_file))
+        timers.initialize_symbol('XRP')
+        level, _ = settings.PROFIT_STAGES[0]
+        assert timers.check_profit_taking('XRP', level, settings.PROFIT_STAGES) is not None
+
+        restarted = TimerManager(StateStore(db_file))
+        restarted.initialize_symbol('XRP')
+
+        assert restarted.stage_timers['XRP'][level] > datetime.now() - timedelta(minutes=1)
+        assert restarted.check_profit_taking('XRP', level, settings.PROFIT_STAGES) is None
+
+    def test_restored_symbol_skips_live_discovery(self, db_file):
+        bot = _bot(StateStore(db_file))
+        bot.position_manager.get_existing_positions_bulk = Mock(return_value={'XRP': 0.0})
+        assert bot.add_symbols(['XRP']) == ['XRP']
+        bot.position_manager.update_position('XRP', 500.0)
+        bot._handle_failure('XRP')
+
+        restarted = _bot(StateStore(db_file))
+        restarted.position_manager.get_existing_positions_bulk = Mock()
+        restarted.position_balancer.rebalance_position = Mock()
+
+        assert restarted.add_symbols(['XRP']) == ['XRP']
+        restarted.position_manager.get_existing_positions_bulk.assert_not_called()
+        restarted.position_balancer.rebalance_position.assert_not_called()
+        assert restarted.position_manager.get_position('XRP').value_usd == 500.0
+        assert restarted.failed_attempts == {'XRP': 1}
+        # 복원한 포지션은 첫 사이클에 실제 잔고/포지션으로 확인
+        assert restarted.order_executor.reconcile_symbols == {'XRP'}
+
+    def test_closed_symbol_forgotten(self, db_file):
+        store = StateStore(db_file)
+        bot = _bot(store)
+        bot.position_manager.get_existing_positions_bulk = Mock(return_value={'XRP': 0.0})
+        bot.add_symbols(['XRP'])
+        bot.position_manager.update_position('XRP', 500.0)
+
+        bot._cleanup_symbol('XRP')
+
+        assert store.load_positions() == {}
+        assert store.load_timers() == {}
+        assert store.load_failures() == {}